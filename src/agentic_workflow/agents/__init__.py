@@ -11,6 +11,7 @@ from .base import Agent, AgentResult, AgentTask
 from .cicd import CICDAgent
 from .code_generation import CodeGenerationAgent
 from .planning import PlanningAgent
+from .pool import AgentPool, get_agent_pool
 from .program_manager import ProgramManagerAgent
 from .requirement_engineering import RequirementEngineeringAgent
 from .review import ReviewAgent
@@ -92,6 +93,8 @@ __all__ = [
     "TestingAgent",
     "ProgramManagerAgent",
     "create_agent",
+    "AgentPool",
+    "get_agent_pool",
     "get_available_agent_types",
     "AGENT_REGISTRY",
 ]
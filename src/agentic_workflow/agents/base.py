@@ -241,6 +241,14 @@ class Agent(Component, ABC):
         """Get agent execution history."""
         return self._execution_history.copy()
 
+    def reset(self) -> None:
+        """Clear per-request state so the agent can be reused.
+
+        Called by the agent pool when a pooled instance is released.
+        Subclasses that keep request-specific state should extend this.
+        """
+        self._execution_history.clear()
+
     def get_capabilities(self) -> List[str]:
         """Get list of agent capabilities.
 
@@ -0,0 +1,274 @@
+"""Pool of warm, reusable agent instances."""
+
+import asyncio
+import json
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Callable, Deque, Dict, List, Optional, Tuple
+
+from agentic_workflow.agents.base import Agent
+from agentic_workflow.core.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+PoolKey = Tuple[str, str]
+AgentFactory = Callable[[str, str, Dict[str, Any]], Agent]
+
+
+def _create_agent(agent_type: str, agent_id: str, config: Dict[str, Any]) -> Agent:
+    """Create an agent through the agent registry."""
+    from agentic_workflow.agents import create_agent
+
+    return create_agent(agent_type, agent_id=agent_id, config=config)
+
+
+@dataclass
+class PooledAgent:
+    """An agent instance owned by the pool."""
+
+    agent: Agent
+    key: PoolKey
+    active: int = 0
+    uses: int = 0
+    last_used: float = field(default_factory=time.monotonic)
+
+
+class AgentPool:
+    """Hands out warm agent instances keyed by agent type and config.
+
+    Constructing an agent builds its reasoning engine and templates, so
+    instances are kept and reused across requests instead. Each instance
+    serves at most ``max_concurrency_per_agent`` requests at once and each
+    key has at most ``max_agents_per_key`` instances; callers beyond that
+    wait for a release. Released instances are reset with ``Agent.reset``
+    once they are idle, and instances idle for longer than
+    ``idle_timeout`` seconds are stopped and evicted.
+    """
+
+    def __init__(
+        self,
+        max_agents_per_key: int = 4,
+        max_concurrency_per_agent: int = 1,
+        idle_timeout: float = 300.0,
+        factory: Optional[AgentFactory] = None,
+    ):
+        """Initialize the agent pool.
+
+        Args:
+            max_agents_per_key: Maximum instances per agent type and config
+            max_concurrency_per_agent: Requests one instance may serve at once
+            idle_timeout: Seconds an unused instance is kept
+            factory: Callable creating an agent from (type, id, config)
+        """
+        self.max_agents_per_key = max(1, max_agents_per_key)
+        self.max_concurrency_per_agent = max(1, max_concurrency_per_agent)
+        self.idle_timeout = idle_timeout
+        self.factory = factory or _create_agent
+
+        self._agents: Dict[PoolKey, List[PooledAgent]] = {}
+        self._by_agent: Dict[int, PooledAgent] = {}
+        self._waiters: Dict[PoolKey, Deque["asyncio.Future[None]"]] = {}
+        self._created = 0
+
+        # Statistics
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def make_key(agent_type: str, config: Optional[Dict[str, Any]] = None) -> PoolKey:
+        """Build the pool key for an agent type and config.
+
+        Args:
+            agent_type: Agent type name
+            config: Agent configuration
+
+        Returns:
+            Hashable pool key
+        """
+        return agent_type, json.dumps(config or {}, sort_keys=True, default=str)
+
+    async def acquire(
+        self, agent_type: str, config: Optional[Dict[str, Any]] = None
+    ) -> Agent:
+        """Check out an agent, creating one or waiting if needed.
+
+        Args:
+            agent_type: Agent type name
+            config: Agent configuration
+
+        Returns:
+            Agent instance; must be returned with ``release``
+        """
+        await self.evict_idle()
+        key = self.make_key(agent_type, config)
+
+        while True:
+            pooled = self._pick(key)
+            if pooled is not None:
+                self.hits += 1
+                break
+
+            instances = self._agents.setdefault(key, [])
+            if len(instances) < self.max_agents_per_key:
+                self._created += 1
+                agent = self.factory(
+                    agent_type, f"{agent_type}_pool_{self._created}", config or {}
+                )
+                pooled = PooledAgent(agent=agent, key=key)
+                instances.append(pooled)
+                self._by_agent[id(agent)] = pooled
+                self.misses += 1
+                break
+
+            waiter = asyncio.get_running_loop().create_future()
+            self._waiters.setdefault(key, deque()).append(waiter)
+            try:
+                await waiter
+            except asyncio.CancelledError:
+                if waiter.done() and not waiter.cancelled():
+                    # Pass the wake-up on to the next waiter
+                    self._wake_waiter(key)
+                raise
+
+        pooled.active += 1
+        pooled.uses += 1
+        pooled.last_used = time.monotonic()
+        return pooled.agent
+
+    def _pick(self, key: PoolKey) -> Optional[PooledAgent]:
+        """Pick the least loaded instance with spare capacity."""
+        candidates = [
+            pooled
+            for pooled in self._agents.get(key, [])
+            if pooled.active < self.max_concurrency_per_agent
+        ]
+        if not candidates:
+            return None
+        return min(candidates, key=lambda pooled: pooled.active)
+
+    async def release(self, agent: Agent) -> None:
+        """Return an agent to the pool.
+
+        Args:
+            agent: Agent obtained from ``acquire``
+        """
+        pooled = self._by_agent.get(id(agent))
+        if pooled is None:
+            return
+
+        pooled.active = max(0, pooled.active - 1)
+        pooled.last_used = time.monotonic()
+        if pooled.active == 0:
+            try:
+                agent.reset()
+            except Exception as e:
+                # A failed reset leaves stale state behind; drop the instance
+                logger.warning(f"Failed to reset agent {agent.agent_id}: {e}")
+                await self._evict(pooled)
+
+        self._wake_waiter(pooled.key)
+
+    def _wake_waiter(self, key: PoolKey) -> None:
+        """Wake the oldest caller waiting for an instance of a key."""
+        waiters = self._waiters.get(key)
+        while waiters:
+            waiter = waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                break
+
+    @asynccontextmanager
+    async def agent(
+        self, agent_type: str, config: Optional[Dict[str, Any]] = None
+    ) -> AsyncIterator[Agent]:
+        """Borrow an agent for the duration of a block.
+
+        Args:
+            agent_type: Agent type name
+            config: Agent configuration
+
+        Yields:
+            Agent instance
+        """
+        agent = await self.acquire(agent_type, config)
+        try:
+            yield agent
+        finally:
+            await self.release(agent)
+
+    async def evict_idle(self) -> int:
+        """Stop and remove instances idle for longer than ``idle_timeout``.
+
+        Returns:
+            Number of evicted instances
+        """
+        cutoff = time.monotonic() - self.idle_timeout
+        idle = [
+            pooled
+            for instances in self._agents.values()
+            for pooled in instances
+            if pooled.active == 0 and pooled.last_used <= cutoff
+        ]
+        for pooled in idle:
+            await self._evict(pooled)
+        return len(idle)
+
+    async def _evict(self, pooled: PooledAgent) -> None:
+        """Remove an instance from the pool and stop it."""
+        instances = self._agents.get(pooled.key, [])
+        if pooled in instances:
+            instances.remove(pooled)
+        if not instances:
+            self._agents.pop(pooled.key, None)
+        self._by_agent.pop(id(pooled.agent), None)
+        self.evictions += 1
+        try:
+            await pooled.agent.stop()
+        except Exception as e:
+            logger.warning(f"Failed to stop agent {pooled.agent.agent_id}: {e}")
+
+        # A waiter may now create a replacement instance
+        self._wake_waiter(pooled.key)
+
+    async def close(self) -> None:
+        """Stop and remove every pooled instance."""
+        for instances in list(self._agents.values()):
+            for pooled in list(instances):
+                await self._evict(pooled)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get pool statistics.
+
+        Returns:
+            Instance counts and reuse counters
+        """
+        return {
+            "agents": sum(len(instances) for instances in self._agents.values()),
+            "active": sum(
+                pooled.active
+                for instances in self._agents.values()
+                for pooled in instances
+            ),
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+
+
+# Global agent pool instance
+_agent_pool: Optional[AgentPool] = None
+
+
+def get_agent_pool() -> AgentPool:
+    """Get or create the global agent pool instance.
+
+    Returns:
+        AgentPool instance
+    """
+    global _agent_pool
+    if _agent_pool is None:
+        _agent_pool = AgentPool()
+    return _agent_pool
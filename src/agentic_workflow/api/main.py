@@ -8,6 +8,7 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from agentic_workflow import __version__, monitoring_service
+from agentic_workflow.agents.pool import get_agent_pool
 from agentic_workflow.api.agents import router as agents_router
 from agentic_workflow.api.auth_endpoints import router as auth_router
 from agentic_workflow.api.billing import router as billing_router
@@ -20,6 +21,7 @@ from agentic_workflow.api.tools import router as tools_router
 from agentic_workflow.api.workflows import router as workflows_router
 from agentic_workflow.api.workflow_protected import router as protected_workflows_router
 from agentic_workflow.api.workflow_orchestration import router as orchestration_router
+from agentic_workflow.api.workflow_orchestration import stop_job_queue
 from agentic_workflow.api.websocket_execution import router as websocket_router
 from agentic_workflow.core.logging_config import get_logger, setup_logging
 
@@ -40,6 +42,8 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     yield
 
     # Shutdown
+    await stop_job_queue()
+    await get_agent_pool().close()
     await monitoring_service.stop()
     logger.info("System services stopped")
 
@@ -17,6 +17,8 @@ import logging
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect
 from pydantic import BaseModel
 
+from agentic_workflow.core.interfaces import EventHandler
+
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/ws", tags=["websocket"])
@@ -99,6 +101,7 @@ async def websocket_execution_endpoint(
     execution progress. Updates include:
     - Workflow execution started
     - Individual step started/completed
+    - Partial step output, streamed as the step produces it
     - Workflow execution completed
     - Execution failures/errors
     
@@ -174,5 +177,42 @@ async def send_execution_update(
     logger.debug(f"Sent {update_type} update for execution {execution_id}")
 
 
+class ExecutionUpdateHandler(EventHandler):
+    """
+    Forwards workflow engine events to WebSocket subscribers.
+
+    Register it on an engine with ``engine.register_event_handler`` to
+    stream ``step_output`` chunks and step completions to clients watching
+    the workflow as they happen.
+    """
+
+    def __init__(self, connection_manager: ConnectionManager | None = None):
+        self.manager = connection_manager or manager
+
+    async def handle_event(self, event_type: str, event_data: dict) -> None:
+        execution_id = event_data.get("execution_id")
+        if not execution_id:
+            return
+
+        workflow_id = event_data.get("workflow_id")
+        if not workflow_id:
+            workflow_id = self.manager.get_workflow_for_execution(execution_id)
+        if not workflow_id or workflow_id not in self.manager.active_connections:
+            return
+
+        update = ExecutionUpdate(
+            type=event_type,
+            execution_id=execution_id,
+            workflow_id=workflow_id,
+            timestamp=datetime.now(timezone.utc).isoformat(),
+            data={
+                key: value
+                for key, value in event_data.items()
+                if key not in ("execution_id", "workflow_id")
+            },
+        )
+        await self.manager.broadcast_to_workflow(workflow_id, update.model_dump())
+
+
 # Export the manager and helper function
-__all__ = ["router", "manager", "send_execution_update"]
+__all__ = ["router", "manager", "send_execution_update", "ExecutionUpdateHandler"]
@@ -6,9 +6,14 @@ This module provides the seamless user experience endpoint that combines:
 2. File attachment handling
 3. Tenant preferences application
 4. Agent workflow execution
+
+Executions are validated in the request, then queued and run by a pool of
+background workers; clients poll the status endpoint for results.
 """
 
-from typing import Any, Dict, List, Optional
+import asyncio
+import json
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
 from datetime import datetime, timezone
 
 from fastapi import (
@@ -21,9 +26,11 @@ from fastapi import (
 )
 from pydantic import BaseModel, Field
 
-from agentic_workflow.agents.planning import PlanningAgent
 from agentic_workflow.agents.base import AgentTask
-from agentic_workflow.core.tenant import TenantService, get_tenant_service
+from agentic_workflow.agents.pool import get_agent_pool
+from agentic_workflow.core.config import get_config
+from agentic_workflow.core.job_queue import JobQueue, QueueFullError
+from agentic_workflow.core.tenant import Tenant, TenantService, TierType, get_tenant_service
 from agentic_workflow.core.file_attachment import FileService, get_file_service, ChunkingService
 from agentic_workflow.core.logging_config import get_logger
 
@@ -75,130 +82,268 @@ class WorkflowStatusResponse(BaseModel):
     progress: float
     current_step: Optional[str] = None
     results: Optional[Dict[str, Any]] = None
+    error: Optional[str] = None
 
 
 # In-memory execution tracking (replace with database in production)
 _executions: Dict[str, Dict[str, Any]] = {}
 
+# Queue lane per tenant tier; lower lanes are served first
+_TIER_PRIORITY: Dict[TierType, int] = {
+    TierType.BUSINESS: 0,
+    TierType.STANDARD: 1,
+    TierType.FREE: 2,
+}
 
-@router.post(
-    "/execute",
-    response_model=WorkflowExecutionResponse,
-    status_code=status.HTTP_201_CREATED,
-)
-async def execute_workflow(
-    tenant_id: str = Form(...),
-    prompt: str = Form(...),
-    files: Optional[List[UploadFile]] = File(None),
-    preferences: Optional[str] = Form(None),  # JSON string
-    agent_type: str = Form(default="planning"),
+# Global job queue instance
+_job_queue: Optional[JobQueue] = None
+
+
+def get_job_queue() -> JobQueue:
+    """Get or create the global workflow job queue.
+
+    Returns:
+        JobQueue instance
+    """
+    global _job_queue
+    if _job_queue is None:
+        config = get_config()
+        _job_queue = JobQueue(
+            max_size=config.job_queue_size,
+            concurrency=config.job_workers,
+        )
+    return _job_queue
+
+
+async def stop_job_queue() -> None:
+    """Stop the workflow job queue and close out unfinished executions.
+
+    Running executions are cancelled and record themselves as such; queued
+    executions that never ran are marked cancelled here and their reserved
+    usage is released.
+    """
+    if _job_queue is None:
+        return
+
+    for execution_id in await _job_queue.stop():
+        execution_record = _executions.get(execution_id)
+        if execution_record is None or execution_record["status"] != "queued":
+            continue
+        execution_record["status"] = "cancelled"
+        execution_record["error"] = "Workflow queue stopped before the execution ran"
+        execution_record["completed_at"] = datetime.now(timezone.utc).isoformat()
+        await _release_reservation(
+            execution_record["tenant_id"],
+            execution_record["prompt_info"]["estimated_tokens"],
+        )
+
+
+def _new_execution_id(tenant_id: str) -> str:
+    """Generate an execution ID for a tenant."""
+    now = datetime.now(timezone.utc)
+    return f"exec_{now.strftime('%Y%m%d_%H%M%S')}_{now.microsecond:06d}_{tenant_id[:8]}"
+
+
+async def _validate_request(
+    tenant_service: TenantService,
+    chunking_service: ChunkingService,
+    tenant_id: str,
+    prompt: str,
+    has_files: bool,
+) -> Tuple[Tenant, int]:
+    """Check the tenant, prompt size and file support for a request.
+
+    The quota is checked when the execution is queued, see
+    ``_enqueue_execution``.
+
+    Args:
+        tenant_service: Tenant service
+        chunking_service: Chunking service used to estimate tokens
+        tenant_id: Tenant ID
+        prompt: User prompt
+        has_files: Whether the request attaches files
+
+    Returns:
+        Tuple of (tenant, estimated prompt tokens)
+
+    Raises:
+        HTTPException: If the request cannot be accepted
+    """
+    tenant = await tenant_service.get_tenant(tenant_id)
+    if not tenant:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Tenant not found: {tenant_id}",
+        )
+
+    limits = tenant.get_limits()
+    estimated_tokens = chunking_service.estimate_tokens(prompt)
+    if estimated_tokens > limits.max_prompt_size:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Prompt too large: {estimated_tokens} tokens exceeds limit of {limits.max_prompt_size}",
+        )
+
+    if has_files and not limits.file_attachments:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail=f"Tenant tier '{tenant.tier}' does not support file attachments",
+        )
+
+    return tenant, estimated_tokens
+
+
+async def _release_reservation(tenant_id: str, estimated_tokens: int) -> None:
+    """Return the usage reserved for an execution that never ran."""
+    await get_tenant_service().track_usage(
+        tenant_id, requests=-1, tokens=-estimated_tokens
+    )
+
+
+async def _enqueue_execution(
+    execution_id: str,
+    tenant: Tenant,
+    estimated_tokens: int,
+    job: Callable[[], Awaitable[None]],
 ) -> Dict[str, Any]:
-    """Execute end-to-end workflow with prompt, files, and preferences.
+    """Check the quota, record a queued execution and submit its job.
 
-    This endpoint provides a seamless experience where users can:
-    1. Send their prompt (any size)
-    2. Attach files as context
-    3. Send preferences for the workflow
+    The request and its prompt tokens are charged to the tenant here rather
+    than when the execution finishes, so executions still queued or running
+    count against the quota of later submissions.
 
     Args:
-        tenant_id: Tenant ID for isolation and quota management
-        prompt: User prompt of any size (will be chunked automatically)
-        files: Optional file attachments to use as context
-        preferences: Optional JSON string of preferences to override defaults
-        agent_type: Agent type to execute (planning, code_generation, etc.)
+        execution_id: Execution ID
+        tenant: Tenant the execution belongs to
+        estimated_tokens: Estimated prompt tokens
+        job: Coroutine function running the execution
 
     Returns:
-        Workflow execution response with results
+        The queued execution record
+
+    Raises:
+        HTTPException: 429 if the tenant quota or the job queue is exhausted
     """
-    now = datetime.now(timezone.utc)
-    execution_id = f"exec_{now.strftime('%Y%m%d_%H%M%S')}_{now.microsecond:06d}_{tenant_id[:8]}"
-    
+    tenant_service = get_tenant_service()
+    quota_check = await tenant_service.check_quota(tenant.id)
+    if not quota_check["allowed"]:
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail=f"Quota exceeded: {quota_check['reason']}",
+        )
+    await tenant_service.track_usage(tenant.id, requests=1, tokens=estimated_tokens)
+
+    execution_record = {
+        "execution_id": execution_id,
+        "tenant_id": tenant.id,
+        "status": "queued",
+        "prompt_info": {
+            "total_chunks": 0,
+            "chunk_indices": [],
+            "estimated_tokens": estimated_tokens,
+        },
+        "files_processed": 0,
+        "preferences_applied": {},
+        "agent_results": {},
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "completed_at": None,
+        "error": None,
+    }
+    _executions[execution_id] = execution_record
+
     try:
-        # Initialize services (use singleton pattern for consistency)
-        tenant_service = get_tenant_service()
-        file_service = get_file_service()
-        chunking_service = ChunkingService()
-
-        # Step 1: Validate tenant and check quota
-        tenant = await tenant_service.get_tenant(tenant_id)
-        if not tenant:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Tenant not found: {tenant_id}",
-            )
+        get_job_queue().submit(
+            execution_id, job, priority=_TIER_PRIORITY.get(tenant.tier, len(_TIER_PRIORITY))
+        )
+    except QueueFullError as e:
+        del _executions[execution_id]
+        await _release_reservation(tenant.id, estimated_tokens)
+        logger.warning(f"Rejected workflow execution {execution_id}: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail="Workflow queue is full, retry later",
+            headers={"Retry-After": "5"},
+        )
 
-        quota_check = await tenant_service.check_quota(tenant_id)
-        if not quota_check["allowed"]:
-            raise HTTPException(
-                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
-                detail=f"Quota exceeded: {quota_check['reason']}",
-            )
+    logger.info(f"Queued workflow execution {execution_id} for tenant {tenant.id}")
+    return execution_record
 
-        logger.info(f"Starting workflow execution {execution_id} for tenant {tenant_id}")
-
-        # Step 2: Process and chunk prompt
-        logger.info(f"Processing prompt ({len(prompt)} chars)")
-        limits = tenant.get_limits()
-        
-        # Check prompt size against tier limit
-        estimated_tokens = chunking_service.estimate_tokens(prompt)
-        if estimated_tokens > limits.max_prompt_size:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"Prompt too large: {estimated_tokens} tokens exceeds limit of {limits.max_prompt_size}",
-            )
 
-        # Chunk the prompt if needed
+async def _run_execution(
+    execution_id: str,
+    tenant: Tenant,
+    prompt: str,
+    estimated_tokens: int,
+    agent_type: str,
+    file_ids: List[str],
+    uploads: List[Dict[str, Any]],
+    request_preferences: Dict[str, Any],
+) -> None:
+    """Run a queued workflow execution and update its record.
+
+    Args:
+        execution_id: Execution ID
+        tenant: Tenant the execution belongs to
+        prompt: User prompt
+        estimated_tokens: Estimated prompt tokens
+        agent_type: Agent type to execute
+        file_ids: IDs of already uploaded files to use as context
+        uploads: Files read from the request, uploaded before the agent runs
+        request_preferences: Preferences overriding tenant defaults
+    """
+    execution_record = _executions.get(execution_id)
+    if execution_record is None:
+        # Deleted while queued
+        return
+    execution_record["status"] = "running"
+
+    tenant_service = get_tenant_service()
+    file_service = get_file_service()
+    chunking_service = ChunkingService()
+    limits = tenant.get_limits()
+
+    try:
+        # Step 1: Chunk the prompt
         prompt_chunks = chunking_service.chunk_text(prompt)
         logger.info(f"Prompt chunked into {len(prompt_chunks)} pieces")
+        execution_record["prompt_info"] = {
+            "total_chunks": len(prompt_chunks),
+            "chunk_indices": [c.metadata.chunk_index for c in prompt_chunks],
+            "estimated_tokens": estimated_tokens,
+        }
 
-        # Step 3: Process file attachments
-        file_ids = []
-        files_processed = 0
-        if files:
-            if not limits.file_attachments:
-                raise HTTPException(
-                    status_code=status.HTTP_403_FORBIDDEN,
-                    detail=f"Tenant tier '{tenant.tier}' does not support file attachments",
-                )
-
-            for file in files:
-                content = await file.read()
-                file_attachment = await file_service.upload_file(
-                    tenant_id=tenant_id,
-                    filename=file.filename or "unnamed",
-                    content=content,
-                    content_type=file.content_type or "application/octet-stream",
+        # Step 2: Upload attached files concurrently
+        execution_record["current_step"] = "files"
+        uploaded = await asyncio.gather(
+            *(
+                file_service.upload_file(
+                    tenant_id=tenant.id,
+                    filename=upload["filename"],
+                    content=upload["content"],
+                    content_type=upload["content_type"],
                     retention_days=limits.storage_days,
                 )
-                file_ids.append(file_attachment.id)
-                files_processed += 1
-            
-            logger.info(f"Processed {files_processed} file attachments")
-
-        # Step 4: Load and merge preferences
-        import json
-        preferences_dict = {}
-        
-        # Load tenant default preferences
+                for upload in uploads
+            )
+        )
+        file_ids = file_ids + [file_attachment.id for file_attachment in uploaded]
+        execution_record["files_processed"] = len(file_ids)
+
+        # Step 3: Load tenant defaults and apply request preferences
+        execution_record["current_step"] = "preferences"
+        preferences_dict: Dict[str, Any] = {}
         if limits.preference_storage:
-            tenant_prefs = await tenant_service.get_all_preferences(tenant_id)
+            tenant_prefs = await tenant_service.get_all_preferences(tenant.id)
             preferences_dict = {
                 key: pref.preference_value
                 for key, pref in tenant_prefs.items()
             }
-        
-        # Override with request-specific preferences
-        if preferences:
-            try:
-                request_prefs = json.loads(preferences)
-                preferences_dict.update(request_prefs)
-            except json.JSONDecodeError:
-                logger.warning("Invalid JSON in preferences, skipping")
-
+        preferences_dict.update(request_preferences)
+        execution_record["preferences_applied"] = preferences_dict
         logger.info(f"Applied {len(preferences_dict)} preferences")
 
-        # Step 5: Prepare context for agent execution
+        # Step 4: Prepare context and execute agent
+        execution_record["current_step"] = "agent"
         context = {
             "prompt": prompt,
             "prompt_chunks": [
@@ -214,66 +359,132 @@ async def execute_workflow(
             "tenant_tier": tenant.tier.value,
         }
 
-        # Step 6: Execute agent workflow
-        logger.info(f"Executing {agent_type} agent")
-        
         # For now, we'll use the planning agent as the default
         # In production, this would route to the appropriate agent
-        agent = PlanningAgent(agent_id=f"{agent_type}_{execution_id}")
-        
-        task = AgentTask(
-            task_id=execution_id,
-            agent_id=agent.agent_id,
-            objective=prompt,
-            context=context,
+        logger.info(f"Executing {agent_type} agent")
+        async with get_agent_pool().agent("planning") as agent:
+            task = AgentTask(
+                task_id=execution_id,
+                agent_id=agent.agent_id,
+                objective=prompt,
+                context=context,
+            )
+
+            try:
+                result = await agent.execute(task)
+                execution_record["agent_results"] = {
+                    "success": result.success,
+                    "result": result.result,
+                    "metadata": result.metadata,
+                }
+                execution_record["status"] = "completed"
+            except Exception as e:
+                logger.error(f"Agent execution failed: {e}")
+                execution_record["agent_results"] = {"error": str(e)}
+                execution_record["status"] = "failed"
+                execution_record["error"] = str(e)
+
+        # Step 5: Track usage (the request and tokens were reserved on enqueue)
+        await tenant_service.track_usage(tenant.id, files=len(file_ids))
+
+    except asyncio.CancelledError:
+        logger.warning(f"Workflow execution {execution_id} cancelled")
+        execution_record["status"] = "cancelled"
+        execution_record["error"] = "Workflow execution cancelled"
+        raise
+
+    except Exception as e:
+        logger.error(f"Workflow execution failed: {e}", exc_info=True)
+        execution_record["status"] = "failed"
+        execution_record["error"] = f"Workflow execution failed: {str(e)}"
+
+    finally:
+        execution_record["current_step"] = None
+        execution_record["completed_at"] = datetime.now(timezone.utc).isoformat()
+        logger.info(
+            f"Workflow execution {execution_id} finished: {execution_record['status']}"
         )
 
-        try:
-            result = await agent.execute(task)
-            agent_results = {
-                "success": result.success,
-                "result": result.result,
-                "metadata": result.metadata,
-            }
-            execution_status = "completed"
-            error_msg = None
-        except Exception as e:
-            logger.error(f"Agent execution failed: {e}")
-            agent_results = {"error": str(e)}
-            execution_status = "failed"
-            error_msg = str(e)
-
-        # Step 7: Track usage
-        await tenant_service.track_usage(
+
+@router.post(
+    "/execute",
+    response_model=WorkflowExecutionResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+)
+async def execute_workflow(
+    tenant_id: str = Form(...),
+    prompt: str = Form(...),
+    files: Optional[List[UploadFile]] = File(None),
+    preferences: Optional[str] = Form(None),  # JSON string
+    agent_type: str = Form(default="planning"),
+) -> Dict[str, Any]:
+    """Queue an end-to-end workflow with prompt, files, and preferences.
+
+    This endpoint provides a seamless experience where users can:
+    1. Send their prompt (any size)
+    2. Attach files as context
+    3. Send preferences for the workflow
+
+    The request is validated and the execution queued immediately; poll
+    ``/status/{execution_id}`` for progress and results.
+
+    Args:
+        tenant_id: Tenant ID for isolation and quota management
+        prompt: User prompt of any size (will be chunked automatically)
+        files: Optional file attachments to use as context
+        preferences: Optional JSON string of preferences to override defaults
+        agent_type: Agent type to execute (planning, code_generation, etc.)
+
+    Returns:
+        Queued workflow execution record
+
+    Raises:
+        HTTPException: 429 if the tenant quota or the job queue is exhausted
+    """
+    execution_id = _new_execution_id(tenant_id)
+
+    try:
+        tenant, estimated_tokens = await _validate_request(
+            get_tenant_service(),
+            ChunkingService(),
             tenant_id,
-            requests=1,
-            tokens=estimated_tokens,
-            files=files_processed,
+            prompt,
+            has_files=bool(files),
         )
 
-        # Step 8: Store execution record
-        completed_at = datetime.now(timezone.utc).isoformat()
-        execution_record = {
-            "execution_id": execution_id,
-            "tenant_id": tenant_id,
-            "status": execution_status,
-            "prompt_info": {
-                "total_chunks": len(prompt_chunks),
-                "chunk_indices": [c.metadata.chunk_index for c in prompt_chunks],
-                "estimated_tokens": estimated_tokens,
-            },
-            "files_processed": files_processed,
-            "preferences_applied": preferences_dict,
-            "agent_results": agent_results,
-            "created_at": datetime.now(timezone.utc).isoformat(),
-            "completed_at": completed_at,
-            "error": error_msg,
-        }
-        
-        _executions[execution_id] = execution_record
-        logger.info(f"Workflow execution {execution_id} completed: {execution_status}")
+        # Uploads must be read before the request completes
+        uploads = []
+        if files:
+            contents = await asyncio.gather(*(file.read() for file in files))
+            uploads = [
+                {
+                    "filename": file.filename or "unnamed",
+                    "content": content,
+                    "content_type": file.content_type or "application/octet-stream",
+                }
+                for file, content in zip(files, contents)
+            ]
 
-        return execution_record
+        request_preferences: Dict[str, Any] = {}
+        if preferences:
+            try:
+                request_preferences = json.loads(preferences)
+            except json.JSONDecodeError:
+                logger.warning("Invalid JSON in preferences, skipping")
+
+        async def job() -> None:
+            await _run_execution(
+                execution_id,
+                tenant,
+                prompt,
+                estimated_tokens,
+                agent_type,
+                [],
+                uploads,
+                request_preferences,
+            )
+
+        return await _enqueue_execution(execution_id, tenant, estimated_tokens, job)
 
     except HTTPException:
         raise
@@ -288,12 +499,12 @@ async def execute_workflow(
 @router.post(
     "/execute-json",
     response_model=WorkflowExecutionResponse,
-    status_code=status.HTTP_201_CREATED,
+    status_code=status.HTTP_202_ACCEPTED,
 )
 async def execute_workflow_json(
     request: WorkflowExecutionRequest,
 ) -> Dict[str, Any]:
-    """Execute workflow with JSON request (alternative to multipart form).
+    """Queue a workflow with a JSON request (alternative to multipart form).
 
     This endpoint provides the same functionality as /execute but accepts
     JSON input instead of multipart form data. Files must be uploaded
@@ -303,146 +514,56 @@ async def execute_workflow_json(
         request: Workflow execution request
 
     Returns:
-        Workflow execution response with results
-    """
-    now = datetime.now(timezone.utc)
-    execution_id = f"exec_{now.strftime('%Y%m%d_%H%M%S')}_{now.microsecond:06d}_{request.tenant_id[:8]}"
-    
-    try:
-        # Initialize services (use singleton pattern for consistency)
-        tenant_service = get_tenant_service()
-        file_service = get_file_service()
-        chunking_service = ChunkingService()
-
-        # Step 1: Validate tenant and check quota
-        tenant = await tenant_service.get_tenant(request.tenant_id)
-        if not tenant:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Tenant not found: {request.tenant_id}",
-            )
-
-        quota_check = await tenant_service.check_quota(request.tenant_id)
-        if not quota_check["allowed"]:
-            raise HTTPException(
-                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
-                detail=f"Quota exceeded: {quota_check['reason']}",
-            )
+        Queued workflow execution record
 
-        # Step 2: Process and chunk prompt
-        limits = tenant.get_limits()
-        estimated_tokens = chunking_service.estimate_tokens(request.prompt)
-        
-        if estimated_tokens > limits.max_prompt_size:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"Prompt too large: {estimated_tokens} tokens exceeds limit of {limits.max_prompt_size}",
-            )
+    Raises:
+        HTTPException: 429 if the tenant quota or the job queue is exhausted
+    """
+    execution_id = _new_execution_id(request.tenant_id)
 
-        prompt_chunks = chunking_service.chunk_text(request.prompt)
+    try:
+        tenant, estimated_tokens = await _validate_request(
+            get_tenant_service(),
+            ChunkingService(),
+            request.tenant_id,
+            request.prompt,
+            has_files=bool(request.file_ids),
+        )
 
-        # Step 3: Validate file IDs
-        files_processed = 0
-        if request.file_ids:
-            if not limits.file_attachments:
+        # Validate file IDs
+        file_ids = request.file_ids or []
+        file_service = get_file_service()
+        attachments = await asyncio.gather(
+            *(file_service.get_file(file_id) for file_id in file_ids)
+        )
+        for file_id, file_attachment in zip(file_ids, attachments):
+            if not file_attachment:
+                raise HTTPException(
+                    status_code=status.HTTP_404_NOT_FOUND,
+                    detail=f"File not found: {file_id}",
+                )
+            if file_attachment.tenant_id != request.tenant_id:
                 raise HTTPException(
                     status_code=status.HTTP_403_FORBIDDEN,
-                    detail=f"Tenant tier '{tenant.tier}' does not support file attachments",
+                    detail=f"Access denied to file: {file_id}",
                 )
 
-            for file_id in request.file_ids:
-                file_attachment = await file_service.get_file(file_id)
-                if not file_attachment:
-                    raise HTTPException(
-                        status_code=status.HTTP_404_NOT_FOUND,
-                        detail=f"File not found: {file_id}",
-                    )
-                if file_attachment.tenant_id != request.tenant_id:
-                    raise HTTPException(
-                        status_code=status.HTTP_403_FORBIDDEN,
-                        detail=f"Access denied to file: {file_id}",
-                    )
-                files_processed += 1
-
-        # Step 4: Load and merge preferences
-        preferences_dict = {}
-        if limits.preference_storage:
-            tenant_prefs = await tenant_service.get_all_preferences(request.tenant_id)
-            preferences_dict = {
-                key: pref.preference_value
-                for key, pref in tenant_prefs.items()
-            }
-        
-        if request.preferences:
-            preferences_dict.update(request.preferences)
-
-        # Step 5: Prepare context and execute
-        context = {
-            "prompt": request.prompt,
-            "prompt_chunks": [
-                {
-                    "index": chunk.metadata.chunk_index,
-                    "content": chunk.content,
-                    "tokens": chunk.metadata.tokens,
-                }
-                for chunk in prompt_chunks
-            ],
-            "file_ids": request.file_ids or [],
-            "preferences": preferences_dict,
-            "tenant_tier": tenant.tier.value,
-        }
-
-        agent = PlanningAgent(agent_id=f"{request.agent_type}_{execution_id}")
-        task = AgentTask(
-            task_id=execution_id,
-            agent_id=agent.agent_id,
-            objective=request.prompt,
-            context=context,
-        )
+        async def job() -> None:
+            await _run_execution(
+                execution_id,
+                tenant,
+                request.prompt,
+                estimated_tokens,
+                request.agent_type,
+                file_ids,
+                [],
+                request.preferences or {},
+            )
 
-        try:
-            result = await agent.execute(task)
-            agent_results = {
-                "success": result.success,
-                "result": result.result,
-                "metadata": result.metadata,
-            }
-            execution_status = "completed"
-            error_msg = None
-        except Exception as e:
-            logger.error(f"Agent execution failed: {e}")
-            agent_results = {"error": str(e)}
-            execution_status = "failed"
-            error_msg = str(e)
-
-        # Track usage
-        await tenant_service.track_usage(
-            request.tenant_id,
-            requests=1,
-            tokens=estimated_tokens,
-            files=files_processed,
+        execution_record = await _enqueue_execution(
+            execution_id, tenant, estimated_tokens, job
         )
-
-        # Store execution record
-        execution_record = {
-            "execution_id": execution_id,
-            "tenant_id": request.tenant_id,
-            "status": execution_status,
-            "prompt_info": {
-                "total_chunks": len(prompt_chunks),
-                "chunk_indices": [c.metadata.chunk_index for c in prompt_chunks],
-                "estimated_tokens": estimated_tokens,
-            },
-            "files_processed": files_processed,
-            "preferences_applied": preferences_dict,
-            "agent_results": agent_results,
-            "created_at": datetime.now(timezone.utc).isoformat(),
-            "completed_at": datetime.now(timezone.utc).isoformat(),
-            "error": error_msg,
-        }
-        
-        _executions[execution_id] = execution_record
-
+        execution_record["files_processed"] = len(file_ids)
         return execution_record
 
     except HTTPException:
@@ -479,7 +600,7 @@ async def get_workflow_status(execution_id: str) -> Dict[str, Any]:
     # Calculate progress
     if execution["status"] == "completed":
         progress = 1.0
-    elif execution["status"] == "failed":
+    elif execution["status"] in ("failed", "cancelled", "queued"):
         progress = 0.0
     else:
         progress = 0.5  # In progress
@@ -490,6 +611,7 @@ async def get_workflow_status(execution_id: str) -> Dict[str, Any]:
         "progress": progress,
         "current_step": execution.get("current_step"),
         "results": execution.get("agent_results"),
+        "error": execution.get("error"),
     }
 
 
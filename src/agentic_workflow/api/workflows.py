@@ -7,7 +7,7 @@ allowing users to create, manage, and execute workflows through a graphical inte
 Sprint 1-2: Foundation - API Structure
 """
 
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 from datetime import datetime, timezone
 
 from fastapi import APIRouter, HTTPException, Depends, status
@@ -16,6 +16,7 @@ from pydantic import BaseModel, Field
 from agentic_workflow.core.engine import WorkflowEngine, WorkflowDefinition, WorkflowStep
 from agentic_workflow.core.interfaces import ServiceResponse
 from agentic_workflow.core.logging_config import get_logger
+from agentic_workflow.core.plan import PlanCache
 
 logger = get_logger(__name__)
 
@@ -113,9 +114,22 @@ class WorkflowStorage:
     def __init__(self):
         self._workflows: Dict[str, Dict[str, Any]] = {}
         self._executions: Dict[str, Dict[str, Any]] = {}
-    
-    def save_workflow(self, workflow_id: str, workflow: VisualWorkflowDefinition) -> Dict[str, Any]:
-        """Save a workflow definition."""
+        # Converted engine definitions with the stored record they were built from
+        self._definitions: Dict[str, Tuple[Dict[str, Any], WorkflowDefinition]] = {}
+    
+    def save_workflow(
+        self,
+        workflow_id: str,
+        workflow: VisualWorkflowDefinition,
+        definition: Optional[WorkflowDefinition] = None,
+    ) -> Dict[str, Any]:
+        """Save a workflow definition.
+
+        Args:
+            workflow_id: Workflow ID
+            workflow: Visual workflow definition
+            definition: Engine definition already converted from ``workflow``
+        """
         now = datetime.now(timezone.utc)
         workflow_data = {
             "id": workflow_id,
@@ -128,8 +142,51 @@ class WorkflowStorage:
             "updated_at": now,
         }
         self._workflows[workflow_id] = workflow_data
+        self._definitions.pop(workflow_id, None)
+        if definition is not None:
+            self._cache_definition(workflow_id, workflow_data, definition)
         return workflow_data
     
+    def get_definition(self, workflow_id: str) -> Optional[WorkflowDefinition]:
+        """Get the engine definition of a stored workflow.
+
+        The visual graph is converted once per saved version; later calls
+        return the cached definition.
+        """
+        workflow_data = self._workflows.get(workflow_id)
+        if workflow_data is None:
+            return None
+
+        # Every save stores a new record, so identity tells if it changed
+        cached = self._definitions.get(workflow_id)
+        if cached is not None and cached[0] is workflow_data:
+            return cached[1]
+
+        visual = VisualWorkflowDefinition(
+            id=workflow_id,
+            name=workflow_data["name"],
+            description=workflow_data.get("description"),
+            nodes=[VisualNode(**node) for node in workflow_data["nodes"]],
+            edges=[VisualEdge(**edge) for edge in workflow_data["edges"]],
+            metadata=workflow_data.get("metadata", {}),
+        )
+        return self._cache_definition(
+            workflow_id, workflow_data, WorkflowConverter.visual_to_workflow(visual)
+        )
+    
+    def _cache_definition(
+        self,
+        workflow_id: str,
+        workflow_data: Dict[str, Any],
+        definition: WorkflowDefinition,
+    ) -> WorkflowDefinition:
+        """Cache a converted definition, pinned to the workflow's version."""
+        updated_at = workflow_data.get("updated_at")
+        version = updated_at.isoformat() if isinstance(updated_at, datetime) else None
+        definition = definition.model_copy(update={"id": workflow_id, "version": version})
+        self._definitions[workflow_id] = (workflow_data, definition)
+        return definition
+    
     def get_workflow(self, workflow_id: str) -> Optional[Dict[str, Any]]:
         """Retrieve a workflow by ID."""
         return self._workflows.get(workflow_id)
@@ -140,6 +197,7 @@ class WorkflowStorage:
     
     def delete_workflow(self, workflow_id: str) -> bool:
         """Delete a workflow."""
+        self._definitions.pop(workflow_id, None)
         if workflow_id in self._workflows:
             del self._workflows[workflow_id]
             return True
@@ -162,6 +220,9 @@ _storage_instance = WorkflowStorage()
 workflow_storage: Dict[str, Dict[str, Any]] = _storage_instance._workflows
 execution_storage: Dict[str, Dict[str, Any]] = _storage_instance._executions
 
+# Compiled plans of stored workflows, keyed by workflow ID and version
+_plan_cache = PlanCache()
+
 
 # ============================================================================
 # Workflow Converter: Visual Graph <-> WorkflowDefinition
@@ -318,7 +379,7 @@ async def create_visual_workflow(definition: VisualWorkflowDefinition) -> Dict[s
         logger.info(f"Workflow has {len(definition.nodes)} nodes and {len(definition.edges)} edges")
         
         # Save to storage
-        workflow_data = _storage_instance.save_workflow(workflow_id, definition)
+        workflow_data = _storage_instance.save_workflow(workflow_id, definition, workflow_def)
         
         return {
             "workflow_id": workflow_id,
@@ -419,7 +480,8 @@ async def update_workflow(workflow_id: str, definition: VisualWorkflowDefinition
         logger.info(f"Updating workflow: {workflow_id}")
         
         # Save updated version
-        workflow_data = _storage_instance.save_workflow(workflow_id, definition)
+        workflow_data = _storage_instance.save_workflow(workflow_id, definition, workflow_def)
+        _plan_cache.invalidate(workflow_id)
         
         return {
             "workflow_id": workflow_id,
@@ -448,6 +510,7 @@ async def delete_workflow(workflow_id: str):
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Workflow {workflow_id} not found"
         )
+    _plan_cache.invalidate(workflow_id)
     
     logger.info(f"Deleted workflow: {workflow_id}")
 
@@ -467,26 +530,20 @@ async def execute_workflow(workflow_id: str, request: WorkflowExecutionRequest)
     Returns:
         Execution result
     """
-    # Get workflow
-    workflow_data = _storage_instance.get_workflow(workflow_id)
+    # Get workflow; converted definitions are cached per saved version
+    workflow_def = _storage_instance.get_definition(workflow_id)
     
-    if not workflow_data:
+    if workflow_def is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Workflow {workflow_id} not found"
         )
     
     try:
-        # Convert visual workflow to engine format
-        visual_def = VisualWorkflowDefinition(
-            name=workflow_data["name"],
-            description=workflow_data.get("description"),
-            nodes=[VisualNode(**node) for node in workflow_data["nodes"]],
-            edges=[VisualEdge(**edge) for edge in workflow_data["edges"]],
-            metadata=workflow_data.get("metadata", {}),
-        )
-        
-        workflow_def = WorkflowConverter.visual_to_workflow(visual_def)
+        # Compiled plans are cached per workflow version
+        plan = _plan_cache.get_plan(workflow_def)
+        if not plan.valid:
+            raise ValueError(plan.errors[0].message)
         
         # Generate execution ID
         execution_id = f"exec_{datetime.now(timezone.utc).strftime('%Y%m%d_%H%M%S_%f')}"
@@ -511,7 +568,8 @@ async def execute_workflow(workflow_id: str, request: WorkflowExecutionRequest)
         try:
             # Placeholder execution logic
             result = {
-                "steps_completed": len(workflow_def.steps),
+                "steps_completed": len(plan.steps),
+                "levels": len(plan.levels),
                 "workflow_name": workflow_def.name,
                 "message": "Workflow executed successfully (MVP mode)",
             }
@@ -1,11 +1,15 @@
 """Core workflow engine components."""
 
+from .budget import LatencyTracker
 from .config import create_config, get_config, reload_config, set_config
 from .engine import WorkflowEngine
+from .event_dispatch import EventDispatcher, OverflowPolicy
+from .health import CircuitState, ComponentHealthGate
 from .interfaces import (
     Component,
     ComponentStatus,
     EventHandler,
+    ResourceBudget,
     Service,
     ServiceResponse,
     WorkflowDefinition,
@@ -13,6 +17,15 @@ from .interfaces import (
     WorkflowStep,
 )
 from .logging_config import get_logger, setup_logging
+from .plan import ExecutionPlan, PlanCache, compile_workflow
+from .state_store import (
+    ExecutionStateStore,
+    FileStateStore,
+    RedisStateStore,
+    SQLiteStateStore,
+)
+from .step_cache import StepResultCache
+from .streaming import StepStream
 
 __all__ = [
     # Configuration
@@ -22,6 +35,21 @@ __all__ = [
     "reload_config",
     # Engine
     "WorkflowEngine",
+    "ExecutionPlan",
+    "PlanCache",
+    "compile_workflow",
+    "ComponentHealthGate",
+    "CircuitState",
+    "EventDispatcher",
+    "OverflowPolicy",
+    "StepStream",
+    "LatencyTracker",
+    # Execution state
+    "ExecutionStateStore",
+    "SQLiteStateStore",
+    "FileStateStore",
+    "RedisStateStore",
+    "StepResultCache",
     # Interfaces
     "Component",
     "Service",
@@ -31,6 +59,7 @@ __all__ = [
     "WorkflowDefinition",
     "WorkflowStep",
     "WorkflowExecution",
+    "ResourceBudget",
     "ComponentStatus",
     # Logging
     "get_logger",
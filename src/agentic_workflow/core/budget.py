@@ -0,0 +1,163 @@
+"""Resource accounting and adaptive timeouts for workflow steps."""
+
+import math
+from collections import deque
+from typing import Any, Deque, Dict, Optional, Tuple
+
+from .interfaces import ServiceResponse
+
+# Resources reported by components in ``ServiceResponse.metadata["usage"]``
+REPORTED_RESOURCES = ("tokens", "tool_calls", "memory_bytes")
+
+# Resources rolled up as a peak instead of a total
+PEAK_RESOURCES = frozenset({"memory_bytes"})
+
+
+def step_usage(response: ServiceResponse, wall_time: float) -> Dict[str, float]:
+    """Get the resources a step used.
+
+    Args:
+    response: Response returned by the step's component
+    wall_time: Seconds the step took
+
+    Returns:
+    Usage by resource name
+    """
+    reported = response.metadata.get("usage") or {}
+    usage: Dict[str, float] = {"wall_time": wall_time}
+    for resource in REPORTED_RESOURCES:
+        value = reported.get(resource)
+        if isinstance(value, (int, float)):
+            usage[resource] = value
+    return usage
+
+
+def add_usage(total: Dict[str, float], usage: Dict[str, float]) -> None:
+    """Roll a step's usage up into an execution total, in place.
+
+    Args:
+    total: Execution usage to update
+    usage: Step usage
+    """
+    for resource, value in usage.items():
+        if resource in PEAK_RESOURCES:
+            total[resource] = max(total.get(resource, 0), value)
+        else:
+            total[resource] = total.get(resource, 0) + value
+
+
+class LatencyTracker:
+    """Rolling step latencies used to derive adaptive timeouts.
+
+    Keeps the last ``window`` latencies per (component, action). Steps
+    that time out are kept as censored samples at the timeout they hit, so
+    timeouts push the p95 up instead of leaving only the fast steps that
+    finished in time. Once ``min_samples`` have been seen, the adaptive
+    timeout is the p95 latency times ``multiplier``, clamped to
+    ``[floor, ceiling]``.
+    """
+
+    def __init__(
+        self,
+        window: int = 200,
+        min_samples: int = 20,
+        multiplier: float = 3.0,
+        floor: float = 1.0,
+        ceiling: Optional[float] = None,
+    ):
+        """Initialize the latency tracker.
+
+        Args:
+        window: Latencies kept per (component, action)
+        min_samples: Samples needed before timeouts adapt
+        multiplier: Headroom applied to the p95 latency
+        floor: Minimum adaptive timeout in seconds
+        ceiling: Maximum adaptive timeout in seconds
+        """
+        self.window = window
+        self.min_samples = min_samples
+        self.multiplier = multiplier
+        self.floor = floor
+        self.ceiling = ceiling
+        self._samples: Dict[Tuple[str, str], Deque[float]] = {}
+
+    def record(self, component: str, action: str, seconds: float) -> None:
+        """Record a successful step latency.
+
+        Args:
+        component: Component name
+        action: Step action
+        seconds: Step latency
+        """
+        key = (component, action)
+        samples = self._samples.get(key)
+        if samples is None:
+            samples = self._samples[key] = deque(maxlen=self.window)
+        samples.append(seconds)
+
+    def record_timeout(self, component: str, action: str, timeout: float) -> None:
+        """Record a step that timed out.
+
+        The step took at least ``timeout`` seconds, which is recorded as a
+        censored latency sample.
+
+        Args:
+        component: Component name
+        action: Step action
+        timeout: Timeout the step hit, in seconds
+        """
+        self.record(component, action, timeout)
+
+    def percentile(
+        self, component: str, action: str, quantile: float = 0.95
+    ) -> Optional[float]:
+        """Get a latency percentile (nearest rank).
+
+        Args:
+        component: Component name
+        action: Step action
+        quantile: Quantile between 0 and 1
+
+        Returns:
+        Latency in seconds, or None without samples
+        """
+        samples = self._samples.get((component, action))
+        if not samples:
+            return None
+        ordered = sorted(samples)
+        rank = max(1, math.ceil(quantile * len(ordered)))
+        return ordered[rank - 1]
+
+    def timeout_for(self, component: str, action: str) -> Optional[float]:
+        """Get the adaptive timeout for a (component, action).
+
+        Args:
+        component: Component name
+        action: Step action
+
+        Returns:
+        Timeout in seconds, or None until enough samples are collected
+        """
+        samples = self._samples.get((component, action))
+        if samples is None or len(samples) < self.min_samples:
+            return None
+        p95 = self.percentile(component, action)
+        timeout = max(self.floor, (p95 or 0.0) * self.multiplier)
+        if self.ceiling is not None:
+            timeout = min(timeout, self.ceiling)
+        return timeout
+
+    def get_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Get latency statistics per (component, action).
+
+        Returns:
+        Mapping of "component.action" to sample count, p95 and timeout
+        """
+        return {
+            f"{component}.{action}": {
+                "samples": len(samples),
+                "p95": self.percentile(component, action),
+                "timeout": self.timeout_for(component, action),
+            }
+            for (component, action), samples in self._samples.items()
+        }
@@ -4,15 +4,34 @@ This module provides infrastructure for agents to communicate, share insights,
 and coordinate activities across the workflow system.
 """
 
+import asyncio
+import heapq
+import re
 import uuid
 from abc import ABC, abstractmethod
+from collections import deque
 from datetime import UTC, datetime
-from typing import Any, Dict, List, Optional, Set
+from functools import lru_cache
+from itertools import islice
+from typing import (
+    Any,
+    Callable,
+    Deque,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Pattern,
+    Set,
+    Tuple,
+    Type,
+)
 
 from pydantic import BaseModel, Field
 
+from agentic_workflow.core.event_dispatch import OverflowPolicy
 from agentic_workflow.core.logging_config import get_logger
-from agentic_workflow.memory.interfaces import MemoryType
+from agentic_workflow.core.message_history import MessageHistory, MessageHistoryPage
 
 logger = get_logger(__name__)
 
@@ -28,6 +47,7 @@ class Message(BaseModel):
     priority: int = Field(ge=1, le=5, default=3)  # 1=Low, 5=Critical
     created_at: str = Field(default_factory=lambda: datetime.now(UTC).isoformat())
     expires_at: Optional[str] = None
+    topic: Optional[str] = None  # Dot-separated, e.g. "tasks.code.review"
 
 
 class InsightMessage(Message):
@@ -56,8 +76,34 @@ class NotificationMessage(Message):
     context: Dict[str, Any] = {}
 
 
+def _parse_expiry(message: Message) -> Optional[float]:
+    """Get a message's expiry time as a POSIX timestamp.
+
+    Timestamps without a timezone are taken as UTC; invalid ones are
+    ignored with a warning.
+    """
+    if not message.expires_at:
+        return None
+    try:
+        expires = datetime.fromisoformat(message.expires_at.replace("Z", "+00:00"))
+    except ValueError:
+        logger.warning(f"Ignoring invalid expiry of message {message.message_id}")
+        return None
+    if expires.tzinfo is None:
+        expires = expires.replace(tzinfo=UTC)
+    return expires.timestamp()
+
+
 class CommunicationChannel(ABC):
-    """Abstract base class for communication channels."""
+    """Abstract base class for communication channels.
+
+    ``in_process`` channels are only read by agents of this process, so a
+    broadcast can be routed into mailboxes when it is sent. Shared channels
+    may be written by other processes whose routing tables differ; their
+    broadcasts are routed when they are received instead.
+    """
+
+    in_process: bool = False
 
     @abstractmethod
     async def send_message(self, message: Message) -> bool:
@@ -65,8 +111,14 @@ class CommunicationChannel(ABC):
         pass
 
     @abstractmethod
-    async def receive_messages(self, agent_id: str) -> List[Message]:
-        """Receive messages for a specific agent."""
+    async def receive_messages(
+        self, agent_id: str, include_broadcasts: bool = True
+    ) -> List[Message]:
+        """Receive messages for a specific agent.
+
+        Broadcasts are left out when ``include_broadcasts`` is False, for
+        agents whose broadcasts are routed to their mailbox instead.
+        """
         pass
 
     @abstractmethod
@@ -74,62 +126,170 @@ class CommunicationChannel(ABC):
         """Broadcast a message to all agents."""
         pass
 
+    async def deliver(self, message: Message, recipients: Iterable[str]) -> int:
+        """Deliver a message to the mailboxes of the given agents.
+
+        Returns:
+            Number of mailboxes the message was delivered to
+        """
+        delivered = 0
+        for recipient_id in recipients:
+            copy = message.model_copy(update={"recipient_id": recipient_id})
+            delivered += await self.send_message(copy)
+        return delivered
+
 
 class InMemoryChannel(CommunicationChannel):
-    """In-memory communication channel for local agent coordination."""
+    """In-memory communication channel for local agent coordination.
 
-    def __init__(self) -> None:
-        self.messages: Dict[str, List[Message]] = {}  # agent_id -> messages
-        self.broadcast_messages: List[Message] = []
-        self.max_messages_per_agent = 1000
+    Direct messages wait in a per-agent mailbox until the agent receives
+    them. Broadcasts go to a single shared ring buffer that every agent
+    reads through its own cursor, so each agent gets each broadcast once
+    and nothing is copied per reader; agents that fall more than
+    ``max_broadcast_messages`` behind miss the overwritten broadcasts.
+
+    Expiry times are parsed once on send and indexed in a min-heap, so
+    receiving only has to pop the messages that expired since the last
+    call. When a mailbox is full, ``drop_oldest`` discards its oldest
+    message, ``drop_newest`` rejects the new one and ``block`` makes the
+    sender wait up to ``send_timeout`` seconds for the agent to receive.
+    """
+
+    in_process = True
+
+    def __init__(
+        self,
+        max_messages_per_agent: int = 1000,
+        max_broadcast_messages: Optional[int] = None,
+        overflow: OverflowPolicy = OverflowPolicy.DROP_OLDEST,
+        send_timeout: float = 5.0,
+    ) -> None:
+        self.messages: Dict[str, Deque[Message]] = {}  # agent_id -> messages
+        self.broadcast_messages: Deque[Message] = deque()
+        self.max_messages_per_agent = max_messages_per_agent
+        self.max_broadcast_messages = max_broadcast_messages or max_messages_per_agent
+        self.overflow = OverflowPolicy(overflow)
+        self.send_timeout = send_timeout
+
+        # Sequence number of the next broadcast and each agent's read cursor
+        self._broadcast_sequence = 0
+        self._cursors: Dict[str, int] = {}
+
+        # Expiry index: timestamps of held messages with the number of
+        # places holding them, a heap ordered by them and the held messages
+        # found to be expired
+        self._expiry: Dict[str, float] = {}
+        self._expiry_refs: Dict[str, int] = {}
+        self._expiry_heap: List[Tuple[float, str]] = []
+        self._expired: Set[str] = set()
+
+        self._space: Dict[str, asyncio.Event] = {}
+        self.dropped_messages = 0
+        self.missed_broadcasts = 0
 
     async def send_message(self, message: Message) -> bool:
         """Send a message to a specific agent."""
         try:
-            if message.recipient_id:
-                if message.recipient_id not in self.messages:
-                    self.messages[message.recipient_id] = []
-
-                # Maintain message limit per agent
-                if (
-                    len(self.messages[message.recipient_id])
-                    >= self.max_messages_per_agent
-                ):
-                    self.messages[message.recipient_id].pop(0)  # Remove oldest
-
-                self.messages[message.recipient_id].append(message)
-                logger.debug(
-                    f"Message sent from {message.sender_id} to {message.recipient_id}"
-                )
-                return True
-            return False
+            if not message.recipient_id:
+                return False
+
+            if not await self._enqueue(message.recipient_id, message):
+                return False
+            logger.debug(
+                f"Message sent from {message.sender_id} to {message.recipient_id}"
+            )
+            return True
         except Exception as e:
             logger.error(f"Failed to send message: {e}")
             return False
 
-    async def receive_messages(self, agent_id: str) -> List[Message]:
-        """Receive messages for a specific agent."""
+    async def deliver(self, message: Message, recipients: Iterable[str]) -> int:
+        """Deliver one message object to the mailboxes of the given agents."""
+        delivered = 0
         try:
-            agent_messages = self.messages.get(agent_id, []).copy()
-            broadcast_messages = self.broadcast_messages.copy()
+            for recipient_id in recipients:
+                delivered += await self._enqueue(recipient_id, message)
+        except Exception as e:
+            logger.error(f"Failed to deliver message: {e}")
+        return delivered
+
+    async def _enqueue(self, agent_id: str, message: Message) -> bool:
+        """Append a message to an agent's mailbox, applying the overflow policy."""
+        mailbox = self.messages.setdefault(agent_id, deque())
+        if len(mailbox) >= self.max_messages_per_agent:
+            if self.overflow == OverflowPolicy.DROP_NEWEST:
+                self.dropped_messages += 1
+                logger.warning(f"Mailbox of {agent_id} is full")
+                return False
+            if self.overflow == OverflowPolicy.BLOCK:
+                if not await self._wait_for_space(agent_id):
+                    self.dropped_messages += 1
+                    logger.warning(f"Mailbox of {agent_id} is full")
+                    return False
+                mailbox = self.messages.setdefault(agent_id, deque())
+            while len(mailbox) >= self.max_messages_per_agent:
+                self._forget(mailbox.popleft())  # Remove oldest
+                self.dropped_messages += 1
+
+        self._index_expiry(message)
+        mailbox.append(message)
+        return True
+
+    async def _wait_for_space(self, agent_id: str) -> bool:
+        """Wait until an agent's mailbox has room or the timeout passes."""
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.send_timeout
+        while len(self.messages.get(agent_id, ())) >= self.max_messages_per_agent:
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                return False
+            space = self._space.setdefault(agent_id, asyncio.Event())
+            space.clear()
+            try:
+                await asyncio.wait_for(space.wait(), timeout=remaining)
+            except asyncio.TimeoutError:
+                return False
+        return True
 
-            # Filter out expired messages
-            current_time = datetime.now(UTC)
-            all_messages = agent_messages + broadcast_messages
+    async def receive_messages(
+        self, agent_id: str, include_broadcasts: bool = True
+    ) -> List[Message]:
+        """Receive messages for a specific agent."""
+        try:
+            self._purge_expired(datetime.now(UTC).timestamp())
 
             valid_messages = []
-            for msg in all_messages:
-                if msg.expires_at:
-                    expire_time = datetime.fromisoformat(
-                        msg.expires_at.replace("Z", "+00:00")
-                    )
-                    if current_time < expire_time:
+            mailbox = self.messages.get(agent_id)
+            if mailbox:
+                for msg in mailbox:
+                    if msg.message_id not in self._expired:
                         valid_messages.append(msg)
-                else:
-                    valid_messages.append(msg)
-
-            # Clear received messages for this agent
-            self.messages[agent_id] = []
+                    self._forget(msg)
+
+                # Clear received messages for this agent
+                mailbox.clear()
+                if agent_id in self._space:
+                    self._space[agent_id].set()
+
+            if not include_broadcasts:
+                return valid_messages
+
+            # Read the broadcasts published since this agent's last call
+            oldest = self._broadcast_sequence - len(self.broadcast_messages)
+            cursor = self._cursors.get(agent_id, oldest)
+            if cursor < oldest:
+                self.missed_broadcasts += oldest - cursor
+                cursor = oldest
+            unread = list(
+                islice(
+                    reversed(self.broadcast_messages),
+                    self._broadcast_sequence - cursor,
+                )
+            )
+            valid_messages.extend(
+                msg for msg in reversed(unread) if msg.message_id not in self._expired
+            )
+            self._cursors[agent_id] = self._broadcast_sequence
 
             return valid_messages
         except Exception as e:
@@ -139,27 +299,507 @@ class InMemoryChannel(CommunicationChannel):
     async def broadcast_message(self, message: Message) -> bool:
         """Broadcast a message to all agents."""
         try:
-            # Maintain broadcast message limit
-            if len(self.broadcast_messages) >= self.max_messages_per_agent:
-                self.broadcast_messages.pop(0)
+            # Overwrite the oldest broadcast once the ring buffer is full
+            while len(self.broadcast_messages) >= self.max_broadcast_messages:
+                self._forget(self.broadcast_messages.popleft())
 
+            self._index_expiry(message)
             self.broadcast_messages.append(message)
+            self._broadcast_sequence += 1
             logger.debug(f"Message broadcast from {message.sender_id}")
             return True
         except Exception as e:
             logger.error(f"Failed to broadcast message: {e}")
             return False
 
+    def _index_expiry(self, message: Message) -> None:
+        """Add a message's expiry time to the expiry index."""
+        if message.message_id in self._expiry_refs:
+            self._expiry_refs[message.message_id] += 1
+            return
+        timestamp = _parse_expiry(message)
+        if timestamp is None:
+            return
+        self._expiry[message.message_id] = timestamp
+        self._expiry_refs[message.message_id] = 1
+        heapq.heappush(self._expiry_heap, (timestamp, message.message_id))
+
+    def _purge_expired(self, now: float) -> None:
+        """Mark held messages whose expiry time has passed as expired."""
+        heap = self._expiry_heap
+        while heap and heap[0][0] <= now:
+            timestamp, message_id = heapq.heappop(heap)
+            if self._expiry.get(message_id) == timestamp:
+                self._expired.add(message_id)
+
+        # Drop index entries of messages no longer held
+        if len(heap) > 2 * len(self._expiry) + 64:
+            self._expiry_heap = [
+                entry for entry in heap if self._expiry.get(entry[1]) == entry[0]
+            ]
+            heapq.heapify(self._expiry_heap)
+
+    def _forget(self, message: Message) -> None:
+        """Release one hold of a message in the expiry index."""
+        refs = self._expiry_refs.get(message.message_id)
+        if refs is None:
+            return
+        if refs > 1:
+            self._expiry_refs[message.message_id] = refs - 1
+            return
+        del self._expiry_refs[message.message_id]
+        del self._expiry[message.message_id]
+        self._expired.discard(message.message_id)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get channel statistics."""
+        return {
+            "agents_with_messages": sum(
+                1 for mailbox in self.messages.values() if mailbox
+            ),
+            "total_agent_messages": sum(
+                len(mailbox) for mailbox in self.messages.values()
+            ),
+            "broadcast_messages": len(self.broadcast_messages),
+            "dropped_messages": self.dropped_messages,
+            "missed_broadcasts": self.missed_broadcasts,
+        }
+
+
+# Message classes by message type, used to rebuild messages read from Redis
+_MESSAGE_CLASSES: Dict[str, Type[Message]] = {
+    "insight": InsightMessage,
+    "coordination": CoordinationMessage,
+    "notification": NotificationMessage,
+}
+
+
+def _text(value: Any) -> str:
+    """Decode a Redis reply value to text."""
+    return value.decode("utf-8") if isinstance(value, bytes) else str(value)
+
+
+class RedisStreamChannel(CommunicationChannel):
+    """Communication channel on Redis Streams, shared across processes.
+
+    Direct messages are appended to the recipient's stream
+    ``{prefix}inbox:{recipient_id}`` and broadcasts to ``{prefix}broadcast``,
+    each trimmed to about ``max_len`` entries. Agents read through a
+    consumer group named after their role, so agents of one role running in
+    different processes share that role's messages while every role gets
+    every broadcast. A recipient ID may name an agent or a role; by default
+    every agent is its own role.
+
+    Delivered messages stay pending in the group until acknowledged, on
+    receipt with ``auto_ack`` or through ``ack_messages`` once processed.
+    Entries pending for longer than ``claim_idle`` seconds, such as those
+    held by a crashed consumer, are reclaimed by the next receive of the
+    role.
+    """
+
+    def __init__(
+        self,
+        client: Any,
+        key_prefix: str = "agentic_comm:",
+        role_for: Optional[Callable[[str], str]] = None,
+        max_len: int = 10000,
+        batch_size: int = 100,
+        block: Optional[float] = None,
+        claim_idle: float = 60.0,
+        auto_ack: bool = True,
+    ) -> None:
+        """Initialize the Redis Streams channel.
+
+        Args:
+            client: Async Redis client (``redis.asyncio.Redis``)
+            key_prefix: Prefix for every stream key
+            role_for: Maps an agent ID to its role (consumer group)
+            max_len: Approximate maximum entries kept per stream
+            batch_size: Maximum entries read per stream and call
+            block: Seconds a receive waits for new messages (None to not wait)
+            claim_idle: Seconds before another consumer reclaims an entry
+            auto_ack: Acknowledge messages as soon as they are received
+        """
+        self.client = client
+        self.key_prefix = key_prefix
+        self.role_for = role_for or (lambda agent_id: agent_id)
+        self.max_len = max_len
+        self.batch_size = batch_size
+        self.block = block
+        self.claim_idle = claim_idle
+        self.auto_ack = auto_ack
+
+        self._groups: Set[Tuple[str, str]] = set()
+        # message_id -> (stream, group, entry_id) of unacknowledged messages
+        self._unacked: Dict[str, Tuple[str, str, str]] = {}
+
+    @classmethod
+    async def from_connection(
+        cls, connection: Optional[Any] = None, **kwargs: Any
+    ) -> "RedisStreamChannel":
+        """Create a channel on a Redis connection, connecting it if needed.
+
+        Args:
+            connection: RedisConnectionManager (a new one when omitted)
+            **kwargs: Channel options
+
+        Returns:
+            Redis Streams channel
+
+        Raises:
+            ConnectionError: If Redis is not reachable
+        """
+        from agentic_workflow.memory.connections.redis_connection import (
+            RedisConnectionManager,
+        )
+
+        connection = connection or RedisConnectionManager("redis_communication")
+        if not await connection.ensure_connected():
+            raise ConnectionError("Redis is not available for communication")
+        return cls(connection.client, **kwargs)
+
+    def _stream(self, name: str) -> str:
+        """Build a stream key."""
+        return f"{self.key_prefix}{name}"
+
+    async def _append(self, stream: str, message: Message) -> bool:
+        """Append a message to a stream."""
+        try:
+            await self.client.xadd(
+                stream,
+                {
+                    "message_type": message.message_type,
+                    "data": message.model_dump_json(),
+                },
+                maxlen=self.max_len,
+                approximate=True,
+            )
+            return True
+        except Exception as e:
+            logger.error(f"Failed to append message to {stream}: {e}")
+            return False
+
+    async def send_message(self, message: Message) -> bool:
+        """Send a message to a specific agent or role."""
+        if not message.recipient_id:
+            return False
+        sent = await self._append(
+            self._stream(f"inbox:{message.recipient_id}"), message
+        )
+        if sent:
+            logger.debug(
+                f"Message sent from {message.sender_id} to {message.recipient_id}"
+            )
+        return sent
+
+    async def broadcast_message(self, message: Message) -> bool:
+        """Broadcast a message to all agents."""
+        sent = await self._append(self._stream("broadcast"), message)
+        if sent:
+            logger.debug(f"Message broadcast from {message.sender_id}")
+        return sent
+
+    async def _ensure_group(self, stream: str, group: str) -> None:
+        """Create a consumer group reading a stream from its start."""
+        if (stream, group) in self._groups:
+            return
+        try:
+            await self.client.xgroup_create(stream, group, id="0", mkstream=True)
+        except Exception as e:
+            if "BUSYGROUP" not in str(e):
+                raise
+        self._groups.add((stream, group))
+
+    async def receive_messages(
+        self, agent_id: str, include_broadcasts: bool = True
+    ) -> List[Message]:
+        """Receive messages for a specific agent."""
+        try:
+            role = self.role_for(agent_id)
+            streams = [self._stream(f"inbox:{agent_id}")]
+            if role != agent_id:
+                streams.append(self._stream(f"inbox:{role}"))
+            if include_broadcasts:
+                streams.append(self._stream("broadcast"))
+            for stream in streams:
+                await self._ensure_group(stream, role)
+
+            # Take over entries left pending by consumers that went away
+            entries: List[Tuple[str, str, Any]] = []
+            for stream in streams:
+                claimed = await self.client.xautoclaim(
+                    stream,
+                    role,
+                    agent_id,
+                    min_idle_time=int(self.claim_idle * 1000),
+                    start_id="0-0",
+                    count=self.batch_size,
+                )
+                entries.extend(
+                    (stream, _text(entry_id), fields)
+                    for entry_id, fields in claimed[1]
+                    if fields
+                )
+
+            block = None
+            if not entries and self.block is not None:
+                block = int(self.block * 1000)
+            response = await self.client.xreadgroup(
+                role,
+                agent_id,
+                {stream: ">" for stream in streams},
+                count=self.batch_size,
+                block=block,
+            )
+            if isinstance(response, dict):
+                response = response.items()
+            for stream, stream_entries in response or []:
+                entries.extend(
+                    (_text(stream), _text(entry_id), fields)
+                    for entry_id, fields in stream_entries
+                )
+
+            return await self._deliver(role, entries)
+        except Exception as e:
+            logger.error(f"Failed to receive messages for {agent_id}: {e}")
+            return []
+
+    async def _deliver(
+        self, group: str, entries: List[Tuple[str, str, Any]]
+    ) -> List[Message]:
+        """Decode stream entries, acknowledging those not left to the caller."""
+        now = datetime.now(UTC).timestamp()
+        messages = []
+        acks: Dict[str, List[str]] = {}
+        for stream, entry_id, fields in entries:
+            fields = {_text(key): _text(value) for key, value in fields.items()}
+            try:
+                message_class = _MESSAGE_CLASSES.get(fields["message_type"], Message)
+                message = message_class.model_validate_json(fields["data"])
+            except Exception as e:
+                logger.warning(f"Dropping unreadable entry {entry_id} of {stream}: {e}")
+                acks.setdefault(stream, []).append(entry_id)
+                continue
+
+            expires = _parse_expiry(message)
+            if expires is not None and expires <= now:
+                acks.setdefault(stream, []).append(entry_id)
+                continue
+
+            messages.append(message)
+            if self.auto_ack:
+                acks.setdefault(stream, []).append(entry_id)
+            else:
+                self._unacked[message.message_id] = (stream, group, entry_id)
+
+        for stream, entry_ids in acks.items():
+            await self.client.xack(stream, group, *entry_ids)
+        return messages
+
+    async def ack_messages(self, messages: List[Message]) -> int:
+        """Acknowledge processed messages so they are not delivered again.
+
+        Args:
+            messages: Messages returned by ``receive_messages``
+
+        Returns:
+            Number of messages acknowledged
+        """
+        pending: Dict[Tuple[str, str], List[str]] = {}
+        for message in messages:
+            entry = self._unacked.pop(message.message_id, None)
+            if entry is not None:
+                stream, group, entry_id = entry
+                pending.setdefault((stream, group), []).append(entry_id)
+
+        acknowledged = 0
+        for (stream, group), entry_ids in pending.items():
+            try:
+                acknowledged += await self.client.xack(stream, group, *entry_ids)
+            except Exception as e:
+                logger.error(f"Failed to acknowledge messages on {stream}: {e}")
+        return acknowledged
+
+
+@lru_cache(maxsize=1024)
+def compile_topic_pattern(pattern: str) -> Pattern[str]:
+    """Compile a topic pattern to a regular expression.
+
+    Topics are dot-separated. ``*`` matches exactly one segment and a final
+    ``#`` matches any number of trailing segments, including none.
+
+    Args:
+        pattern: Topic pattern, e.g. ``"tasks.*.review"`` or ``"tasks.#"``
+
+    Returns:
+        Compiled expression matching whole topics
+    """
+    segments = pattern.split(".")
+    tail = ""
+    if segments[-1] == "#":
+        segments.pop()
+        tail = r"(?:\..+)?" if segments else ".*"
+    body = r"\.".join(
+        "[^.]+" if segment == "*" else re.escape(segment) for segment in segments
+    )
+    return re.compile(body + tail)
+
+
+class MessageRouter:
+    """Routing table deciding at send time which agents get a message.
+
+    Routes are keyed by message type and then by topic pattern, so routing
+    a message only visits the patterns registered for its type. A route
+    without a pattern matches every topic; messages without a topic only
+    match such routes. Agents without any route are not routed and keep
+    receiving every message.
+    """
+
+    def __init__(self) -> None:
+        # message_type -> topic pattern (None for any) -> agent IDs
+        self._routes: Dict[str, Dict[Optional[str], Set[str]]] = {}
+        # agent_id -> (message_type, topic pattern) routes of the agent
+        self._agent_routes: Dict[str, Set[Tuple[str, Optional[str]]]] = {}
+
+        # Statistics
+        self.routed = 0
+        self.deliveries = 0
+        self.filtered = 0
+
+    def add_routes(
+        self,
+        agent_id: str,
+        message_types: Iterable[str],
+        topics: Optional[Iterable[str]] = None,
+    ) -> None:
+        """Route messages of the given types, and topics if any, to an agent.
+
+        Args:
+            agent_id: Agent ID
+            message_types: Message types
+            topics: Topic patterns (None for any topic)
+        """
+        patterns: List[Optional[str]] = list(topics) if topics else [None]
+        for pattern in patterns:
+            if pattern is not None:
+                compile_topic_pattern(pattern)
+        routes = self._agent_routes.setdefault(agent_id, set())
+        for message_type in message_types:
+            by_pattern = self._routes.setdefault(message_type, {})
+            for pattern in patterns:
+                by_pattern.setdefault(pattern, set()).add(agent_id)
+                routes.add((message_type, pattern))
+
+    def remove_agent(self, agent_id: str) -> None:
+        """Remove every route of an agent.
+
+        Args:
+            agent_id: Agent ID
+        """
+        for message_type, pattern in self._agent_routes.pop(agent_id, set()):
+            by_pattern = self._routes[message_type]
+            by_pattern[pattern].discard(agent_id)
+            if not by_pattern[pattern]:
+                del by_pattern[pattern]
+            if not by_pattern:
+                del self._routes[message_type]
+
+    def is_routed(self, agent_id: str) -> bool:
+        """Whether messages to an agent are routed."""
+        return agent_id in self._agent_routes
+
+    @staticmethod
+    def _matches(pattern: Optional[str], topic: Optional[str]) -> bool:
+        """Check a message topic against a route's topic pattern."""
+        if pattern is None:
+            return True
+        return topic is not None and bool(
+            compile_topic_pattern(pattern).fullmatch(topic)
+        )
+
+    def route(self, message: Message) -> Set[str]:
+        """Get the routed agents a broadcast message should go to.
+
+        Args:
+            message: Message to route
+
+        Returns:
+            IDs of the matching agents
+        """
+        recipients: Set[str] = set()
+        for pattern, agents in self._routes.get(message.message_type, {}).items():
+            if self._matches(pattern, message.topic):
+                recipients |= agents
+        self.routed += 1
+        self.deliveries += len(recipients)
+        return recipients
+
+    def accepts(self, agent_id: str, message: Message) -> bool:
+        """Check whether a direct message should be delivered to an agent.
+
+        Args:
+            agent_id: Recipient agent ID
+            message: Message to deliver
+
+        Returns:
+            True unless the agent is routed and no route matches
+        """
+        routes = self._agent_routes.get(agent_id)
+        if routes is None:
+            return True
+        accepted = any(
+            message_type == message.message_type
+            and self._matches(pattern, message.topic)
+            for message_type, pattern in routes
+        )
+        if not accepted:
+            self.filtered += 1
+        return accepted
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get routing statistics."""
+        return {
+            "routed_agents": len(self._agent_routes),
+            "routes": {
+                message_type: len(by_pattern)
+                for message_type, by_pattern in self._routes.items()
+            },
+            "routed_messages": self.routed,
+            "deliveries": self.deliveries,
+            "filtered_messages": self.filtered,
+        }
+
 
 class CommunicationManager:
-    """Central manager for agent communication and coordination."""
+    """Central manager for agent communication and coordination.
+
+    Subscriptions feed a routing table that decides delivery at send time:
+    broadcasts are fanned out only to the mailboxes of subscribed agents
+    whose routes match, and direct messages that match none of the
+    recipient's routes are dropped. Agents without subscriptions receive
+    every message.
 
-    def __init__(self, memory_manager: Optional[Any] = None) -> None:
+    On channels shared with other processes (not ``in_process``) the
+    sender cannot see every agent's routes, so subscribed agents read the
+    broadcast stream and messages are filtered by their routes on receipt.
+    """
+
+    def __init__(
+        self,
+        memory_manager: Optional[Any] = None,
+        history: Optional[MessageHistory] = None,
+    ) -> None:
         self.memory_manager = memory_manager
         self.channels: Dict[str, CommunicationChannel] = {}
         self.subscriptions: Dict[str, Set[str]] = {}  # agent_id -> message_types
+        self.router = MessageRouter()
         self.logger = get_logger(__name__)
 
+        # Message history is persisted through the memory manager, if any
+        if history is None and memory_manager is not None:
+            history = MessageHistory(memory_manager)
+        self.history = history
+
         # Initialize default in-memory channel
         self.add_channel("default", InMemoryChannel())
 
@@ -168,38 +808,54 @@ class CommunicationManager:
         self.channels[channel_name] = channel
         self.logger.info(f"Added communication channel: {channel_name}")
 
-    def subscribe_agent(self, agent_id: str, message_types: List[str]) -> None:
-        """Subscribe an agent to specific message types."""
+    def subscribe_agent(
+        self,
+        agent_id: str,
+        message_types: List[str],
+        topics: Optional[List[str]] = None,
+    ) -> None:
+        """Subscribe an agent to message types, optionally on some topics.
+
+        Topic patterns follow ``compile_topic_pattern``.
+        """
         if agent_id not in self.subscriptions:
             self.subscriptions[agent_id] = set()
         self.subscriptions[agent_id].update(message_types)
+        self.router.add_routes(agent_id, message_types, topics)
         self.logger.debug(f"Agent {agent_id} subscribed to: {message_types}")
 
+    def unsubscribe_agent(self, agent_id: str) -> None:
+        """Remove every subscription of an agent."""
+        self.subscriptions.pop(agent_id, None)
+        self.router.remove_agent(agent_id)
+
     async def send_message(
         self, message: Message, channel_name: str = "default"
     ) -> bool:
-        """Send a message through a specific channel."""
+        """Send a message through a specific channel.
+
+        Returns:
+            True if the message was sent; False for an unknown channel, a
+            failed send, or a direct message dropped because it matches
+            none of the recipient's routes
+        """
         if channel_name not in self.channels:
             self.logger.error(f"Unknown channel: {channel_name}")
             return False
 
+        if message.recipient_id and not self.router.accepts(
+            message.recipient_id, message
+        ):
+            self.logger.debug(
+                f"Message {message.message_id} not routed to {message.recipient_id}"
+            )
+            return False
+
         success = await self.channels[channel_name].send_message(message)
 
-        # Store in memory for persistence if available
-        if success and self.memory_manager:
-            try:
-                self.memory_manager.store(
-                    key=f"message_{message.message_id}",
-                    data=message.model_dump(),
-                    memory_type=MemoryType.SHORT_TERM,
-                    metadata={
-                        "sender_id": message.sender_id,
-                        "recipient_id": message.recipient_id,
-                        "message_type": message.message_type,
-                    },
-                )
-            except Exception as e:
-                self.logger.warning(f"Failed to store message in memory: {e}")
+        # Queue for persistence; written to memory in the background
+        if success and self.history is not None:
+            self.history.record(message)
 
         return success
 
@@ -211,14 +867,17 @@ class CommunicationManager:
             self.logger.error(f"Unknown channel: {channel_name}")
             return []
 
-        messages = await self.channels[channel_name].receive_messages(agent_id)
+        channel = self.channels[channel_name]
+        if not self.router.is_routed(agent_id):
+            return await channel.receive_messages(agent_id)
 
-        # Filter messages based on subscriptions
-        if agent_id in self.subscriptions:
-            subscribed_types = self.subscriptions[agent_id]
-            messages = [msg for msg in messages if msg.message_type in subscribed_types]
+        # Broadcasts for subscribed agents were routed to their mailbox
+        if channel.in_process:
+            return await channel.receive_messages(agent_id, include_broadcasts=False)
 
-        return messages
+        # Other processes may have sent without knowing this agent's routes
+        messages = await channel.receive_messages(agent_id)
+        return [msg for msg in messages if self.router.accepts(agent_id, msg)]
 
     async def broadcast_insight(
         self, insight_data: Dict[str, Any], channel_name: str = "default"
@@ -242,7 +901,17 @@ class CommunicationManager:
             self.logger.error(f"Unknown channel: {channel_name}")
             return False
 
-        return await self.channels[channel_name].broadcast_message(message)
+        channel = self.channels[channel_name]
+        # Agents without subscriptions read the channel's broadcasts
+        success = await channel.broadcast_message(message)
+        if channel.in_process:
+            recipients = self.router.route(message)
+            if recipients:
+                await channel.deliver(message, recipients)
+
+        if success and self.history is not None:
+            self.history.record(message)
+        return success
 
     async def send_coordination_request(
         self,
@@ -294,30 +963,38 @@ class CommunicationManager:
         else:
             return await self.broadcast_message(notification_message)
 
-    def get_message_history(
-        self, agent_id: str, limit: int = 50
-    ) -> List[Dict[str, Any]]:
-        """Retrieve message history for an agent from memory."""
-        if not self.memory_manager:
-            return []
+    async def get_message_history(
+        self,
+        agent_id: str,
+        limit: int = 50,
+        cursor: Optional[str] = None,
+        peer_id: Optional[str] = None,
+    ) -> MessageHistoryPage:
+        """Retrieve a page of an agent's message history, newest first.
+
+        Pass the returned ``next_cursor`` to get the following page.
+        """
+        if self.history is None:
+            return MessageHistoryPage(messages=[])
 
         try:
-            results = self.memory_manager.search(
-                query=f"sender_id:{agent_id} OR recipient_id:{agent_id}",
-                memory_type=MemoryType.SHORT_TERM,
-                limit=limit,
-                filters={"type": "message"},
-            )
-            return results if isinstance(results, list) else []
+            return await self.history.query(agent_id, peer_id, limit, cursor)
         except Exception as e:
             self.logger.error(f"Failed to retrieve message history: {e}")
-            return []
+            return MessageHistoryPage(messages=[])
+
+    async def close(self) -> None:
+        """Write any buffered message history to memory."""
+        if self.history is not None:
+            await self.history.close()
 
     def get_communication_stats(self) -> Dict[str, Any]:
         """Get communication statistics."""
         stats = {
             "channels": list(self.channels.keys()),
+            "routing": self.router.get_stats(),
             "subscribed_agents": len(self.subscriptions),
+            "history": self.history.get_stats() if self.history else None,
             "subscription_details": {
                 agent_id: list(message_types)
                 for agent_id, message_types in self.subscriptions.items()
@@ -327,13 +1004,7 @@ class CommunicationManager:
         # Add channel-specific stats for in-memory channels
         for channel_name, channel in self.channels.items():
             if isinstance(channel, InMemoryChannel):
-                stats[f"{channel_name}_channel_stats"] = {
-                    "agents_with_messages": len(channel.messages),
-                    "total_agent_messages": sum(
-                        len(msgs) for msgs in channel.messages.values()
-                    ),
-                    "broadcast_messages": len(channel.broadcast_messages),
-                }
+                stats[f"{channel_name}_channel_stats"] = channel.get_stats()
 
         return stats
 
@@ -63,6 +63,12 @@ class MonitoringConfig(BaseModel):
     health_check_interval: int = Field(default=30)  # seconds
     metrics_collection_interval: int = Field(default=10)  # seconds
 
+    # Component health gating for workflow steps
+    health_cache_ttl: float = Field(default=5.0, ge=0.0)  # seconds
+    health_probe_min_interval: float = Field(default=1.0, ge=0.0)  # seconds
+    circuit_failure_threshold: int = Field(default=3, gt=0)
+    circuit_recovery_timeout: float = Field(default=30.0, ge=0.0)  # seconds
+
 
 class SecurityConfig(BaseModel):
     """Security configuration."""
@@ -95,7 +101,24 @@ class Config(BaseModel):
     # Additional settings
     worker_threads: int = Field(default=4, gt=0)
     max_concurrent_workflows: int = Field(default=10, gt=0)
+    max_concurrent_steps: int = Field(default=8, gt=0)  # per workflow execution
     default_timeout: int = Field(default=300, gt=0)  # seconds
+    job_queue_size: int = Field(default=1000, gt=0)  # pending background jobs
+    job_workers: int = Field(default=4, gt=0)
+    event_queue_size: int = Field(default=1000, gt=0)  # pending events per handler
+    event_handler_timeout: float = Field(default=5.0, gt=0)  # seconds
+    event_overflow_policy: str = Field(default="drop_oldest")
+    event_history_size: int = Field(default=10000, gt=0)  # events kept in memory
+    event_history_max_age: Optional[float] = Field(default=None, gt=0)  # seconds
+    event_spill_dir: Optional[str] = Field(default=None)  # evicted events on disk
+    event_spill_segment_bytes: int = Field(default=64 * 1024 * 1024, gt=0)
+    plan_cache_size: int = Field(default=256, ge=0)  # compiled workflow plans
+
+    # Adaptive step timeouts (p95 latency per component action x multiplier)
+    adaptive_timeouts: bool = Field(default=False)
+    adaptive_timeout_multiplier: float = Field(default=3.0, gt=0)
+    adaptive_timeout_min_samples: int = Field(default=20, gt=0)
+    adaptive_timeout_floor: float = Field(default=1.0, gt=0)  # seconds
 
     model_config = ConfigDict(  # type: ignore[typeddict-unknown-key]
         env_prefix="AGENTIC_",
@@ -2,21 +2,32 @@
 
 import asyncio
 import uuid
+from collections import deque
 from contextlib import asynccontextmanager
 from datetime import UTC, datetime
-from typing import Any, Dict, List, Optional, Set
+from typing import Any, Dict, List, Optional, Set, cast
 
+from .budget import LatencyTracker, add_usage, step_usage
 from .config import Config, get_config
+from .event_dispatch import EventDispatcher, OverflowPolicy
+from .exceptions import ResourceLimitError
+from .health import ComponentHealthGate
 from .interfaces import (
     Component,
     ComponentStatus,
     EventHandler,
+    ResourceBudget,
+    Service,
     ServiceResponse,
     WorkflowDefinition,
     WorkflowExecution,
     WorkflowStep,
 )
 from .logging_config import get_logger, log_error, log_performance
+from .plan import ExecutionPlan, PlanCache
+from .state_store import ExecutionStateStore
+from .step_cache import StepResultCache
+from .streaming import StepStream, assemble_chunks
 
 logger = get_logger(__name__)
 
@@ -28,6 +39,8 @@ class ComponentRegistry:
         """Initialize component registry."""
         self._components: Dict[str, Component] = {}
         self._dependencies: Dict[str, Set[str]] = {}
+        # Bumped on every change so compiled plans can detect stale handles
+        self.generation = 0
 
     def register(self, component: Component) -> None:
         """Register a component.
@@ -43,6 +56,7 @@ class ComponentRegistry:
 
         self._components[component.name] = component
         self._dependencies[component.name] = set(component.get_dependencies())
+        self.generation += 1
 
         logger.info(f"Registered component: {component.name}")
 
@@ -105,18 +119,49 @@ class ComponentRegistry:
 class WorkflowEngine:
     """Main workflow engine that orchestrates system components."""
 
-    def __init__(self, config: Optional[Config] = None):
+    def __init__(
+        self,
+        config: Optional[Config] = None,
+        state_store: Optional[ExecutionStateStore] = None,
+        step_cache: Optional[StepResultCache] = None,
+    ):
         """Initialize workflow engine.
 
         Args:
         config: Optional configuration override
+        state_store: Optional durable store for checkpointing executions
+        step_cache: Optional cache memoizing results of cacheable steps
         """
         self.config = config or get_config()
+        self.state_store = state_store
+        self.step_cache = step_cache
         self.components = ComponentRegistry()
         self.event_handlers: List[EventHandler] = []
+        self.events = EventDispatcher(
+            queue_size=self.config.event_queue_size,
+            timeout=self.config.event_handler_timeout,
+            overflow=OverflowPolicy(self.config.event_overflow_policy),
+        )
         self.running_workflows: Dict[str, WorkflowExecution] = {}
+        self.plans = PlanCache(self.config.plan_cache_size)
+        self.latency = LatencyTracker(
+            min_samples=self.config.adaptive_timeout_min_samples,
+            multiplier=self.config.adaptive_timeout_multiplier,
+            floor=self.config.adaptive_timeout_floor,
+            ceiling=self.config.default_timeout,
+        )
         self._shutdown_event = asyncio.Event()
 
+        # Health gate shared by every workflow step on this engine
+        monitoring = self.config.monitoring
+        self.health_gate = ComponentHealthGate(
+            ttl=monitoring.health_cache_ttl,
+            min_probe_interval=monitoring.health_probe_min_interval,
+            failure_threshold=monitoring.circuit_failure_threshold,
+            recovery_timeout=monitoring.circuit_recovery_timeout,
+            refresh_interval=monitoring.health_check_interval,
+        )
+
         logger.info("Workflow engine initialized")
 
     def register_component(self, component: Component) -> None:
@@ -127,15 +172,42 @@ class WorkflowEngine:
         """
         self.components.register(component)
 
-    def register_event_handler(self, handler: EventHandler) -> None:
+    def register_event_handler(
+        self,
+        handler: EventHandler,
+        queue_size: Optional[int] = None,
+        timeout: Optional[float] = None,
+        overflow: Optional[OverflowPolicy] = None,
+    ) -> None:
         """Register an event handler.
 
+        Events are delivered to the handler in the background; the optional
+        arguments override the engine's dispatch defaults for this handler.
+
         Args:
         handler: Event handler to register
+        queue_size: Maximum pending events for this handler
+        timeout: Seconds allowed per delivery to this handler
+        overflow: Policy when this handler's queue is full
         """
         self.event_handlers.append(handler)
+        self.events.register(handler, queue_size, timeout, overflow)
         logger.info(f"Registered event handler: {handler.__class__.__name__}")
 
+    def compile_workflow(self, workflow: WorkflowDefinition) -> ExecutionPlan:
+        """Get the validated execution plan for a workflow.
+
+        Plans are cached by workflow ID and version and rebuilt when
+        components are registered.
+
+        Args:
+        workflow: Workflow definition
+
+        Returns:
+        Compiled execution plan
+        """
+        return self.plans.get_plan(workflow, self.components)
+
     async def start(self) -> None:
         """Start the workflow engine and all components."""
         logger.info("Starting workflow engine...")
@@ -151,6 +223,9 @@ class WorkflowEngine:
                 if component:
                     await self._start_component(component)
 
+            # Keep cached component health fresh between steps
+            self.health_gate.start(lambda: self.components.get_all().values())
+
             logger.info("Workflow engine started successfully")
 
         except Exception as e:
@@ -164,6 +239,8 @@ class WorkflowEngine:
 
         # Signal shutdown
         self._shutdown_event.set()
+        await self.health_gate.stop()
+        await self.events.stop(timeout=self.config.event_handler_timeout)
 
         # Stop all components in reverse order
         startup_order = self.components.get_startup_order()
@@ -212,27 +289,62 @@ class WorkflowEngine:
         except Exception as e:
             log_error(e, {"component": component.name, "operation": "stop"})
 
-    async def execute_workflow(self, workflow: WorkflowDefinition) -> WorkflowExecution:
+    async def execute_workflow(
+        self, workflow: WorkflowDefinition, execution_id: Optional[str] = None
+    ) -> WorkflowExecution:
         """Execute a workflow.
 
+        Steps run as soon as all of their dependencies have completed, up to
+        ``config.max_concurrent_steps`` at a time. When a step fails or is
+        cancelled, the steps depending on it are cancelled; independent
+        branches keep running and the workflow is marked failed once they
+        finish.
+
+        With a state store configured, every completed step is checkpointed
+        with its output. Passing the ID of a stored execution resumes it:
+        checkpointed steps are skipped and only the remaining steps run.
+
         Args:
             workflow: Workflow definition to execute
+            execution_id: ID of an execution to resume, or the ID to give
+                a new execution
 
         Returns:
             Workflow execution result
+
+        Raises:
+            ValueError: If the stored execution belongs to another workflow
         """
-        execution = WorkflowExecution(
-            id=str(uuid.uuid4()),
-            workflow_id=workflow.id,
-            status="running",
-            current_step=None,
-            start_time=datetime.now(UTC).isoformat(),
-            end_time=None,
-            result=None,
-            error=None,
-        )
+        execution = await self._load_execution(execution_id)
+        if execution is not None:
+            if execution.workflow_id != workflow.id:
+                raise ValueError(
+                    f"Execution {execution.id} belongs to workflow "
+                    f"{execution.workflow_id}, not {workflow.id}"
+                )
+            execution.status = "running"
+            execution.failed_steps = []
+            execution.cancelled_steps = []
+            execution.end_time = None
+            execution.error = None
+            logger.info(
+                f"Resuming execution {execution.id} with "
+                f"{len(execution.completed_steps)} checkpointed steps"
+            )
+        else:
+            execution = WorkflowExecution(
+                id=execution_id or str(uuid.uuid4()),
+                workflow_id=workflow.id,
+                status="running",
+                current_step=None,
+                start_time=datetime.now(UTC).isoformat(),
+                end_time=None,
+                result=None,
+                error=None,
+            )
 
         self.running_workflows[execution.id] = execution
+        await self._checkpoint_execution(execution)
 
         logger.info_with_data(  # type: ignore[attr-defined]
             f"Starting workflow execution: {workflow.name}",
@@ -243,9 +355,8 @@ class WorkflowEngine:
         try:
             start_time_perf = asyncio.get_event_loop().time()
 
-            # Execute workflow steps
-            for step in workflow.steps:
-                await self._execute_step(step, execution)
+            # Execute workflow steps in dependency order
+            await self._run_steps(workflow, execution)
 
             # Mark as completed
             execution.status = "completed"
@@ -267,6 +378,12 @@ class WorkflowEngine:
                 duration_seconds=duration,
             )
 
+        except asyncio.CancelledError:
+            execution.status = "cancelled"
+            execution.error = "Workflow execution cancelled"
+            execution.end_time = datetime.now(UTC).isoformat()
+            raise
+
         except Exception as e:
             execution.status = "failed"
             execution.error = str(e)
@@ -284,17 +401,234 @@ class WorkflowEngine:
         finally:
             # Remove from running workflows
             self.running_workflows.pop(execution.id, None)
+            await self._checkpoint_execution(execution)
 
         return execution
 
+    async def _load_execution(
+        self, execution_id: Optional[str]
+    ) -> Optional[WorkflowExecution]:
+        """Load a stored execution to resume, if there is one."""
+        if execution_id is None or self.state_store is None:
+            return None
+        try:
+            return await self.state_store.load_execution(execution_id)
+        except Exception as e:
+            log_error(e, {"execution_id": execution_id, "operation": "load"})
+            return None
+
+    async def _checkpoint_execution(self, execution: WorkflowExecution) -> None:
+        """Persist the execution header."""
+        if self.state_store is None:
+            return
+        try:
+            await self.state_store.save_execution(execution)
+        except Exception as e:
+            log_error(e, {"execution_id": execution.id, "operation": "checkpoint"})
+
+    async def _checkpoint_step(
+        self, execution: WorkflowExecution, step_id: str
+    ) -> None:
+        """Persist a completed step and its output."""
+        if self.state_store is None:
+            return
+        try:
+            await self.state_store.save_step(
+                execution.id,
+                {
+                    "step_id": step_id,
+                    "output": execution.step_outputs.get(step_id),
+                    "started_at": execution.step_start_times.get(step_id),
+                    "completed_at": execution.step_end_times.get(step_id),
+                },
+            )
+        except Exception as e:
+            log_error(
+                e,
+                {
+                    "execution_id": execution.id,
+                    "step_id": step_id,
+                    "operation": "checkpoint",
+                },
+            )
+
+    async def _run_steps(
+        self, workflow: WorkflowDefinition, execution: WorkflowExecution
+    ) -> None:
+        """Run workflow steps concurrently as their dependencies complete.
+
+        Args:
+            workflow: Workflow definition to execute
+            execution: Current workflow execution
+
+        Raises:
+            RuntimeError: If the workflow is invalid or any step fails
+            asyncio.CancelledError: If the execution is cancelled
+        """
+        plan = self.compile_workflow(workflow)
+        if plan.errors:
+            for error in plan.errors:
+                if error.step_id and error.step_id not in execution.failed_steps:
+                    execution.failed_steps.append(error.step_id)
+            execution.error = plan.errors[0].message
+            raise RuntimeError(plan.errors[0].message)
+
+        # Steps checkpointed by an earlier attempt are already satisfied
+        done = plan.mask(execution.completed_steps)
+        ready = deque(
+            position
+            for position in range(len(plan.steps))
+            if not done >> position & 1 and plan.is_ready(position, done)
+        )
+        # Steps that were queued or launched, so none is scheduled twice
+        launched = 0
+        scheduled = done
+        for position in ready:
+            scheduled |= 1 << position
+
+        streams = {
+            step.id: (
+                StepStream.completed(step.id, execution.step_outputs.get(step.id))
+                if done >> position & 1
+                else StepStream(step.id)
+            )
+            for position, step in enumerate(plan.steps)
+        }
+        running: Dict["asyncio.Task[None]", int] = {}
+        first_error: Optional[BaseException] = None
+
+        # The execution budget is checked as steps finish; its wall time
+        # also bounds how long to wait for running steps
+        budget = workflow.budget
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        deadline = None
+        if budget is not None and budget.wall_time is not None:
+            deadline = started + budget.wall_time
+
+        try:
+            while ready or running:
+                while ready and len(running) < self.config.max_concurrent_steps:
+                    position = ready.popleft()
+                    step = plan.steps[position]
+                    execution.step_start_times[step.id] = datetime.now(UTC).isoformat()
+                    task = asyncio.create_task(
+                        self._execute_step(
+                            step, execution, plan.components[position], streams
+                        )
+                    )
+                    running[task] = position
+                    launched |= 1 << position
+
+                    # Steps reading input streams start with their producers
+                    for child in plan.dependents[position]:
+                        if (
+                            plan.steps[child].stream_inputs
+                            and not scheduled >> child & 1
+                            and plan.is_ready(child, done | launched)
+                        ):
+                            ready.append(child)
+                            scheduled |= 1 << child
+
+                finished, _ = await asyncio.wait(
+                    running,
+                    timeout=(
+                        None if deadline is None else max(0, deadline - loop.time())
+                    ),
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
+                for task in finished:
+                    position = running.pop(task)
+                    step = plan.steps[position]
+                    execution.step_end_times[step.id] = datetime.now(UTC).isoformat()
+
+                    if task.cancelled():
+                        execution.cancelled_steps.append(step.id)
+                        first_error = first_error or RuntimeError(
+                            f"Step cancelled: {step.name}"
+                        )
+                        streams[step.id].close(first_error)
+                    elif task.exception() is not None:
+                        if step.id not in execution.failed_steps:
+                            execution.failed_steps.append(step.id)
+                        first_error = first_error or task.exception()
+                        streams[step.id].close(task.exception())
+                    else:
+                        streams[step.id].finish(execution.step_outputs.get(step.id))
+                        await self._checkpoint_step(execution, step.id)
+                        done |= 1 << position
+                        for child in plan.dependents[position]:
+                            if not scheduled >> child & 1 and plan.is_ready(
+                                child, done
+                            ):
+                                ready.append(child)
+                                scheduled |= 1 << child
+
+                if budget is not None:
+                    usage = dict(execution.resource_usage)
+                    usage["wall_time"] = loop.time() - started
+                    try:
+                        self._enforce_budget(budget, usage, f"Workflow {workflow.name}")
+                    except ResourceLimitError as e:
+                        # Stop the whole execution once its budget is spent
+                        await self._cancel_running_steps(running, plan, execution)
+                        first_error = first_error or e
+                        break
+
+        except asyncio.CancelledError:
+            await self._cancel_running_steps(running, plan, execution)
+            self._cancel_unstarted_steps(workflow, execution)
+            raise
+        finally:
+            for stream in streams.values():
+                stream.close(RuntimeError("Workflow execution stopped"))
+
+        if first_error is not None:
+            # Steps downstream of a failure never became ready
+            self._cancel_unstarted_steps(workflow, execution)
+            raise first_error
+
+    async def _cancel_running_steps(
+        self,
+        running: Dict["asyncio.Task[None]", int],
+        plan: ExecutionPlan,
+        execution: WorkflowExecution,
+    ) -> None:
+        """Cancel running steps and mark them as cancelled."""
+        for task in running:
+            task.cancel()
+        await asyncio.gather(*running, return_exceptions=True)
+        for position in running.values():
+            step_id = plan.steps[position].id
+            execution.step_end_times[step_id] = datetime.now(UTC).isoformat()
+            execution.cancelled_steps.append(step_id)
+        running.clear()
+
+    def _cancel_unstarted_steps(
+        self, workflow: WorkflowDefinition, execution: WorkflowExecution
+    ) -> None:
+        """Mark every step that never started as cancelled."""
+        for step in workflow.steps:
+            if step.id not in execution.step_start_times:
+                execution.cancelled_steps.append(step.id)
+
     async def _execute_step(
-        self, step: WorkflowStep, execution: WorkflowExecution
+        self,
+        step: WorkflowStep,
+        execution: WorkflowExecution,
+        component: Optional[Component] = None,
+        streams: Optional[Dict[str, StepStream]] = None,
     ) -> None:
         """Execute a single workflow step.
 
+        The scheduler only starts a step once its dependencies have
+        completed, so they are not re-checked here.
+
         Args:
             step: Workflow step to execute
             execution: Current workflow execution
+            component: Component resolved by the execution plan
+            streams: Output streams of the execution's steps
 
         Raises:
             RuntimeError: If component not found or step fails
@@ -306,26 +640,53 @@ class WorkflowEngine:
             action=step.action,
         )
 
-        # Check dependencies
-        for dep_step_id in step.dependencies:
-            if dep_step_id not in execution.completed_steps:
-                execution.failed_steps.append(step.id)
-                execution.error = f"Step dependency not met: {dep_step_id}"
-                raise RuntimeError(f"Step dependency not met: {dep_step_id}")
-
         # Get component
-        component = self.components.get(step.component)
+        component = component or self.components.get(step.component)
         if not component:
             raise RuntimeError(f"Component not found: {step.component}")
 
-        # Check component health
-        health = await component.health_check()
-        if not health.success:
-            raise RuntimeError(f"Component unhealthy: {step.component}")
+        # Reuse a memoized result for identical inputs
+        cache_key = None
+        if self.step_cache is not None and step.cacheable and not step.stream_inputs:
+            cache_key = self.step_cache.make_key(
+                step,
+                {
+                    dep_step_id: execution.step_outputs.get(dep_step_id)
+                    for dep_step_id in step.dependencies
+                },
+            )
+            found, output = await self.step_cache.get(cache_key)
+            if found:
+                execution.cache_hits += 1
+                execution.cached_steps.append(step.id)
+                execution.step_outputs[step.id] = output
+                execution.completed_steps.append(step.id)
+                execution.current_step = step.id
+                await self._emit_event(
+                    "step_completed",
+                    {
+                        "step_id": step.id,
+                        "execution_id": execution.id,
+                        "workflow_id": execution.workflow_id,
+                        "response": ServiceResponse(
+                            success=True, data=output
+                        ).model_dump(),
+                        "cached": True,
+                    },
+                )
+                return
+            execution.cache_misses += 1
+
+        # Check component health (cached, and short-circuited while the
+        # component's circuit breaker is open)
+        healthy, reason = await self.health_gate.check(component)
+        if not healthy:
+            raise RuntimeError(reason or f"Component unhealthy: {step.component}")
 
         try:
             # Execute step with timeout
-            timeout = step.timeout or self.config.default_timeout
+            timeout = self._step_timeout(step)
+            started = asyncio.get_running_loop().time()
 
             request = {
                 "action": step.action,
@@ -333,12 +694,27 @@ class WorkflowEngine:
                 "step_id": step.id,
                 "execution_id": execution.id,
             }
+            streams = streams or {}
+            if step.stream_inputs:
+                request["streams"] = {
+                    dep_step_id: streams[dep_step_id]
+                    for dep_step_id in step.dependencies
+                    if dep_step_id in streams
+                }
 
             # Execute with timeout
             if hasattr(component, "process_request"):
-                response = await asyncio.wait_for(
-                    component.process_request(request), timeout=timeout
-                )
+                try:
+                    response = await asyncio.wait_for(
+                        self._request_step(
+                            component, request, step, execution, streams.get(step.id)
+                        ),
+                        timeout=timeout,
+                    )
+                except Exception:
+                    self.health_gate.record_failure(step.component)
+                    raise
+                self.health_gate.record_success(step.component)
             else:
                 raise RuntimeError(
                     f"Component does not support requests: {step.component}"
@@ -347,7 +723,22 @@ class WorkflowEngine:
             if not response.success:
                 raise RuntimeError(f"Step failed: {response.error}")
 
+            # Account for the resources the step used
+            elapsed = asyncio.get_running_loop().time() - started
+            self.latency.record(step.component, step.action, elapsed)
+            usage = step_usage(response, elapsed)
+            execution.step_usage[step.id] = usage
+            add_usage(execution.resource_usage, usage)
+            if step.budget is not None:
+                self._enforce_budget(step.budget, usage, f"Step {step.name}")
+
+            if cache_key is not None and self.step_cache is not None:
+                await self.step_cache.put(
+                    cache_key, response.data, self.step_cache.ttl_for(step)
+                )
+
             # Mark step as completed
+            execution.step_outputs[step.id] = response.data
             execution.completed_steps.append(step.id)
             execution.current_step = step.id
 
@@ -357,30 +748,133 @@ class WorkflowEngine:
                 {
                     "step_id": step.id,
                     "execution_id": execution.id,
+                    "workflow_id": execution.workflow_id,
                     "response": response.model_dump(),
                 },
             )
 
         except asyncio.TimeoutError:
+            self.latency.record_timeout(step.component, step.action, timeout)
             execution.failed_steps.append(step.id)
             execution.error = f"Step timeout: {step.name}"
             raise RuntimeError(f"Step timeout: {step.name}")
 
+    async def _request_step(
+        self,
+        component: Component,
+        request: Dict[str, Any],
+        step: WorkflowStep,
+        execution: WorkflowExecution,
+        stream: Optional[StepStream],
+    ) -> ServiceResponse:
+        """Send a request to a step's component, forwarding streamed chunks.
+
+        Chunks yielded by a streaming component are published to the step's
+        stream and emitted as ``step_output`` events. Without a final
+        response, the step output is assembled from the chunks.
+
+        Args:
+            component: Step component
+            request: Request data
+            step: Workflow step
+            execution: Current workflow execution
+            stream: Output stream of the step
+
+        Returns:
+            Service response
+        """
+        # Callers check for process_request; it may be an async generator
+        result: Any = cast(Service, component).process_request(request)
+        if not hasattr(result, "__aiter__"):
+            response: ServiceResponse = await result
+            return response
+
+        chunks: List[Any] = []
+        final: Optional[ServiceResponse] = None
+        async for item in result:
+            if isinstance(item, ServiceResponse):
+                final = item
+                continue
+            chunks.append(item)
+            if stream is not None:
+                stream.publish(item)
+            await self._emit_event(
+                "step_output",
+                {
+                    "step_id": step.id,
+                    "execution_id": execution.id,
+                    "workflow_id": execution.workflow_id,
+                    "index": len(chunks) - 1,
+                    "chunk": item,
+                },
+            )
+
+        if final is None:
+            final = ServiceResponse(success=True, data=assemble_chunks(chunks))
+        return final
+
+    def _step_timeout(self, step: WorkflowStep) -> float:
+        """Get the timeout for a step.
+
+        An explicit step timeout wins; otherwise the adaptive timeout for
+        the step's component action is used once enough latencies have been
+        seen, falling back to the default timeout. A wall time budget caps
+        the result.
+
+        Args:
+            step: Workflow step
+
+        Returns:
+            Timeout in seconds
+        """
+        timeout: Optional[float] = step.timeout
+        if timeout is None and self.config.adaptive_timeouts:
+            timeout = self.latency.timeout_for(step.component, step.action)
+        if timeout is None:
+            timeout = self.config.default_timeout
+        if step.budget is not None and step.budget.wall_time is not None:
+            timeout = min(timeout, step.budget.wall_time)
+        return timeout
+
+    @staticmethod
+    def _enforce_budget(
+        budget: ResourceBudget, usage: Dict[str, float], context: str
+    ) -> None:
+        """Raise if a resource usage exceeds its budget.
+
+        Args:
+            budget: Resource budget
+            usage: Usage by resource name
+            context: What the budget applies to, for the error message
+
+        Raises:
+            ResourceLimitError: If any limit is exceeded
+        """
+        exceeded = budget.exceeded(usage)
+        if exceeded:
+            resource = exceeded[0]
+            limit = getattr(budget, resource)
+            raise ResourceLimitError(
+                f"{context} exceeded its {resource} budget "
+                f"({usage[resource]:g} > {limit:g})",
+                resource_type=resource,
+                context=context,
+                current=usage[resource],
+                limit=limit,
+            )
+
     async def _emit_event(self, event_type: str, event_data: Dict[str, Any]) -> None:
-        """Emit an event to all registered handlers.
+        """Queue an event for all registered handlers.
+
+        Handlers run in the background, so this does not wait for them
+        unless a handler uses the ``block`` overflow policy and its queue
+        is full.
 
         Args:
             event_type: Type of event
             event_data: Event data
         """
-        for handler in self.event_handlers:
-            try:
-                await handler.handle_event(event_type, event_data)
-            except Exception as e:
-                log_error(
-                    e,
-                    {"event_type": event_type, "handler": handler.__class__.__name__},
-                )
+        await self.events.dispatch(event_type, event_data)
 
     async def health_check(self) -> ServiceResponse:
         """Check health of the workflow engine and all components.
@@ -394,23 +888,29 @@ class WorkflowEngine:
 
             for name, component in self.components.get_all().items():
                 health = await component.health_check()
+                self.health_gate.record_probe(name, health.success, health.error)
                 components_health[name] = {
                     "healthy": health.success,
                     "status": component.status.value,
                     "error": health.error,
+                    "circuit": self.health_gate.get_state(name).circuit.value,
                 }
 
                 if not health.success:
                     overall_healthy = False
 
-            return ServiceResponse(
-                success=overall_healthy,
-                data={
-                    "engine_status": "healthy" if overall_healthy else "unhealthy",
-                    "components": components_health,
-                    "running_workflows": len(self.running_workflows),
-                },
-            )
+            data: Dict[str, Any] = {
+                "engine_status": "healthy" if overall_healthy else "unhealthy",
+                "components": components_health,
+                "running_workflows": len(self.running_workflows),
+            }
+            if self.step_cache is not None:
+                data["step_cache"] = self.step_cache.get_stats()
+            if self.event_handlers:
+                data["event_handlers"] = self.events.get_stats()
+            data["step_latency"] = self.latency.get_stats()
+
+            return ServiceResponse(success=overall_healthy, data=data)
 
         except Exception as e:
             return ServiceResponse(success=False, error=str(e))
@@ -0,0 +1,199 @@
+"""Asynchronous, isolated delivery of engine events to handlers."""
+
+import asyncio
+from dataclasses import asdict, dataclass
+from enum import Enum
+from typing import Any, Dict, List, Optional, Tuple
+
+from .interfaces import EventHandler
+from .logging_config import get_logger, log_error
+
+logger = get_logger(__name__)
+
+Event = Tuple[str, Dict[str, Any]]
+
+
+class OverflowPolicy(str, Enum):
+    """What to do when a handler's queue is full."""
+
+    DROP_OLDEST = "drop_oldest"
+    DROP_NEWEST = "drop_newest"
+    BLOCK = "block"
+
+
+@dataclass
+class HandlerStats:
+    """Delivery counters for one handler."""
+
+    delivered: int = 0
+    failed: int = 0
+    timed_out: int = 0
+    dropped: int = 0
+
+
+class _HandlerChannel:
+    """Bounded queue and delivery task for a single handler."""
+
+    def __init__(
+        self,
+        handler: EventHandler,
+        queue_size: int,
+        timeout: Optional[float],
+        overflow: OverflowPolicy,
+    ):
+        self.handler = handler
+        self.timeout = timeout
+        self.overflow = overflow
+        self.queue: "asyncio.Queue[Event]" = asyncio.Queue(maxsize=queue_size)
+        self.stats = HandlerStats()
+        self.task: Optional["asyncio.Task[None]"] = None
+
+    @property
+    def name(self) -> str:
+        """Handler name used in logs and statistics."""
+        return self.handler.__class__.__name__
+
+    async def put(self, event: Event) -> None:
+        """Queue an event according to the overflow policy."""
+        if self.task is None or self.task.done():
+            self.task = asyncio.create_task(self._deliver())
+
+        if self.overflow == OverflowPolicy.BLOCK:
+            await self.queue.put(event)
+            return
+
+        if self.queue.full():
+            self.stats.dropped += 1
+            if self.overflow == OverflowPolicy.DROP_NEWEST:
+                return
+            self.queue.get_nowait()
+            self.queue.task_done()
+        self.queue.put_nowait(event)
+
+    async def _deliver(self) -> None:
+        """Deliver queued events to the handler one at a time."""
+        while True:
+            event_type, event_data = await self.queue.get()
+            try:
+                await asyncio.wait_for(
+                    self.handler.handle_event(event_type, event_data),
+                    timeout=self.timeout,
+                )
+                self.stats.delivered += 1
+            except asyncio.TimeoutError:
+                self.stats.timed_out += 1
+                logger.warning(
+                    f"Event handler {self.name} timed out handling {event_type}"
+                )
+            except Exception as e:
+                self.stats.failed += 1
+                log_error(e, {"event_type": event_type, "handler": self.name})
+            finally:
+                self.queue.task_done()
+
+
+class EventDispatcher:
+    """Fans engine events out to handlers without waiting on them.
+
+    Every handler gets its own bounded queue and delivery task, so handlers
+    run concurrently and a slow or failing handler only affects itself.
+    Deliveries exceeding the handler's timeout are abandoned. When a queue
+    is full, ``drop_oldest`` discards the oldest pending event,
+    ``drop_newest`` discards the new one and ``block`` makes the emitter
+    wait for room; only ``block`` can ever hold up the emitter.
+    """
+
+    def __init__(
+        self,
+        queue_size: int = 1000,
+        timeout: Optional[float] = 5.0,
+        overflow: OverflowPolicy = OverflowPolicy.DROP_OLDEST,
+    ):
+        """Initialize the dispatcher.
+
+        Args:
+        queue_size: Default maximum pending events per handler
+        timeout: Default seconds allowed per delivery (None for no limit)
+        overflow: Default policy when a handler's queue is full
+        """
+        self.queue_size = queue_size
+        self.timeout = timeout
+        self.overflow = OverflowPolicy(overflow)
+        self._channels: List[_HandlerChannel] = []
+
+    def register(
+        self,
+        handler: EventHandler,
+        queue_size: Optional[int] = None,
+        timeout: Optional[float] = None,
+        overflow: Optional[OverflowPolicy] = None,
+    ) -> None:
+        """Register a handler, optionally overriding the defaults.
+
+        Args:
+        handler: Event handler
+        queue_size: Maximum pending events for this handler
+        timeout: Seconds allowed per delivery to this handler
+        overflow: Policy when this handler's queue is full
+        """
+        self._channels.append(
+            _HandlerChannel(
+                handler,
+                queue_size if queue_size is not None else self.queue_size,
+                timeout if timeout is not None else self.timeout,
+                OverflowPolicy(overflow) if overflow is not None else self.overflow,
+            )
+        )
+
+    async def dispatch(self, event_type: str, event_data: Dict[str, Any]) -> None:
+        """Queue an event for every registered handler.
+
+        Args:
+        event_type: Type of event
+        event_data: Event data
+        """
+        for channel in self._channels:
+            await channel.put((event_type, event_data))
+
+    async def flush(self) -> None:
+        """Wait until every queued event has been handled."""
+        await asyncio.gather(
+            *(
+                channel.queue.join()
+                for channel in self._channels
+                if channel.task is not None and not channel.task.done()
+            )
+        )
+
+    async def stop(self, timeout: Optional[float] = None) -> None:
+        """Stop delivery, first waiting up to ``timeout`` for queues to drain.
+
+        Args:
+        timeout: Seconds to wait for pending events (None to skip draining)
+        """
+        if timeout:
+            try:
+                await asyncio.wait_for(self.flush(), timeout=timeout)
+            except asyncio.TimeoutError:
+                logger.warning("Event queues not drained before shutdown")
+
+        tasks = [channel.task for channel in self._channels if channel.task]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        for channel in self._channels:
+            channel.task = None
+
+    def get_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Get delivery statistics per handler.
+
+        Returns:
+        Mapping of handler name to its counters and queue depth
+        """
+        stats: Dict[str, Dict[str, Any]] = {}
+        for index, channel in enumerate(self._channels):
+            name = (
+                channel.name if channel.name not in stats else f"{channel.name}#{index}"
+            )
+            stats[name] = {**asdict(channel.stats), "pending": channel.queue.qsize()}
+        return stats
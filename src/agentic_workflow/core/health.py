@@ -0,0 +1,284 @@
+"""Cached component health gating with circuit breakers."""
+
+import asyncio
+import time
+from dataclasses import dataclass
+from enum import Enum
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple
+
+from .interfaces import Component, ServiceResponse
+from .logging_config import get_logger, log_error
+
+logger = get_logger(__name__)
+
+
+class CircuitState(str, Enum):
+    """Circuit breaker states."""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+@dataclass
+class ComponentHealthState:
+    """Cached health and breaker state for one component."""
+
+    healthy: bool = False
+    checked_at: Optional[float] = None
+    error: Optional[str] = None
+    circuit: CircuitState = CircuitState.CLOSED
+    consecutive_failures: int = 0
+    opened_at: float = 0.0
+    probes: int = 0
+    cache_hits: int = 0
+    short_circuits: int = 0
+
+
+class ComponentHealthGate:
+    """Decides whether a component may serve a workflow step.
+
+    Health probe results are cached for ``ttl`` seconds and a component is
+    never probed more than once per ``min_probe_interval`` seconds;
+    concurrent callers share a single in-flight probe. Failed probes and
+    failed requests count towards a circuit breaker per component. After
+    ``failure_threshold`` consecutive failures the circuit opens and steps
+    are rejected without probing. Once ``recovery_timeout`` has elapsed the
+    circuit goes half-open: a single probe decides whether it closes
+    again or stays open.
+
+    One gate is shared by every workflow running on an engine, and
+    ``start`` runs a background task that refreshes cached health so steps
+    rarely wait on a probe.
+    """
+
+    def __init__(
+        self,
+        ttl: float = 5.0,
+        min_probe_interval: float = 1.0,
+        failure_threshold: int = 3,
+        recovery_timeout: float = 30.0,
+        refresh_interval: float = 30.0,
+    ):
+        """Initialize the health gate.
+
+        Args:
+        ttl: Seconds a probe result is reused
+        min_probe_interval: Minimum seconds between probes of one component
+        failure_threshold: Consecutive failures that open the circuit
+        recovery_timeout: Seconds an open circuit waits before a trial probe
+        refresh_interval: Seconds between background refreshes
+        """
+        self.ttl = ttl
+        self.min_probe_interval = min_probe_interval
+        self.failure_threshold = max(1, failure_threshold)
+        self.recovery_timeout = recovery_timeout
+        self.refresh_interval = refresh_interval
+
+        self._states: Dict[str, ComponentHealthState] = {}
+        self._probes: Dict[str, "asyncio.Task[ServiceResponse]"] = {}
+        self._refresher: Optional["asyncio.Task[None]"] = None
+
+    def get_state(self, name: str) -> ComponentHealthState:
+        """Get (or create) the state for a component.
+
+        Args:
+        name: Component name
+
+        Returns:
+        Component health state
+        """
+        state = self._states.get(name)
+        if state is None:
+            state = self._states[name] = ComponentHealthState()
+        return state
+
+    async def check(self, component: Component) -> Tuple[bool, Optional[str]]:
+        """Check whether a component may serve a request.
+
+        Args:
+        component: Component about to be used
+
+        Returns:
+        Tuple of (allowed, reason) where reason explains a rejection
+        """
+        state = self.get_state(component.name)
+        now = time.monotonic()
+
+        if state.circuit == CircuitState.OPEN:
+            if now - state.opened_at < self.recovery_timeout:
+                state.short_circuits += 1
+                return False, f"Circuit open for component: {component.name}"
+            state.circuit = CircuitState.HALF_OPEN
+            logger.info(f"Circuit half-open for component: {component.name}")
+        elif state.circuit == CircuitState.CLOSED and self._is_fresh(state, now):
+            state.cache_hits += 1
+            return state.healthy, state.error
+
+        await self.probe(component)
+        if state.circuit == CircuitState.OPEN:
+            return False, f"Circuit open for component: {component.name}"
+        return state.healthy, state.error
+
+    def _is_fresh(self, state: ComponentHealthState, now: float) -> bool:
+        """Check if a cached result can be reused."""
+        if state.checked_at is None:
+            return False
+        age = now - state.checked_at
+        return age < self.ttl or (not state.healthy and age < self.min_probe_interval)
+
+    async def probe(self, component: Component) -> ServiceResponse:
+        """Probe a component, sharing the result with concurrent callers.
+
+        Args:
+        component: Component to probe
+
+        Returns:
+        Health check response
+        """
+        task = self._probes.get(component.name)
+        if task is None:
+            # The probe runs in its own task so a cancelled caller does not
+            # cancel it for everyone else waiting on the result
+            task = asyncio.create_task(self._run_probe(component))
+            self._probes[component.name] = task
+        return await asyncio.shield(task)
+
+    async def _run_probe(self, component: Component) -> ServiceResponse:
+        """Run one health check and record its result."""
+        try:
+            try:
+                health = await component.health_check()
+            except Exception as e:
+                health = ServiceResponse(success=False, error=str(e))
+            self.get_state(component.name).probes += 1
+            self.record_probe(component.name, health.success, health.error)
+            return health
+        finally:
+            self._probes.pop(component.name, None)
+
+    def record_probe(
+        self, name: str, healthy: bool, error: Optional[str] = None
+    ) -> None:
+        """Store a health probe result.
+
+        Args:
+        name: Component name
+        healthy: Whether the probe succeeded
+        error: Error reported by the probe
+        """
+        state = self.get_state(name)
+        state.checked_at = time.monotonic()
+        state.healthy = healthy
+        state.error = None if healthy else f"Component unhealthy: {name}"
+        if error and not healthy:
+            state.error = f"{state.error} ({error})"
+
+        if healthy:
+            self.record_success(name)
+        else:
+            self.record_failure(name)
+
+    def record_success(self, name: str) -> None:
+        """Record a successful probe or request, closing the circuit.
+
+        Args:
+        name: Component name
+        """
+        state = self.get_state(name)
+        if state.circuit != CircuitState.CLOSED:
+            logger.info(f"Circuit closed for component: {name}")
+        state.circuit = CircuitState.CLOSED
+        state.consecutive_failures = 0
+
+    def record_failure(self, name: str) -> None:
+        """Record a failed probe or request.
+
+        A failure while half-open, or reaching the failure threshold,
+        opens the circuit.
+
+        Args:
+        name: Component name
+        """
+        state = self.get_state(name)
+        state.consecutive_failures += 1
+        if state.circuit == CircuitState.HALF_OPEN or (
+            state.circuit == CircuitState.CLOSED
+            and state.consecutive_failures >= self.failure_threshold
+        ):
+            state.circuit = CircuitState.OPEN
+            state.opened_at = time.monotonic()
+            state.healthy = False
+            logger.warning(
+                f"Circuit opened for component: {name} "
+                f"after {state.consecutive_failures} failures"
+            )
+
+    def start(self, get_components: Callable[[], Iterable[Component]]) -> None:
+        """Start refreshing cached health in the background.
+
+        Args:
+        get_components: Callable returning the components to refresh
+        """
+        if self._refresher is None or self._refresher.done():
+            self._refresher = asyncio.create_task(self._refresh_loop(get_components))
+
+    async def stop(self) -> None:
+        """Stop the background refresher."""
+        if self._refresher is not None:
+            self._refresher.cancel()
+            try:
+                await self._refresher
+            except asyncio.CancelledError:
+                pass
+            self._refresher = None
+
+    async def _refresh_loop(
+        self, get_components: Callable[[], Iterable[Component]]
+    ) -> None:
+        """Periodically re-probe components whose circuit is not open."""
+        while True:
+            await asyncio.sleep(self.refresh_interval)
+            try:
+                await self.refresh(get_components())
+            except Exception as e:
+                log_error(e, {"operation": "health_refresh"})
+
+    async def refresh(self, components: Iterable[Component]) -> None:
+        """Re-probe components so cached health stays current.
+
+        Components with an open circuit are left alone until their recovery
+        timeout lets a step trial them.
+
+        Args:
+        components: Components to refresh
+        """
+        now = time.monotonic()
+        due = []
+        for component in components:
+            state = self.get_state(component.name)
+            if state.circuit == CircuitState.OPEN:
+                continue
+            if state.checked_at is None or (
+                now - state.checked_at >= self.min_probe_interval
+            ):
+                due.append(component)
+        await asyncio.gather(*(self.probe(component) for component in due))
+
+    def get_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Get health and breaker state for every known component.
+
+        Returns:
+        Mapping of component name to its state
+        """
+        return {
+            name: {
+                "healthy": state.healthy,
+                "circuit": state.circuit.value,
+                "consecutive_failures": state.consecutive_failures,
+                "probes": state.probes,
+                "cache_hits": state.cache_hits,
+                "short_circuits": state.short_circuits,
+            }
+            for name, state in self._states.items()
+        }
@@ -82,6 +82,10 @@ class Service(Component):
     async def process_request(self, request: Dict[str, Any]) -> ServiceResponse:
         """Process a service request.
 
+        Workflow step components may instead implement this as an async
+        generator that yields output chunks as they are produced and may
+        end by yielding the final ``ServiceResponse``.
+
         Args:
             request: Request data
 
@@ -105,6 +109,34 @@ class EventHandler(ABC):
         pass
 
 
+class ResourceBudget(BaseModel):
+    """Resource limits for a workflow step or a whole execution.
+
+    Unset limits are not enforced. ``wall_time`` is in seconds and
+    ``memory_bytes`` limits peak usage; the other limits are totals.
+    """
+
+    wall_time: Optional[float] = None
+    tokens: Optional[int] = None
+    tool_calls: Optional[int] = None
+    memory_bytes: Optional[int] = None
+
+    def exceeded(self, usage: Dict[str, float]) -> List[str]:
+        """Get the limits exceeded by a resource usage.
+
+        Args:
+            usage: Usage by resource name
+
+        Returns:
+            Names of the exceeded resources
+        """
+        return [
+            resource
+            for resource, limit in self.model_dump(exclude_none=True).items()
+            if usage.get(resource, 0) > limit
+        ]
+
+
 class WorkflowStep(BaseModel):
     """Represents a single step in a workflow."""
 
@@ -115,6 +147,11 @@ class WorkflowStep(BaseModel):
     parameters: Dict[str, Any] = {}
     dependencies: List[str] = []
     timeout: Optional[int] = None
+    cacheable: bool = False
+    cache_ttl: Optional[int] = None
+    budget: Optional[ResourceBudget] = None
+    # Start once every dependency has started, reading their output streams
+    stream_inputs: bool = False
 
 
 class WorkflowDefinition(BaseModel):
@@ -125,6 +162,8 @@ class WorkflowDefinition(BaseModel):
     description: str
     steps: List[WorkflowStep]
     metadata: Dict[str, Any] = {}
+    version: Optional[str] = None
+    budget: Optional[ResourceBudget] = None
 
 
 class WorkflowExecution(BaseModel):
@@ -136,7 +175,16 @@ class WorkflowExecution(BaseModel):
     current_step: Optional[str] = None
     completed_steps: List[str] = []
     failed_steps: List[str] = []
+    cancelled_steps: List[str] = []
     start_time: Optional[str] = None
     end_time: Optional[str] = None
+    step_start_times: Dict[str, str] = {}
+    step_end_times: Dict[str, str] = {}
+    step_outputs: Dict[str, Any] = {}
+    cached_steps: List[str] = []
+    cache_hits: int = 0
+    cache_misses: int = 0
+    step_usage: Dict[str, Dict[str, float]] = {}
+    resource_usage: Dict[str, float] = {}
     result: Optional[Dict[str, Any]] = None
     error: Optional[str] = None
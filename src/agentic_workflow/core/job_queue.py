@@ -0,0 +1,169 @@
+"""Bounded priority job queue with a worker pool."""
+
+import asyncio
+import itertools
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set
+
+from .logging_config import get_logger, log_error
+
+logger = get_logger(__name__)
+
+JobFunc = Callable[[], Awaitable[Any]]
+
+
+class QueueFullError(Exception):
+    """Raised when a job is submitted to a full queue."""
+
+
+@dataclass(order=True)
+class _QueuedJob:
+    """Queue entry ordered by priority, then submission order."""
+
+    priority: int
+    sequence: int
+    job_id: str = field(compare=False)
+    func: JobFunc = field(compare=False)
+
+
+class JobQueue:
+    """Runs submitted coroutines on a fixed pool of background workers.
+
+    Jobs wait in a bounded queue with one lane per priority level; lower
+    values are served first and jobs within a lane run in submission
+    order. Submitting to a full queue raises ``QueueFullError`` instead of
+    waiting, so callers can shed load immediately.
+
+    Workers are started on first use and are bound to the running event
+    loop; if the queue is used from a new loop, it is reset and fresh
+    workers are started there.
+    """
+
+    def __init__(self, max_size: int = 1000, concurrency: int = 4):
+        """Initialize the job queue.
+
+        Args:
+        max_size: Maximum number of jobs waiting to run
+        concurrency: Number of jobs run at once
+        """
+        self.max_size = max_size
+        self.concurrency = max(1, concurrency)
+
+        self._queue: Optional["asyncio.PriorityQueue[_QueuedJob]"] = None
+        self._workers: List["asyncio.Task[None]"] = []
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._sequence = itertools.count()
+        self._running: Set[str] = set()
+
+        # Statistics
+        self.submitted = 0
+        self.rejected = 0
+        self.completed = 0
+        self.failed = 0
+
+    def _ensure_started(self) -> "asyncio.PriorityQueue[_QueuedJob]":
+        """Start workers on the running loop if needed."""
+        loop = asyncio.get_running_loop()
+        if self._queue is None or self._loop is not loop:
+            if self._loop is not None and self._loop is not loop:
+                logger.debug("Job queue rebound to a new event loop")
+            self._queue = asyncio.PriorityQueue(maxsize=self.max_size)
+            self._loop = loop
+            self._running.clear()
+            self._workers = [
+                asyncio.create_task(self._worker(self._queue))
+                for _ in range(self.concurrency)
+            ]
+        return self._queue
+
+    def submit(self, job_id: str, func: JobFunc, priority: int = 0) -> None:
+        """Queue a job.
+
+        Args:
+        job_id: Identifier used in logs and statistics
+        func: Coroutine function run by a worker
+        priority: Lane to queue in; lower values run first
+
+        Raises:
+        QueueFullError: If the queue is at capacity
+        """
+        queue = self._ensure_started()
+        try:
+            queue.put_nowait(_QueuedJob(priority, next(self._sequence), job_id, func))
+        except asyncio.QueueFull:
+            self.rejected += 1
+            raise QueueFullError(f"Job queue is full ({self.max_size} pending)")
+        self.submitted += 1
+
+    async def _worker(self, queue: "asyncio.PriorityQueue[_QueuedJob]") -> None:
+        """Run queued jobs until cancelled."""
+        while True:
+            job = await queue.get()
+            self._running.add(job.job_id)
+            try:
+                await job.func()
+                self.completed += 1
+            except Exception as e:
+                self.failed += 1
+                log_error(e, {"operation": "job", "job_id": job.job_id})
+            finally:
+                self._running.discard(job.job_id)
+                queue.task_done()
+
+    async def join(self) -> None:
+        """Wait until every queued job has finished."""
+        if self._queue is not None and self._loop is asyncio.get_running_loop():
+            await self._queue.join()
+
+    async def stop(self) -> List[str]:
+        """Cancel the workers, along with any jobs they are running.
+
+        Running jobs see ``asyncio.CancelledError``; jobs still waiting in
+        the queue are dropped without running.
+
+        Returns:
+        IDs of the queued jobs that were dropped, in the order they would
+        have run
+        """
+        dropped: List[str] = []
+        if self._queue is not None:
+            while not self._queue.empty():
+                dropped.append(self._queue.get_nowait().job_id)
+        workers = self._workers
+        self._workers = []
+        self._queue = None
+        self._loop = None
+        for worker in workers:
+            worker.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
+        self._running.clear()
+        if dropped:
+            logger.warning(f"Job queue stopped with {len(dropped)} jobs not run")
+        return dropped
+
+    @property
+    def pending(self) -> int:
+        """Number of jobs waiting to run."""
+        return self._queue.qsize() if self._queue is not None else 0
+
+    @property
+    def running(self) -> int:
+        """Number of jobs currently running."""
+        return len(self._running)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get queue statistics.
+
+        Returns:
+        Queue depth and job counters
+        """
+        return {
+            "pending": self.pending,
+            "running": self.running,
+            "max_size": self.max_size,
+            "concurrency": self.concurrency,
+            "submitted": self.submitted,
+            "rejected": self.rejected,
+            "completed": self.completed,
+            "failed": self.failed,
+        }
@@ -0,0 +1,382 @@
+"""Write-behind persistence and indexed lookup of agent message history."""
+
+import asyncio
+import json
+from collections import deque
+from datetime import UTC, datetime
+from typing import TYPE_CHECKING, Any, Deque, Dict, List, Optional, Set, Tuple
+
+from pydantic import BaseModel
+
+from agentic_workflow.core.logging_config import get_logger, log_error
+from agentic_workflow.memory.interfaces import MemoryType
+
+if TYPE_CHECKING:
+    from agentic_workflow.core.communication import Message
+
+logger = get_logger(__name__)
+
+# Peer of broadcast conversations
+BROADCAST = "*"
+
+ConversationKey = Tuple[str, str]
+# (created_at timestamp, message_id), ordered by time
+MessageRef = Tuple[float, str]
+
+
+class MessageHistoryPage(BaseModel):
+    """One page of message history, newest first."""
+
+    messages: List[Dict[str, Any]]
+    next_cursor: Optional[str] = None
+
+
+def conversation_key(agent_id: str, peer_id: Optional[str]) -> ConversationKey:
+    """Get the key of the conversation between two agents.
+
+    Args:
+        agent_id: Agent ID
+        peer_id: Other agent ID (None for the agent's broadcasts)
+
+    Returns:
+        Order-independent conversation key
+    """
+    if peer_id is None or peer_id == BROADCAST:
+        return agent_id, BROADCAST
+    first, second = sorted((agent_id, peer_id))
+    return first, second
+
+
+def _encode_cursor(ref: MessageRef) -> str:
+    """Encode the position after a message as a cursor."""
+    return f"{ref[0]!r}:{ref[1]}"
+
+
+def _decode_cursor(cursor: str) -> MessageRef:
+    """Decode a cursor built by ``_encode_cursor``."""
+    timestamp, _, message_id = cursor.partition(":")
+    return float(timestamp), message_id
+
+
+class MessageHistory:
+    """Records sent messages and serves paginated history per agent.
+
+    Recording only appends to an in-memory write-behind buffer; a
+    background task writes the buffer to the memory manager in batches of
+    ``batch_size`` every ``flush_interval`` seconds, or sooner when a
+    batch is full, so senders never wait on storage. Messages still in the
+    buffer are served from it.
+
+    History is indexed per conversation (a pair of agents, or an agent and
+    its broadcasts) and partitioned by ``partition_seconds`` of creation
+    time, so a lookup only touches the agent's conversations and the
+    partitions it needs; partitions older than ``retention`` seconds are
+    dropped from the index on the first flush of each new partition, along
+    with conversations left empty. Pages are read newest first and
+    continued with the returned cursor.
+
+    The index lives in process memory and is not rebuilt from storage, so
+    history is only queryable in the process that recorded it; persisted
+    messages outlive a restart but are no longer listed by ``query``.
+    """
+
+    def __init__(
+        self,
+        memory_manager: Any,
+        batch_size: int = 100,
+        flush_interval: float = 1.0,
+        max_buffer: int = 10000,
+        partition_seconds: int = 3600,
+        retention: int = 86400,
+        memory_type: MemoryType = MemoryType.SHORT_TERM,
+    ):
+        """Initialize the message history.
+
+        Args:
+            memory_manager: MemoryManager to persist messages in
+            batch_size: Messages written per batch
+            flush_interval: Seconds between background flushes
+            max_buffer: Maximum unwritten messages; the oldest are dropped
+            partition_seconds: Width of an index partition in seconds
+            retention: Seconds of history kept in the index
+            memory_type: Memory type messages are stored as
+        """
+        self.memory_manager = memory_manager
+        self.batch_size = max(1, batch_size)
+        self.flush_interval = flush_interval
+        self.max_buffer = max_buffer
+        self.partition_seconds = partition_seconds
+        self.retention = retention
+        self.memory_type = memory_type
+
+        self._buffer: Deque["Message"] = deque()
+        self._pending: Dict[str, "Message"] = {}
+        self._index: Dict[ConversationKey, Dict[int, List[MessageRef]]] = {}
+        self._conversations: Dict[str, Set[ConversationKey]] = {}
+        self._pruned_partition: Optional[int] = None
+
+        self._flush_lock = asyncio.Lock()
+        self._wakeup: Optional[asyncio.Event] = None
+        self._flusher: Optional["asyncio.Task[None]"] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+        # Statistics
+        self.recorded = 0
+        self.flushed = 0
+        self.failed_batches = 0
+        self.dropped = 0
+
+    def _partition(self, timestamp: float) -> int:
+        """Get the index partition of a timestamp."""
+        return int(timestamp // self.partition_seconds)
+
+    @staticmethod
+    def _entry_id(message_id: str) -> str:
+        """Get the memory entry ID of a message."""
+        return f"message_{message_id}"
+
+    def record(self, message: "Message") -> None:
+        """Index a message and queue it for persistence without waiting.
+
+        Args:
+            message: Sent message
+        """
+        try:
+            created = datetime.fromisoformat(message.created_at.replace("Z", "+00:00"))
+            if created.tzinfo is None:
+                created = created.replace(tzinfo=UTC)
+            timestamp = created.timestamp()
+        except ValueError:
+            timestamp = datetime.now(UTC).timestamp()
+        ref = (timestamp, message.message_id)
+
+        key = conversation_key(message.sender_id, message.recipient_id)
+        partitions = self._index.setdefault(key, {})
+        partition = self._partition(timestamp)
+        if partition not in partitions:
+            self._prune(partitions, partition)
+        partitions.setdefault(partition, []).append(ref)
+        for agent_id in set(key) - {BROADCAST}:
+            self._conversations.setdefault(agent_id, set()).add(key)
+
+        if len(self._buffer) >= self.max_buffer:
+            oldest = self._buffer.popleft()
+            self._pending.pop(oldest.message_id, None)
+            self.dropped += 1
+        self._buffer.append(message)
+        self._pending[message.message_id] = message
+        self.recorded += 1
+
+        self._ensure_flusher()
+        if len(self._buffer) >= self.batch_size and self._wakeup is not None:
+            self._wakeup.set()
+
+    def _prune(self, partitions: Dict[int, List[MessageRef]], newest: int) -> None:
+        """Drop partitions older than the retention window."""
+        oldest_kept = newest - self.retention // self.partition_seconds
+        for partition in [p for p in partitions if p < oldest_kept]:
+            del partitions[partition]
+
+    def _prune_index(self, now: float) -> None:
+        """Drop expired partitions of every conversation, once per partition.
+
+        Conversations without partitions left are removed from the index
+        and from their agents' conversation sets.
+        """
+        newest = self._partition(now)
+        if self._pruned_partition == newest:
+            return
+        self._pruned_partition = newest
+
+        for key in list(self._index):
+            partitions = self._index[key]
+            self._prune(partitions, newest)
+            if partitions:
+                continue
+            del self._index[key]
+            for agent_id in set(key) - {BROADCAST}:
+                keys = self._conversations.get(agent_id)
+                if keys is not None:
+                    keys.discard(key)
+                    if not keys:
+                        del self._conversations[agent_id]
+
+    def _ensure_flusher(self) -> None:
+        """Start the background flusher on the running loop if needed."""
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        if self._flusher is None or self._flusher.done() or self._loop is not loop:
+            if self._loop is not loop:
+                self._flush_lock = asyncio.Lock()
+            self._wakeup = asyncio.Event()
+            self._loop = loop
+            self._flusher = asyncio.create_task(self._flush_periodically(self._wakeup))
+
+    async def _flush_periodically(self, wakeup: asyncio.Event) -> None:
+        """Flush the buffer every interval or once a batch is full."""
+        while True:
+            try:
+                await asyncio.wait_for(wakeup.wait(), self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            wakeup.clear()
+            await self.flush()
+
+    async def flush(self) -> int:
+        """Write every buffered message to memory.
+
+        Returns:
+            Number of messages written
+        """
+        written = 0
+        async with self._flush_lock:
+            self._prune_index(datetime.now(UTC).timestamp())
+            while self._buffer:
+                batch = [
+                    self._buffer.popleft()
+                    for _ in range(min(self.batch_size, len(self._buffer)))
+                ]
+                stored = await self._write(batch)
+                written += stored
+                if stored < len(batch):
+                    # Retry the rest on the next flush
+                    break
+        return written
+
+    async def _write(self, batch: List["Message"]) -> int:
+        """Store a batch, putting messages that failed back in the buffer."""
+        items = [
+            {
+                "content": message.model_dump_json(),
+                "memory_type": self.memory_type,
+                "entry_id": self._entry_id(message.message_id),
+                "metadata": {
+                    "type": "message",
+                    "sender_id": message.sender_id,
+                    "recipient_id": message.recipient_id,
+                    "message_type": message.message_type,
+                },
+                "tags": ["message"],
+            }
+            for message in batch
+        ]
+        try:
+            stored = set(await self.memory_manager.store_many(items))
+        except Exception as e:
+            log_error(e, {"operation": "flush_message_history"})
+            stored = set()
+
+        failed = [
+            message
+            for message in batch
+            if self._entry_id(message.message_id) not in stored
+        ]
+        for message in batch:
+            if self._entry_id(message.message_id) in stored:
+                self._pending.pop(message.message_id, None)
+        if failed:
+            self.failed_batches += 1
+            self._buffer.extendleft(reversed(failed))
+        self.flushed += len(batch) - len(failed)
+        return len(batch) - len(failed)
+
+    async def query(
+        self,
+        agent_id: str,
+        peer_id: Optional[str] = None,
+        limit: int = 50,
+        cursor: Optional[str] = None,
+    ) -> MessageHistoryPage:
+        """Get a page of an agent's message history, newest first.
+
+        Args:
+            agent_id: Agent ID
+            peer_id: Only the conversation with this agent (``"*"`` for the
+                agent's broadcasts)
+            limit: Maximum messages per page
+            cursor: ``next_cursor`` of the previous page
+
+        Returns:
+            Messages as dicts and the cursor of the next page, if any
+        """
+        if peer_id is not None:
+            keys = [conversation_key(agent_id, peer_id)]
+        else:
+            keys = list(self._conversations.get(agent_id, ()))
+        before = _decode_cursor(cursor) if cursor else None
+
+        partitions = sorted(
+            {p for key in keys for p in self._index.get(key, {})}, reverse=True
+        )
+        if before is not None:
+            partitions = [p for p in partitions if p <= self._partition(before[0])]
+
+        refs: List[MessageRef] = []
+        for partition in partitions:
+            chunk = [
+                ref
+                for key in keys
+                for ref in self._index.get(key, {}).get(partition, ())
+                if before is None or ref < before
+            ]
+            chunk.sort(reverse=True)
+            refs.extend(chunk)
+            if len(refs) > limit:
+                break
+
+        page = refs[:limit]
+        stored = await self._load(
+            [message_id for _, message_id in page if message_id not in self._pending]
+        )
+        messages = []
+        for _, message_id in page:
+            if message_id in self._pending:
+                messages.append(self._pending[message_id].model_dump())
+            elif message_id in stored:
+                messages.append(stored[message_id])
+
+        next_cursor = _encode_cursor(page[-1]) if len(refs) > limit else None
+        return MessageHistoryPage(messages=messages, next_cursor=next_cursor)
+
+    async def _load(self, message_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Load persisted messages by ID."""
+        if not message_ids:
+            return {}
+        try:
+            entries = await self.memory_manager.get_many(
+                [self._entry_id(message_id) for message_id in message_ids],
+                memory_type=self.memory_type,
+            )
+        except Exception as e:
+            log_error(e, {"operation": "load_message_history"})
+            return {}
+
+        loaded = {}
+        for message_id in message_ids:
+            entry = entries.get(self._entry_id(message_id))
+            if entry is not None:
+                loaded[message_id] = json.loads(entry.content)
+        return loaded
+
+    async def close(self) -> None:
+        """Stop the background flusher and write what is left."""
+        if self._flusher is not None:
+            # Only cancel between flushes so no batch is lost mid-write
+            async with self._flush_lock:
+                self._flusher.cancel()
+            await asyncio.gather(self._flusher, return_exceptions=True)
+            self._flusher = None
+        await self.flush()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get history statistics."""
+        return {
+            "buffered": len(self._buffer),
+            "recorded": self.recorded,
+            "flushed": self.flushed,
+            "failed_batches": self.failed_batches,
+            "dropped": self.dropped,
+            "conversations": len(self._index),
+        }
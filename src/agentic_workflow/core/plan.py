@@ -0,0 +1,284 @@
+"""Compilation of workflow definitions into cached execution plans."""
+
+import hashlib
+import weakref
+from collections import OrderedDict
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Dict, Iterable, List, Mapping, Optional, Tuple
+
+from .interfaces import Component, WorkflowDefinition, WorkflowStep
+from .logging_config import get_logger
+
+if TYPE_CHECKING:
+    from .engine import ComponentRegistry
+
+logger = get_logger(__name__)
+
+
+@dataclass(frozen=True)
+class PlanError:
+    """A validation error found while compiling a workflow."""
+
+    message: str
+    step_id: Optional[str] = None
+
+
+@dataclass(frozen=True)
+class ExecutionPlan:
+    """Immutable, pre-validated form of a workflow definition.
+
+    Steps keep their definition order and step ``i`` is bit ``1 << i`` in
+    every bitset, so checking whether a step is ready is a single mask
+    operation against the bitset of completed steps.
+    """
+
+    workflow_id: str
+    version: str
+    registry_generation: int
+    steps: Tuple[WorkflowStep, ...]
+    index: Mapping[str, int]
+    levels: Tuple[Tuple[str, ...], ...]
+    dependency_masks: Tuple[int, ...]
+    dependents: Tuple[Tuple[int, ...], ...]
+    components: Tuple[Optional[Component], ...]
+    errors: Tuple[PlanError, ...]
+
+    @property
+    def valid(self) -> bool:
+        """Whether the workflow can be executed."""
+        return not self.errors
+
+    def mask(self, step_ids: Iterable[str]) -> int:
+        """Build the bitset of the given steps, ignoring unknown IDs.
+
+        Args:
+        step_ids: Step IDs
+
+        Returns:
+        Bitset of the steps
+        """
+        bits = 0
+        for step_id in step_ids:
+            position = self.index.get(step_id)
+            if position is not None:
+                bits |= 1 << position
+        return bits
+
+    def is_ready(self, position: int, done: int) -> bool:
+        """Check whether every dependency of a step is in ``done``.
+
+        Args:
+        position: Step position in the plan
+        done: Bitset of completed steps
+
+        Returns:
+        True if the step can run
+        """
+        return self.dependency_masks[position] & ~done == 0
+
+
+def workflow_version(workflow: WorkflowDefinition) -> str:
+    """Get the version used to cache a workflow's plan.
+
+    Uses the definition's explicit version when set, otherwise a hash of
+    its content.
+
+    Args:
+    workflow: Workflow definition
+
+    Returns:
+    Version string
+    """
+    if workflow.version:
+        return workflow.version
+    content = workflow.model_dump_json().encode("utf-8")
+    return hashlib.sha256(content).hexdigest()
+
+
+def compile_workflow(
+    workflow: WorkflowDefinition,
+    registry: Optional["ComponentRegistry"] = None,
+    version: Optional[str] = None,
+) -> ExecutionPlan:
+    """Validate a workflow and compile it into an execution plan.
+
+    Validation problems are collected in ``ExecutionPlan.errors`` rather
+    than raised.
+
+    Args:
+    workflow: Workflow definition
+    registry: Registry to resolve step components against; components are
+        left unresolved and unchecked without one
+    version: Version to record (computed when omitted)
+
+    Returns:
+    Compiled execution plan
+    """
+    steps = tuple(workflow.steps)
+    errors: List[PlanError] = []
+
+    index: Dict[str, int] = {}
+    for position, step in enumerate(steps):
+        if step.id in index:
+            errors.append(PlanError(f"Duplicate step id: {step.id}", step.id))
+        else:
+            index[step.id] = position
+
+    dependency_masks = [0] * len(steps)
+    dependents: List[List[int]] = [[] for _ in steps]
+    for position, step in enumerate(steps):
+        for dep_step_id in dict.fromkeys(step.dependencies):
+            dep_position = index.get(dep_step_id)
+            if dep_position is None:
+                errors.append(
+                    PlanError(f"Step dependency not met: {dep_step_id}", step.id)
+                )
+                continue
+            dependency_masks[position] |= 1 << dep_position
+            dependents[dep_position].append(position)
+
+    # Kahn's algorithm by level; steps left over are on a cycle
+    levels: List[Tuple[str, ...]] = []
+    placed = 0
+    current = [p for p in range(len(steps)) if dependency_masks[p] == 0]
+    seen = set(current)
+    while current:
+        levels.append(tuple(steps[p].id for p in current))
+        for p in current:
+            placed |= 1 << p
+        following = []
+        for p in current:
+            for child in dependents[p]:
+                if child not in seen and dependency_masks[child] & ~placed == 0:
+                    seen.add(child)
+                    following.append(child)
+        current = following
+    if len(seen) < len(steps):
+        cycle = sorted(steps[p].id for p in range(len(steps)) if p not in seen)
+        errors.append(PlanError(f"Circular step dependency detected: {cycle}"))
+
+    components: List[Optional[Component]] = [None] * len(steps)
+    if registry is not None:
+        for position, step in enumerate(steps):
+            components[position] = registry.get(step.component)
+            if components[position] is None:
+                errors.append(
+                    PlanError(f"Component not found: {step.component}", step.id)
+                )
+
+    return ExecutionPlan(
+        workflow_id=workflow.id,
+        version=version or workflow_version(workflow),
+        registry_generation=registry.generation if registry is not None else 0,
+        steps=steps,
+        index=MappingProxyType(index),
+        levels=tuple(levels),
+        dependency_masks=tuple(dependency_masks),
+        dependents=tuple(tuple(children) for children in dependents),
+        components=tuple(components),
+        errors=tuple(errors),
+    )
+
+
+class PlanCache:
+    """LRU cache of compiled plans keyed by workflow ID and version.
+
+    Plans resolved against a component registry are recompiled once the
+    registry has changed since they were built.
+
+    Content hashes of unversioned definitions are computed once per
+    definition object. Definitions changed in place keep their first hash
+    unless ``get_plan`` is asked to rehash them.
+    """
+
+    def __init__(self, max_size: int = 256):
+        """Initialize the plan cache.
+
+        Args:
+        max_size: Maximum number of cached plans
+        """
+        self.max_size = max_size
+        self._plans: "OrderedDict[Tuple[str, str], ExecutionPlan]" = OrderedDict()
+        self._versions: Dict[int, Tuple["weakref.ref[WorkflowDefinition]", str]] = {}
+
+        # Statistics
+        self.hits = 0
+        self.misses = 0
+
+    def get_plan(
+        self,
+        workflow: WorkflowDefinition,
+        registry: Optional["ComponentRegistry"] = None,
+        rehash: bool = False,
+    ) -> ExecutionPlan:
+        """Get the plan for a workflow, compiling it on a miss.
+
+        Args:
+        workflow: Workflow definition
+        registry: Registry to resolve step components against
+        rehash: Recompute the content hash of an unversioned definition,
+            e.g. after changing it in place
+
+        Returns:
+        Compiled execution plan
+        """
+        version = self._version(workflow, rehash)
+        key = (workflow.id, version)
+        generation = registry.generation if registry is not None else 0
+
+        plan = self._plans.get(key)
+        if plan is not None and plan.registry_generation == generation:
+            self._plans.move_to_end(key)
+            self.hits += 1
+            return plan
+
+        self.misses += 1
+        plan = compile_workflow(workflow, registry, version)
+        if plan.errors:
+            logger.warning(
+                f"Workflow {workflow.id} failed validation: "
+                f"{[error.message for error in plan.errors]}"
+            )
+        if self.max_size > 0:
+            self._plans[key] = plan
+            self._plans.move_to_end(key)
+            while len(self._plans) > self.max_size:
+                self._plans.popitem(last=False)
+        return plan
+
+    def invalidate(self, workflow_id: str) -> None:
+        """Drop every cached plan of a workflow.
+
+        Args:
+        workflow_id: Workflow ID
+        """
+        for key in [key for key in self._plans if key[0] == workflow_id]:
+            del self._plans[key]
+
+    def clear(self) -> None:
+        """Drop every cached plan."""
+        self._plans.clear()
+
+    def _version(self, workflow: WorkflowDefinition, rehash: bool) -> str:
+        """Get a workflow's version, hashing each definition object once."""
+        if workflow.version:
+            return workflow.version
+
+        key = id(workflow)
+        cached = self._versions.get(key)
+        if not rehash and cached is not None and cached[0]() is workflow:
+            return cached[1]
+
+        version = workflow_version(workflow)
+        ref = weakref.ref(workflow, lambda _: self._versions.pop(key, None))
+        self._versions[key] = (ref, version)
+        return version
+
+    def get_stats(self) -> Dict[str, int]:
+        """Get cache statistics.
+
+        Returns:
+        Size and hit counters
+        """
+        return {"plans": len(self._plans), "hits": self.hits, "misses": self.misses}
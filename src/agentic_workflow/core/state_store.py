@@ -0,0 +1,499 @@
+"""Durable execution state stores for checkpointing workflow executions."""
+
+import asyncio
+import json
+import os
+import sqlite3
+import threading
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+
+from .interfaces import WorkflowExecution
+from .logging_config import get_logger
+
+logger = get_logger(__name__)
+
+# Step checkpoint fields restored onto a resumed execution
+StepCheckpoint = Dict[str, Any]
+
+
+def _execution_header(execution: WorkflowExecution) -> Dict[str, Any]:
+    """Get the execution fields stored outside the step checkpoints."""
+    return execution.model_dump(
+        exclude={
+            "completed_steps",
+            "step_outputs",
+            "step_start_times",
+            "step_end_times",
+        }
+    )
+
+
+def _restore_execution(
+    header: Dict[str, Any], steps: List[StepCheckpoint]
+) -> WorkflowExecution:
+    """Rebuild an execution from its header and step checkpoints."""
+    execution = WorkflowExecution(**header)
+    for checkpoint in steps:
+        step_id = checkpoint["step_id"]
+        if step_id not in execution.completed_steps:
+            execution.completed_steps.append(step_id)
+        execution.step_outputs[step_id] = checkpoint.get("output")
+        if checkpoint.get("started_at"):
+            execution.step_start_times[step_id] = checkpoint["started_at"]
+        if checkpoint.get("completed_at"):
+            execution.step_end_times[step_id] = checkpoint["completed_at"]
+    return execution
+
+
+class ExecutionStateStore(ABC):
+    """Persists workflow executions and a checkpoint per completed step.
+
+    The execution header (status, error, timestamps) is written when an
+    execution starts and finishes; each completed step is checkpointed
+    with its output as soon as it finishes, so a resumed execution can skip
+    every step that already ran.
+    """
+
+    @abstractmethod
+    async def save_execution(self, execution: WorkflowExecution) -> bool:
+        """Create or update the execution header.
+
+        Args:
+            execution: Workflow execution
+
+        Returns:
+            True if successful, False otherwise
+        """
+        pass
+
+    @abstractmethod
+    async def save_step(self, execution_id: str, checkpoint: StepCheckpoint) -> bool:
+        """Checkpoint a completed step.
+
+        Args:
+            execution_id: Workflow execution ID
+            checkpoint: Step ID, output, started_at and completed_at
+
+        Returns:
+            True if successful, False otherwise
+        """
+        pass
+
+    @abstractmethod
+    async def load_execution(self, execution_id: str) -> Optional[WorkflowExecution]:
+        """Load an execution with its completed steps restored.
+
+        Args:
+            execution_id: Workflow execution ID
+
+        Returns:
+            Workflow execution or None if not found
+        """
+        pass
+
+    @abstractmethod
+    async def list_executions(self, status: Optional[str] = None) -> List[str]:
+        """List stored execution IDs.
+
+        Args:
+            status: Only list executions with this status (e.g. "running"
+                to find runs interrupted by a restart)
+
+        Returns:
+            Execution IDs
+        """
+        pass
+
+    @abstractmethod
+    async def delete_execution(self, execution_id: str) -> bool:
+        """Delete an execution and its checkpoints.
+
+        Args:
+            execution_id: Workflow execution ID
+
+        Returns:
+            True if the execution existed, False otherwise
+        """
+        pass
+
+    async def close(self) -> None:
+        """Release any resources held by the store."""
+        pass
+
+
+class SQLiteStateStore(ExecutionStateStore):
+    """Execution state store backed by a local SQLite database."""
+
+    def __init__(self, path: Union[str, Path] = ":memory:"):
+        """Initialize the SQLite state store.
+
+        Args:
+        path: Database file path
+        """
+        self.path = str(path)
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(self.path, check_same_thread=False)
+        with self._lock:
+            self._db.executescript(
+                "PRAGMA journal_mode=WAL;"
+                "CREATE TABLE IF NOT EXISTS executions ("
+                " id TEXT PRIMARY KEY, status TEXT NOT NULL, data TEXT NOT NULL);"
+                "CREATE TABLE IF NOT EXISTS steps ("
+                " execution_id TEXT NOT NULL, step_id TEXT NOT NULL,"
+                " seq INTEGER NOT NULL, data TEXT NOT NULL,"
+                " PRIMARY KEY (execution_id, step_id));"
+            )
+            self._db.commit()
+
+    def _write(self, sql: str, params: tuple) -> int:
+        """Run a write statement and commit it."""
+        with self._lock:
+            cursor = self._db.execute(sql, params)
+            self._db.commit()
+            return cursor.rowcount
+
+    async def save_execution(self, execution: WorkflowExecution) -> bool:
+        """Create or update the execution header."""
+        try:
+            await asyncio.to_thread(
+                self._write,
+                "INSERT OR REPLACE INTO executions (id, status, data) VALUES (?, ?, ?)",
+                (
+                    execution.id,
+                    execution.status,
+                    json.dumps(_execution_header(execution), default=str),
+                ),
+            )
+            return True
+        except sqlite3.Error as e:
+            logger.error(f"Failed to save execution {execution.id}: {e}")
+            return False
+
+    async def save_step(self, execution_id: str, checkpoint: StepCheckpoint) -> bool:
+        """Checkpoint a completed step."""
+        try:
+            await asyncio.to_thread(
+                self._write,
+                "INSERT OR REPLACE INTO steps (execution_id, step_id, seq, data) "
+                "VALUES (?, ?, (SELECT COUNT(*) FROM steps WHERE execution_id = ?), ?)",
+                (
+                    execution_id,
+                    checkpoint["step_id"],
+                    execution_id,
+                    json.dumps(checkpoint, default=str),
+                ),
+            )
+            return True
+        except sqlite3.Error as e:
+            logger.error(f"Failed to checkpoint step for {execution_id}: {e}")
+            return False
+
+    def _load(self, execution_id: str) -> Optional[WorkflowExecution]:
+        """Read an execution and its steps."""
+        with self._lock:
+            row = self._db.execute(
+                "SELECT data FROM executions WHERE id = ?", (execution_id,)
+            ).fetchone()
+            if row is None:
+                return None
+            steps = self._db.execute(
+                "SELECT data FROM steps WHERE execution_id = ? ORDER BY seq",
+                (execution_id,),
+            ).fetchall()
+        return _restore_execution(
+            json.loads(row[0]), [json.loads(data) for (data,) in steps]
+        )
+
+    async def load_execution(self, execution_id: str) -> Optional[WorkflowExecution]:
+        """Load an execution with its completed steps restored."""
+        try:
+            return await asyncio.to_thread(self._load, execution_id)
+        except sqlite3.Error as e:
+            logger.error(f"Failed to load execution {execution_id}: {e}")
+            return None
+
+    def _list(self, status: Optional[str]) -> List[str]:
+        """Read execution IDs."""
+        with self._lock:
+            if status is None:
+                rows = self._db.execute("SELECT id FROM executions").fetchall()
+            else:
+                rows = self._db.execute(
+                    "SELECT id FROM executions WHERE status = ?", (status,)
+                ).fetchall()
+        return [execution_id for (execution_id,) in rows]
+
+    async def list_executions(self, status: Optional[str] = None) -> List[str]:
+        """List stored execution IDs."""
+        try:
+            return await asyncio.to_thread(self._list, status)
+        except sqlite3.Error as e:
+            logger.error(f"Failed to list executions: {e}")
+            return []
+
+    def _delete(self, execution_id: str) -> bool:
+        """Delete an execution and its steps."""
+        with self._lock:
+            deleted = self._db.execute(
+                "DELETE FROM executions WHERE id = ?", (execution_id,)
+            ).rowcount
+            self._db.execute(
+                "DELETE FROM steps WHERE execution_id = ?", (execution_id,)
+            )
+            self._db.commit()
+        return deleted > 0
+
+    async def delete_execution(self, execution_id: str) -> bool:
+        """Delete an execution and its checkpoints."""
+        try:
+            return await asyncio.to_thread(self._delete, execution_id)
+        except sqlite3.Error as e:
+            logger.error(f"Failed to delete execution {execution_id}: {e}")
+            return False
+
+    async def close(self) -> None:
+        """Close the database."""
+        with self._lock:
+            self._db.close()
+
+
+class FileStateStore(ExecutionStateStore):
+    """Execution state store backed by an append-only JSON lines file.
+
+    Every change is appended as one record and the file is replayed into
+    memory when the store is opened. ``compact`` rewrites the file with
+    only the live records.
+    """
+
+    def __init__(self, path: Union[str, Path], fsync: bool = False):
+        """Initialize the file state store.
+
+        Args:
+        path: Log file path
+        fsync: Flush each record to disk before returning
+        """
+        self.path = Path(path)
+        self.fsync = fsync
+        self._lock = asyncio.Lock()
+        self._headers: Dict[str, Dict[str, Any]] = {}
+        self._steps: Dict[str, Dict[str, StepCheckpoint]] = {}
+        self._replay()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = open(self.path, "a", encoding="utf-8")
+
+    def _replay(self) -> None:
+        """Rebuild state from the log."""
+        if not self.path.exists():
+            return
+        with open(self.path, encoding="utf-8") as log:
+            for line_number, line in enumerate(log, 1):
+                if not line.strip():
+                    continue
+                try:
+                    self._apply(json.loads(line))
+                except (json.JSONDecodeError, KeyError) as e:
+                    # A crash can leave a torn final line; skip it
+                    logger.warning(
+                        f"Skipping bad record {self.path}:{line_number}: {e}"
+                    )
+
+    def _apply(self, record: Dict[str, Any]) -> None:
+        """Apply one log record to the in-memory state."""
+        op = record["op"]
+        execution_id = record["execution_id"]
+        if op == "execution":
+            self._headers[execution_id] = record["data"]
+            self._steps.setdefault(execution_id, {})
+        elif op == "step":
+            checkpoint = record["data"]
+            self._steps.setdefault(execution_id, {})[checkpoint["step_id"]] = checkpoint
+        elif op == "delete":
+            self._headers.pop(execution_id, None)
+            self._steps.pop(execution_id, None)
+
+    def _append_line(self, line: str) -> None:
+        """Write one record to the log."""
+        self._file.write(line)
+        self._file.flush()
+        if self.fsync:
+            os.fsync(self._file.fileno())
+
+    async def _append(self, record: Dict[str, Any]) -> bool:
+        """Persist a record and apply it."""
+        try:
+            line = json.dumps(record, default=str) + "\n"
+            async with self._lock:
+                await asyncio.to_thread(self._append_line, line)
+                self._apply(json.loads(line))
+            return True
+        except (OSError, ValueError) as e:
+            logger.error(f"Failed to append to {self.path}: {e}")
+            return False
+
+    async def save_execution(self, execution: WorkflowExecution) -> bool:
+        """Create or update the execution header."""
+        return await self._append(
+            {
+                "op": "execution",
+                "execution_id": execution.id,
+                "data": _execution_header(execution),
+            }
+        )
+
+    async def save_step(self, execution_id: str, checkpoint: StepCheckpoint) -> bool:
+        """Checkpoint a completed step."""
+        return await self._append(
+            {"op": "step", "execution_id": execution_id, "data": checkpoint}
+        )
+
+    async def load_execution(self, execution_id: str) -> Optional[WorkflowExecution]:
+        """Load an execution with its completed steps restored."""
+        header = self._headers.get(execution_id)
+        if header is None:
+            return None
+        return _restore_execution(
+            header, list(self._steps.get(execution_id, {}).values())
+        )
+
+    async def list_executions(self, status: Optional[str] = None) -> List[str]:
+        """List stored execution IDs."""
+        return [
+            execution_id
+            for execution_id, header in self._headers.items()
+            if status is None or header.get("status") == status
+        ]
+
+    async def delete_execution(self, execution_id: str) -> bool:
+        """Delete an execution and its checkpoints."""
+        if execution_id not in self._headers:
+            return False
+        return await self._append({"op": "delete", "execution_id": execution_id})
+
+    async def compact(self) -> None:
+        """Rewrite the log keeping only live executions."""
+        async with self._lock:
+            tmp_path = self.path.with_suffix(self.path.suffix + ".tmp")
+            with open(tmp_path, "w", encoding="utf-8") as out:
+                for execution_id, header in self._headers.items():
+                    records = [{"op": "execution", "data": header}] + [
+                        {"op": "step", "data": checkpoint}
+                        for checkpoint in self._steps.get(execution_id, {}).values()
+                    ]
+                    for record in records:
+                        record["execution_id"] = execution_id
+                        out.write(json.dumps(record, default=str) + "\n")
+            self._file.close()
+            os.replace(tmp_path, self.path)
+            self._file = open(self.path, "a", encoding="utf-8")
+
+    async def close(self) -> None:
+        """Close the log file."""
+        self._file.close()
+
+
+class RedisStateStore(ExecutionStateStore):
+    """Execution state store backed by Redis hashes.
+
+    Uses ``{prefix}execution:{id}`` for the header, ``{prefix}steps:{id}``
+    mapping step IDs to checkpoints and ``{prefix}executions`` as the
+    index of execution IDs.
+    """
+
+    def __init__(self, client: Any, key_prefix: str = "workflow:"):
+        """Initialize the Redis state store.
+
+        Args:
+        client: Async Redis client (``redis.asyncio.Redis``)
+        key_prefix: Prefix for every key
+        """
+        self.client = client
+        self.key_prefix = key_prefix
+
+    def _key(self, kind: str, execution_id: str = "") -> str:
+        """Build a key."""
+        return f"{self.key_prefix}{kind}{':' + execution_id if execution_id else ''}"
+
+    async def save_execution(self, execution: WorkflowExecution) -> bool:
+        """Create or update the execution header."""
+        try:
+            await self.client.hset(
+                self._key("execution", execution.id),
+                mapping={
+                    "status": execution.status,
+                    "data": json.dumps(_execution_header(execution), default=str),
+                },
+            )
+            await self.client.sadd(self._key("executions"), execution.id)
+            return True
+        except Exception as e:
+            logger.error(f"Failed to save execution {execution.id}: {e}")
+            return False
+
+    async def save_step(self, execution_id: str, checkpoint: StepCheckpoint) -> bool:
+        """Checkpoint a completed step."""
+        try:
+            await self.client.hset(
+                self._key("steps", execution_id),
+                checkpoint["step_id"],
+                json.dumps(checkpoint, default=str),
+            )
+            return True
+        except Exception as e:
+            logger.error(f"Failed to checkpoint step for {execution_id}: {e}")
+            return False
+
+    async def load_execution(self, execution_id: str) -> Optional[WorkflowExecution]:
+        """Load an execution with its completed steps restored."""
+        try:
+            header = await self.client.hget(
+                self._key("execution", execution_id), "data"
+            )
+            if not header:
+                return None
+            steps = await self.client.hgetall(self._key("steps", execution_id))
+            checkpoints = sorted(
+                (json.loads(data) for data in steps.values()),
+                key=lambda checkpoint: str(checkpoint.get("completed_at") or ""),
+            )
+            return _restore_execution(json.loads(header), checkpoints)
+        except Exception as e:
+            logger.error(f"Failed to load execution {execution_id}: {e}")
+            return None
+
+    async def list_executions(self, status: Optional[str] = None) -> List[str]:
+        """List stored execution IDs."""
+        try:
+            execution_ids = sorted(
+                member.decode("utf-8") if isinstance(member, bytes) else member
+                for member in await self.client.smembers(self._key("executions"))
+            )
+            if status is None:
+                return execution_ids
+
+            matching = []
+            for execution_id in execution_ids:
+                stored = await self.client.hget(
+                    self._key("execution", execution_id), "status"
+                )
+                if isinstance(stored, bytes):
+                    stored = stored.decode("utf-8")
+                if stored == status:
+                    matching.append(execution_id)
+            return matching
+        except Exception as e:
+            logger.error(f"Failed to list executions: {e}")
+            return []
+
+    async def delete_execution(self, execution_id: str) -> bool:
+        """Delete an execution and its checkpoints."""
+        try:
+            deleted = await self.client.delete(
+                self._key("execution", execution_id), self._key("steps", execution_id)
+            )
+            await self.client.srem(self._key("executions"), execution_id)
+            return bool(deleted)
+        except Exception as e:
+            logger.error(f"Failed to delete execution {execution_id}: {e}")
+            return False
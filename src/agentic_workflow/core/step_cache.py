@@ -0,0 +1,224 @@
+"""Content-addressed memoization of workflow step results."""
+
+import asyncio
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple, Union
+
+from .interfaces import WorkflowStep
+from .logging_config import get_logger
+
+logger = get_logger(__name__)
+
+
+class StepResultCache:
+    """Two-tier cache of step outputs keyed by what the step computes from.
+
+    The key is a SHA-256 of the step's component, action and parameters
+    together with the outputs of its upstream steps, so a step is only
+    reused when everything it could depend on is identical. Results live in
+    an in-memory LRU and, when ``disk_path`` is set, in a SQLite file shared
+    across restarts; memory misses fall back to disk and are promoted.
+
+    Only steps marked ``cacheable`` are memoized, for ``cache_ttl`` seconds
+    or ``default_ttl`` when the step does not set one.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        default_ttl: int = 3600,
+        disk_path: Optional[Union[str, Path]] = None,
+    ):
+        """Initialize the step result cache.
+
+        Args:
+        max_entries: Results kept in memory
+        default_ttl: Seconds a result is reused when the step sets no TTL
+        disk_path: Optional SQLite file for the disk tier
+        """
+        self.max_entries = max_entries
+        self.default_ttl = default_ttl
+
+        self._memory: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self._disk: Optional[sqlite3.Connection] = None
+        self._disk_lock = threading.Lock()
+        if disk_path is not None:
+            self._open_disk(str(disk_path))
+
+        # Statistics
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+    def _open_disk(self, path: str) -> None:
+        """Open (or create) the disk tier."""
+        try:
+            self._disk = sqlite3.connect(path, check_same_thread=False)
+            self._disk.execute(
+                "CREATE TABLE IF NOT EXISTS step_results "
+                "(key TEXT PRIMARY KEY, expires_at REAL NOT NULL, value TEXT NOT NULL)"
+            )
+            self._disk.commit()
+        except sqlite3.Error as e:
+            logger.error(f"Failed to open step cache at {path}: {e}")
+            self._disk = None
+
+    @staticmethod
+    def make_key(step: WorkflowStep, upstream_outputs: Dict[str, Any]) -> str:
+        """Compute the content address of a step invocation.
+
+        Args:
+        step: Workflow step
+        upstream_outputs: Outputs of the step's dependencies by step ID
+
+        Returns:
+        Hex digest identifying the invocation
+        """
+        payload = json.dumps(
+            {
+                "component": step.component,
+                "action": step.action,
+                "parameters": step.parameters,
+                "upstream": upstream_outputs,
+            },
+            sort_keys=True,
+            separators=(",", ":"),
+            default=str,
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def ttl_for(self, step: WorkflowStep) -> int:
+        """Get the TTL for a step's results."""
+        return step.cache_ttl if step.cache_ttl is not None else self.default_ttl
+
+    async def get(self, key: str) -> Tuple[bool, Any]:
+        """Look up a cached result.
+
+        Args:
+        key: Content address from ``make_key``
+
+        Returns:
+        Tuple of (found, output)
+        """
+        now = time.time()
+        cached = self._memory.get(key)
+        if cached is not None:
+            expires_at, output = cached
+            if expires_at > now:
+                self._memory.move_to_end(key)
+                self.memory_hits += 1
+                return True, output
+            del self._memory[key]
+
+        if self._disk is not None:
+            row = await asyncio.to_thread(self._disk_load, key, now)
+            if row is not None:
+                expires_at, output = row
+                self._remember(key, expires_at, output)
+                self.disk_hits += 1
+                return True, output
+
+        self.misses += 1
+        return False, None
+
+    async def put(self, key: str, output: Any, ttl: int) -> None:
+        """Store a step result.
+
+        Args:
+        key: Content address from ``make_key``
+        output: Step output (must be JSON serializable for the disk tier)
+        ttl: Seconds the result may be reused
+        """
+        if ttl <= 0:
+            return
+        expires_at = time.time() + ttl
+        self._remember(key, expires_at, output)
+        if self._disk is not None:
+            await asyncio.to_thread(self._disk_store, key, expires_at, output)
+
+    def _remember(self, key: str, expires_at: float, output: Any) -> None:
+        """Add a result to the in-memory LRU."""
+        if self.max_entries <= 0:
+            return
+        self._memory[key] = (expires_at, output)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+
+    def _disk_load(self, key: str, now: float) -> Optional[Tuple[float, Any]]:
+        """Read an unexpired result from disk."""
+        if self._disk is None:
+            return None
+        try:
+            with self._disk_lock:
+                row = self._disk.execute(
+                    "SELECT expires_at, value FROM step_results "
+                    "WHERE key = ? AND expires_at > ?",
+                    (key, now),
+                ).fetchone()
+        except sqlite3.Error as e:
+            logger.warning(f"Failed to read step cache: {e}")
+            return None
+        if row is None:
+            return None
+        return row[0], json.loads(row[1])
+
+    def _disk_store(self, key: str, expires_at: float, output: Any) -> None:
+        """Write a result to disk."""
+        if self._disk is None:
+            return
+        try:
+            value = json.dumps(output)
+        except (TypeError, ValueError):
+            # Non-JSON outputs are only cached in memory
+            return
+        try:
+            with self._disk_lock:
+                self._disk.execute(
+                    "INSERT OR REPLACE INTO step_results (key, expires_at, value) "
+                    "VALUES (?, ?, ?)",
+                    (key, expires_at, value),
+                )
+                self._disk.execute(
+                    "DELETE FROM step_results WHERE expires_at <= ?", (time.time(),)
+                )
+                self._disk.commit()
+        except sqlite3.Error as e:
+            logger.warning(f"Failed to write step cache: {e}")
+
+    def clear(self) -> None:
+        """Drop every cached result."""
+        self._memory.clear()
+        if self._disk is not None:
+            with self._disk_lock:
+                self._disk.execute("DELETE FROM step_results")
+                self._disk.commit()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache statistics.
+
+        Returns:
+        Hit, miss and size counters
+        """
+        lookups = self.memory_hits + self.disk_hits + self.misses
+        hits = self.memory_hits + self.disk_hits
+        return {
+            "memory_entries": len(self._memory),
+            "memory_hits": self.memory_hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+            "hit_rate": hits / lookups if lookups else 0.0,
+        }
+
+    def close(self) -> None:
+        """Close the disk tier."""
+        if self._disk is not None:
+            with self._disk_lock:
+                self._disk.close()
+            self._disk = None
@@ -0,0 +1,120 @@
+"""Incremental output streams for workflow steps."""
+
+import asyncio
+from typing import Any, AsyncIterator, List, Optional
+
+
+class StepStream:
+    """Output chunks of a workflow step, readable while the step runs.
+
+    Iterating a stream yields every chunk from the first one, then waits
+    for new chunks until the step finishes, so readers that subscribe late
+    miss nothing. Steps that do not stream show up as a single chunk
+    holding their output. If the step fails, readers get an error once the
+    buffered chunks are consumed.
+    """
+
+    def __init__(self, step_id: str):
+        """Initialize the stream.
+
+        Args:
+        step_id: ID of the step producing the stream
+        """
+        self.step_id = step_id
+        self.chunks: List[Any] = []
+        self.closed = False
+        self.error: Optional[BaseException] = None
+        self._changed = asyncio.Event()
+
+    @classmethod
+    def completed(cls, step_id: str, output: Any) -> "StepStream":
+        """Build the closed stream of a step that has already finished.
+
+        Args:
+        step_id: Step ID
+        output: Step output
+
+        Returns:
+        Closed stream holding the output
+        """
+        stream = cls(step_id)
+        stream.finish(output)
+        return stream
+
+    def publish(self, chunk: Any) -> None:
+        """Append a chunk and wake waiting readers.
+
+        Args:
+        chunk: Output chunk
+
+        Raises:
+        RuntimeError: If the stream is closed
+        """
+        if self.closed:
+            raise RuntimeError(f"Stream of step {self.step_id} is closed")
+        self.chunks.append(chunk)
+        self._wake()
+
+    def finish(self, output: Any) -> None:
+        """Close the stream after the step succeeded.
+
+        Args:
+        output: Step output, published as the only chunk if none were
+            streamed
+        """
+        if self.closed:
+            return
+        if not self.chunks:
+            self.chunks.append(output)
+        self.close()
+
+    def close(self, error: Optional[BaseException] = None) -> None:
+        """Close the stream; later calls are ignored.
+
+        Args:
+        error: Failure of the step, if any
+        """
+        if self.closed:
+            return
+        self.closed = True
+        self.error = error
+        self._wake()
+
+    def _wake(self) -> None:
+        """Release every reader waiting for a change."""
+        self._changed.set()
+        self._changed = asyncio.Event()
+
+    async def __aiter__(self) -> AsyncIterator[Any]:
+        """Yield chunks as they are published.
+
+        Raises:
+        RuntimeError: If the step failed
+        """
+        position = 0
+        while True:
+            while position < len(self.chunks):
+                yield self.chunks[position]
+                position += 1
+            if self.closed:
+                if self.error is not None:
+                    raise RuntimeError(
+                        f"Step {self.step_id} failed: {self.error}"
+                    ) from self.error
+                return
+            await self._changed.wait()
+
+
+def assemble_chunks(chunks: List[Any]) -> Any:
+    """Build the output of a step that streamed without a final response.
+
+    Args:
+    chunks: Streamed chunks
+
+    Returns:
+    The chunks joined into one string when they are all strings, otherwise
+    the list of chunks
+    """
+    if chunks and all(isinstance(chunk, str) for chunk in chunks):
+        return "".join(chunks)
+    return list(chunks)
@@ -7,10 +7,24 @@ for inter-agent communication and system-wide event handling.
 import asyncio
 import json
 import logging
+import time
+from bisect import bisect_left, bisect_right
 from dataclasses import asdict, dataclass
 from datetime import UTC, datetime
 from enum import Enum
-from typing import Any, Callable, Dict, List, Optional, Union
+from itertools import islice
+from pathlib import Path
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    TextIO,
+    Tuple,
+    Union,
+)
 
 try:
     from asyncio_mqtt import Client as MQTTClient
@@ -69,12 +83,355 @@ class Event:
         return cls(**data)
 
 
+@dataclass
+class EventPage:
+    """Events after a cursor, oldest first."""
+
+    events: List[Event]
+    # Sequence number to pass back as ``since`` for the following events
+    cursor: int
+
+
+# (sequence number, monotonic event time, event)
+_HistoryEntry = Tuple[int, float, Event]
+
+
+class _EntryLog:
+    """List of history entries with cheap removal from the front.
+
+    Removed entries are skipped through a head offset and the list is
+    compacted once the removed prefix outgrows the live part, so positions
+    can be found by bisection and read from directly.
+    """
+
+    __slots__ = ("_items", "_head")
+
+    def __init__(self) -> None:
+        self._items: List[_HistoryEntry] = []
+        self._head = 0
+
+    def __len__(self) -> int:
+        return len(self._items) - self._head
+
+    def __reversed__(self) -> Iterator[_HistoryEntry]:
+        for position in range(len(self._items) - 1, self._head - 1, -1):
+            yield self._items[position]
+
+    def append(self, entry: _HistoryEntry) -> None:
+        self._items.append(entry)
+
+    def first(self) -> _HistoryEntry:
+        return self._items[self._head]
+
+    def popleft(self) -> _HistoryEntry:
+        entry = self._items[self._head]
+        self._head += 1
+        if self._head * 2 >= len(self._items):
+            del self._items[: self._head]
+            self._head = 0
+        return entry
+
+    def bisect_time(self, timestamp: float) -> int:
+        """Offset of the first entry at or after a time."""
+        items, head = self._items, self._head
+        return bisect_left(items, timestamp, lo=head, key=lambda e: e[1]) - head
+
+    def bisect_sequence(self, sequence: int) -> int:
+        """Offset of the first entry after a sequence number."""
+        items, head = self._items, self._head
+        return bisect_right(items, sequence, lo=head, key=lambda e: e[0]) - head
+
+    def iter_from(self, offset: int) -> Iterator[_HistoryEntry]:
+        """Iterate from an offset without walking the entries before it."""
+        for position in range(self._head + offset, len(self._items)):
+            yield self._items[position]
+
+
+class EventHistory:
+    """Bounded event history indexed by event type and source.
+
+    Events are numbered in publish order and kept in a ring buffer of
+    ``max_events`` entries, no older than ``max_age`` seconds. Per-type
+    and per-source indexes hold the same entries, so filtered lookups and
+    "events since" queries only touch matching events. When ``spill_dir``
+    is set, evicted events are appended to JSON-lines segment files there,
+    rotated after ``segment_bytes``, and can be read back with ``replay``.
+    """
+
+    def __init__(
+        self,
+        max_events: int = 10000,
+        max_age: Optional[float] = None,
+        spill_dir: Optional[Union[str, Path]] = None,
+        segment_bytes: int = 64 * 1024 * 1024,
+    ):
+        self.max_events = max(1, max_events)
+        self.max_age = max_age
+        self.spill_dir = Path(spill_dir) if spill_dir is not None else None
+        self.segment_bytes = segment_bytes
+        self.logger = get_logger(f"{__name__}.EventHistory")
+
+        self._entries = _EntryLog()
+        self._by_type: Dict[str, _EntryLog] = {}
+        self._by_source: Dict[str, _EntryLog] = {}
+        self._sequence = 0
+        self._last_time = float("-inf")
+
+        self._segment: Optional[TextIO] = None
+        self._segment_size = 0
+
+        # Statistics
+        self.evicted = 0
+        self.spilled = 0
+
+        if self.spill_dir is not None:
+            self._sequence = self._resume_sequence()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def append(self, event: Event) -> int:
+        """Record an event, evicting the oldest ones past the limits.
+
+        Returns:
+            Sequence number of the event
+        """
+        self._sequence += 1
+        # Clamp to keep the history time-ordered even if clocks disagree
+        self._last_time = max(self._last_time, event.timestamp.timestamp())
+        entry = (self._sequence, self._last_time, event)
+
+        self._entries.append(entry)
+        self._by_type.setdefault(event.event_type, _EntryLog()).append(entry)
+        self._by_source.setdefault(event.source, _EntryLog()).append(entry)
+
+        while len(self._entries) > self.max_events:
+            self._evict()
+        self._expire()
+        return self._sequence
+
+    def _expire(self) -> None:
+        """Evict events older than ``max_age``."""
+        if self.max_age is None:
+            return
+        oldest = time.time() - self.max_age
+        while self._entries and self._entries.first()[1] < oldest:
+            self._evict()
+
+    def _evict(self) -> None:
+        """Drop the oldest event from the buffer and its indexes."""
+        entry = self._entries.popleft()
+        event = entry[2]
+        # The oldest entry overall is also the oldest in its indexes
+        for index, key in (
+            (self._by_type, event.event_type),
+            (self._by_source, event.source),
+        ):
+            entries = index[key]
+            entries.popleft()
+            if not entries:
+                del index[key]
+        self.evicted += 1
+        if self.spill_dir is not None:
+            self._spill(entry)
+
+    def _candidates(
+        self, event_type: Optional[str], source: Optional[str]
+    ) -> _EntryLog:
+        """Get the smallest stored sequence holding the matching events."""
+        empty = _EntryLog()
+        options = []
+        if event_type is not None:
+            options.append(self._by_type.get(event_type, empty))
+        if source is not None:
+            options.append(self._by_source.get(source, empty))
+        if not options:
+            return self._entries
+        return min(options, key=len)
+
+    @staticmethod
+    def _matches(
+        event: Event, event_type: Optional[str], source: Optional[str]
+    ) -> bool:
+        return (event_type is None or event.event_type == event_type) and (
+            source is None or event.source == source
+        )
+
+    def latest(
+        self,
+        event_type: Optional[str] = None,
+        source: Optional[str] = None,
+        limit: Optional[int] = None,
+    ) -> List[Event]:
+        """Get the most recent matching events, oldest first."""
+        self._expire()
+        matching = (
+            entry[2]
+            for entry in reversed(self._candidates(event_type, source))
+            if self._matches(entry[2], event_type, source)
+        )
+        events = list(islice(matching, limit)) if limit else list(matching)
+        events.reverse()
+        return events
+
+    def since(
+        self,
+        since: Optional[Union[int, datetime]] = None,
+        event_type: Optional[str] = None,
+        source: Optional[str] = None,
+        limit: Optional[int] = None,
+    ) -> EventPage:
+        """Get matching events after a cursor, oldest first.
+
+        Args:
+            since: Cursor of a previous page or sequence number to read
+                after, or the time to read from; None reads from the oldest
+                retained event
+            event_type: Only events of this type
+            source: Only events from this source
+            limit: Maximum events returned
+
+        Returns:
+            The events and the cursor to continue from
+        """
+        self._expire()
+        candidates = self._candidates(event_type, source)
+        if since is None:
+            start = 0
+        elif isinstance(since, datetime):
+            start = candidates.bisect_time(since.timestamp())
+        else:
+            start = candidates.bisect_sequence(since)
+
+        events: List[Event] = []
+        cursor = self._sequence
+        for sequence, _, event in candidates.iter_from(start):
+            if not self._matches(event, event_type, source):
+                continue
+            events.append(event)
+            if limit and len(events) >= limit:
+                cursor = sequence
+                break
+        return EventPage(events=events, cursor=cursor)
+
+    def _segment_path(self, first_sequence: int) -> Path:
+        assert self.spill_dir is not None
+        return self.spill_dir / f"events-{first_sequence:012d}.jsonl"
+
+    def _segments(self) -> List[Path]:
+        """Get the spill segment files, oldest first."""
+        if self.spill_dir is None or not self.spill_dir.exists():
+            return []
+        return sorted(self.spill_dir.glob("events-*.jsonl"))
+
+    def _resume_sequence(self) -> int:
+        """Continue numbering after events spilled by an earlier process."""
+        segments = self._segments()
+        if not segments:
+            return 0
+        try:
+            with segments[-1].open(encoding="utf-8") as segment:
+                last_line = None
+                for last_line in segment:
+                    pass
+            if last_line:
+                return int(json.loads(last_line)["sequence"])
+        except (OSError, ValueError, KeyError) as e:
+            self.logger.error(f"Failed to read event segment {segments[-1]}: {e}")
+        return int(segments[-1].stem.split("-")[1])
+
+    def _spill(self, entry: _HistoryEntry) -> None:
+        """Append an evicted event to the current segment file."""
+        sequence, _, event = entry
+        try:
+            if self._segment is None or self._segment_size >= self.segment_bytes:
+                self._close_segment()
+                assert self.spill_dir is not None
+                self.spill_dir.mkdir(parents=True, exist_ok=True)
+                self._segment = self._segment_path(sequence).open("a", encoding="utf-8")
+                self._segment_size = 0
+            line = json.dumps(
+                {"sequence": sequence, "event": event.to_dict()}, default=str
+            )
+            self._segment.write(line + "\n")
+            self._segment_size += len(line) + 1
+            self.spilled += 1
+        except OSError as e:
+            self.logger.error(f"Failed to spill event {sequence}: {e}")
+
+    def _close_segment(self) -> None:
+        if self._segment is not None:
+            self._segment.close()
+            self._segment = None
+
+    def replay(
+        self,
+        since: Optional[int] = None,
+        event_type: Optional[str] = None,
+        source: Optional[str] = None,
+    ) -> Iterator[Event]:
+        """Yield spilled events, then retained ones, in publish order.
+
+        Args:
+            since: Only events after this sequence number
+            event_type: Only events of this type
+            source: Only events from this source
+        """
+        if self._segment is not None:
+            self._segment.flush()
+        segments = self._segments()
+        last = since if since is not None else 0
+        for position, path in enumerate(segments):
+            if since is not None and position + 1 < len(segments):
+                # Skip segments that end before the cursor
+                if int(segments[position + 1].stem.split("-")[1]) <= since + 1:
+                    continue
+            with path.open(encoding="utf-8") as segment:
+                for line in segment:
+                    record = json.loads(line)
+                    if record["sequence"] <= last:
+                        continue
+                    last = record["sequence"]
+                    event = Event.from_dict(record["event"])
+                    if self._matches(event, event_type, source):
+                        yield event
+        yield from self.since(last, event_type, source).events
+
+    def close(self) -> None:
+        """Close the open spill segment."""
+        self._close_segment()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get history statistics."""
+        return {
+            "size": len(self._entries),
+            "max_events": self.max_events,
+            "oldest_sequence": self._entries.first()[0] if self._entries else None,
+            "latest_sequence": self._sequence,
+            "event_types": len(self._by_type),
+            "sources": len(self._by_source),
+            "evicted": self.evicted,
+            "spilled": self.spilled,
+        }
+
+
 class EventBus:
     """In-memory event bus for local event handling."""
 
-    def __init__(self):
+    def __init__(
+        self,
+        max_events: int = 10000,
+        max_age: Optional[float] = None,
+        spill_dir: Optional[Union[str, Path]] = None,
+        segment_bytes: int = 64 * 1024 * 1024,
+    ):
         self._subscribers: Dict[str, List[Callable]] = {}
-        self._event_history: List[Event] = []
+        self.history = EventHistory(
+            max_events=max_events,
+            max_age=max_age,
+            spill_dir=spill_dir,
+            segment_bytes=segment_bytes,
+        )
         self.logger = get_logger(f"{__name__}.EventBus")
 
     def subscribe(self, event_type: str, handler: Callable[[Event], None]) -> None:
@@ -92,7 +449,7 @@ class EventBus:
 
     async def publish(self, event: Event) -> None:
         """Publish an event to all subscribers."""
-        self._event_history.append(event)
+        self.history.append(event)
 
         # Notify subscribers for specific event type
         if event.event_type in self._subscribers:
@@ -117,18 +474,27 @@ class EventBus:
                     self.logger.error(f"Error in wildcard event handler: {e}")
 
     def get_events(
-        self, event_type: Optional[str] = None, limit: Optional[int] = None
+        self,
+        event_type: Optional[str] = None,
+        limit: Optional[int] = None,
+        source: Optional[str] = None,
     ) -> List[Event]:
         """Get event history with optional filtering."""
-        events = self._event_history
+        return self.history.latest(event_type, source, limit)
 
-        if event_type:
-            events = [e for e in events if e.event_type == event_type]
-
-        if limit:
-            events = events[-limit:]
+    def get_events_since(
+        self,
+        since: Optional[Union[int, datetime]] = None,
+        event_type: Optional[str] = None,
+        source: Optional[str] = None,
+        limit: Optional[int] = None,
+    ) -> EventPage:
+        """Get events after a cursor or time, oldest first."""
+        return self.history.since(since, event_type, source, limit)
 
-        return events
+    def close(self) -> None:
+        """Close the history's spill file."""
+        self.history.close()
 
 
 class MQTTEventManager:
@@ -221,7 +587,12 @@ class EventManager:
 
     def __init__(self):
         self.config = get_config()
-        self.local_bus = EventBus()
+        self.local_bus = EventBus(
+            max_events=self.config.event_history_size,
+            max_age=self.config.event_history_max_age,
+            spill_dir=self.config.event_spill_dir,
+            segment_bytes=self.config.event_spill_segment_bytes,
+        )
         self.mqtt_manager = None
         self.logger = get_logger(__name__)
 
@@ -244,6 +615,7 @@ class EventManager:
         """Stop the event manager."""
         if self.mqtt_manager:
             await self.mqtt_manager.disconnect()
+        self.local_bus.close()
         self.logger.info("Event manager stopped")
 
     def subscribe(self, event_type: str, handler: Callable[[Event], None]) -> None:
@@ -290,6 +662,16 @@ class EventManager:
         """Get event history from local bus."""
         return self.local_bus.get_events(event_type, limit)
 
+    def get_events_since(
+        self,
+        since: Optional[Union[int, datetime]] = None,
+        event_type: Optional[str] = None,
+        source: Optional[str] = None,
+        limit: Optional[int] = None,
+    ) -> EventPage:
+        """Get events from local bus after a cursor or time."""
+        return self.local_bus.get_events_since(since, event_type, source, limit)
+
 
 # Global event manager instance
 event_manager = EventManager()
@@ -394,6 +776,8 @@ __all__ = [
     "Event",
     "EventType",
     "EventBus",
+    "EventHistory",
+    "EventPage",
     "MQTTEventManager",
     "EventManager",
     "event_manager",
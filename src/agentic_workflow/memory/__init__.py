@@ -1,6 +1,8 @@
 """Memory management module for the agentic workflow system."""
 
 from .cache_store import RedisCacheStore
+from .codec import EntryCodec, get_entry_codec, register_entry_codec
+from .embedding_pipeline import EmbeddingPipeline
 from .factory import MemoryStoreFactory
 from .interfaces import (
     BasicMemoryStore,
@@ -17,6 +19,8 @@ from .interfaces import (
 )
 from .manager import MemoryManager
 from .short_term import ShortTermMemory
+from .text_index import TextIndex
+from .vector_index import VectorIndex
 
 try:
     from .vector_store import WeaviateVectorStore
@@ -41,6 +45,13 @@ __all__ = [
     "RedisCacheStore",
     "ShortTermMemory",
     "WeaviateVectorStore",
+    "VectorIndex",
+    "TextIndex",
+    "EmbeddingPipeline",
+    # Serialization
+    "EntryCodec",
+    "get_entry_codec",
+    "register_entry_codec",
     # Manager
     "MemoryManager",
     # Factory
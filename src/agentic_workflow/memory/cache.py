@@ -4,10 +4,11 @@ import json
 import pickle
 import time
 from datetime import UTC, datetime
-from typing import TYPE_CHECKING, Any, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, cast
 
 from ..core.config import get_config
 from ..core.logging_config import get_logger
+from .codec import decode_entry, get_entry_codec, is_binary_payload
 from .interfaces import (
     CacheStore,
     MemoryEntry,
@@ -68,6 +69,8 @@ class CacheMemoryStore(CacheStore):
         self.default_ttl = int(self.config.get("default_ttl", 3600))  # 1 hour
         self.max_connections = int(self.config.get("max_connections", 10))
         self.encoding = self.config.get("encoding", "utf-8")
+        self.scan_batch_size = int(self.config.get("scan_batch_size", 100))
+        self.codec = get_entry_codec(self.config.get("codec", "struct"))
 
         # Parse Redis URL
         self.redis_config = self._parse_redis_url(redis_url)
@@ -76,6 +79,10 @@ class CacheMemoryStore(CacheStore):
         self.client: Optional[Redis] = None
         self.connection_pool: Optional[redis.ConnectionPool] = None
 
+        # Client returning raw bytes, for reading binary entry payloads
+        self.binary_client: Optional[Redis] = None
+        self.binary_connection_pool: Optional[redis.ConnectionPool] = None
+
         # Statistics
         self.total_sets = 0
         self.total_gets = 0
@@ -143,6 +150,14 @@ class CacheMemoryStore(CacheStore):
             if self.client is not None:
                 await self.client.ping()
 
+            self.binary_connection_pool = redis.ConnectionPool(
+                max_connections=self.max_connections,
+                **{**self.redis_config, "decode_responses": False},
+            )
+            self.binary_client = redis.Redis(
+                connection_pool=self.binary_connection_pool
+            )
+
             logger.info(
                 f"Connected to Redis at {self.redis_config['host']}:{self.redis_config['port']}"
             )
@@ -153,6 +168,8 @@ class CacheMemoryStore(CacheStore):
             logger.error(f"Failed to connect to Redis: {e}")
             self.client = None
             self.connection_pool = None
+            self.binary_client = None
+            self.binary_connection_pool = None
             return False
 
     async def _ensure_client(self) -> bool:
@@ -169,28 +186,27 @@ class CacheMemoryStore(CacheStore):
         """Create a prefixed cache key."""
         return f"{self.key_prefix}{key}"
 
-    def _serialize_entry(self, entry: MemoryEntry) -> str:
-        """Serialize memory entry to JSON string."""
+    def _entry_client(self) -> "Redis":
+        """Get the client used to read entry payloads.
+
+        Callers must have checked that ``self.client`` is connected.
+        """
+        return cast("Redis", self.binary_client or self.client)
+
+    def _serialize_entry(self, entry: MemoryEntry) -> bytes:
+        """Encode memory entry with the configured codec."""
         try:
-            data = {
-                "id": entry.id,
-                "content": entry.content,
-                "metadata": entry.metadata,
-                "memory_type": entry.memory_type.value,
-                "timestamp": entry.timestamp.isoformat(),
-                "ttl": entry.ttl,
-                "embedding": entry.embedding,
-                "tags": entry.tags,
-                "priority": entry.priority,
-            }
-            return json.dumps(data)
+            return self.codec.encode(entry)
         except Exception as e:
             logger.error(f"Failed to serialize entry: {e}")
-            return "{}"
+            return b"{}"
 
-    def _deserialize_entry(self, data: str) -> Optional[MemoryEntry]:
-        """Deserialize JSON string to memory entry."""
+    def _deserialize_entry(self, data: Any) -> Optional[MemoryEntry]:
+        """Decode a stored payload (binary codec or legacy JSON) to an entry."""
         try:
+            if is_binary_payload(data):
+                return decode_entry(data)
+
             entry_data = json.loads(data)
 
             # Parse timestamp
@@ -244,6 +260,76 @@ class CacheMemoryStore(CacheStore):
             logger.error(f"Failed to store entry {entry.id}: {e}")
             return False
 
+    async def store_many(self, entries: List[MemoryEntry]) -> List[bool]:
+        """Store several memory entries in one pipelined round trip.
+
+        Args:
+            entries: Memory entries to store
+
+        Returns:
+            Success flag for each entry, in input order
+        """
+        if not entries:
+            return []
+
+        try:
+            if not await self._ensure_client() or self.client is None:
+                return [False] * len(entries)
+
+            pipe = self.client.pipeline(transaction=False)
+            for entry in entries:
+                pipe.setex(
+                    self._make_key(entry.id),
+                    entry.ttl or self.default_ttl,
+                    self._serialize_entry(entry),
+                )
+            results = await pipe.execute()
+
+            self.total_sets += len(entries)
+
+            logger.debug(f"Stored {len(entries)} entries in cache")
+            return [bool(result) for result in results]
+
+        except Exception as e:
+            logger.error(f"Failed to store cache entries: {e}")
+            return [False] * len(entries)
+
+    async def get_many(self, entry_ids: List[str]) -> Dict[str, MemoryEntry]:
+        """Get several memory entries with a single MGET.
+
+        Args:
+            entry_ids: IDs of the entries to get
+
+        Returns:
+            Found entries keyed by ID; missing IDs are omitted
+        """
+        if not entry_ids:
+            return {}
+
+        try:
+            if not await self._ensure_client() or self.client is None:
+                return {}
+
+            values = await self._entry_client().mget(
+                [self._make_key(entry_id) for entry_id in entry_ids]
+            )
+
+            found: Dict[str, MemoryEntry] = {}
+            for entry_id, value in zip(entry_ids, values):
+                self.total_gets += 1
+                entry = self._deserialize_entry(value) if value else None
+                if entry:
+                    found[entry_id] = entry
+                    self.cache_hits += 1
+                else:
+                    self.cache_misses += 1
+
+            return found
+
+        except Exception as e:
+            logger.error(f"Failed to get cache entries: {e}")
+            return {}
+
     async def retrieve(self, query: MemoryQuery) -> MemoryResult:
         """Retrieve memory entries based on query.
 
@@ -270,16 +356,18 @@ class CacheMemoryStore(CacheStore):
                 )
 
             matching_entries = []
+            # Lowercase the query once rather than once per scanned entry
+            content_needle = query.content.lower() if query.content else None
 
             # If looking for specific content, try direct key lookup
             if query.content and len(query.content.split()) == 1:
                 # Assume content might be a key
                 possible_key = self._make_key(query.content)
-                value = await self.client.get(possible_key)
+                value = await self._entry_client().get(possible_key)
 
                 if value:
                     entry = self._deserialize_entry(value)
-                    if entry and self._matches_query(entry, query):
+                    if entry and self._matches_query(entry, query, content_needle):
                         matching_entries.append(entry)
                         self.cache_hits += 1
                     else:
@@ -291,18 +379,26 @@ class CacheMemoryStore(CacheStore):
             if not matching_entries and query.limit <= 100:  # Limit scan operations
                 pattern = f"{self.key_prefix}*"
 
-                async for key in self.client.scan_iter(match=pattern, count=100):
+                batch: List[str] = []
+
+                # Fetch scanned keys with one MGET per batch
+                async for key in self.client.scan_iter(
+                    match=pattern, count=self.scan_batch_size
+                ):
+                    batch.append(key)
+                    if len(batch) < self.scan_batch_size:
+                        continue
+                    await self._collect_matches(
+                        batch, query, content_needle, matching_entries
+                    )
+                    batch = []
                     if len(matching_entries) >= query.limit:
                         break
 
-                    try:
-                        value = await self.client.get(key)
-                        if value:
-                            entry = self._deserialize_entry(value)
-                            if entry and self._matches_query(entry, query):
-                                matching_entries.append(entry)
-                    except Exception:
-                        continue  # Skip problematic entries
+                if batch and len(matching_entries) < query.limit:
+                    await self._collect_matches(
+                        batch, query, content_needle, matching_entries
+                    )
 
             # Sort by priority and timestamp
             matching_entries.sort(
@@ -335,15 +431,68 @@ class CacheMemoryStore(CacheStore):
                 success=False,
             )
 
-    def _matches_query(self, entry: MemoryEntry, query: MemoryQuery) -> bool:
-        """Check if an entry matches the query criteria."""
+    async def _collect_matches(
+        self,
+        keys: List[str],
+        query: MemoryQuery,
+        content_needle: Optional[str],
+        matching_entries: List[MemoryEntry],
+    ) -> None:
+        """Load a batch of keys with MGET and keep the entries that match.
+
+        Args:
+        keys: Cache keys to load
+        query: Query parameters
+        content_needle: Pre-lowercased query content
+        matching_entries: List that matching entries are appended to
+        """
+        if self.client is None:
+            return
+
+        try:
+            values = await self._entry_client().mget(keys)
+        except Exception as e:
+            logger.warning(f"Failed to load cache batch: {e}")
+            return
+
+        for value in values:
+            if len(matching_entries) >= query.limit:
+                break
+            if not value:
+                continue
+            try:
+                entry = self._deserialize_entry(value)
+                if entry and self._matches_query(entry, query, content_needle):
+                    matching_entries.append(entry)
+            except Exception:
+                continue  # Skip problematic entries
+
+    def _matches_query(
+        self,
+        entry: MemoryEntry,
+        query: MemoryQuery,
+        content_needle: Optional[str] = None,
+    ) -> bool:
+        """Check if an entry matches the query criteria.
+
+        Args:
+        entry: Memory entry to check
+        query: Query parameters
+        content_needle: Pre-lowercased query content, if already computed
+
+        Returns:
+        True if the entry matches, False otherwise
+        """
         # Memory type filter
         if query.memory_type and entry.memory_type != query.memory_type:
             return False
 
         # Content filter (simple text search)
-        if query.content and query.content.lower() not in entry.content.lower():
-            return False
+        if query.content:
+            if content_needle is None:
+                content_needle = query.content.lower()
+            if content_needle not in entry.content.lower():
+                return False
 
         # Tags filter
         if query.tags:
@@ -378,7 +527,7 @@ class CacheMemoryStore(CacheStore):
                 return False
 
             key = self._make_key(entry_id)
-            value = await self.client.get(key)
+            value = await self._entry_client().get(key)
 
             if not value:
                 logger.warning(f"Entry not found in cache: {entry_id}")
@@ -432,6 +581,35 @@ class CacheMemoryStore(CacheStore):
             logger.error(f"Failed to delete cache entry: {e}")
             return False
 
+    async def delete_many(self, entry_ids: List[str]) -> List[bool]:
+        """Delete several memory entries in one pipelined round trip.
+
+        Args:
+            entry_ids: IDs of the entries to delete
+
+        Returns:
+            Deletion flag for each ID, in input order
+        """
+        if not entry_ids:
+            return []
+
+        try:
+            if not await self._ensure_client() or self.client is None:
+                return [False] * len(entry_ids)
+
+            # One DEL per key so each ID gets its own result
+            pipe = self.client.pipeline(transaction=False)
+            for entry_id in entry_ids:
+                pipe.delete(self._make_key(entry_id))
+            results = await pipe.execute()
+
+            logger.debug(f"Deleted {sum(map(bool, results))} entries from cache")
+            return [bool(result) for result in results]
+
+        except Exception as e:
+            logger.error(f"Failed to delete cache entries: {e}")
+            return [False] * len(entry_ids)
+
     async def clear(self, memory_type: Optional[MemoryType] = None) -> bool:
         """Clear memory entries.
 
@@ -463,7 +641,7 @@ class CacheMemoryStore(CacheStore):
 
             async for key in self.client.scan_iter(match=pattern, count=100):
                 try:
-                    value = await self.client.get(key)
+                    value = await self._entry_client().get(key)
                     if value:
                         entry = self._deserialize_entry(value)
                         if entry and entry.memory_type == memory_type:
@@ -513,7 +691,7 @@ class CacheMemoryStore(CacheStore):
                 # Try to get memory type from entry (expensive)
                 if total_entries <= 1000:  # Limit detailed analysis
                     try:
-                        value = await self.client.get(key)
+                        value = await self._entry_client().get(key)
                         if value:
                             entry = self._deserialize_entry(value)
                             if entry:
@@ -702,6 +880,10 @@ class CacheMemoryStore(CacheStore):
             await self.client.close()
             self.client = None
             self.connection_pool = None
+        if self.binary_client is not None:
+            await self.binary_client.close()
+            self.binary_client = None
+            self.binary_connection_pool = None
 
         logger.info("Cache memory store closed")
 
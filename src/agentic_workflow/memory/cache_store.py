@@ -1,11 +1,29 @@
 """Redis-based cache store implementation with improved architecture."""
 
+import asyncio
+import heapq
 import json
 import time
-from typing import Any, Dict, List, Optional, cast
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    cast,
+)
+
+import numpy as np
 
 from ..core.logging_config import get_logger
-from ..utils.serialization import memory_entry_to_dict, serialize_to_json
+from ..utils.embeddings import get_embedding_provider
+from ..utils.serialization import serialize_to_json
+from .codec import decode_entry, get_entry_codec
 from .connections import RedisConnectionManager
 from .connections.redis_connection import RedisClientNotAvailableError
 from .interfaces import (
@@ -16,15 +34,53 @@ from .interfaces import (
     MemoryStats,
     MemoryType,
 )
+from .vector_index import VectorIndex
 
 logger = get_logger(__name__)
 
+# Weight that keeps priority dominant over the timestamp in the rank score
+_RANK_PRIORITY_WEIGHT = 1e10
+
+
+def _decode(value: Any) -> str:
+    """Decode a Redis reply that may be bytes or str."""
+    return value.decode("utf-8") if isinstance(value, bytes) else str(value)
+
+
+def _pack_vector(embedding: Sequence[float]) -> bytes:
+    """Pack an embedding as little-endian float32 bytes."""
+    return np.asarray(embedding, dtype="<f4").tobytes()
+
+
+def _stream_id(message_id: str) -> Tuple[int, int]:
+    """Parse a Redis stream ID into a comparable tuple."""
+    millis, _, sequence = message_id.partition("-")
+    return int(millis), int(sequence or 0)
+
 
 class RedisCacheStore(CacheStore):
     """Redis-based cache store with improved architecture.
 
     This implementation uses a dedicated connection manager and adheres to
     both the legacy CacheStore interface and the new KeyValueStore protocol.
+
+    Embeddings are kept out of the JSON payload and stored as packed
+    float32 bytes in one hash per memory type (the type's vector block).
+    ``similarity_search`` loads the blocks with one pipelined round trip
+    and scores them with NumPy; with ``vector_mirror`` enabled the blocks
+    are mirrored in process and kept current by replaying a change stream.
+
+    Example config:
+    ```python
+    config = {
+        "codec": "struct",  # Entry payload codec (see memory.codec)
+        "embedding_provider": "local",  # See get_embedding_provider
+        "embedding": {"dimension": 384},  # Provider configuration
+        "auto_embed": False,  # Embed entries stored without an embedding
+        "vector_mirror": False,  # Keep an in-process copy of the vectors
+        "vector_index": {},  # VectorIndex configuration for the mirror
+    }
+    ```
     """
 
     def __init__(
@@ -38,6 +94,31 @@ class RedisCacheStore(CacheStore):
         """
         super().__init__(name, config)
 
+        # Number of keys fetched per MGET when loading entries
+        self.mget_chunk_size = int(self.config.get("mget_chunk_size", 500))
+
+        # Payload codec; entries written by any registered codec stay readable
+        self.codec = get_entry_codec(self.config.get("codec", "struct"))
+
+        # Embeddings for text queries and, if enabled, entries stored without one
+        self.auto_embed = bool(self.config.get("auto_embed", False))
+        self.embedding_provider = get_embedding_provider(
+            self.config.get("embedding_provider", "local"),
+            self.config.get("embedding", {}),
+        )
+
+        # Optional in-process mirror of the vector blocks
+        self.vector_changes_maxlen = int(
+            self.config.get("vector_changes_maxlen", 100000)
+        )
+        self.vector_mirror: Optional[VectorIndex] = None
+        if self.config.get("vector_mirror", False):
+            self.vector_mirror = VectorIndex(self.config.get("vector_index", {}))
+        self._mirror_cursor: Optional[str] = None
+
+        # Set once entries written before the rank index existed are ranked
+        self._rank_backfilled = False
+
         # Create Redis connection manager
         self.redis = RedisConnectionManager(f"{name}_connection", self.config)
 
@@ -66,6 +147,420 @@ class RedisCacheStore(CacheStore):
         """Get Redis key for tag index."""
         return f"tag:{tag}"
 
+    def _get_rank_key(self) -> str:
+        """Get Redis key for the sorted set ordering entries by rank."""
+        return "rank:entries"
+
+    def _get_rank_marker_key(self) -> str:
+        """Get Redis key marking that legacy entries were added to the rank index."""
+        return "rank:backfilled"
+
+    def _get_vector_key(self, memory_type: MemoryType) -> str:
+        """Get Redis key for the vector block of a memory type."""
+        return f"vectors:{memory_type.value}"
+
+    def _get_vector_changes_key(self) -> str:
+        """Get Redis key for the stream of vector block changes."""
+        return "vectors:changes"
+
+    def _binary_client(self) -> Any:
+        """Get a client that returns raw bytes for vector reads."""
+        return getattr(self.redis, "binary_client", None) or self.redis.client
+
+    def _serialize_payload(self, entry: MemoryEntry) -> bytes:
+        """Encode an entry without its embedding (kept in the vector block)."""
+        return self.codec.encode(entry.model_copy(update={"embedding": None}))
+
+    async def _embeddings_for(
+        self, entries: List[MemoryEntry]
+    ) -> List[Optional[List[float]]]:
+        """Get the embedding to store for each entry.
+
+        Entries without an embedding are embedded in one batch when
+        ``auto_embed`` is enabled. The entries themselves are not modified.
+        """
+        embeddings: List[Optional[List[float]]] = [
+            list(entry.embedding) if entry.embedding else None for entry in entries
+        ]
+        missing = [i for i, embedding in enumerate(embeddings) if embedding is None]
+        if missing and self.auto_embed:
+            try:
+                generated = await self._embed_texts(
+                    [entries[i].content for i in missing]
+                )
+                for i, embedding in zip(missing, generated):
+                    embeddings[i] = embedding or None
+            except Exception as e:
+                logger.warning(f"Failed to embed entries: {e}")
+        return embeddings
+
+    async def _embed_texts(self, texts: List[str]) -> List[List[float]]:
+        """Embed texts without blocking the event loop.
+
+        Providers with a synchronous ``embed_documents`` (such as the local
+        hashing provider) are CPU-bound and run in a worker thread; others
+        are awaited directly.
+        """
+        embed_documents = getattr(self.embedding_provider, "embed_documents", None)
+        if callable(embed_documents):
+            return await asyncio.to_thread(embed_documents, texts)
+        return await self.embedding_provider.embed_batch(texts)
+
+    def _queue_vector_writes(
+        self, pipe: Any, items: List[Tuple[MemoryEntry, List[float]]]
+    ) -> None:
+        """Queue vector block writes and change records on a pipeline."""
+        blocks: Dict[str, Dict[str, bytes]] = {}
+        for entry, embedding in items:
+            vector_key = self._get_vector_key(entry.memory_type)
+            blocks.setdefault(vector_key, {})[entry.id] = _pack_vector(embedding)
+        for vector_key, mapping in blocks.items():
+            pipe.hset(vector_key, mapping=mapping)
+        for entry, _ in items:
+            self._queue_vector_change(pipe, entry.memory_type.value, entry.id)
+
+        if self.vector_mirror is not None:
+            for entry, embedding in items:
+                self.vector_mirror.add(entry.id, embedding)
+
+    def _queue_vector_deletes(
+        self, pipe: Any, items: List[Tuple[MemoryType, str]]
+    ) -> None:
+        """Queue vector block deletions and change records on a pipeline."""
+        blocks: Dict[str, List[str]] = {}
+        for memory_type, entry_id in items:
+            blocks.setdefault(self._get_vector_key(memory_type), []).append(entry_id)
+        for vector_key, entry_ids in blocks.items():
+            pipe.hdel(vector_key, *entry_ids)
+        for memory_type, entry_id in items:
+            self._queue_vector_change(pipe, memory_type.value, entry_id)
+
+        if self.vector_mirror is not None:
+            for _, entry_id in items:
+                self.vector_mirror.remove(entry_id)
+
+    def _queue_vector_change(self, pipe: Any, type_value: str, entry_id: str) -> None:
+        """Record a vector block change for mirrors to replay."""
+        pipe.xadd(
+            self._get_vector_changes_key(),
+            {"type": type_value, "id": entry_id},
+            maxlen=self.vector_changes_maxlen,
+            approximate=True,
+        )
+
+    async def _attach_embeddings(self, entries: List[MemoryEntry]) -> None:
+        """Restore embeddings from the vector blocks onto loaded entries."""
+        by_type: Dict[MemoryType, List[MemoryEntry]] = {}
+        for entry in entries:
+            if entry.embedding is None:
+                by_type.setdefault(entry.memory_type, []).append(entry)
+        if not by_type:
+            return
+
+        pipe = self._binary_client().pipeline(transaction=False)
+        for memory_type, typed in by_type.items():
+            pipe.hmget(self._get_vector_key(memory_type), [entry.id for entry in typed])
+        replies = await pipe.execute()
+
+        for typed, blobs in zip(by_type.values(), replies):
+            for entry, blob in zip(typed, blobs):
+                if blob:
+                    entry.embedding = np.frombuffer(blob, dtype="<f4").tolist()
+
+    async def _load_vectors(self, dimension: int) -> Tuple[List[str], np.ndarray]:
+        """Load every stored vector of the given dimension.
+
+        All vector blocks are fetched in one pipelined round trip. Vectors
+        of another dimension (e.g. from a different embedding model) are
+        skipped.
+
+        Returns:
+        Entry IDs and the matching ``(n, dimension)`` float32 matrix
+        """
+        pipe = self._binary_client().pipeline(transaction=False)
+        for memory_type in MemoryType:
+            pipe.hgetall(self._get_vector_key(memory_type))
+        blocks = await pipe.execute()
+
+        size = dimension * 4
+        ids: List[str] = []
+        blobs: List[bytes] = []
+        for block in blocks:
+            for entry_id, blob in (block or {}).items():
+                if len(blob) == size:
+                    ids.append(_decode(entry_id))
+                    blobs.append(blob)
+
+        vectors = np.frombuffer(b"".join(blobs), dtype="<f4")
+        return ids, vectors.reshape(len(ids), dimension)
+
+    @staticmethod
+    def _rank_vectors(
+        ids: List[str], vectors: np.ndarray, query: np.ndarray, threshold: float
+    ) -> List[Tuple[str, float]]:
+        """Score vectors by cosine similarity and rank those above threshold."""
+        if not ids:
+            return []
+        norms = np.linalg.norm(vectors, axis=1) * np.linalg.norm(query)
+        norms[norms == 0.0] = 1.0
+        scores = (vectors @ query) / norms
+
+        above = np.flatnonzero(scores >= threshold)
+        order = above[np.argsort(-scores[above], kind="stable")]
+        return [(ids[i], float(scores[i])) for i in order]
+
+    async def _refresh_mirror(self) -> None:
+        """Bring the in-process vector mirror up to date.
+
+        The first call loads every vector block. Later calls replay the
+        change stream from the last seen ID and re-read only the changed
+        vectors. The mirror is reloaded when the blocks were cleared or
+        when the stream was trimmed past the cursor.
+        """
+        mirror = cast(VectorIndex, self.vector_mirror)
+        client = self._binary_client()
+        stream = self._get_vector_changes_key()
+
+        if self._mirror_cursor is not None:
+            pipe = client.pipeline(transaction=False)
+            pipe.xrange(stream, "-", "+", count=1)
+            pipe.xread({stream: self._mirror_cursor})
+            first, replies = await pipe.execute()
+
+            changes = [
+                (_decode(message_id), fields)
+                for _, messages in (replies or [])
+                for message_id, fields in messages
+            ]
+            fields_list = [
+                {_decode(k): _decode(v) for k, v in fields.items()}
+                for _, fields in changes
+            ]
+            trimmed = bool(first) and _stream_id(_decode(first[0][0])) > _stream_id(
+                self._mirror_cursor
+            )
+            if not trimmed and not any("reset" in f for f in fields_list):
+                if changes:
+                    await self._apply_mirror_changes(mirror, fields_list)
+                    self._mirror_cursor = changes[-1][0]
+                return
+
+        # Full load: capture the cursor first so no change is missed
+        pipe = client.pipeline(transaction=False)
+        pipe.xrevrange(stream, "+", "-", count=1)
+        for memory_type in MemoryType:
+            pipe.hgetall(self._get_vector_key(memory_type))
+        last, *blocks = await pipe.execute()
+
+        mirror.clear()
+        for block in blocks:
+            for entry_id, blob in (block or {}).items():
+                mirror.add(_decode(entry_id), np.frombuffer(blob, dtype="<f4"))
+        self._mirror_cursor = _decode(last[0][0]) if last else "0-0"
+
+    async def _apply_mirror_changes(
+        self, mirror: VectorIndex, changes: List[Dict[str, str]]
+    ) -> None:
+        """Re-read changed vectors and apply them to the mirror."""
+        changed = {(f["type"], f["id"]) for f in changes if "id" in f}
+        if not changed:
+            return
+
+        pipe = self._binary_client().pipeline(transaction=False)
+        for type_value, entry_id in changed:
+            pipe.hget(self._get_vector_key(MemoryType(type_value)), entry_id)
+        blobs = await pipe.execute()
+
+        for (_, entry_id), blob in zip(changed, blobs):
+            if blob:
+                mirror.add(entry_id, np.frombuffer(blob, dtype="<f4"))
+            else:
+                mirror.remove(entry_id)
+
+    def _rank_score(self, entry: MemoryEntry) -> float:
+        """Get the rank score of an entry (priority first, then recency)."""
+        return entry.priority * _RANK_PRIORITY_WEIGHT + entry.timestamp.timestamp()
+
+    def _parse_entry(self, entry_id: str, entry_data: Any) -> Optional[MemoryEntry]:
+        """Parse a stored entry payload.
+
+        Args:
+        entry_id: Entry ID (for logging)
+        entry_data: Raw payload from Redis
+
+        Returns:
+        Memory entry or None if the payload is invalid
+        """
+        try:
+            return decode_entry(entry_data)
+        except Exception as e:
+            logger.error(f"Failed to parse entry {entry_id}: {e}")
+            return None
+
+    async def _fetch_entries(
+        self, entry_ids: List[str], missing: Optional[List[str]] = None
+    ) -> List[MemoryEntry]:
+        """Load entries with chunked MGETs sent in a single pipeline.
+
+        Args:
+        entry_ids: IDs to load, in the order results should be returned
+        missing: Optional list that collects IDs whose payload is gone
+
+        Returns:
+        Entries that still exist, in the requested order
+        """
+        if not entry_ids:
+            return []
+
+        pipe = self._binary_client().pipeline(transaction=False)
+        for start in range(0, len(entry_ids), self.mget_chunk_size):
+            chunk = entry_ids[start : start + self.mget_chunk_size]
+            pipe.mget([self._get_key(entry_id) for entry_id in chunk])
+        replies = await pipe.execute()
+
+        entries: List[MemoryEntry] = []
+        payloads = (payload for reply in replies for payload in reply)
+        for entry_id, payload in zip(entry_ids, payloads):
+            if payload:
+                entry = self._parse_entry(entry_id, payload)
+                if entry:
+                    entries.append(entry)
+            elif missing is not None:
+                missing.append(entry_id)
+        return entries
+
+    async def _fetch_ranked(
+        self,
+        read_ids: Callable[[int, int], Awaitable[List[str]]],
+        limit: int,
+    ) -> Tuple[List[MemoryEntry], List[str]]:
+        """Load the first ``limit`` live entries in rank order.
+
+        IDs whose payload has expired are skipped and reading continues
+        further down the ranking until enough live entries are found.
+
+        Args:
+        read_ids: Returns ``count`` ranked IDs starting at ``offset``
+        limit: Number of live entries wanted
+
+        Returns:
+        Live entries in rank order and the IDs found without a payload
+        """
+        entries: List[MemoryEntry] = []
+        dead: List[str] = []
+        offset = 0
+        while len(entries) < limit:
+            count = limit - len(entries)
+            entry_ids = await read_ids(offset, count)
+            entries.extend(await self._fetch_entries(entry_ids, dead))
+            offset += len(entry_ids)
+            if len(entry_ids) < count:
+                break
+        return entries, dead
+
+    async def _prune_index(
+        self, client: Any, entry_ids: List[str], tag_keys: Sequence[str] = ()
+    ) -> None:
+        """Drop index references to entries whose payload has expired.
+
+        The tags of an expired entry are no longer known, so only the given
+        tag sets are cleaned; other tag sets are pruned when a query on
+        them runs into the same IDs.
+        """
+        pipe = client.pipeline(transaction=False)
+        pipe.zrem(self._get_rank_key(), *entry_ids)
+        for memory_type in MemoryType:
+            pipe.srem(self._get_type_key(memory_type), *entry_ids)
+        for tag_key in tag_keys:
+            pipe.srem(tag_key, *entry_ids)
+        pipe.delete(*[self._get_metadata_key(entry_id) for entry_id in entry_ids])
+        self._queue_vector_deletes(
+            pipe,
+            [
+                (memory_type, entry_id)
+                for entry_id in entry_ids
+                for memory_type in MemoryType
+            ],
+        )
+        await pipe.execute()
+
+    async def _backfill_rank(self, client: Any) -> None:
+        """Add entries written before the rank index existed to it.
+
+        The keyspace is scanned once per database; a marker key records
+        that the scan finished so other processes skip it.
+        """
+        if self._rank_backfilled:
+            return
+
+        if not await client.exists(self._get_rank_marker_key()):
+            entry_ids = [
+                _decode(key).split(":", 1)[-1]
+                async for key in client.scan_iter(match="entry:*", count=500)
+            ]
+            for start in range(0, len(entry_ids), self.mget_chunk_size):
+                chunk = entry_ids[start : start + self.mget_chunk_size]
+                scores = await client.zmscore(self._get_rank_key(), chunk)
+                unranked = [
+                    entry_id
+                    for entry_id, score in zip(chunk, scores or [None] * len(chunk))
+                    if score is None
+                ]
+                entries = await self._fetch_entries(unranked)
+                if entries:
+                    await client.zadd(
+                        self._get_rank_key(),
+                        {entry.id: self._rank_score(entry) for entry in entries},
+                    )
+            await client.set(self._get_rank_marker_key(), "1")
+
+        self._rank_backfilled = True
+
+    async def _candidate_ids(
+        self, client: Any, query: MemoryQuery
+    ) -> Optional[Set[str]]:
+        """Resolve type and tag filters against the index sets.
+
+        Tags match if an entry has any of them (SUNION); a memory type
+        narrows that down (SINTER with the type set).
+
+        Returns:
+        Matching entry IDs, or None if the query has no indexed filters
+        """
+        type_key = self._get_type_key(query.memory_type) if query.memory_type else None
+        tag_keys = [self._get_tag_key(tag) for tag in dict.fromkeys(query.tags)]
+
+        if not type_key and not tag_keys:
+            return None
+
+        if type_key and tag_keys:
+            pipe = client.pipeline(transaction=False)
+            for tag_key in tag_keys:
+                pipe.sinter(type_key, tag_key)
+            members = set().union(*await pipe.execute())
+        elif len(tag_keys) > 1:
+            members = await client.sunion(*tag_keys)
+        else:
+            members = await client.smembers(type_key or tag_keys[0])
+
+        return {_decode(member) for member in members}
+
+    async def _rank_scores(
+        self, client: Any, entry_ids: Iterable[str]
+    ) -> List[Tuple[str, float]]:
+        """Look up the rank score of each candidate ID.
+
+        IDs without a rank score get ``-inf`` so they sort after ranked ones.
+        """
+        ids = list(entry_ids)
+        if not ids:
+            return []
+        scores = await client.zmscore(self._get_rank_key(), ids)
+        return [
+            (entry_id, float("-inf") if score is None else float(score))
+            for entry_id, score in zip(ids, scores or [None] * len(ids))
+        ]
+
     async def store(self, entry: MemoryEntry) -> bool:
         """Store a memory entry.
 
@@ -85,9 +580,9 @@ class RedisCacheStore(CacheStore):
             self.redis._ensure_client()
             client = cast(Any, self.redis.client)
 
-            # Convert entry to dict and serialize
-            entry_dict = memory_entry_to_dict(entry)
-            serialized_data = serialize_to_json(entry_dict)
+            # Serialize entry; the embedding goes to the vector block
+            serialized_data = self._serialize_payload(entry)
+            (embedding,) = await self._embeddings_for([entry])
 
             # Store entry data
             if entry.ttl:
@@ -102,10 +597,19 @@ class RedisCacheStore(CacheStore):
             # Add to type index
             await client.sadd(self._get_type_key(entry.memory_type), entry.id)
 
+            # Add to rank index
+            await client.zadd(self._get_rank_key(), {entry.id: self._rank_score(entry)})
+
             # Add to tag indices
             for tag in entry.tags:
                 await client.sadd(self._get_tag_key(tag), entry.id)
 
+            # Add to the vector block
+            if embedding:
+                pipe = client.pipeline(transaction=False)
+                self._queue_vector_writes(pipe, [(entry, embedding)])
+                await pipe.execute()
+
             self.total_sets += 1
             return True
         except RedisClientNotAvailableError as e:
@@ -115,6 +619,110 @@ class RedisCacheStore(CacheStore):
             logger.error(f"Error storing entry: {e}")
             return False
 
+    async def store_many(self, entries: List[MemoryEntry]) -> List[bool]:
+        """Store several memory entries in one pipelined round trip.
+
+        Entries without a TTL are written with a single MSET; index updates
+        are grouped so each type and tag set gets one SADD.
+
+        Args:
+            entries: Memory entries to store
+
+        Returns:
+            Success flag for each entry, in input order
+        """
+        if not entries:
+            return []
+
+        try:
+            if not await self.redis.ensure_connected():
+                return [False] * len(entries)
+
+            self.redis._ensure_client()
+            client = cast(Any, self.redis.client)
+
+            embeddings = await self._embeddings_for(entries)
+
+            pipe = client.pipeline(transaction=False)
+            persistent: Dict[str, bytes] = {}
+            type_members: Dict[str, List[str]] = {}
+            tag_members: Dict[str, List[str]] = {}
+
+            for entry in entries:
+                serialized_data = self._serialize_payload(entry)
+                if entry.ttl:
+                    pipe.setex(self._get_key(entry.id), entry.ttl, serialized_data)
+                else:
+                    persistent[self._get_key(entry.id)] = serialized_data
+
+                metadata = {str(k): str(v) for k, v in entry.metadata.items()}
+                if metadata:
+                    pipe.hset(self._get_metadata_key(entry.id), mapping=metadata)
+
+                type_key = self._get_type_key(entry.memory_type)
+                type_members.setdefault(type_key, []).append(entry.id)
+                for tag in entry.tags:
+                    tag_members.setdefault(self._get_tag_key(tag), []).append(entry.id)
+
+            if persistent:
+                pipe.mset(persistent)
+            for set_key, members in {**type_members, **tag_members}.items():
+                pipe.sadd(set_key, *members)
+            pipe.zadd(
+                self._get_rank_key(),
+                {entry.id: self._rank_score(entry) for entry in entries},
+            )
+            self._queue_vector_writes(
+                pipe,
+                [
+                    (entry, embedding)
+                    for entry, embedding in zip(entries, embeddings)
+                    if embedding
+                ],
+            )
+
+            await pipe.execute()
+
+            self.total_sets += len(entries)
+            return [True] * len(entries)
+        except RedisClientNotAvailableError as e:
+            logger.error(f"Redis client not available: {e}")
+            return [False] * len(entries)
+        except Exception as e:
+            logger.error(f"Error storing entries: {e}")
+            return [False] * len(entries)
+
+    async def get_many(self, entry_ids: List[str]) -> Dict[str, MemoryEntry]:
+        """Get several memory entries with chunked MGETs.
+
+        Args:
+            entry_ids: IDs of the entries to get
+
+        Returns:
+            Found entries keyed by ID; missing IDs are omitted
+        """
+        try:
+            if not await self.redis.ensure_connected():
+                return {}
+
+            self.redis._ensure_client()
+
+            unique_ids = list(dict.fromkeys(entry_ids))
+            entries = await self._fetch_entries(unique_ids)
+            await self._attach_embeddings(entries)
+
+            self.total_gets += len(unique_ids)
+            self.cache_hits += len(entries)
+            self.cache_misses += len(unique_ids) - len(entries)
+
+            return {entry.id: entry for entry in entries}
+        except RedisClientNotAvailableError as e:
+            logger.error(f"Redis client not available: {e}")
+            return {}
+        except Exception as e:
+            logger.error(f"Error getting entries: {e}")
+            return {}
+
     async def retrieve(self, query: MemoryQuery) -> MemoryResult:
         """Retrieve memory entries based on query.
 
@@ -141,52 +749,47 @@ class RedisCacheStore(CacheStore):
             client = cast(Any, self.redis.client)
 
             start_time = time.time()
-            entries = []
-            entry_ids = []
-
-            # Get entry IDs based on query filters
-            if query.memory_type:
-                type_key = self._get_type_key(query.memory_type)
-                type_entries = await client.smembers(type_key)
-                entry_ids.extend(
-                    [entry_id.decode("utf-8") for entry_id in type_entries]
-                )
-            elif query.tags:
-                for tag in query.tags:
-                    tag_key = self._get_tag_key(tag)
-                    tag_entries = await client.smembers(tag_key)
-                    entry_ids.extend(
-                        [entry_id.decode("utf-8") for entry_id in tag_entries]
-                    )
-            else:
-                keys = await client.keys("entry:*")
-                entry_ids = [key.decode("utf-8").split(":")[-1] for key in keys]
-
-            # Remove duplicates
-            entry_ids = list(set(entry_ids))
-
-            # Retrieve entries
-            for entry_id in entry_ids:
-                entry_data = await client.get(self._get_key(entry_id))
-                if entry_data:
-                    try:
-                        # First deserialize the JSON string to a dictionary
-                        entry_dict = json.loads(entry_data)
-                        # Then create the MemoryEntry
-                        entry = MemoryEntry(**entry_dict)
-                        entries.append(entry)
-                    except Exception as e:
-                        logger.error(f"Failed to parse entry {entry_id}: {e}")
-                        continue
+            self.total_gets += 1
+            limit = query.limit if query.limit and query.limit > 0 else 10
 
-            # Apply limit
-            if query.limit and query.limit > 0:
-                entries = entries[: query.limit]
+            await self._backfill_rank(client)
+
+            candidate_ids = await self._candidate_ids(client, query)
+            if candidate_ids is not None:
+                total_count = len(candidate_ids)
+                scored = await self._rank_scores(client, candidate_ids)
+
+                async def read_ids(offset: int, count: int) -> List[str]:
+                    top = heapq.nlargest(offset + count, scored, key=lambda s: s[1])
+                    return [entry_id for entry_id, _ in top[offset:]]
+
+            else:
+                # Unfiltered: read the top of the rank index directly
+                total_count = int(await client.zcard(self._get_rank_key()) or 0)
+
+                async def read_ids(offset: int, count: int) -> List[str]:
+                    return [
+                        _decode(entry_id)
+                        for entry_id in await client.zrevrange(
+                            self._get_rank_key(), offset, offset + count - 1
+                        )
+                    ]
+
+            entries, dead = await self._fetch_ranked(read_ids, limit)
+            if dead:
+                tag_keys = [self._get_tag_key(tag) for tag in query.tags]
+                await self._prune_index(client, dead, tag_keys)
+                total_count = max(total_count - len(dead), len(entries))
+            await self._attach_embeddings(entries)
+            if entries:
+                self.cache_hits += 1
+            else:
+                self.cache_misses += 1
 
             query_time = time.time() - start_time
             return MemoryResult(
                 entries=entries,
-                total_count=len(entries),
+                total_count=total_count,
                 query_time=query_time,
                 similarity_scores=[1.0] * len(entries),
                 success=True,
@@ -245,27 +848,39 @@ class RedisCacheStore(CacheStore):
                 return False
 
             self.redis._ensure_client()
-            client = cast(Any, self.redis.client)
 
             # Get existing entry
-            entry_data = await client.get(self._get_key(entry_id))
+            entry_data = await self._binary_client().get(self._get_key(entry_id))
             if not entry_data:
                 return False
 
-            try:
-                # First deserialize the JSON string to a dictionary
-                entry_dict = json.loads(entry_data)
-                # Then create the MemoryEntry
-                entry = MemoryEntry(**entry_dict)
-            except Exception as e:
-                logger.error(f"Failed to parse entry {entry_id}: {e}")
+            entry = self._parse_entry(entry_id, entry_data)
+            if entry is None:
                 return False
 
+            # Keep the stored vector unless the content is replaced
+            if "content" not in updates and "embedding" not in updates:
+                await self._attach_embeddings([entry])
+            old_type = entry.memory_type
+            old_content = entry.content
+
             # Update fields
             for field, value in updates.items():
                 if hasattr(entry, field):
                     setattr(entry, field, value)
 
+            # Drop the old vector when it no longer matches the entry's
+            # content or now sits in the wrong type block
+            if entry.memory_type != old_type or (
+                "embedding" not in updates and entry.content != old_content
+            ):
+                client = cast(Any, self.redis.client)
+                pipe = client.pipeline(transaction=False)
+                self._queue_vector_deletes(pipe, [(old_type, entry_id)])
+                if entry.memory_type != old_type:
+                    pipe.srem(self._get_type_key(old_type), entry_id)
+                await pipe.execute()
+
             # Store updated entry
             return await self.store(entry)
 
@@ -296,15 +911,12 @@ class RedisCacheStore(CacheStore):
             client = cast(Any, self.redis.client)
 
             # Get entry data first to get metadata
-            entry_data = await client.get(self._get_key(entry_id))
+            entry_data = await self._binary_client().get(self._get_key(entry_id))
             if not entry_data:
                 return False
 
-            try:
-                entry_dict = json.loads(entry_data)
-                entry = MemoryEntry(**entry_dict)
-            except Exception as e:
-                logger.error(f"Failed to parse entry {entry_id}: {e}")
+            entry = self._parse_entry(entry_id, entry_data)
+            if entry is None:
                 return False
 
             # Delete entry data
@@ -316,10 +928,18 @@ class RedisCacheStore(CacheStore):
             # Remove from type index
             await client.srem(self._get_type_key(entry.memory_type), entry_id)
 
+            # Remove from rank index
+            await client.zrem(self._get_rank_key(), entry_id)
+
             # Remove from tag indices
             for tag in entry.tags:
                 await client.srem(self._get_tag_key(tag), entry_id)
 
+            # Remove from the vector block
+            pipe = client.pipeline(transaction=False)
+            self._queue_vector_deletes(pipe, [(entry.memory_type, entry_id)])
+            await pipe.execute()
+
             return True
 
         except RedisClientNotAvailableError as e:
@@ -329,6 +949,59 @@ class RedisCacheStore(CacheStore):
             logger.error(f"Error deleting entry: {e}")
             return False
 
+    async def delete_many(self, entry_ids: List[str]) -> List[bool]:
+        """Delete several memory entries in one pipelined round trip.
+
+        Args:
+            entry_ids: IDs of the entries to delete
+
+        Returns:
+            Deletion flag for each ID, in input order
+        """
+        if not entry_ids:
+            return []
+
+        try:
+            if not await self.redis.ensure_connected():
+                return [False] * len(entry_ids)
+
+            self.redis._ensure_client()
+            client = cast(Any, self.redis.client)
+
+            # Entries are loaded first to find the index sets they belong to
+            entries = await self._fetch_entries(list(dict.fromkeys(entry_ids)))
+            if not entries:
+                return [False] * len(entry_ids)
+
+            set_members: Dict[str, List[str]] = {}
+            keys: List[str] = []
+            for entry in entries:
+                keys.append(self._get_key(entry.id))
+                keys.append(self._get_metadata_key(entry.id))
+                type_key = self._get_type_key(entry.memory_type)
+                set_members.setdefault(type_key, []).append(entry.id)
+                for tag in entry.tags:
+                    set_members.setdefault(self._get_tag_key(tag), []).append(entry.id)
+
+            pipe = client.pipeline(transaction=False)
+            pipe.delete(*keys)
+            for set_key, members in set_members.items():
+                pipe.srem(set_key, *members)
+            pipe.zrem(self._get_rank_key(), *(entry.id for entry in entries))
+            self._queue_vector_deletes(
+                pipe, [(entry.memory_type, entry.id) for entry in entries]
+            )
+            await pipe.execute()
+
+            deleted = {entry.id for entry in entries}
+            return [entry_id in deleted for entry_id in entry_ids]
+        except RedisClientNotAvailableError as e:
+            logger.error(f"Redis client not available: {e}")
+            return [False] * len(entry_ids)
+        except Exception as e:
+            logger.error(f"Error deleting entries: {e}")
+            return [False] * len(entry_ids)
+
     async def clear(self, memory_type: Optional[MemoryType] = None) -> bool:
         """Clear all entries or entries of a specific type.
 
@@ -360,6 +1033,7 @@ class RedisCacheStore(CacheStore):
 
                 # Clear the type index
                 await client.delete(type_key)
+                vector_keys = [self._get_vector_key(memory_type)]
             else:
                 # Clear all entries
                 keys = await client.keys("entry:*")
@@ -381,6 +1055,20 @@ class RedisCacheStore(CacheStore):
                 if keys:
                     await client.delete(*keys)
 
+                # Clear the rank index
+                await client.delete(self._get_rank_key())
+                vector_keys = [self._get_vector_key(t) for t in MemoryType]
+                vector_keys.append(self._get_vector_changes_key())
+
+            # Clear the vector blocks and tell mirrors to reload
+            pipe = client.pipeline(transaction=False)
+            pipe.delete(*vector_keys)
+            pipe.xadd(self._get_vector_changes_key(), {"reset": "1"})
+            await pipe.execute()
+            if self.vector_mirror is not None:
+                self.vector_mirror.clear()
+                self._mirror_cursor = None
+
             return True
 
         except RedisClientNotAvailableError as e:
@@ -706,8 +1394,8 @@ class RedisCacheStore(CacheStore):
                 return []
 
             self.redis._ensure_client()
-            # TODO: Implement embedding creation
-            return []
+            (embedding,) = await self._embed_texts([content])
+            return embedding
 
         except RedisClientNotAvailableError as e:
             logger.error(f"Redis client not available: {e}")
@@ -743,12 +1431,58 @@ class RedisCacheStore(CacheStore):
                 )
 
             self.redis._ensure_client()
-            # TODO: Implement vector similarity search
+            client = cast(Any, self.redis.client)
+            start_time = time.time()
+
+            query = np.asarray(query_embedding, dtype=np.float32)
+            if query.ndim != 1 or query.size == 0:
+                ranked = []
+            elif self.vector_mirror is not None:
+                await self._refresh_mirror()
+                ranked = self.vector_mirror.search(
+                    query, k=len(self.vector_mirror), threshold=threshold
+                )
+            else:
+                ids, vectors = await self._load_vectors(query.size)
+                ranked = self._rank_vectors(ids, vectors, query, threshold)
+
+            # Load the best matches, skipping vectors whose entry expired
+            entries: List[MemoryEntry] = []
+            scores: List[float] = []
+            stale: List[str] = []
+            for start in range(0, len(ranked), max(limit, 1)):
+                window = ranked[start : start + limit]
+                loaded = {
+                    entry.id: entry
+                    for entry in await self._fetch_entries(
+                        [entry_id for entry_id, _ in window]
+                    )
+                }
+                for entry_id, score in window:
+                    entry = loaded.get(entry_id)
+                    if entry is None:
+                        stale.append(entry_id)
+                    elif len(entries) < limit:
+                        entries.append(entry)
+                        scores.append(score)
+                if len(entries) >= limit:
+                    break
+
+            if stale:
+                pipe = client.pipeline(transaction=False)
+                for memory_type in MemoryType:
+                    pipe.hdel(self._get_vector_key(memory_type), *stale)
+                await pipe.execute()
+                if self.vector_mirror is not None:
+                    for entry_id in stale:
+                        self.vector_mirror.remove(entry_id)
+
+            await self._attach_embeddings(entries)
             return MemoryResult(
-                entries=[],
-                total_count=0,
-                query_time=0.0,
-                similarity_scores=[],
+                entries=entries,
+                total_count=len(ranked) - len(stale),
+                query_time=time.time() - start_time,
+                similarity_scores=scores,
                 success=True,
             )
 
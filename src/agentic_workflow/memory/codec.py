@@ -0,0 +1,266 @@
+"""Versioned codecs for serializing memory entries in key-value stores."""
+
+import json
+import struct
+import sys
+from abc import ABC, abstractmethod
+from array import array
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Sequence, Union
+
+from .interfaces import MemoryEntry, MemoryType
+
+# Binary payloads start with a NUL byte, which can never begin a JSON document,
+# followed by the codec version.
+_BINARY_MARKER = 0
+_NO_TTL = -1
+_NO_EMBEDDING = 0xFFFFFFFF
+
+Payload = Union[bytes, bytearray, memoryview, str]
+
+
+def _pack_floats(values: Sequence[float]) -> bytes:
+    """Pack floats as little-endian float32."""
+    vector = array("f", values)
+    if sys.byteorder == "big":
+        vector.byteswap()
+    return vector.tobytes()
+
+
+def _unpack_floats(data: Union[bytes, memoryview]) -> List[float]:
+    """Unpack little-endian float32 bytes."""
+    vector = array("f")
+    vector.frombytes(data)
+    if sys.byteorder == "big":
+        vector.byteswap()
+    return vector.tolist()
+
+
+class EntryCodec(ABC):
+    """Serializes memory entries to and from a stored payload.
+
+    Every binary codec writes a two byte header (a NUL marker and its
+    ``version``) so payloads written by any registered codec, as well as
+    legacy JSON payloads, can be read back regardless of the configured
+    codec.
+    """
+
+    name: str = ""
+    version: int = 0
+
+    @abstractmethod
+    def encode(self, entry: MemoryEntry) -> bytes:
+        """Encode a memory entry.
+
+        Args:
+            entry: Memory entry to encode
+
+        Returns:
+            Encoded payload
+        """
+        pass
+
+    @abstractmethod
+    def decode(self, payload: bytes, trusted: bool = True) -> MemoryEntry:
+        """Decode a payload written by this codec.
+
+        Args:
+            payload: Encoded payload, including the header
+            trusted: Skip model validation for data written by our own store
+
+        Returns:
+            Decoded memory entry
+        """
+        pass
+
+
+class JsonEntryCodec(EntryCodec):
+    """Legacy JSON format (no header), always readable."""
+
+    name = "json"
+    version = 0
+
+    def encode(self, entry: MemoryEntry) -> bytes:
+        """Encode a memory entry as a JSON document."""
+        return entry.model_dump_json().encode("utf-8")
+
+    def decode(self, payload: bytes, trusted: bool = True) -> MemoryEntry:
+        """Decode a JSON document with full validation."""
+        return MemoryEntry(**json.loads(payload))
+
+
+class StructEntryCodec(EntryCodec):
+    """Compact binary format built on ``struct``.
+
+    Layout after the header: priority and TTL as int64, the byte lengths
+    of the variable fields, then ID, content, memory type, ISO timestamp,
+    a JSON ``[metadata, tags]`` pair and the embedding as raw
+    little-endian float32.
+    """
+
+    name = "struct"
+    version = 1
+
+    _FIXED = struct.Struct("<BBqqIIIIII")
+
+    def encode(self, entry: MemoryEntry) -> bytes:
+        """Encode a memory entry in the struct layout."""
+        entry_id = entry.id.encode("utf-8")
+        content = entry.content.encode("utf-8")
+        memory_type = entry.memory_type.value.encode("utf-8")
+        timestamp = entry.timestamp.isoformat().encode("utf-8")
+        extras = json.dumps([entry.metadata, entry.tags]).encode("utf-8")
+        if entry.embedding is None:
+            embedding = b""
+            dimension = _NO_EMBEDDING
+        else:
+            embedding = _pack_floats(entry.embedding)
+            dimension = len(entry.embedding)
+
+        header = self._FIXED.pack(
+            _BINARY_MARKER,
+            self.version,
+            entry.priority,
+            _NO_TTL if entry.ttl is None else entry.ttl,
+            len(entry_id),
+            len(content),
+            len(memory_type),
+            len(timestamp),
+            len(extras),
+            dimension,
+        )
+        return b"".join(
+            (header, entry_id, content, memory_type, timestamp, extras, embedding)
+        )
+
+    def decode(self, payload: bytes, trusted: bool = True) -> MemoryEntry:
+        """Decode a payload in the struct layout."""
+        (
+            _,
+            _,
+            priority,
+            ttl,
+            id_length,
+            content_length,
+            type_length,
+            timestamp_length,
+            extras_length,
+            dimension,
+        ) = self._FIXED.unpack_from(payload)
+
+        view = memoryview(payload)
+        offset = self._FIXED.size
+        fields: List[bytes] = []
+        for length in (
+            id_length,
+            content_length,
+            type_length,
+            timestamp_length,
+            extras_length,
+        ):
+            fields.append(bytes(view[offset : offset + length]))
+            offset += length
+        entry_id, content, memory_type, timestamp, extras = fields
+        metadata, tags = json.loads(extras)
+
+        embedding: Optional[List[float]] = None
+        if dimension != _NO_EMBEDDING:
+            embedding = _unpack_floats(view[offset : offset + dimension * 4])
+
+        data: Dict[str, Any] = {
+            "id": entry_id.decode("utf-8"),
+            "content": content.decode("utf-8"),
+            "metadata": metadata,
+            "memory_type": MemoryType(memory_type.decode("utf-8")),
+            "timestamp": datetime.fromisoformat(timestamp.decode("utf-8")),
+            "ttl": None if ttl == _NO_TTL else ttl,
+            "embedding": embedding,
+            "tags": tags,
+            "priority": priority,
+        }
+        if trusted:
+            return MemoryEntry.model_construct(**data)
+        return MemoryEntry(**data)
+
+
+_CODECS_BY_NAME: Dict[str, EntryCodec] = {}
+_CODECS_BY_VERSION: Dict[int, EntryCodec] = {}
+
+
+def register_entry_codec(codec: EntryCodec) -> None:
+    """Register a codec so it can be configured by name and decoded by version.
+
+    Args:
+        codec: Codec instance
+
+    Raises:
+        ValueError: If another codec already uses the name or version
+    """
+    existing = _CODECS_BY_NAME.get(codec.name) or _CODECS_BY_VERSION.get(codec.version)
+    if existing is not None and existing is not codec:
+        raise ValueError(
+            f"Codec {codec.name!r} (version {codec.version}) conflicts with "
+            f"registered codec {existing.name!r} (version {existing.version})"
+        )
+    _CODECS_BY_NAME[codec.name] = codec
+    _CODECS_BY_VERSION[codec.version] = codec
+
+
+def get_entry_codec(name: str = "struct") -> EntryCodec:
+    """Get a registered codec by name.
+
+    Args:
+        name: Codec name ("struct" or "json", or a registered custom codec)
+
+    Returns:
+        Codec instance
+
+    Raises:
+        ValueError: If no codec is registered under the name
+    """
+    codec = _CODECS_BY_NAME.get(name)
+    if codec is None:
+        raise ValueError(f"Unknown entry codec: {name}")
+    return codec
+
+
+def is_binary_payload(payload: Payload) -> bool:
+    """Check if a stored payload was written by a binary codec.
+
+    Args:
+        payload: Stored payload
+
+    Returns:
+        True for binary payloads, False for legacy JSON
+    """
+    return isinstance(payload, (bytes, bytearray, memoryview)) and bytes(
+        payload[:1]
+    ) == bytes((_BINARY_MARKER,))
+
+
+def decode_entry(payload: Payload, trusted: bool = True) -> MemoryEntry:
+    """Decode a stored payload written by any registered codec.
+
+    Args:
+        payload: Stored payload (bytes, or str for legacy JSON)
+        trusted: Skip model validation for data written by our own store
+
+    Returns:
+        Decoded memory entry
+
+    Raises:
+        ValueError: If the payload uses an unknown codec version
+    """
+    data = payload.encode("utf-8") if isinstance(payload, str) else bytes(payload)
+    if not is_binary_payload(data):
+        return _CODECS_BY_VERSION[JsonEntryCodec.version].decode(data, trusted)
+
+    version = data[1] if len(data) > 1 else -1
+    codec = _CODECS_BY_VERSION.get(version)
+    if codec is None:
+        raise ValueError(f"Unknown entry codec version: {version}")
+    return codec.decode(data, trusted)
+
+
+register_entry_codec(JsonEntryCodec())
+register_entry_codec(StructEntryCodec())
@@ -79,6 +79,9 @@ class RedisConnectionManager(ConnectionManager["Redis"]):
         super().__init__(name, config)
         # Initialize as None, but will be set during connect()
         self.connection_pool: Optional[Any] = None
+        # Client returning raw bytes, for binary payloads such as vectors
+        self.binary_client: Optional[Any] = None
+        self.binary_connection_pool: Optional[Any] = None
 
     def _parse_redis_url(self, redis_url: str) -> Dict[str, Any]:
         """Parse Redis URL into connection parameters."""
@@ -136,6 +139,14 @@ class RedisConnectionManager(ConnectionManager["Redis"]):
             if self.client is not None:
                 await self.client.ping()
 
+            self.binary_connection_pool = redis.ConnectionPool(
+                max_connections=self.max_connections,
+                **{**self.connection_config, "decode_responses": False},
+            )
+            self.binary_client = redis.Redis(
+                connection_pool=self.binary_connection_pool
+            )
+
             self._is_healthy = True
             logger.info(
                 f"Connected to Redis at {self.connection_config['host']}:{self.connection_config['port']}"
@@ -148,6 +159,8 @@ class RedisConnectionManager(ConnectionManager["Redis"]):
             logger.error(f"Failed to connect to Redis: {e}")
             self.client = None
             self.connection_pool = None
+            self.binary_client = None
+            self.binary_connection_pool = None
             self._is_healthy = False
             return False
 
@@ -161,6 +174,14 @@ class RedisConnectionManager(ConnectionManager["Redis"]):
             self.connection_pool.disconnect()
             self.connection_pool = None
 
+        if self.binary_client:
+            await self.binary_client.close()
+            self.binary_client = None
+
+        if self.binary_connection_pool:
+            await self.binary_connection_pool.disconnect()
+            self.binary_connection_pool = None
+
         self._is_healthy = False
         logger.info("Disconnected from Redis")
 
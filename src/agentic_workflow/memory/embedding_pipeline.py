@@ -0,0 +1,296 @@
+"""Batched, cached embedding pipeline for vector stores."""
+
+import asyncio
+import hashlib
+import sqlite3
+import threading
+from array import array
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from ..core.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+
+class EmbeddingPipeline:
+    """Embedding stage that batches, caches and de-duplicates requests.
+
+    Concurrent ``embed`` calls are coalesced into a single
+    ``embed_documents`` call: requests are queued for up to
+    ``batch_window`` seconds or until ``max_batch_size`` texts are waiting.
+    Embeddings are cached by a hash of the model name and content, in an
+    in-memory LRU and optionally in a SQLite file, so identical content is
+    embedded once. Requests for content that is already being embedded
+    wait for the in-flight result instead of starting a new one.
+
+    Providers with a native ``aembed_documents`` coroutine are awaited
+    directly; synchronous ``embed_documents`` runs in a worker thread so
+    the event loop is never blocked on the remote call.
+
+    Example config:
+    ```python
+    config = {
+        "max_batch_size": 64,  # Texts per embed_documents call
+        "batch_window": 0.005,  # Seconds to wait for more requests
+        "cache_size": 10000,  # Embeddings kept in memory
+        "cache_path": "/var/cache/embeddings.db",  # Optional on-disk cache
+    }
+    ```
+    """
+
+    def __init__(self, model: Any, config: Optional[Dict[str, Any]] = None):
+        """Initialize the embedding pipeline.
+
+        Args:
+        model: Embedding model exposing ``embed_documents``
+        config: Configuration parameters
+        """
+        config = config or {}
+        self.model = model
+        self.model_name = str(
+            config.get("model_name", getattr(model, "model", type(model).__name__))
+        )
+        self.max_batch_size = max(1, int(config.get("max_batch_size", 64)))
+        self.batch_window = float(config.get("batch_window", 0.005))
+        self.cache_size = int(config.get("cache_size", 10000))
+        self.cache_path: Optional[str] = config.get("cache_path")
+
+        self._cache: "OrderedDict[str, List[float]]" = OrderedDict()
+        self._pending: Dict[str, "asyncio.Future[List[float]]"] = {}
+        self._queue: List[Tuple[str, str]] = []
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        self._tasks: Set["asyncio.Task[None]"] = set()
+
+        self._disk: Optional[sqlite3.Connection] = None
+        self._disk_lock = threading.Lock()
+        if self.cache_path:
+            self._open_disk_cache(self.cache_path)
+
+        # Statistics
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self.disk_hits = 0
+        self.total_batches = 0
+        self.total_embedded = 0
+
+    def _open_disk_cache(self, path: str) -> None:
+        """Open (or create) the on-disk embedding cache."""
+        try:
+            self._disk = sqlite3.connect(path, check_same_thread=False)
+            self._disk.execute(
+                "CREATE TABLE IF NOT EXISTS embeddings "
+                "(key TEXT PRIMARY KEY, vector BLOB NOT NULL)"
+            )
+            self._disk.commit()
+        except sqlite3.Error as e:
+            logger.error(f"Failed to open embedding cache at {path}: {e}")
+            self._disk = None
+
+    def _key(self, text: str) -> str:
+        """Get the cache key for a text."""
+        digest = hashlib.sha256(f"{self.model_name}\0{text}".encode("utf-8"))
+        return digest.hexdigest()
+
+    def _cache_get(self, key: str) -> Optional[List[float]]:
+        """Look up an embedding in the in-memory LRU."""
+        embedding = self._cache.get(key)
+        if embedding is not None:
+            self._cache.move_to_end(key)
+        return embedding
+
+    def _cache_put(self, key: str, embedding: List[float]) -> None:
+        """Add an embedding to the in-memory LRU."""
+        if self.cache_size <= 0:
+            return
+        self._cache[key] = embedding
+        self._cache.move_to_end(key)
+        while len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+
+    async def embed(self, text: str) -> List[float]:
+        """Embed a single text.
+
+        Args:
+            text: Text to embed
+
+        Returns:
+            Vector embedding
+        """
+        return (await self.embed_many([text]))[0]
+
+    async def embed_many(self, texts: List[str]) -> List[List[float]]:
+        """Embed several texts, reusing cached and in-flight embeddings.
+
+        Args:
+            texts: Texts to embed
+
+        Returns:
+            Vector embeddings, in input order
+
+        Raises:
+            Exception: If the embedding model fails
+        """
+        loop = asyncio.get_running_loop()
+        waits: List["asyncio.Future[List[float]]"] = []
+
+        for text in texts:
+            key = self._key(text)
+            cached = self._cache_get(key)
+            if cached is not None:
+                self.cache_hits += 1
+                future: "asyncio.Future[List[float]]" = loop.create_future()
+                future.set_result(cached)
+            elif key in self._pending:
+                self.cache_hits += 1
+                future = self._pending[key]
+            else:
+                self.cache_misses += 1
+                future = loop.create_future()
+                self._pending[key] = future
+                self._queue.append((key, text))
+            waits.append(future)
+
+        self._schedule_flush(loop)
+        # Futures are shared with concurrent callers; shield them so one
+        # caller being cancelled does not cancel the others' results
+        return list(await asyncio.gather(*(asyncio.shield(w) for w in waits)))
+
+    def _schedule_flush(self, loop: asyncio.AbstractEventLoop) -> None:
+        """Flush now if a batch is full, otherwise after the batch window."""
+        if not self._queue:
+            return
+        if len(self._queue) >= self.max_batch_size or self.batch_window <= 0:
+            if self._flush_handle is not None:
+                self._flush_handle.cancel()
+                self._flush_handle = None
+            self._start_flush()
+        elif self._flush_handle is None:
+            self._flush_handle = loop.call_later(self.batch_window, self._start_flush)
+
+    def _start_flush(self) -> None:
+        """Start a task that embeds everything queued so far."""
+        self._flush_handle = None
+        queued, self._queue = self._queue, []
+        for start in range(0, len(queued), self.max_batch_size):
+            task = asyncio.ensure_future(
+                self._flush(queued[start : start + self.max_batch_size])
+            )
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _flush(self, batch: List[Tuple[str, str]]) -> None:
+        """Resolve one batch of queued requests."""
+        keys = [key for key, _ in batch]
+        try:
+            embeddings = await self._resolve(keys, [text for _, text in batch])
+        except Exception as e:
+            logger.error(f"Failed to embed batch of {len(batch)} texts: {e}")
+            for key in keys:
+                future = self._pending.pop(key, None)
+                if future is not None and not future.done():
+                    future.set_exception(e)
+            return
+
+        for key, embedding in zip(keys, embeddings):
+            self._cache_put(key, embedding)
+            future = self._pending.pop(key, None)
+            if future is not None and not future.done():
+                future.set_result(embedding)
+
+    async def _resolve(self, keys: List[str], texts: List[str]) -> List[List[float]]:
+        """Load embeddings from disk or compute them with the model."""
+        found = {}
+        if self._disk is not None:
+            found = await asyncio.to_thread(self._disk_load, keys)
+            self.disk_hits += len(found)
+
+        missing = [i for i, key in enumerate(keys) if key not in found]
+        if missing:
+            computed = await self._embed_documents([texts[i] for i in missing])
+            if len(computed) != len(missing):
+                raise ValueError(
+                    f"Embedding model returned {len(computed)} embeddings "
+                    f"for {len(missing)} texts"
+                )
+            self.total_batches += 1
+            self.total_embedded += len(missing)
+
+            new = {keys[i]: list(vector) for i, vector in zip(missing, computed)}
+            if self._disk is not None:
+                await asyncio.to_thread(self._disk_store, new)
+            found.update(new)
+
+        return [found[key] for key in keys]
+
+    async def _embed_documents(self, texts: List[str]) -> List[List[float]]:
+        """Call the model without blocking the event loop."""
+        native = getattr(self.model, "aembed_documents", None)
+        if asyncio.iscoroutinefunction(native):
+            return list(await native(texts))
+        return list(await asyncio.to_thread(self.model.embed_documents, texts))
+
+    def _disk_load(self, keys: List[str]) -> Dict[str, List[float]]:
+        """Read cached embeddings from disk."""
+        if self._disk is None:
+            return {}
+        placeholders = ",".join("?" * len(keys))
+        try:
+            with self._disk_lock:
+                rows = self._disk.execute(
+                    f"SELECT key, vector FROM embeddings WHERE key IN ({placeholders})",
+                    keys,
+                ).fetchall()
+        except sqlite3.Error as e:
+            logger.warning(f"Failed to read embedding cache: {e}")
+            return {}
+        return {key: array("f", blob).tolist() for key, blob in rows}
+
+    def _disk_store(self, embeddings: Dict[str, List[float]]) -> None:
+        """Write embeddings to disk as packed float32."""
+        if self._disk is None or not embeddings:
+            return
+        try:
+            with self._disk_lock:
+                self._disk.executemany(
+                    "INSERT OR REPLACE INTO embeddings (key, vector) VALUES (?, ?)",
+                    [
+                        (key, array("f", vector).tobytes())
+                        for key, vector in embeddings.items()
+                    ],
+                )
+                self._disk.commit()
+        except sqlite3.Error as e:
+            logger.warning(f"Failed to write embedding cache: {e}")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get pipeline statistics.
+
+        Returns:
+            Cache and batching statistics
+        """
+        lookups = self.cache_hits + self.cache_misses
+        return {
+            "cache_entries": len(self._cache),
+            "cache_hits": self.cache_hits,
+            "cache_misses": self.cache_misses,
+            "hit_rate": self.cache_hits / lookups if lookups else 0.0,
+            "disk_hits": self.disk_hits,
+            "total_batches": self.total_batches,
+            "total_embedded": self.total_embedded,
+        }
+
+    async def close(self) -> None:
+        """Finish queued requests and close the on-disk cache."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        if self._queue:
+            self._start_flush()
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+
+        if self._disk is not None:
+            with self._disk_lock:
+                self._disk.close()
+            self._disk = None
@@ -60,6 +60,10 @@ class MemoryQuery(BaseModel):
     time_range: Optional[tuple[datetime, datetime]] = Field(
         default=None, description="Time range filter"
     )
+    scored: bool = Field(
+        default=False,
+        description="Rank content matches by relevance and return their scores",
+    )
 
 
 class MemoryResult(BaseModel):
@@ -70,6 +74,12 @@ class MemoryResult(BaseModel):
     query_time: float
     similarity_scores: List[float]
     success: bool = True
+    store_timings: Dict[str, float] = Field(
+        default_factory=dict, description="Query time in seconds per store"
+    )
+    failed_stores: List[str] = Field(
+        default_factory=list, description="Stores that failed or timed out"
+    )
 
 
 class MemoryStats(BaseModel):
@@ -256,6 +266,46 @@ class MemoryStore(ABC):
         """
         pass
 
+    async def store_many(self, entries: List[MemoryEntry]) -> List[bool]:
+        """Store several memory entries.
+
+        The default implementation stores entries one at a time; stores
+        override it to write the whole batch in a single round trip.
+
+        Args:
+            entries: Memory entries to store
+
+        Returns:
+            Success flag for each entry, in input order
+        """
+        return [await self.store(entry) for entry in entries]
+
+    @abstractmethod
+    async def get_many(self, entry_ids: List[str]) -> Dict[str, MemoryEntry]:
+        """Get several memory entries by ID.
+
+        Args:
+            entry_ids: IDs of the entries to get
+
+        Returns:
+            Found entries keyed by ID; missing IDs are omitted
+        """
+        pass
+
+    async def delete_many(self, entry_ids: List[str]) -> List[bool]:
+        """Delete several memory entries.
+
+        The default implementation deletes entries one at a time; stores
+        override it to delete the whole batch in a single round trip.
+
+        Args:
+            entry_ids: IDs of the entries to delete
+
+        Returns:
+            Deletion flag for each ID, in input order
+        """
+        return [await self.delete(entry_id) for entry_id in entry_ids]
+
     @abstractmethod
     async def get_stats(self) -> MemoryStats:
         """Get memory store statistics.
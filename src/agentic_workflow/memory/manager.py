@@ -1,8 +1,12 @@
 """Memory manager that coordinates multiple memory stores."""
 
+import asyncio
+import heapq
+import itertools
+import time
 import uuid
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Set, Tuple
 
 from ..core.logging_config import get_logger
 from .factory import MemoryStoreFactory
@@ -46,9 +50,14 @@ class MemoryManager:
             MemoryType.VECTOR: "vector_store",
         }
 
+        # Per-store deadline for cross-store queries (seconds)
+        self.store_timeout = float(self.config.get("store_timeout", 5.0))
+
         # Statistics
         self.total_operations = 0
         self.operations_by_type: Dict[str, int] = {}
+        self.retrieval_time_by_store: Dict[str, float] = {}
+        self.retrievals_by_store: Dict[str, int] = {}
 
         logger.info("Initialized memory manager")
 
@@ -202,6 +211,75 @@ class MemoryManager:
             logger.error(f"Failed to store memory entry: {e}")
             raise
 
+    async def store_many(self, items: List[Dict[str, Any]]) -> List[str]:
+        """Store several pieces of content, batching writes per store.
+
+        Each item takes the same keys as ``store`` (``content``,
+        ``memory_type``, ``metadata``, ``tags``, ``priority``, ``ttl``,
+        ``entry_id``). Entries going to the same store are written with a
+        single ``store_many`` call.
+
+        Args:
+            items: Content and options for each entry
+
+        Returns:
+            IDs of the stored entries, in input order; entries that failed
+            to store are left out
+
+        Raises:
+            ValueError: If an item has no content or its store is not available
+        """
+        try:
+            entries: List[MemoryEntry] = []
+            batches: Dict[str, List[MemoryEntry]] = {}
+            stores: Dict[str, MemoryStore] = {}
+            now = datetime.now(timezone.utc)
+
+            for item in items:
+                if not item.get("content"):
+                    raise ValueError("Content is required for every entry")
+
+                memory_type = MemoryType(item.get("memory_type", MemoryType.SHORT_TERM))
+                entry = MemoryEntry(
+                    id=item.get("entry_id") or str(uuid.uuid4()),
+                    content=item["content"],
+                    metadata=item.get("metadata") or {},
+                    memory_type=memory_type,
+                    timestamp=now,
+                    ttl=item.get("ttl"),
+                    tags=item.get("tags") or [],
+                    priority=item.get("priority", 0),
+                )
+                entries.append(entry)
+
+                store_name = self.store_types.get(memory_type, "")
+                stores[store_name] = self._get_store_for_type(memory_type)
+                batches.setdefault(store_name, []).append(entry)
+
+            stored: Set[str] = set()
+            for store_name, batch in batches.items():
+                results = await stores[store_name].store_many(batch)
+                for entry, success in zip(batch, results):
+                    if success:
+                        stored.add(entry.id)
+                        op_type = f"store_{entry.memory_type.value}"
+                        self.operations_by_type[op_type] = (
+                            self.operations_by_type.get(op_type, 0) + 1
+                        )
+
+            self.total_operations += len(stored)
+
+            if len(stored) < len(entries):
+                logger.warning(f"Stored {len(stored)} of {len(entries)} memory entries")
+            else:
+                logger.debug(f"Stored {len(stored)} memory entries")
+
+            return [entry.id for entry in entries if entry.id in stored]
+
+        except Exception as e:
+            logger.error(f"Failed to store memory entries: {e}")
+            raise
+
     async def retrieve(
         self,
         query: Optional[MemoryQuery] = None,
@@ -237,30 +315,7 @@ class MemoryManager:
                 store = self._get_store_for_type(query.memory_type)
                 result = await store.retrieve(query)
             else:
-                # Search across all stores and merge results
-                all_results = []
-
-                for store_name, store in self.stores.items():
-                    try:
-                        store_result = await store.retrieve(query)
-                        all_results.extend(store_result.entries)
-                    except Exception as e:
-                        logger.warning(f"Failed to query store {store_name}: {e}")
-                        continue
-
-                # Sort merged results by priority and timestamp (highest priority, most recent first)
-                all_results.sort(key=lambda e: (e.priority, e.timestamp), reverse=True)
-
-                # Apply limit
-                limited_results = all_results[: query.limit]
-
-                result = MemoryResult(
-                    entries=limited_results,
-                    total_count=len(all_results),
-                    query_time=0.0,  # Would need to aggregate timing
-                    similarity_scores=[1.0] * len(limited_results),
-                    success=True,
-                )
+                result = await self._retrieve_across_stores(query)
 
             # Update statistics
             self.total_operations += 1
@@ -283,6 +338,140 @@ class MemoryManager:
                 success=False,
             )
 
+    async def _retrieve_across_stores(self, query: MemoryQuery) -> MemoryResult:
+        """Query every store concurrently and merge the results.
+
+        Each store gets ``store_timeout`` seconds; stores that fail or time
+        out are reported in ``failed_stores`` and the results of the others
+        are still returned.
+
+        Args:
+            query: Query parameters
+
+        Returns:
+            Merged results, highest priority and most recent first
+        """
+        start_time = time.perf_counter()
+        outcomes = await asyncio.gather(
+            *(
+                self._retrieve_from_store(store_name, store, query)
+                for store_name, store in self.stores.items()
+            )
+        )
+
+        def rank(entry: MemoryEntry) -> Tuple[int, datetime]:
+            return (entry.priority, entry.timestamp)
+
+        runs: List[List[MemoryEntry]] = []
+        store_timings: Dict[str, float] = {}
+        failed_stores: List[str] = []
+        total_count = 0
+
+        for store_name, store_result, elapsed in outcomes:
+            store_timings[store_name] = elapsed
+            self.retrieval_time_by_store[store_name] = (
+                self.retrieval_time_by_store.get(store_name, 0.0) + elapsed
+            )
+            self.retrievals_by_store[store_name] = (
+                self.retrievals_by_store.get(store_name, 0) + 1
+            )
+
+            if store_result is None:
+                failed_stores.append(store_name)
+                continue
+
+            total_count += len(store_result.entries)
+            # Each run holds at most query.limit entries and is usually
+            # already ordered, so sorting it is close to linear
+            runs.append(sorted(store_result.entries, key=rank, reverse=True))
+
+        # k-way merge of the per-store runs, stopping at the limit
+        merged = list(
+            itertools.islice(heapq.merge(*runs, key=rank, reverse=True), query.limit)
+        )
+
+        return MemoryResult(
+            entries=merged,
+            total_count=total_count,
+            query_time=time.perf_counter() - start_time,
+            similarity_scores=[1.0] * len(merged),
+            success=True,
+            store_timings=store_timings,
+            failed_stores=failed_stores,
+        )
+
+    async def _retrieve_from_store(
+        self, store_name: str, store: MemoryStore, query: MemoryQuery
+    ) -> Tuple[str, Optional[MemoryResult], float]:
+        """Query one store under the per-store deadline.
+
+        Returns:
+            Store name, its result (None if it failed or timed out) and the
+            time spent waiting for it
+        """
+        start_time = time.perf_counter()
+        try:
+            store_result = await asyncio.wait_for(
+                store.retrieve(query), timeout=self.store_timeout
+            )
+        except asyncio.TimeoutError:
+            logger.warning(f"Store {store_name} timed out after {self.store_timeout}s")
+            store_result = None
+        except Exception as e:
+            logger.warning(f"Failed to query store {store_name}: {e}")
+            store_result = None
+
+        if store_result is not None and not store_result.success:
+            store_result = None
+
+        return store_name, store_result, time.perf_counter() - start_time
+
+    async def get_many(
+        self, entry_ids: List[str], memory_type: Optional[MemoryType] = None
+    ) -> Dict[str, MemoryEntry]:
+        """Get several memory entries by ID.
+
+        Args:
+            entry_ids: IDs of the entries to get
+            memory_type: Type of memory (if known)
+
+        Returns:
+            Found entries keyed by ID; missing IDs are omitted
+        """
+        try:
+            if memory_type:
+                stores = [self._get_store_for_type(memory_type)]
+            else:
+                stores = list(self.stores.values())
+
+            found: Dict[str, MemoryEntry] = {}
+            for store in stores:
+                remaining = [
+                    entry_id for entry_id in entry_ids if entry_id not in found
+                ]
+                if not remaining:
+                    break
+                try:
+                    found.update(await store.get_many(remaining))
+                except Exception as e:
+                    logger.warning(f"Failed to get entries from {store.name}: {e}")
+                    continue
+
+            self.total_operations += 1
+            op_type = "get_many"
+            if memory_type:
+                op_type = f"get_many_{memory_type.value}"
+            self.operations_by_type[op_type] = (
+                self.operations_by_type.get(op_type, 0) + 1
+            )
+
+            logger.debug(f"Got {len(found)} of {len(entry_ids)} memory entries")
+            return found
+
+        except Exception as e:
+            logger.error(f"Failed to get memory entries: {e}")
+            return {}
+
     async def search_similar(
         self,
         content: str,
@@ -441,6 +630,51 @@ class MemoryManager:
             logger.error(f"Failed to delete memory entry: {e}")
             return False
 
+    async def delete_many(
+        self, entry_ids: List[str], memory_type: Optional[MemoryType] = None
+    ) -> List[bool]:
+        """Delete several memory entries.
+
+        Args:
+            entry_ids: IDs of the entries to delete
+            memory_type: Type of memory (if known)
+
+        Returns:
+            Deletion flag for each ID, in input order
+        """
+        try:
+            if memory_type:
+                stores = [self._get_store_for_type(memory_type)]
+            else:
+                # Entries might exist in multiple stores
+                stores = list(self.stores.values())
+
+            deleted = [False] * len(entry_ids)
+            for store in stores:
+                try:
+                    results = await store.delete_many(entry_ids)
+                except Exception:
+                    continue
+                deleted = [done or bool(r) for done, r in zip(deleted, results)]
+
+            count = sum(deleted)
+            if count:
+                self.total_operations += count
+                op_type = "delete"
+                if memory_type:
+                    op_type = f"delete_{memory_type.value}"
+                self.operations_by_type[op_type] = (
+                    self.operations_by_type.get(op_type, 0) + count
+                )
+
+                logger.debug(f"Deleted {count} memory entries")
+
+            return deleted
+
+        except Exception as e:
+            logger.error(f"Failed to delete memory entries: {e}")
+            return [False] * len(entry_ids)
+
     async def clear(
         self, memory_type: Optional[MemoryType] = None, store_name: Optional[str] = None
     ) -> bool:
@@ -500,6 +734,10 @@ class MemoryManager:
             stats: Dict[str, Any] = {
                 "total_operations": self.total_operations,
                 "operations_by_type": self.operations_by_type.copy(),
+                "average_retrieval_time_by_store": {
+                    store_name: total / self.retrievals_by_store[store_name]
+                    for store_name, total in self.retrieval_time_by_store.items()
+                },
                 "stores": {},
             }
 
@@ -133,6 +133,12 @@ class MemoryService(Service):
                 return await self._handle_update_request(params)
             elif action == "delete":
                 return await self._handle_delete_request(params)
+            elif action == "store_many":
+                return await self._handle_store_many_request(params)
+            elif action == "get_many":
+                return await self._handle_get_many_request(params)
+            elif action == "delete_many":
+                return await self._handle_delete_many_request(params)
             elif action == "clear":
                 return await self._handle_clear_request(params)
             elif action == "get_stats":
@@ -203,6 +209,7 @@ class MemoryService(Service):
                     limit=params.get("limit", 10),
                     similarity_threshold=params.get("similarity_threshold", 0.7),
                     time_range=params.get("time_range"),
+                    scored=params.get("scored", False),
                 )
 
             result = await self.memory_manager.retrieve(query)
@@ -315,6 +322,90 @@ class MemoryService(Service):
         except Exception as e:
             return ServiceResponse(success=False, error=f"Delete operation failed: {e}")
 
+    async def _handle_store_many_request(
+        self, params: Dict[str, Any]
+    ) -> ServiceResponse:
+        """Handle batch store memory request."""
+        try:
+            entries = params.get("entries")
+            if not entries:
+                return ServiceResponse(
+                    success=False, error="entries are required for store_many"
+                )
+
+            entry_ids = await self.memory_manager.store_many(entries)
+
+            return ServiceResponse(
+                success=len(entry_ids) == len(entries),
+                data={"entry_ids": entry_ids, "stored": len(entry_ids)},
+                metadata={"action": "store_many", "requested": len(entries)},
+            )
+
+        except Exception as e:
+            return ServiceResponse(
+                success=False, error=f"Store many operation failed: {e}"
+            )
+
+    async def _handle_get_many_request(self, params: Dict[str, Any]) -> ServiceResponse:
+        """Handle batch get memory entries request."""
+        try:
+            entry_ids = params.get("entry_ids")
+            if not entry_ids:
+                return ServiceResponse(success=False, error="entry_ids are required")
+
+            memory_type_str = params.get("memory_type")
+            memory_type = MemoryType(memory_type_str) if memory_type_str else None
+
+            found = await self.memory_manager.get_many(
+                entry_ids=entry_ids, memory_type=memory_type
+            )
+
+            return ServiceResponse(
+                success=True,
+                data={
+                    "entries": {
+                        entry_id: entry.model_dump()
+                        for entry_id, entry in found.items()
+                    },
+                    "missing": [
+                        entry_id for entry_id in entry_ids if entry_id not in found
+                    ],
+                },
+                metadata={"action": "get_many", "requested": len(entry_ids)},
+            )
+
+        except Exception as e:
+            return ServiceResponse(
+                success=False, error=f"Get many operation failed: {e}"
+            )
+
+    async def _handle_delete_many_request(
+        self, params: Dict[str, Any]
+    ) -> ServiceResponse:
+        """Handle batch delete memory entries request."""
+        try:
+            entry_ids = params.get("entry_ids")
+            if not entry_ids:
+                return ServiceResponse(success=False, error="entry_ids are required")
+
+            memory_type_str = params.get("memory_type")
+            memory_type = MemoryType(memory_type_str) if memory_type_str else None
+
+            results = await self.memory_manager.delete_many(
+                entry_ids=entry_ids, memory_type=memory_type
+            )
+
+            return ServiceResponse(
+                success=all(results),
+                data={"deleted": dict(zip(entry_ids, results))},
+                metadata={"action": "delete_many", "requested": len(entry_ids)},
+            )
+
+        except Exception as e:
+            return ServiceResponse(
+                success=False, error=f"Delete many operation failed: {e}"
+            )
+
     async def _handle_clear_request(self, params: Dict[str, Any]) -> ServiceResponse:
         """Handle clear memory request."""
         try:
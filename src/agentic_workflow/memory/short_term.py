@@ -1,10 +1,12 @@
 """Short-term memory implementation for the agentic workflow system."""
 
 import asyncio
+import bisect
+import heapq
 import time
 from collections import OrderedDict
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
 
 from ..core.logging_config import get_logger
 from .interfaces import (
@@ -15,10 +17,17 @@ from .interfaces import (
     MemoryStore,
     MemoryType,
 )
+from .text_index import TextIndex
+from .vector_index import VectorIndex
 
 logger = get_logger(__name__)
 
 
+def _time_key(timestamp: datetime) -> float:
+    """Get a sortable key for an entry timestamp."""
+    return timestamp.timestamp()
+
+
 class ContextWindow:
     """Manages a context window of memory entries."""
 
@@ -107,6 +116,15 @@ class ShortTermMemory(MemoryStore):
         # Storage
         self.context_windows: Dict[str, ContextWindow] = {}
         self.entries: OrderedDict[str, MemoryEntry] = OrderedDict()
+        self.vector_index = VectorIndex(config.get("vector_index"))
+        self.text_index = TextIndex(config.get("text_index"))
+
+        # Secondary indexes (entry IDs keyed by field value)
+        self._type_index: Dict[MemoryType, Set[str]] = {}
+        self._tag_index: Dict[str, Set[str]] = {}
+        self._metadata_index: Dict[str, Dict[Any, Set[str]]] = {}
+        self._unhashable_metadata: Dict[str, Set[str]] = {}
+        self._time_index: List[Tuple[float, str]] = []
 
         # Statistics
         self.total_stores = 0
@@ -180,11 +198,7 @@ class ShortTermMemory(MemoryStore):
 
         # Remove expired entries
         for entry_id in expired_entries:
-            if entry_id in self.entries:
-                self.entries.pop(entry_id)
-                # Remove from all windows
-                for window in self.context_windows.values():
-                    window.remove_entry(entry_id)
+            self._remove_entry(entry_id)
 
         # Remove expired windows
         for window_id in expired_windows:
@@ -199,16 +213,95 @@ class ShortTermMemory(MemoryStore):
 
         self.last_cleanup = now
 
+    def _remove_entry(self, entry_id: str) -> Optional[MemoryEntry]:
+        """Remove an entry from the main collection, windows and indexes.
+
+        Every eviction path (delete, TTL cleanup, capacity) goes through here
+        so the indexes never reference entries that are gone.
+        """
+        entry = self.entries.pop(entry_id, None)
+        if entry is None:
+            return None
+
+        # Remove from all windows
+        for window in self.context_windows.values():
+            window.remove_entry(entry_id)
+
+        self._unindex_entry(entry)
+        return entry
+
+    def _index_entry(self, entry: MemoryEntry) -> None:
+        """Add an entry to the indexes."""
+        self._type_index.setdefault(entry.memory_type, set()).add(entry.id)
+
+        for tag in entry.tags:
+            self._tag_index.setdefault(tag, set()).add(entry.id)
+
+        for key, value in entry.metadata.items():
+            try:
+                values = self._metadata_index.setdefault(key, {})
+                values.setdefault(value, set()).add(entry.id)
+            except TypeError:
+                # Unhashable values are only checked by _matches_query
+                self._unhashable_metadata.setdefault(key, set()).add(entry.id)
+
+        bisect.insort(self._time_index, (_time_key(entry.timestamp), entry.id))
+
+        self.text_index.add(entry.id, entry.content)
+
+        if entry.embedding:
+            self.vector_index.add(entry.id, entry.embedding)
+
+    def _unindex_entry(self, entry: MemoryEntry) -> None:
+        """Remove an entry from the indexes."""
+        self._discard(self._type_index, entry.memory_type, entry.id)
+
+        for tag in entry.tags:
+            self._discard(self._tag_index, tag, entry.id)
+
+        for key, value in entry.metadata.items():
+            values = self._metadata_index.get(key, {})
+            try:
+                self._discard(values, value, entry.id)
+            except TypeError:
+                self._discard(self._unhashable_metadata, key, entry.id)
+            if not values:
+                self._metadata_index.pop(key, None)
+
+        item = (_time_key(entry.timestamp), entry.id)
+        pos = bisect.bisect_left(self._time_index, item)
+        if pos < len(self._time_index) and self._time_index[pos] == item:
+            del self._time_index[pos]
+
+        self.text_index.remove(entry.id)
+        self.vector_index.remove(entry.id)
+
+    @staticmethod
+    def _discard(index: Dict[Any, Set[str]], key: Any, entry_id: str) -> None:
+        """Remove an ID from an index bucket, dropping the bucket when empty."""
+        ids = index.get(key)
+        if ids is None:
+            return
+        ids.discard(entry_id)
+        if not ids:
+            del index[key]
+
+    def _reset_indexes(self) -> None:
+        """Drop every index."""
+        self._type_index.clear()
+        self._tag_index.clear()
+        self._metadata_index.clear()
+        self._unhashable_metadata.clear()
+        self._time_index.clear()
+        self.text_index.clear()
+        self.vector_index.clear()
+
     def _ensure_capacity(self) -> None:
         """Ensure we don't exceed maximum capacity."""
         while len(self.entries) >= self.max_total_entries:
             # Remove oldest entry
             oldest_key = next(iter(self.entries))
-            self.entries.pop(oldest_key)
-
-            # Remove from all windows
-            for window in self.context_windows.values():
-                window.remove_entry(oldest_key)
+            self._remove_entry(oldest_key)
 
             logger.debug(f"Evicted entry due to capacity: {oldest_key}")
 
@@ -225,22 +318,7 @@ class ShortTermMemory(MemoryStore):
             # Start cleanup task if not already started
             self._start_cleanup_task()
 
-            self._ensure_capacity()
-
-            # Store in main collection
-            self.entries[entry.id] = entry
-
-            # Add to appropriate context window
-            window_id = entry.metadata.get("context_window", "default")
-            if window_id not in self.context_windows:
-                window_size = entry.metadata.get(
-                    "window_size", self.default_window_size
-                )
-                self.context_windows[window_id] = ContextWindow(window_id, window_size)
-
-            self.context_windows[window_id].add_entry(entry)
-
-            self.total_stores += 1
+            self._store_entry(entry)
 
             logger.debug(f"Stored entry in short-term memory: {entry.id}")
             return True
@@ -249,6 +327,70 @@ class ShortTermMemory(MemoryStore):
             logger.error(f"Failed to store entry {entry.id}: {e}")
             return False
 
+    def _store_entry(self, entry: MemoryEntry) -> None:
+        """Add an entry to the main collection, indexes and its context window."""
+        self._ensure_capacity()
+
+        # Store in main collection
+        previous = self.entries.get(entry.id)
+        if previous is not None:
+            self._unindex_entry(previous)
+        self.entries[entry.id] = entry
+        self._index_entry(entry)
+
+        # Add to appropriate context window
+        window_id = entry.metadata.get("context_window", "default")
+        if window_id not in self.context_windows:
+            window_size = entry.metadata.get("window_size", self.default_window_size)
+            self.context_windows[window_id] = ContextWindow(window_id, window_size)
+
+        self.context_windows[window_id].add_entry(entry)
+
+        self.total_stores += 1
+
+    async def store_many(self, entries: List[MemoryEntry]) -> List[bool]:
+        """Store several memory entries.
+
+        Args:
+            entries: Memory entries to store
+
+        Returns:
+            Success flag for each entry, in input order
+        """
+        self._start_cleanup_task()
+
+        results = []
+        for entry in entries:
+            try:
+                self._store_entry(entry)
+                results.append(True)
+            except Exception as e:
+                logger.error(f"Failed to store entry {entry.id}: {e}")
+                results.append(False)
+
+        logger.debug(f"Stored {sum(results)} entries in short-term memory")
+        return results
+
+    async def get_many(self, entry_ids: List[str]) -> Dict[str, MemoryEntry]:
+        """Get several memory entries by ID.
+
+        Args:
+            entry_ids: IDs of the entries to get
+
+        Returns:
+            Found entries keyed by ID; missing IDs are omitted
+        """
+        self.total_retrievals += 1
+
+        found = {
+            entry_id: self.entries[entry_id]
+            for entry_id in entry_ids
+            if entry_id in self.entries
+        }
+        if found:
+            self.cache_hits += 1
+        return found
+
     async def retrieve(self, query: MemoryQuery) -> MemoryResult:
         """Retrieve memory entries based on query.
 
@@ -262,27 +404,38 @@ class ShortTermMemory(MemoryStore):
         self.total_retrievals += 1
 
         try:
-            matching_entries = []
-
-            # Filter by context window if specified
-            window_id = query.metadata_filters.get("context_window")
-            if window_id and window_id in self.context_windows:
-                candidates = self.context_windows[window_id].get_all_entries()
+            # Apply filters to the narrowed candidate set
+            matching_entries = [
+                entry
+                for entry in self._candidate_entries(query)
+                if self._matches_query(entry, query)
+            ]
+
+            similarity_scores: List[float] = []
+            if query.scored and query.content:
+                # Most relevant first, then priority and recency
+                scores = self.text_index.score(
+                    query.content, {entry.id for entry in matching_entries}
+                )
+                limited_entries = heapq.nlargest(
+                    query.limit,
+                    matching_entries,
+                    key=lambda e: (
+                        scores.get(e.id, 0.0),
+                        e.priority,
+                        _time_key(e.timestamp),
+                    ),
+                )
+                similarity_scores = [
+                    scores.get(entry.id, 0.0) for entry in limited_entries
+                ]
             else:
-                candidates = list(self.entries.values())
-
-            # Apply filters
-            for entry in candidates:
-                if self._matches_query(entry, query):
-                    matching_entries.append(entry)
-
-            # Sort by priority and timestamp
-            matching_entries.sort(
-                key=lambda e: (-e.priority, e.timestamp), reverse=True
-            )
-
-            # Apply limit
-            limited_entries = matching_entries[: query.limit]
+                # Highest priority first, most recent first within a priority
+                limited_entries = heapq.nlargest(
+                    query.limit,
+                    matching_entries,
+                    key=lambda e: (e.priority, _time_key(e.timestamp)),
+                )
 
             query_time = time.time() - start_time
 
@@ -297,7 +450,7 @@ class ShortTermMemory(MemoryStore):
                 entries=limited_entries,
                 total_count=len(matching_entries),
                 query_time=query_time,
-                similarity_scores=[],
+                similarity_scores=similarity_scores,
                 success=True,
             )
 
@@ -311,16 +464,89 @@ class ShortTermMemory(MemoryStore):
                 success=False,
             )
 
+    def _candidate_entries(self, query: MemoryQuery) -> Iterable[MemoryEntry]:
+        """Narrow a query to candidate entries using the secondary indexes.
+
+        Content is resolved here through the text index; for the remaining
+        filters the candidates are a superset of the matches and callers
+        still apply _matches_query to them.
+        """
+        id_sets: List[Set[str]] = []
+
+        content_ids = self.text_index.match(query.content) if query.content else None
+        if content_ids is not None:
+            id_sets.append(content_ids)
+
+        if query.memory_type:
+            id_sets.append(self._type_index.get(query.memory_type, set()))
+
+        if query.tags:
+            id_sets.append(
+                set().union(*(self._tag_index.get(tag, set()) for tag in query.tags))
+            )
+
+        for key, value in query.metadata_filters.items():
+            if key == "context_window":
+                continue  # Handled separately
+            if value is None:
+                # Also matches entries without the key, which are not indexed
+                continue
+            values = self._metadata_index.get(key, {})
+            unhashable = self._unhashable_metadata.get(key, set())
+            try:
+                id_sets.append(values.get(value, set()) | unhashable)
+            except TypeError:
+                id_sets.append(set().union(unhashable, *values.values()))
+
+        time_slice: Optional[List[Tuple[float, str]]] = None
+        if query.time_range:
+            start_time, end_time = query.time_range
+            lo = bisect.bisect_left(self._time_index, (_time_key(start_time), ""))
+            hi = bisect.bisect_right(
+                self._time_index, (_time_key(end_time), "\U0010ffff")
+            )
+            time_slice = self._time_index[lo:hi]
+
+        # Drive the scan from the smallest index hit; the others only filter
+        ids: Optional[Iterable[str]] = None
+        if id_sets:
+            id_sets.sort(key=len)
+            smallest, others = id_sets[0], id_sets[1:]
+            if time_slice is not None and len(time_slice) < len(smallest):
+                ids = (entry_id for _, entry_id in time_slice)
+                others = id_sets
+            else:
+                ids = smallest
+            if others:
+                ids = [i for i in ids if all(i in other for other in others)]
+        elif time_slice is not None:
+            ids = [entry_id for _, entry_id in time_slice]
+
+        # Filter by context window if specified
+        window_id = query.metadata_filters.get("context_window")
+        if window_id and window_id in self.context_windows:
+            source = self.context_windows[window_id].entries
+        else:
+            source = self.entries
+
+        if ids is None:
+            candidates = list(source.values())
+        else:
+            candidates = [source[i] for i in ids if i in source]
+
+        if query.content and content_ids is None:
+            # Queries without word tokens fall back to a substring test
+            needle = query.content.lower()
+            candidates = [e for e in candidates if needle in e.content.lower()]
+
+        return candidates
+
     def _matches_query(self, entry: MemoryEntry, query: MemoryQuery) -> bool:
         """Check if an entry matches the query criteria."""
         # Memory type filter
         if query.memory_type and entry.memory_type != query.memory_type:
             return False
 
-        # Content filter (simple text search)
-        if query.content and query.content.lower() not in entry.content.lower():
-            return False
-
         # Tags filter
         if query.tags:
             if not any(tag in entry.tags for tag in query.tags):
@@ -356,11 +582,15 @@ class ShortTermMemory(MemoryStore):
                 return False
 
             entry = self.entries[entry_id]
+            self._unindex_entry(entry)
 
             # Update fields
-            for field, value in updates.items():
-                if hasattr(entry, field):
-                    setattr(entry, field, value)
+            try:
+                for field, value in updates.items():
+                    if hasattr(entry, field):
+                        setattr(entry, field, value)
+            finally:
+                self._index_entry(entry)
 
             # Update in context windows
             for window in self.context_windows.values():
@@ -384,16 +614,9 @@ class ShortTermMemory(MemoryStore):
             True if successful, False otherwise
         """
         try:
-            if entry_id not in self.entries:
+            if self._remove_entry(entry_id) is None:
                 return False
 
-            # Remove from main collection
-            self.entries.pop(entry_id)
-
-            # Remove from all context windows
-            for window in self.context_windows.values():
-                window.remove_entry(entry_id)
-
             logger.debug(f"Deleted entry: {entry_id}")
             return True
 
@@ -401,6 +624,26 @@ class ShortTermMemory(MemoryStore):
             logger.error(f"Failed to delete entry {entry_id}: {e}")
             return False
 
+    async def delete_many(self, entry_ids: List[str]) -> List[bool]:
+        """Delete several memory entries.
+
+        Args:
+            entry_ids: IDs of the entries to delete
+
+        Returns:
+            Deletion flag for each ID, in input order
+        """
+        results = []
+        for entry_id in entry_ids:
+            try:
+                results.append(self._remove_entry(entry_id) is not None)
+            except Exception as e:
+                logger.error(f"Failed to delete entry {entry_id}: {e}")
+                results.append(False)
+
+        logger.debug(f"Deleted {sum(results)} entries")
+        return results
+
     async def clear(self, memory_type: Optional[MemoryType] = None) -> bool:
         """Clear memory entries.
 
@@ -415,14 +658,11 @@ class ShortTermMemory(MemoryStore):
                 # Clear everything
                 self.entries.clear()
                 self.context_windows.clear()
+                self._reset_indexes()
                 logger.info("Cleared all short-term memory")
             else:
                 # Clear entries of specific type
-                to_remove = [
-                    entry_id
-                    for entry_id, entry in self.entries.items()
-                    if entry.memory_type == memory_type
-                ]
+                to_remove = list(self._type_index.get(memory_type, ()))
 
                 for entry_id in to_remove:
                     await self.delete(entry_id)
@@ -452,10 +692,10 @@ class ShortTermMemory(MemoryStore):
             )
 
             # Count entries by type
-            entries_by_type: Dict[str, int] = {}
-            for entry in self.entries.values():
-                memory_type = entry.memory_type.value
-                entries_by_type[memory_type] = entries_by_type.get(memory_type, 0) + 1
+            entries_by_type: Dict[str, int] = {
+                memory_type.value: len(ids)
+                for memory_type, ids in self._type_index.items()
+            }
 
             return MemoryStats(
                 total_entries=total_entries,
@@ -531,6 +771,7 @@ class ShortTermMemory(MemoryStore):
 
         self.entries.clear()
         self.context_windows.clear()
+        self._reset_indexes()
         self._cleanup_started = False
         self._cleanup_task = None
 
@@ -563,15 +804,32 @@ class ShortTermMemory(MemoryStore):
         Returns:
             Similar memory entries
         """
-        # Short-term memory doesn't support real vector similarity search
-        # In a real implementation, you would compute cosine similarity
-        logger.warning("Short-term memory doesn't support vector similarity search")
-
-        # Return most recent entries as fallback
-        entries = list(self.entries.values())[:limit]
-        return MemoryResult(
-            entries=entries,
-            total_count=len(entries),
-            query_time=0.0,
-            similarity_scores=[0.0] * len(entries),
-        )
+        start_time = time.time()
+        self.total_retrievals += 1
+
+        try:
+            hits = self.vector_index.search(
+                query_embedding, k=limit, threshold=threshold
+            )
+            entries = [self.entries[entry_id] for entry_id, _ in hits]
+            scores = [score for _, score in hits]
+
+            if entries:
+                self.cache_hits += 1
+
+            return MemoryResult(
+                entries=entries,
+                total_count=len(entries),
+                query_time=time.time() - start_time,
+                similarity_scores=scores,
+            )
+
+        except Exception as e:
+            logger.error(f"Failed to perform similarity search: {e}")
+            return MemoryResult(
+                entries=[],
+                total_count=0,
+                query_time=0.0,
+                similarity_scores=[],
+                success=False,
+            )
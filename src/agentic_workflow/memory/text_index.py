@@ -0,0 +1,211 @@
+"""Inverted full-text index with BM25 scoring for memory content."""
+
+import bisect
+import math
+import re
+from collections import Counter
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+_TOKEN_PATTERN = re.compile(r"\w+")
+
+
+def tokenize(text: str) -> List[str]:
+    """Split text into lowercase word tokens.
+
+    Args:
+    text: Text to tokenize
+
+    Returns:
+    List of tokens in order of appearance
+    """
+    return _TOKEN_PATTERN.findall(text.lower())
+
+
+class TextIndex:
+    """Token-level inverted index over memory entry content.
+
+    Postings map each term to the documents containing it and the term
+    frequency in each. The index is updated incrementally as entries are
+    added and removed, so content queries only touch the postings of the
+    query terms instead of every stored entry.
+
+    A query matches a document when the document contains every query term.
+    The last query term also matches as a prefix ("deploy pip" matches
+    "deploy pipeline"), which keeps type-ahead style lookups working.
+
+    Example config:
+    ```python
+    config = {
+        "k1": 1.5,  # BM25 term frequency saturation
+        "b": 0.75,  # BM25 length normalisation
+    }
+    ```
+    """
+
+    def __init__(self, config: Optional[Dict[str, Any]] = None):
+        """Initialize the text index.
+
+        Args:
+        config: Configuration parameters
+        """
+        config = config or {}
+        self.k1 = float(config.get("k1", 1.5))
+        self.b = float(config.get("b", 0.75))
+
+        self._postings: Dict[str, Dict[str, int]] = {}
+        self._doc_terms: Dict[str, List[str]] = {}
+        self._doc_lengths: Dict[str, int] = {}
+        self._total_length = 0
+        # Sorted vocabulary for prefix lookups
+        self._vocabulary: List[str] = []
+
+    def __len__(self) -> int:
+        """Get the number of indexed documents."""
+        return len(self._doc_lengths)
+
+    def __contains__(self, doc_id: object) -> bool:
+        """Check if a document is indexed."""
+        return doc_id in self._doc_lengths
+
+    def add(self, doc_id: str, text: str) -> None:
+        """Index a document, replacing any previous version.
+
+        Args:
+            doc_id: Document (memory entry) ID
+            text: Document content
+        """
+        if doc_id in self._doc_lengths:
+            self.remove(doc_id)
+
+        tokens = tokenize(text)
+        counts = Counter(tokens)
+        for term, count in counts.items():
+            postings = self._postings.get(term)
+            if postings is None:
+                postings = self._postings[term] = {}
+                bisect.insort(self._vocabulary, term)
+            postings[doc_id] = count
+
+        self._doc_terms[doc_id] = list(counts)
+        self._doc_lengths[doc_id] = len(tokens)
+        self._total_length += len(tokens)
+
+    def remove(self, doc_id: str) -> bool:
+        """Remove a document from the index.
+
+        Args:
+            doc_id: Document (memory entry) ID
+
+        Returns:
+            True if the document was indexed, False otherwise
+        """
+        length = self._doc_lengths.pop(doc_id, None)
+        if length is None:
+            return False
+
+        for term in self._doc_terms.pop(doc_id):
+            postings = self._postings[term]
+            del postings[doc_id]
+            if not postings:
+                del self._postings[term]
+                pos = bisect.bisect_left(self._vocabulary, term)
+                del self._vocabulary[pos]
+
+        self._total_length -= length
+        return True
+
+    def clear(self) -> None:
+        """Remove every document."""
+        self._postings.clear()
+        self._doc_terms.clear()
+        self._doc_lengths.clear()
+        self._total_length = 0
+        self._vocabulary.clear()
+
+    def _prefix_terms(self, prefix: str) -> List[str]:
+        """Get indexed terms starting with a prefix."""
+        start = bisect.bisect_left(self._vocabulary, prefix)
+        end = bisect.bisect_left(self._vocabulary, prefix + "\U0010ffff")
+        return self._vocabulary[start:end]
+
+    def _query_terms(self, query: str) -> Optional[List[List[str]]]:
+        """Expand a query into alternatives per query term.
+
+        Returns None if the query has no tokens.
+        """
+        tokens = list(dict.fromkeys(tokenize(query)))
+        if not tokens:
+            return None
+        expanded = [[term] for term in tokens[:-1]]
+        expanded.append(self._prefix_terms(tokens[-1]))
+        return expanded
+
+    def match(self, query: str) -> Optional[Set[str]]:
+        """Find documents containing every query term.
+
+        Args:
+            query: Query text
+
+        Returns:
+            Matching document IDs, or None if the query has no tokens
+        """
+        expanded = self._query_terms(query)
+        if expanded is None:
+            return None
+
+        groups: List[Set[str]] = []
+        for alternatives in expanded:
+            docs: Set[str] = set()
+            for term in alternatives:
+                docs.update(self._postings.get(term, ()))
+            if not docs:
+                return set()
+            groups.append(docs)
+
+        # Intersect starting from the rarest term
+        groups.sort(key=len)
+        result = groups[0]
+        for docs in groups[1:]:
+            result = {doc_id for doc_id in result if doc_id in docs}
+        return result
+
+    def score(self, query: str, doc_ids: Optional[Set[str]] = None) -> Dict[str, float]:
+        """Score documents against a query with BM25.
+
+        Args:
+            query: Query text
+            doc_ids: Documents to score (default: every document matching
+                at least one query term)
+
+        Returns:
+            Mapping of document ID to BM25 score
+        """
+        expanded = self._query_terms(query)
+        if expanded is None or not self._doc_lengths:
+            return {}
+
+        doc_count = len(self._doc_lengths)
+        avg_length = self._total_length / doc_count or 1.0
+        scores: Dict[str, float] = {}
+
+        for term in {term for alternatives in expanded for term in alternatives}:
+            postings = self._postings.get(term)
+            if not postings:
+                continue
+            df = len(postings)
+            idf = math.log(1.0 + (doc_count - df + 0.5) / (df + 0.5))
+
+            items: Iterable[Tuple[str, int]]
+            if doc_ids is None:
+                items = postings.items()
+            elif len(doc_ids) < len(postings):
+                items = ((d, postings[d]) for d in doc_ids if d in postings)
+            else:
+                items = ((d, tf) for d, tf in postings.items() if d in doc_ids)
+
+            for doc_id, tf in items:
+                norm = 1.0 - self.b + self.b * self._doc_lengths[doc_id] / avg_length
+                gain = idf * tf * (self.k1 + 1.0) / (tf + self.k1 * norm)
+                scores[doc_id] = scores.get(doc_id, 0.0) + gain
+
+        return scores
@@ -0,0 +1,335 @@
+"""In-process approximate nearest neighbour index for memory embeddings."""
+
+from typing import Any, Dict, List, Optional, Sequence, Set, Tuple, Union
+
+import numpy as np
+
+from ..core.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+Vector = Union[Sequence[float], np.ndarray]
+
+
+class VectorIndex:
+    """Cosine-similarity vector index backed by a contiguous float32 matrix.
+
+    Vectors are L2-normalised on insert and kept in a single growable
+    ``(capacity, dim)`` matrix, so a query is one matrix-vector product.
+    Deletes swap the last row into the freed slot to keep the matrix dense.
+
+    Below ``train_threshold`` vectors the index answers queries exactly.
+    Once it grows past that, an IVF (inverted file) layer is trained with
+    spherical k-means: every vector is assigned to its nearest centroid and
+    queries only score the rows of the ``nprobe`` closest lists.
+
+    Example config:
+    ```python
+    config = {
+        "train_threshold": 2048,  # Switch from exact to IVF search
+        "nlist": None,  # Number of IVF lists (default: sqrt(n))
+        "nprobe": 8,  # Lists scanned per query
+        "kmeans_iterations": 10,
+        "initial_capacity": 256,
+    }
+    ```
+    """
+
+    def __init__(self, config: Optional[Dict[str, Any]] = None):
+        """Initialize the vector index.
+
+        Args:
+        config: Configuration parameters
+        """
+        config = config or {}
+        self.train_threshold = int(config.get("train_threshold", 2048))
+        self.nlist: Optional[int] = config.get("nlist")
+        self.nprobe = int(config.get("nprobe", 8))
+        self.kmeans_iterations = int(config.get("kmeans_iterations", 10))
+        self.initial_capacity = int(config.get("initial_capacity", 256))
+        self.seed = int(config.get("seed", 0))
+
+        self.dim: Optional[int] = None
+        self._vectors = np.empty((0, 0), dtype=np.float32)
+        self._size = 0
+        self._ids: List[str] = []
+        self._rows: Dict[str, int] = {}
+
+        # IVF state (populated by train())
+        self._centroids: Optional[np.ndarray] = None
+        self._assignments = np.empty(0, dtype=np.int32)
+        self._lists: List[Set[int]] = []
+        self._trained_size = 0
+
+    def __len__(self) -> int:
+        """Get the number of indexed vectors."""
+        return self._size
+
+    def __contains__(self, entry_id: object) -> bool:
+        """Check if an entry is indexed."""
+        return entry_id in self._rows
+
+    @property
+    def is_trained(self) -> bool:
+        """Whether the IVF layer is active."""
+        return self._centroids is not None
+
+    def _normalize(self, vectors: np.ndarray) -> np.ndarray:
+        """L2-normalise rows, leaving zero vectors untouched."""
+        norms = np.linalg.norm(vectors, axis=-1, keepdims=True)
+        norms[norms == 0.0] = 1.0
+        normalized: np.ndarray = vectors / norms
+        return normalized
+
+    def _reserve(self, size: int) -> None:
+        """Grow the backing matrix to hold at least ``size`` rows."""
+        capacity = self._vectors.shape[0]
+        if size <= capacity:
+            return
+        new_capacity = max(self.initial_capacity, capacity * 2, size)
+        vectors = np.empty((new_capacity, self.dim or 0), dtype=np.float32)
+        vectors[: self._size] = self._vectors[: self._size]
+        self._vectors = vectors
+        assignments = np.full(new_capacity, -1, dtype=np.int32)
+        assignments[: self._size] = self._assignments[: self._size]
+        self._assignments = assignments
+
+    def add(self, entry_id: str, embedding: Vector) -> bool:
+        """Add or replace the vector for an entry.
+
+        Args:
+            entry_id: Memory entry ID
+            embedding: Vector embedding
+
+        Returns:
+            True if the vector was indexed, False if it was rejected
+        """
+        vector = np.asarray(embedding, dtype=np.float32)
+        if vector.ndim != 1 or vector.size == 0:
+            return False
+
+        if self.dim is None:
+            self.dim = int(vector.size)
+            self._vectors = np.empty((0, self.dim), dtype=np.float32)
+        elif vector.size != self.dim:
+            logger.warning(
+                f"Rejected embedding for {entry_id}: dimension {vector.size} "
+                f"does not match index dimension {self.dim}"
+            )
+            return False
+
+        vector = self._normalize(vector)
+
+        row = self._rows.get(entry_id)
+        if row is None:
+            self._reserve(self._size + 1)
+            row = self._size
+            self._size += 1
+            self._ids.append(entry_id)
+            self._rows[entry_id] = row
+        elif self._centroids is not None:
+            self._lists[self._assignments[row]].discard(row)
+
+        self._vectors[row] = vector
+        if self._centroids is not None:
+            self._assign_rows(np.array([row]))
+
+        self._maybe_train()
+        return True
+
+    def remove(self, entry_id: str) -> bool:
+        """Remove the vector for an entry.
+
+        Args:
+            entry_id: Memory entry ID
+
+        Returns:
+            True if the entry was indexed, False otherwise
+        """
+        row = self._rows.pop(entry_id, None)
+        if row is None:
+            return False
+
+        last = self._size - 1
+        if self._centroids is not None:
+            self._lists[self._assignments[row]].discard(row)
+
+        if row != last:
+            # Move the last row into the hole to keep the matrix dense
+            moved_id = self._ids[last]
+            self._vectors[row] = self._vectors[last]
+            self._ids[row] = moved_id
+            self._rows[moved_id] = row
+            if self._centroids is not None:
+                list_id = self._assignments[last]
+                self._lists[list_id].discard(last)
+                self._lists[list_id].add(row)
+                self._assignments[row] = list_id
+
+        self._ids.pop()
+        self._size -= 1
+
+        if self._size == 0:
+            self.clear()
+        return True
+
+    def clear(self) -> None:
+        """Remove every vector and reset the index dimension."""
+        self.dim = None
+        self._vectors = np.empty((0, 0), dtype=np.float32)
+        self._size = 0
+        self._ids = []
+        self._rows = {}
+        self._reset_ivf()
+
+    def _reset_ivf(self) -> None:
+        """Drop the IVF layer and fall back to exact search."""
+        self._centroids = None
+        self._assignments = np.full(self._vectors.shape[0], -1, dtype=np.int32)
+        self._lists = []
+        self._trained_size = 0
+
+    def _maybe_train(self) -> None:
+        """Train or retrain the IVF layer when the index has grown enough."""
+        if self._size < self.train_threshold:
+            if self._centroids is not None and self._size < self.train_threshold // 2:
+                self._reset_ivf()
+            return
+        if self._centroids is None or self._size >= self._trained_size * 4:
+            self.train()
+
+    def train(self) -> None:
+        """Cluster the indexed vectors with spherical k-means."""
+        if self._size == 0:
+            return
+
+        data = self._vectors[: self._size]
+        nlist = self.nlist or int(np.sqrt(self._size))
+        nlist = max(1, min(nlist, self._size))
+
+        rng = np.random.default_rng(self.seed)
+        sample_size = min(self._size, nlist * 64)
+        sample = data[rng.choice(self._size, size=sample_size, replace=False)]
+        centroids = sample[rng.choice(sample_size, size=nlist, replace=False)].copy()
+
+        for _ in range(self.kmeans_iterations):
+            labels = np.argmax(sample @ centroids.T, axis=1)
+            for list_id in range(nlist):
+                members = sample[labels == list_id]
+                if len(members):
+                    centroids[list_id] = members.sum(axis=0)
+            centroids = self._normalize(centroids)
+
+        self._centroids = centroids.astype(np.float32)
+        self._lists = [set() for _ in range(nlist)]
+        self._assign_rows(np.arange(self._size))
+        self._trained_size = self._size
+        logger.debug(f"Trained vector index with {nlist} lists over {self._size} rows")
+
+    def _assign_rows(self, rows: np.ndarray) -> None:
+        """Assign rows to their nearest IVF list."""
+        assert self._centroids is not None
+        labels = np.argmax(self._vectors[rows] @ self._centroids.T, axis=1)
+        for row, list_id in zip(rows.tolist(), labels.tolist()):
+            self._assignments[row] = list_id
+            self._lists[list_id].add(row)
+
+    def _candidate_rows(self, query: np.ndarray) -> Optional[np.ndarray]:
+        """Get rows in the nprobe lists closest to a normalised query."""
+        if self._centroids is None:
+            return None
+        nprobe = min(self.nprobe, len(self._lists))
+        centroid_scores = self._centroids @ query
+        probe = np.argpartition(-centroid_scores, nprobe - 1)[:nprobe]
+        rows: List[int] = []
+        for list_id in probe.tolist():
+            rows.extend(self._lists[list_id])
+        return np.fromiter(rows, dtype=np.int64, count=len(rows))
+
+    @staticmethod
+    def _top_k(scores: np.ndarray, k: int) -> np.ndarray:
+        """Get positions of the k highest scores, best first."""
+        if k >= scores.shape[-1]:
+            return np.argsort(-scores, kind="stable")
+        top = np.argpartition(-scores, k - 1)[:k]
+        return top[np.argsort(-scores[top], kind="stable")]
+
+    def search(
+        self, query: Vector, k: int = 10, threshold: float = -1.0
+    ) -> List[Tuple[str, float]]:
+        """Find the entries most similar to a query vector.
+
+        Args:
+            query: Query vector embedding
+            k: Maximum number of results
+            threshold: Minimum cosine similarity
+
+        Returns:
+            List of (entry_id, similarity) pairs, most similar first
+        """
+        return self.search_batch([query], k=k, threshold=threshold)[0]
+
+    def search_batch(
+        self,
+        queries: Sequence[Vector],
+        k: int = 10,
+        threshold: float = -1.0,
+    ) -> List[List[Tuple[str, float]]]:
+        """Find the most similar entries for several query vectors at once.
+
+        Args:
+            queries: Query vector embeddings
+            k: Maximum number of results per query
+            threshold: Minimum cosine similarity
+
+        Returns:
+            One result list of (entry_id, similarity) pairs per query
+        """
+        if not len(queries):
+            return []
+        if self._size == 0 or k <= 0:
+            return [[] for _ in queries]
+
+        matrix = np.asarray(queries, dtype=np.float32)
+        if matrix.ndim != 2 or matrix.shape[1] != self.dim:
+            logger.warning(
+                f"Query dimension {matrix.shape[-1]} does not match "
+                f"index dimension {self.dim}"
+            )
+            return [[] for _ in queries]
+        matrix = self._normalize(matrix)
+        data = self._vectors[: self._size]
+
+        results: List[List[Tuple[str, float]]] = []
+        if self._centroids is None:
+            # Exact search: one matrix product for the whole batch
+            all_scores = matrix @ data.T
+            for scores in all_scores:
+                results.append(self._collect(scores, None, k, threshold))
+            return results
+
+        for query in matrix:
+            rows = self._candidate_rows(query)
+            if rows is None or rows.size == 0:
+                results.append([])
+                continue
+            scores = data[rows] @ query
+            results.append(self._collect(scores, rows, k, threshold))
+        return results
+
+    def _collect(
+        self,
+        scores: np.ndarray,
+        rows: Optional[np.ndarray],
+        k: int,
+        threshold: float,
+    ) -> List[Tuple[str, float]]:
+        """Turn a score vector into thresholded (entry_id, score) pairs."""
+        hits: List[Tuple[str, float]] = []
+        for pos in self._top_k(scores, k).tolist():
+            score = float(scores[pos])
+            if score < threshold:
+                break
+            row = pos if rows is None else int(rows[pos])
+            hits.append((self._ids[row], score))
+        return hits
@@ -8,10 +8,12 @@ from typing import Any, Dict, List, Optional
 from langchain_openai import OpenAIEmbeddings
 from weaviate import WeaviateClient
 from weaviate.collections.classes.config import DataType, Property
+from weaviate.collections.classes.data import DataObject
 from weaviate.collections.classes.filters import Filter
 
 from ..core.config import get_config
 from ..core.logging_config import get_logger
+from .embedding_pipeline import EmbeddingPipeline
 from .interfaces import (
     MemoryEntry,
     MemoryQuery,
@@ -39,7 +41,8 @@ class WeaviateVectorStore(VectorStore):
     "url": "http://localhost:8080",  # Weaviate URL
     "auth_config": {"api_key": "your-api-key"},  # Optional Weaviate auth
     "openai_api_key": "your-openai-key",  # For LangChain embeddings
-    "batch_size": 10  # Optional batch processing size
+    "batch_size": 10,  # Optional batch processing size
+    "embedding_pipeline": {"cache_size": 10000},  # See EmbeddingPipeline
     }
     ```"""
 
@@ -86,6 +89,13 @@ class WeaviateVectorStore(VectorStore):
                 logger.error(f"Failed to initialize LangChain embeddings: {e}")
                 self.embedding_model = None
 
+        # Batches, caches and de-duplicates embedding requests
+        self.embedding_pipeline: Optional[EmbeddingPipeline] = None
+        if self.embedding_model is not None:
+            self.embedding_pipeline = EmbeddingPipeline(
+                self.embedding_model, self.config.get("embedding_pipeline", {})
+            )
+
         # Statistics
         self.total_stores = 0
         self.total_queries = 0
@@ -210,26 +220,25 @@ class WeaviateVectorStore(VectorStore):
             if not await self._create_schema():
                 return False
 
-            # Generate embedding using LangChain if not provided
+            # Generate embedding if not provided
             if (
                 not entry.embedding or len(entry.embedding) == 0
-            ) and self.embedding_model is not None:
+            ) and self.embedding_pipeline is not None:
                 try:
-                    entry.embedding = self.embedding_model.embed_query(entry.content)
-                    logger.debug(
-                        f"Generated embedding for entry using LangChain: {entry.id}"
-                    )
+                    entry.embedding = await self.embedding_pipeline.embed(entry.content)
+                    logger.debug(f"Generated embedding for entry: {entry.id}")
                 except Exception as e:
-                    logger.error(f"Failed to generate embedding with LangChain: {e}")
+                    logger.error(f"Failed to generate embedding: {e}")
 
             # Prepare data
             data = self._serialize_entry(entry)
             vector = entry.embedding if entry.embedding else None
 
-            # Store in Weaviate
+            # Store in Weaviate under the entry ID so lookups by ID match
             self.client.collections.get(self.class_name).data.insert(
                 properties=data,
                 vector=vector,
+                uuid=entry.id,
             )
 
             self.total_stores += 1
@@ -240,6 +249,122 @@ class WeaviateVectorStore(VectorStore):
             logger.error(f"Failed to store entry {entry.id}: {e}")
             return False
 
+    async def store_many(self, entries: List[MemoryEntry]) -> List[bool]:
+        """Store several memory entries with Weaviate batch inserts.
+
+        Missing embeddings go through the embedding pipeline in one call
+        and entries are inserted in chunks of ``batch_size``.
+
+        Args:
+            entries: Memory entries to store
+
+        Returns:
+            Success flag for each entry, in input order
+        """
+        if not entries:
+            return []
+
+        try:
+            if self.provider == "mock" or self.store_type == "local":
+                self.total_stores += len(entries)
+                logger.debug(f"Mock stored {len(entries)} entries in vector store")
+                return [True] * len(entries)
+
+            if not await self._ensure_client() or self.client is None:
+                return [False] * len(entries)
+
+            if not await self._create_schema():
+                return [False] * len(entries)
+
+            # Generate missing embeddings in as few requests as possible;
+            # the caller's entries are left untouched
+            vectors = [entry.embedding or None for entry in entries]
+            missing = [i for i, vector in enumerate(vectors) if vector is None]
+            if missing and self.embedding_pipeline is not None:
+                try:
+                    embeddings = await self.embedding_pipeline.embed_many(
+                        [entries[i].content for i in missing]
+                    )
+                    for i, embedding in zip(missing, embeddings):
+                        vectors[i] = embedding
+                except Exception as e:
+                    logger.error(f"Failed to generate embeddings: {e}")
+
+            collection = self.client.collections.get(self.class_name)
+            results: List[bool] = []
+
+            for start in range(0, len(entries), self.batch_size):
+                chunk = entries[start : start + self.batch_size]
+                response = collection.data.insert_many(
+                    [
+                        DataObject(
+                            properties=self._serialize_entry(entry),
+                            uuid=entry.id,
+                            vector=vector,
+                        )
+                        for entry, vector in zip(
+                            chunk, vectors[start : start + self.batch_size]
+                        )
+                    ]
+                )
+                for index in response.errors:
+                    logger.error(
+                        f"Failed to store entry {chunk[index].id}: "
+                        f"{response.errors[index].message}"
+                    )
+                results.extend(
+                    index not in response.errors for index in range(len(chunk))
+                )
+
+            self.total_stores += sum(results)
+            logger.debug(f"Stored {sum(results)} entries in vector store")
+            return results
+
+        except Exception as e:
+            logger.error(f"Failed to store vector entries: {e}")
+            return [False] * len(entries)
+
+    async def get_many(self, entry_ids: List[str]) -> Dict[str, MemoryEntry]:
+        """Get several memory entries with one filtered fetch.
+
+        Args:
+            entry_ids: IDs of the entries to get
+
+        Returns:
+            Found entries keyed by ID; missing IDs are omitted
+        """
+        if not entry_ids:
+            return {}
+
+        try:
+            if self.provider == "mock" or self.store_type == "local":
+                return {}
+
+            if not await self._ensure_client() or self.client is None:
+                return {}
+
+            collection = self.client.collections.get(self.class_name)
+            response = collection.query.fetch_objects(
+                filters=Filter.by_id().contains_any(entry_ids),
+                limit=len(entry_ids),
+                include_vector=True,
+            )
+
+            found: Dict[str, MemoryEntry] = {}
+            for item in response.objects:
+                entry = self._deserialize_entry(
+                    {**item.properties, "id": str(item.uuid)}
+                )
+                if entry:
+                    found[entry.id] = entry
+
+            self.total_queries += 1
+            return found
+
+        except Exception as e:
+            logger.error(f"Failed to get vector entries: {e}")
+            return {}
+
     async def retrieve(self, query: MemoryQuery) -> MemoryResult:
         """Retrieve memory entries based on query.
 
@@ -361,6 +486,36 @@ class WeaviateVectorStore(VectorStore):
             logger.error(f"Failed to delete vector entry: {e}")
             return False
 
+    async def delete_many(self, entry_ids: List[str]) -> List[bool]:
+        """Delete several memory entries with one batch delete.
+
+        Args:
+            entry_ids: IDs of the entries to delete
+
+        Returns:
+            Deletion flag for each ID, in input order
+        """
+        if not entry_ids:
+            return []
+
+        try:
+            if not await self._ensure_client() or self.client is None:
+                return [False] * len(entry_ids)
+
+            collection = self.client.collections.get(self.class_name)
+            response = collection.data.delete_many(
+                where=Filter.by_id().contains_any(entry_ids), verbose=True
+            )
+
+            deleted = {str(obj.uuid) for obj in response.objects if obj.successful}
+            self.total_deletes += len(deleted)
+            logger.debug(f"Deleted {len(deleted)} entries from vector store")
+            return [entry_id in deleted for entry_id in entry_ids]
+
+        except Exception as e:
+            logger.error(f"Failed to delete vector entries: {e}")
+            return [False] * len(entry_ids)
+
     async def clear(self, memory_type: Optional[MemoryType] = None) -> bool:
         """Clear memory entries.
 
@@ -483,9 +638,8 @@ class WeaviateVectorStore(VectorStore):
         """
         try:
             # Use LangChain for embedding generation
-            if self.embedding_model is not None:
-                # LangChain's embed_query returns a list of floats
-                embedding = self.embedding_model.embed_query(content)
+            if self.embedding_pipeline is not None:
+                embedding = await self.embedding_pipeline.embed(content)
                 if isinstance(embedding, list) and all(
                     isinstance(x, float) for x in embedding
                 ):
@@ -608,7 +762,7 @@ class WeaviateVectorStore(VectorStore):
                 )
 
             # Generate embedding from text using LangChain
-            if not query_text or self.embedding_model is None:
+            if not query_text or self.embedding_pipeline is None:
                 return MemoryResult(
                     entries=[],
                     total_count=0,
@@ -618,7 +772,7 @@ class WeaviateVectorStore(VectorStore):
                 )
 
             # Get embedding for the query text
-            query_embedding = self.embedding_model.embed_query(query_text)
+            query_embedding = await self.embedding_pipeline.embed(query_text)
 
             # Use the embedding for similarity search
             return await self.similarity_search(
@@ -637,5 +791,7 @@ class WeaviateVectorStore(VectorStore):
 
     async def close(self) -> None:
         """Close the vector store and cleanup resources."""
+        if self.embedding_pipeline is not None:
+            await self.embedding_pipeline.close()
         self.client = None
         logger.info("Vector store closed")
@@ -1,8 +1,13 @@
 """Vector embedding utilities."""
 
-import random
-from typing import Any, Dict, List, Optional
-
+import hashlib
+import math
+import re
+from collections import Counter
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple, cast
+
+import numpy as np
 from langchain_openai import OpenAIEmbeddings
 
 from ..core.config import get_config
@@ -11,6 +16,28 @@ from .base import BaseEmbeddingProvider
 
 logger = get_logger(__name__)
 
+_TOKEN_PATTERN = re.compile(r"\w+")
+
+
+def _random_embeddings(count: int, dimension: int = 1536) -> List[List[float]]:
+    """Generate random embeddings in [-1, 1)."""
+    embeddings = np.random.default_rng().uniform(-1, 1, (count, dimension))
+    return cast(List[List[float]], embeddings.tolist())
+
+
+@lru_cache(maxsize=65536)
+def _hash_feature(feature: str, dimension: int, seed: int) -> Tuple[int, float]:
+    """Map a feature to a stable (index, sign) pair.
+
+    Uses BLAKE2b rather than ``hash()`` so the mapping is identical across
+    processes and runs.
+    """
+    digest = hashlib.blake2b(
+        feature.encode("utf-8"), digest_size=8, salt=seed.to_bytes(8, "little")
+    ).digest()
+    value = int.from_bytes(digest, "little")
+    return value % dimension, 1.0 if value >> 63 else -1.0
+
 
 class EmbeddingProvider(BaseEmbeddingProvider):
     """Provider for text embeddings."""
@@ -91,7 +118,7 @@ class OpenAIEmbeddingProvider(EmbeddingProvider):
         """
         if not self._client:
             logger.warning("OpenAI embeddings not available")
-            return [self._generate_random_embedding() for _ in texts]
+            return _random_embeddings(len(texts))
 
         try:
             # Use LangChain to get embeddings
@@ -99,7 +126,7 @@ class OpenAIEmbeddingProvider(EmbeddingProvider):
             return embeddings
         except Exception as e:
             logger.error(f"Failed to generate OpenAI embeddings in batch: {e}")
-            return [self._generate_random_embedding() for _ in texts]
+            return _random_embeddings(len(texts))
 
     def _generate_random_embedding(self) -> List[float]:
         """Generate a random embedding for fallback.
@@ -107,7 +134,7 @@ class OpenAIEmbeddingProvider(EmbeddingProvider):
         Returns:
         Random vector embedding
         """
-        return [random.uniform(-1, 1) for _ in range(1536)]
+        return _random_embeddings(1)[0]
 
 
 class MockEmbeddingProvider(EmbeddingProvider):
@@ -131,7 +158,7 @@ class MockEmbeddingProvider(EmbeddingProvider):
         Returns:
             Random vector embedding
         """
-        return [random.uniform(-1, 1) for _ in range(1536)]
+        return _random_embeddings(1)[0]
 
     async def embed_batch(self, texts: List[str]) -> List[List[float]]:
         """Generate mock embeddings for multiple texts.
@@ -142,7 +169,151 @@ class MockEmbeddingProvider(EmbeddingProvider):
         Returns:
             List of random vector embeddings
         """
-        return [[random.uniform(-1, 1) for _ in range(1536)] for _ in texts]
+        return _random_embeddings(len(texts))
+
+
+class LocalEmbeddingProvider(EmbeddingProvider):
+    """Deterministic offline embedding provider based on feature hashing.
+
+    Each text is turned into word, word-bigram and character n-gram
+    features, which are hashed into a fixed number of signed buckets and
+    weighted by sublinear term frequency. Rows are L2-normalised, so the dot
+    product of two embeddings is their cosine similarity, and texts sharing
+    vocabulary score higher than unrelated ones.
+
+    The same text always maps to the same vector, across processes and
+    machines, and no network access is needed. Intended for tests, CI load
+    runs and offline development, not as a substitute for a semantic model.
+
+    Example config:
+    ```python
+    config = {
+        "dimension": 1536,  # Output dimension
+        "char_ngram": 3,  # Character n-gram size (0 disables)
+        "seed": 0,  # Changes the hashing, and so every vector
+    }
+    ```
+    """
+
+    def __init__(self, config: Optional[Dict[str, Any]] = None):
+        """Initialize local embedding provider.
+
+        Args:
+        config: Configuration parameters
+        """
+        config = config or {}
+        super().__init__(config.get("model", "local-hashing"))
+        self.dimension = int(config.get("dimension", 1536))
+        self.char_ngram = int(config.get("char_ngram", 3))
+        self.seed = int(config.get("seed", 0))
+        # Weight per feature kind: words, word bigrams, character n-grams
+        self._weights = {
+            "w": float(config.get("word_weight", 1.0)),
+            "b": float(config.get("bigram_weight", 0.5)),
+            "c": float(config.get("char_weight", 0.5)),
+        }
+
+        if self.dimension <= 0:
+            raise ValueError("dimension must be positive")
+
+    def _features(self, text: str) -> Counter:
+        """Count the features of a text, prefixed by their kind."""
+        tokens = _TOKEN_PATTERN.findall(text.lower())
+        features: Counter = Counter("w:" + token for token in tokens)
+        features.update(
+            f"b:{first} {second}" for first, second in zip(tokens, tokens[1:])
+        )
+
+        n = self.char_ngram
+        if n > 0:
+            for token in tokens:
+                padded = f"<{token}>"
+                features.update(
+                    "c:" + padded[i : i + n] for i in range(max(1, len(padded) - n + 1))
+                )
+
+        return features
+
+    def embed_array(self, texts: List[str]) -> np.ndarray:
+        """Embed texts into a float32 matrix.
+
+        Args:
+            texts: Texts to embed
+
+        Returns:
+            Array of shape (len(texts), dimension) with unit-length rows;
+            texts without any word characters map to zero rows
+        """
+        matrix = np.zeros((len(texts), self.dimension), dtype=np.float32)
+        rows: List[int] = []
+        columns: List[int] = []
+        values: List[float] = []
+
+        for row, text in enumerate(texts):
+            for feature, count in self._features(text).items():
+                weight = self._weights[feature[0]]
+                if not weight:
+                    continue
+                column, sign = _hash_feature(feature, self.dimension, self.seed)
+                rows.append(row)
+                columns.append(column)
+                # Sublinear term frequency so repeated terms do not dominate
+                values.append(sign * weight * (1.0 + math.log(count)))
+
+        if values:
+            np.add.at(matrix, (rows, columns), values)
+
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        np.divide(matrix, norms, out=matrix, where=norms > 0)
+        return matrix
+
+    async def embed_text(self, text: str) -> List[float]:
+        """Generate a deterministic embedding for text.
+
+        Args:
+            text: Text to embed
+
+        Returns:
+            Unit-length vector embedding
+        """
+        return cast(List[float], self.embed_array([text])[0].tolist())
+
+    async def embed_batch(self, texts: List[str]) -> List[List[float]]:
+        """Generate deterministic embeddings for multiple texts.
+
+        Args:
+            texts: List of texts to embed
+
+        Returns:
+            List of unit-length vector embeddings
+        """
+        if not texts:
+            return []
+        return cast(List[List[float]], self.embed_array(texts).tolist())
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        """Embed documents (LangChain-compatible, synchronous).
+
+        Args:
+            texts: Texts to embed
+
+        Returns:
+            List of unit-length vector embeddings
+        """
+        if not texts:
+            return []
+        return cast(List[List[float]], self.embed_array(texts).tolist())
+
+    def embed_query(self, text: str) -> List[float]:
+        """Embed a query (LangChain-compatible, synchronous).
+
+        Args:
+            text: Text to embed
+
+        Returns:
+            Unit-length vector embedding
+        """
+        return cast(List[float], self.embed_array([text])[0].tolist())
 
 
 def get_embedding_provider(
@@ -151,7 +322,7 @@ def get_embedding_provider(
     """Get embedding provider instance.
 
     Args:
-    provider_type: Type of embedding provider ("openai" or "mock")
+    provider_type: Type of embedding provider ("openai", "local" or "mock")
     config: Configuration parameters
 
     Returns:
@@ -159,6 +330,8 @@ def get_embedding_provider(
     """
     if provider_type == "openai":
         return OpenAIEmbeddingProvider(config)
+    elif provider_type == "local":
+        return LocalEmbeddingProvider(config)
     elif provider_type == "mock":
         return MockEmbeddingProvider(config)
     else:
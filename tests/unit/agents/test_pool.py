@@ -0,0 +1,93 @@
+"""Tests for the agent pool."""
+
+import asyncio
+from typing import Any, Dict, List
+
+import pytest
+
+from agentic_workflow.agents.base import AgentTask
+from agentic_workflow.agents.planning import PlanningAgent
+from agentic_workflow.agents.pool import AgentPool
+
+
+class TestAgentPool:
+    """Test agent reuse, limits and eviction."""
+
+    @pytest.fixture
+    def created(self) -> List[PlanningAgent]:
+        return []
+
+    @pytest.fixture
+    def pool(self, created: List[PlanningAgent]) -> AgentPool:
+        def factory(agent_type: str, agent_id: str, config: Dict[str, Any]) -> Any:
+            agent = PlanningAgent(agent_id=agent_id, config=config)
+            created.append(agent)
+            return agent
+
+        return AgentPool(max_agents_per_key=2, factory=factory)
+
+    @pytest.mark.asyncio
+    async def test_instances_reused_per_key(
+        self, pool: AgentPool, created: List[PlanningAgent]
+    ):
+        """Test released agents are reused for the same type and config."""
+        async with pool.agent("planning", {"max_planning_depth": 3}) as first:
+            pass
+        async with pool.agent("planning", {"max_planning_depth": 3}) as second:
+            pass
+        async with pool.agent("planning", {"max_planning_depth": 4}) as other:
+            pass
+
+        assert first is second
+        assert other is not first
+        assert other.max_depth == 4
+        assert len(created) == 2
+        assert pool.get_stats()["hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_release_resets_request_state(self, pool: AgentPool):
+        """Test per-request state is cleared before an agent is reused."""
+        async with pool.agent("planning") as agent:
+            result = await agent.safe_execute(
+                AgentTask(objective="Build an API", type="create_plan")
+            )
+            assert result.success
+            assert len(agent.get_execution_history()) == 1
+
+        assert agent.get_execution_history() == []
+
+    @pytest.mark.asyncio
+    async def test_callers_wait_when_pool_exhausted(
+        self, pool: AgentPool, created: List[PlanningAgent]
+    ):
+        """Test callers beyond the instance limit wait for a release."""
+        first = await pool.acquire("planning")
+        second = await pool.acquire("planning")
+        assert first is not second
+
+        waiting = asyncio.create_task(pool.acquire("planning"))
+        await asyncio.sleep(0)
+        assert not waiting.done()
+
+        await pool.release(second)
+        assert await waiting is second
+        assert len(created) == 2
+
+        await pool.release(first)
+        await pool.release(second)
+
+    @pytest.mark.asyncio
+    async def test_idle_agents_evicted(
+        self, pool: AgentPool, created: List[PlanningAgent]
+    ):
+        """Test agents idle past the timeout are dropped and replaced."""
+        pool.idle_timeout = 0
+        async with pool.agent("planning") as first:
+            pass
+
+        async with pool.agent("planning") as second:
+            pass
+
+        assert second is not first
+        assert pool.get_stats()["evictions"] == 1
+        assert len(created) == 2
@@ -0,0 +1,49 @@
+"""Tests for forwarding engine events to WebSocket subscribers."""
+
+from typing import Any, Dict, List
+
+import pytest
+
+from agentic_workflow.api.websocket_execution import (
+    ConnectionManager,
+    ExecutionUpdateHandler,
+)
+
+
+class FakeWebSocket:
+    """WebSocket stand-in recording sent messages."""
+
+    def __init__(self) -> None:
+        self.sent: List[Dict[str, Any]] = []
+
+    async def send_json(self, message: Dict[str, Any]) -> None:
+        self.sent.append(message)
+
+
+@pytest.mark.asyncio
+async def test_step_output_forwarded_to_workflow_subscribers():
+    """Test streamed chunks reach clients watching the workflow."""
+    connections = ConnectionManager()
+    websocket = FakeWebSocket()
+    connections.active_connections["wf_1"] = {websocket}  # type: ignore[arg-type]
+    handler = ExecutionUpdateHandler(connections)
+
+    await handler.handle_event(
+        "step_output",
+        {
+            "step_id": "generate",
+            "execution_id": "exec_1",
+            "workflow_id": "wf_1",
+            "index": 0,
+            "chunk": "Hello",
+        },
+    )
+    await handler.handle_event(
+        "step_output", {"execution_id": "exec_2", "workflow_id": "wf_2"}
+    )
+
+    assert len(websocket.sent) == 1
+    update = websocket.sent[0]
+    assert update["type"] == "step_output"
+    assert update["execution_id"] == "exec_1"
+    assert update["data"] == {"step_id": "generate", "index": 0, "chunk": "Hello"}
@@ -8,13 +8,21 @@ from agentic_workflow.core.tenant import get_tenant_service, TierType
 from agentic_workflow.core.file_attachment import get_file_service
 from agentic_workflow.api.workflow_orchestration import (
     WorkflowExecutionRequest,
+    _executions,
     execute_workflow,
     execute_workflow_json,
+    get_job_queue,
     get_workflow_status,
     list_executions,
 )
 
 
+async def _finished(execution_id):
+    """Wait for queued executions to run and return the execution record."""
+    await get_job_queue().join()
+    return _executions[execution_id]
+
+
 @pytest.mark.asyncio
 class TestWorkflowOrchestration:
     """Tests for workflow orchestration endpoints."""
@@ -39,6 +47,9 @@ class TestWorkflowOrchestration:
         )
 
         assert result["tenant_id"] == tenant.id
+        assert result["status"] == "queued"
+
+        result = await _finished(result["execution_id"])
         assert result["status"] in ["completed", "failed"]
         assert result["prompt_info"]["total_chunks"] >= 1
         assert result["files_processed"] == 0
@@ -143,6 +154,7 @@ class TestWorkflowOrchestration:
             preferences=prefs_json,
             agent_type="planning",
         )
+        result = await _finished(result["execution_id"])
 
         # Should have both tenant and request preferences
         assert len(result["preferences_applied"]) >= 2
@@ -195,6 +207,7 @@ class TestWorkflowOrchestration:
         result = await execute_workflow_json(request)
 
         assert result["tenant_id"] == tenant.id
+        result = await _finished(result["execution_id"])
         assert result["status"] in ["completed", "failed"]
         assert result["preferences_applied"]["output_format"] == "detailed"
 
@@ -381,6 +394,7 @@ class TestWorkflowOrchestration:
             preferences=None,
             agent_type="planning",
         )
+        result = await _finished(result["execution_id"])
 
         # Should be chunked
         assert result["prompt_info"]["total_chunks"] > 1
@@ -396,16 +410,177 @@ class TestWorkflowOrchestration:
         )
 
         # Execute workflow
-        await execute_workflow(
+        result = await execute_workflow(
             tenant_id=tenant.id,
             prompt="Test prompt for usage tracking",
             files=None,
             preferences=None,
             agent_type="planning",
         )
+        await _finished(result["execution_id"])
 
         # Check usage
         usage = await tenant_service.get_usage(tenant.id)
         assert usage is not None
         assert usage.requests_count >= 1
         assert usage.tokens_used > 0
+
+    async def test_status_polled_until_complete(self):
+        """Test queued executions report status until they finish."""
+        from agentic_workflow.core.tenant import get_tenant_service
+        tenant_service = get_tenant_service()
+        tenant = await tenant_service.create_tenant(
+            name=f"Test Corp {id(self)}",
+            tier=TierType.STANDARD,
+        )
+
+        result = await execute_workflow(
+            tenant_id=tenant.id,
+            prompt="Test",
+            files=None,
+            preferences=None,
+            agent_type="planning",
+        )
+        queued = await get_workflow_status(result["execution_id"])
+        assert queued["status"] == "queued"
+        assert queued["progress"] == 0.0
+
+        await _finished(result["execution_id"])
+        done = await get_workflow_status(result["execution_id"])
+        assert done["status"] in ["completed", "failed"]
+        assert done["results"]
+
+    async def test_queue_full_returns_429(self, monkeypatch):
+        """Test executions are rejected when the job queue is full."""
+        import asyncio
+
+        from fastapi import HTTPException
+
+        from agentic_workflow.api import workflow_orchestration
+        from agentic_workflow.core.job_queue import JobQueue
+        from agentic_workflow.core.tenant import get_tenant_service
+
+        tenant_service = get_tenant_service()
+        tenant = await tenant_service.create_tenant(
+            name=f"Test Corp {id(self)}",
+            tier=TierType.STANDARD,
+        )
+        queue = JobQueue(max_size=1, concurrency=1)
+        monkeypatch.setattr(workflow_orchestration, "_job_queue", queue)
+
+        # Occupy the only worker and the only queue slot
+        release = asyncio.Event()
+        queue.submit("running", release.wait)
+        await asyncio.sleep(0)
+        queue.submit("pending", release.wait)
+
+        with pytest.raises(HTTPException) as exc_info:
+            await execute_workflow(
+                tenant_id=tenant.id,
+                prompt="Test",
+                files=None,
+                preferences=None,
+                agent_type="planning",
+            )
+
+        assert exc_info.value.status_code == 429
+        assert exc_info.value.headers["Retry-After"]
+        assert queue.get_stats()["rejected"] == 1
+        release.set()
+        await queue.join()
+
+    async def test_queued_executions_count_against_quota(self, monkeypatch):
+        """Test executions still queued are charged against the quota."""
+        import asyncio
+
+        from fastapi import HTTPException
+
+        from agentic_workflow.api import workflow_orchestration
+        from agentic_workflow.core.job_queue import JobQueue
+        from agentic_workflow.core.tenant import get_tenant_service
+
+        tenant_service = get_tenant_service()
+        tenant = await tenant_service.create_tenant(
+            name=f"Test Corp {id(self)}",
+            tier=TierType.FREE,  # 50 requests/day limit
+        )
+        await tenant_service.track_usage(tenant.id, requests=49)
+        queue = JobQueue(concurrency=1)
+        monkeypatch.setattr(workflow_orchestration, "_job_queue", queue)
+
+        # Keep the worker busy so the execution stays queued
+        release = asyncio.Event()
+        queue.submit("running", release.wait)
+        await asyncio.sleep(0)
+
+        result = await execute_workflow(
+            tenant_id=tenant.id,
+            prompt="Test",
+            files=None,
+            preferences=None,
+            agent_type="planning",
+        )
+        assert result["status"] == "queued"
+
+        with pytest.raises(HTTPException) as exc_info:
+            await execute_workflow(
+                tenant_id=tenant.id,
+                prompt="Test",
+                files=None,
+                preferences=None,
+                agent_type="planning",
+            )
+        assert exc_info.value.status_code == 429
+
+        release.set()
+        await queue.join()
+        usage = await tenant_service.get_usage(tenant.id)
+        assert usage.requests_count == 50
+
+    async def test_stop_job_queue_cancels_unfinished_executions(self, monkeypatch):
+        """Test stopping the queue closes out running and queued executions."""
+        import asyncio
+        from contextlib import asynccontextmanager
+
+        from agentic_workflow.api import workflow_orchestration
+        from agentic_workflow.core.job_queue import JobQueue
+        from agentic_workflow.core.tenant import get_tenant_service
+
+        class BlockingPool:
+            @asynccontextmanager
+            async def agent(self, agent_type):
+                await asyncio.Event().wait()
+                yield
+
+        tenant_service = get_tenant_service()
+        tenant = await tenant_service.create_tenant(
+            name=f"Test Corp {id(self)}",
+            tier=TierType.STANDARD,
+        )
+        monkeypatch.setattr(
+            workflow_orchestration, "_job_queue", JobQueue(concurrency=1)
+        )
+        monkeypatch.setattr(workflow_orchestration, "get_agent_pool", BlockingPool)
+
+        running, queued = [
+            await execute_workflow(
+                tenant_id=tenant.id,
+                prompt="Test",
+                files=None,
+                preferences=None,
+                agent_type="planning",
+            )
+            for _ in range(2)
+        ]
+        await asyncio.sleep(0.01)
+        assert running["status"] == "running"
+
+        await workflow_orchestration.stop_job_queue()
+
+        for record in (running, queued):
+            assert record["status"] == "cancelled"
+            assert record["error"]
+            assert record["completed_at"] is not None
+        # Only the execution that started keeps its reserved request
+        usage = await tenant_service.get_usage(tenant.id)
+        assert usage.requests_count == 1
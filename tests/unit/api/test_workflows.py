@@ -72,3 +72,39 @@ class TestWorkflowAPI:
         assert response.status_code == 200
         workflows = response.json()
         assert isinstance(workflows, list)
+
+    def test_execute_reuses_converted_definition(self, monkeypatch):
+        """Test repeated executions convert the visual graph only once."""
+        workflow_data = {
+            "id": "wf_exec",
+            "name": "Exec Workflow",
+            "nodes": [
+                {
+                    "id": f"node_{i}",
+                    "position": {"x": 0, "y": i * 100},
+                    "data": {"agent_type": "planning", "label": f"Step {i}"},
+                }
+                for i in range(2)
+            ],
+            "edges": [{"id": "edge_0", "source": "node_0", "target": "node_1"}],
+        }
+        created = client.post("/api/v1/workflows/visual/create", json=workflow_data)
+        workflow_id = created.json()["workflow_id"]
+
+        conversions = []
+        original = WorkflowConverter.visual_to_workflow
+        monkeypatch.setattr(
+            WorkflowConverter,
+            "visual_to_workflow",
+            staticmethod(lambda visual: conversions.append(visual) or original(visual)),
+        )
+
+        for _ in range(3):
+            response = client.post(
+                f"/api/v1/workflows/{workflow_id}/execute", json={"parameters": {}}
+            )
+            assert response.status_code == 200
+            assert response.json()["status"] == "completed"
+            assert response.json()["result"]["steps_completed"] == 2
+
+        assert conversions == []
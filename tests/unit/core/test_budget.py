@@ -0,0 +1,206 @@
+"""Tests for resource budgets and adaptive step timeouts."""
+
+import asyncio
+from typing import Any, Dict
+
+import pytest
+
+from agentic_workflow.core.budget import LatencyTracker, add_usage
+from agentic_workflow.core.engine import WorkflowEngine
+from agentic_workflow.core.interfaces import (
+    Component,
+    ResourceBudget,
+    ServiceResponse,
+    WorkflowDefinition,
+    WorkflowStep,
+)
+
+
+def _step(step_id: str, **kwargs: Any) -> WorkflowStep:
+    return WorkflowStep(
+        id=step_id, name=step_id, component="metered", action="run", **kwargs
+    )
+
+
+class MeteredComponent(Component):
+    """Component that sleeps and reports the usage given in its parameters."""
+
+    def __init__(self) -> None:
+        super().__init__("metered", {})
+
+    async def initialize(self) -> None:
+        pass
+
+    async def start(self) -> None:
+        pass
+
+    async def stop(self) -> None:
+        pass
+
+    async def health_check(self) -> ServiceResponse:
+        return ServiceResponse(success=True)
+
+    async def process_request(self, request: Dict[str, Any]) -> ServiceResponse:
+        parameters = request["parameters"]
+        await asyncio.sleep(parameters.get("sleep", 0))
+        return ServiceResponse(
+            success=True,
+            data={"step": request["step_id"]},
+            metadata={"usage": parameters.get("usage", {})},
+        )
+
+
+class TestLatencyTracker:
+    """Test percentile and adaptive timeout derivation."""
+
+    def test_p95_drives_timeout_once_warm(self):
+        """Test the timeout is p95 times the multiplier after min_samples."""
+        tracker = LatencyTracker(min_samples=20, multiplier=2.0, floor=0.5)
+        for i in range(1, 20):
+            tracker.record("llm", "generate", float(i))
+        assert tracker.timeout_for("llm", "generate") is None
+
+        tracker.record("llm", "generate", 20.0)
+
+        assert tracker.percentile("llm", "generate") == 19.0
+        assert tracker.timeout_for("llm", "generate") == 38.0
+        assert tracker.timeout_for("llm", "other") is None
+
+    def test_timeout_clamped(self):
+        """Test adaptive timeouts stay between the floor and the ceiling."""
+        tracker = LatencyTracker(min_samples=1, floor=1.0, ceiling=10.0)
+        tracker.record("fast", "run", 0.01)
+        tracker.record("slow", "run", 60.0)
+
+        assert tracker.timeout_for("fast", "run") == 1.0
+        assert tracker.timeout_for("slow", "run") == 10.0
+
+    def test_timeouts_loosen_the_timeout(self):
+        """Test timed-out steps count as censored samples at their timeout."""
+        tracker = LatencyTracker(min_samples=20, multiplier=3.0, floor=0.1)
+        for _ in range(20):
+            tracker.record("llm", "generate", 0.1)
+        timeout = tracker.timeout_for("llm", "generate")
+        assert timeout == pytest.approx(0.3)
+
+        tracker.record_timeout("llm", "generate", timeout)
+        tracker.record_timeout("llm", "generate", timeout)
+
+        assert tracker.timeout_for("llm", "generate") == pytest.approx(0.9)
+
+    def test_usage_rollup(self):
+        """Test totals are summed while memory is tracked as a peak."""
+        total: Dict[str, float] = {}
+        add_usage(total, {"tokens": 10, "memory_bytes": 500})
+        add_usage(total, {"tokens": 5, "memory_bytes": 200})
+
+        assert total == {"tokens": 15, "memory_bytes": 500}
+
+
+class TestEngineBudgets:
+    """Test budget enforcement in workflow execution."""
+
+    @pytest.fixture
+    def engine(self) -> WorkflowEngine:
+        engine = WorkflowEngine()
+        engine.register_component(MeteredComponent())
+        return engine
+
+    @pytest.mark.asyncio
+    async def test_usage_rolled_up_per_execution(self, engine: WorkflowEngine):
+        """Test reported usage is kept per step and totalled per execution."""
+        workflow = WorkflowDefinition(
+            id="usage",
+            name="Usage",
+            description="Two metered steps",
+            steps=[
+                _step("a", parameters={"usage": {"tokens": 100, "tool_calls": 1}}),
+                _step("b", parameters={"usage": {"tokens": 50}}),
+            ],
+        )
+
+        execution = await engine.execute_workflow(workflow)
+
+        assert execution.status == "completed"
+        assert execution.step_usage["a"]["tokens"] == 100
+        assert execution.resource_usage["tokens"] == 150
+        assert execution.resource_usage["tool_calls"] == 1
+        assert execution.resource_usage["wall_time"] >= 0
+
+    @pytest.mark.asyncio
+    async def test_step_budget_exceeded_fails_step(self, engine: WorkflowEngine):
+        """Test a step using more tokens than budgeted fails."""
+        workflow = WorkflowDefinition(
+            id="step-budget",
+            name="Step budget",
+            description="Step over its token budget",
+            steps=[
+                _step(
+                    "a",
+                    parameters={"usage": {"tokens": 200}},
+                    budget=ResourceBudget(tokens=100),
+                ),
+                _step("b", dependencies=["a"]),
+            ],
+        )
+
+        execution = await engine.execute_workflow(workflow)
+
+        assert execution.status == "failed"
+        assert "tokens budget" in (execution.error or "")
+        assert execution.failed_steps == ["a"]
+        assert execution.cancelled_steps == ["b"]
+
+    @pytest.mark.asyncio
+    async def test_workflow_budget_cancels_remaining_steps(
+        self, engine: WorkflowEngine
+    ):
+        """Test an exhausted execution budget stops the whole workflow."""
+        workflow = WorkflowDefinition(
+            id="workflow-budget",
+            name="Workflow budget",
+            description="Runs past its wall time",
+            budget=ResourceBudget(wall_time=0.05),
+            steps=[
+                _step("quick"),
+                _step("slow", parameters={"sleep": 5}),
+                _step("after", dependencies=["quick", "slow"]),
+            ],
+        )
+
+        execution = await engine.execute_workflow(workflow)
+
+        assert execution.status == "failed"
+        assert "wall_time budget" in (execution.error or "")
+        assert execution.completed_steps == ["quick"]
+        assert sorted(execution.cancelled_steps) == ["after", "slow"]
+
+    @pytest.mark.asyncio
+    async def test_adaptive_timeout_applied(self, engine: WorkflowEngine):
+        """Test learned latencies replace the default timeout."""
+        assert engine._step_timeout(_step("a")) == engine.config.default_timeout
+
+        engine.config.adaptive_timeouts = True
+        engine.latency.min_samples = 1
+        engine.latency.floor = 0.05
+        engine.latency.record("metered", "run", 0.01)
+
+        assert engine._step_timeout(_step("a")) == pytest.approx(0.05)
+        assert engine._step_timeout(_step("a", timeout=7)) == 7
+        assert (
+            engine._step_timeout(_step("a", budget=ResourceBudget(wall_time=0.01)))
+            == 0.01
+        )
+
+        workflow = WorkflowDefinition(
+            id="adaptive",
+            name="Adaptive",
+            description="Step slower than its learned timeout",
+            steps=[_step("a", parameters={"sleep": 1})],
+        )
+        execution = await engine.execute_workflow(workflow)
+
+        assert execution.status == "failed"
+        assert execution.error == "Step timeout: a"
+        # The timeout is kept as a censored sample, loosening the timeout
+        assert engine.latency.percentile("metered", "run") == pytest.approx(0.05)
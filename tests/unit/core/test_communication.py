@@ -1,7 +1,9 @@
 """Tests for communication system in agentic workflow."""
 
+import asyncio
 from datetime import UTC, datetime, timedelta
-from unittest.mock import Mock
+from typing import Any, Dict, List, Optional, Tuple
+from unittest.mock import AsyncMock, Mock
 
 import pytest
 
@@ -11,7 +13,10 @@ from agentic_workflow.core.communication import (
     InMemoryChannel,
     InsightMessage,
     Message,
+    MessageRouter,
     NotificationMessage,
+    RedisStreamChannel,
+    compile_topic_pattern,
     create_communication_manager,
     setup_agent_communication,
 )
@@ -215,6 +220,289 @@ class TestInMemoryChannel:
         assert channel.messages["agent1"][0].content["number"] == 2  # oldest kept
         assert channel.messages["agent1"][-1].content["number"] == 4  # newest
 
+    @pytest.mark.asyncio
+    async def test_broadcast_delivered_once_per_agent(self):
+        """Test each agent reads each broadcast once through its cursor."""
+        channel = InMemoryChannel(max_broadcast_messages=2)
+
+        for i in range(2):
+            await channel.broadcast_message(
+                Message(sender_id="system", message_type="test", content={"n": i})
+            )
+        first = await channel.receive_messages("agent1")
+        assert [msg.content["n"] for msg in first] == [0, 1]
+        assert await channel.receive_messages("agent1") == []
+
+        # agent1 falls behind the ring buffer and misses broadcast 2
+        for i in range(2, 5):
+            await channel.broadcast_message(
+                Message(sender_id="system", message_type="test", content={"n": i})
+            )
+        behind = await channel.receive_messages("agent1")
+        assert [msg.content["n"] for msg in behind] == [3, 4]
+        assert channel.get_stats()["missed_broadcasts"] == 1
+
+        # New agents start at the oldest retained broadcast
+        newcomer = await channel.receive_messages("agent2")
+        assert [msg.content["n"] for msg in newcomer] == [3, 4]
+
+    @pytest.mark.asyncio
+    async def test_expired_broadcast_skipped(self):
+        """Test broadcasts are filtered by their indexed expiry time."""
+        channel = InMemoryChannel()
+        past_time = (datetime.now(UTC) - timedelta(seconds=1)).isoformat()
+
+        await channel.broadcast_message(
+            Message(
+                sender_id="system",
+                message_type="expired",
+                content={},
+                expires_at=past_time,
+            )
+        )
+        await channel.broadcast_message(
+            Message(sender_id="system", message_type="valid", content={})
+        )
+
+        messages = await channel.receive_messages("agent1")
+        assert [msg.message_type for msg in messages] == ["valid"]
+
+    @pytest.mark.asyncio
+    async def test_drop_newest_overflow(self):
+        """Test a full mailbox rejects new messages under drop_newest."""
+        channel = InMemoryChannel(max_messages_per_agent=1, overflow="drop_newest")
+
+        for i in range(2):
+            success = await channel.send_message(
+                Message(
+                    sender_id="sender",
+                    recipient_id="agent1",
+                    message_type="test",
+                    content={"number": i},
+                )
+            )
+            assert success is (i == 0)
+
+        messages = await channel.receive_messages("agent1")
+        assert [msg.content["number"] for msg in messages] == [0]
+        assert channel.get_stats()["dropped_messages"] == 1
+
+    @pytest.mark.asyncio
+    async def test_block_overflow_waits_for_receive(self):
+        """Test senders wait for room under the block policy."""
+        channel = InMemoryChannel(max_messages_per_agent=1, overflow="block")
+
+        def message(number: int) -> Message:
+            return Message(
+                sender_id="sender",
+                recipient_id="agent1",
+                message_type="test",
+                content={"number": number},
+            )
+
+        await channel.send_message(message(0))
+        sending = asyncio.create_task(channel.send_message(message(1)))
+        await asyncio.sleep(0)
+        assert not sending.done()
+
+        assert len(await channel.receive_messages("agent1")) == 1
+        assert await sending
+        assert channel.messages["agent1"][0].content["number"] == 1
+
+        channel.send_timeout = 0.01
+        assert not await channel.send_message(message(2))
+
+
+class FakeRedisStreams:
+    """In-process stand-in for the async Redis stream commands used."""
+
+    def __init__(self) -> None:
+        self.streams: Dict[str, List[Tuple[int, Dict[str, str]]]] = {}
+        # (stream, group) -> last delivered sequence and pending entries
+        self.groups: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        self.sequence = 0
+
+    async def xadd(
+        self,
+        name: str,
+        fields: Dict[str, str],
+        maxlen: Optional[int] = None,
+        approximate: bool = True,
+    ) -> str:
+        self.sequence += 1
+        entries = self.streams.setdefault(name, [])
+        entries.append((self.sequence, dict(fields)))
+        if maxlen is not None:
+            del entries[: max(0, len(entries) - maxlen)]
+        return f"{self.sequence}-0"
+
+    async def xgroup_create(
+        self, name: str, groupname: str, id: str = "$", mkstream: bool = False
+    ) -> bool:
+        if (name, groupname) in self.groups:
+            raise Exception("BUSYGROUP Consumer Group name already exists")
+        self.streams.setdefault(name, [])
+        self.groups[(name, groupname)] = {"last": 0, "pending": {}}
+        return True
+
+    async def xreadgroup(
+        self,
+        groupname: str,
+        consumername: str,
+        streams: Dict[str, str],
+        count: Optional[int] = None,
+        block: Optional[int] = None,
+    ) -> List[Any]:
+        response = []
+        for name in streams:
+            group = self.groups[(name, groupname)]
+            entries = [
+                (sequence, fields)
+                for sequence, fields in self.streams[name]
+                if sequence > group["last"]
+            ][:count]
+            if entries:
+                group["last"] = entries[-1][0]
+                for sequence, _ in entries:
+                    group["pending"][f"{sequence}-0"] = consumername
+                response.append(
+                    [name, [(f"{seq}-0", fields) for seq, fields in entries]]
+                )
+        return response
+
+    async def xautoclaim(
+        self,
+        name: str,
+        groupname: str,
+        consumername: str,
+        min_idle_time: int,
+        start_id: str = "0-0",
+        count: Optional[int] = None,
+    ) -> List[Any]:
+        # Entries count as idle only when claiming without a minimum
+        if min_idle_time > 0:
+            return ["0-0", [], []]
+        pending = self.groups[(name, groupname)]["pending"]
+        stored = {f"{seq}-0": fields for seq, fields in self.streams[name]}
+        claimed = []
+        for entry_id in list(pending)[:count]:
+            pending[entry_id] = consumername
+            claimed.append((entry_id, stored.get(entry_id)))
+        return ["0-0", claimed, []]
+
+    async def xack(self, name: str, groupname: str, *ids: str) -> int:
+        pending = self.groups[(name, groupname)]["pending"]
+        return sum(pending.pop(entry_id, None) is not None for entry_id in ids)
+
+
+class TestRedisStreamChannel:
+    """Test the Redis Streams channel against an in-process stand-in."""
+
+    @pytest.mark.asyncio
+    async def test_send_broadcast_and_receive(self):
+        """Test direct and broadcast messages round-trip with their types."""
+        channel = RedisStreamChannel(FakeRedisStreams())
+
+        await channel.send_message(
+            Message(
+                sender_id="agent1",
+                recipient_id="agent2",
+                message_type="test",
+                content={"data": "test"},
+            )
+        )
+        await channel.broadcast_message(
+            InsightMessage(
+                sender_id="agent1",
+                content={"insight": "pattern"},
+                insight_type="reasoning",
+                confidence=0.7,
+            )
+        )
+
+        messages = await channel.receive_messages("agent2")
+        assert [msg.message_type for msg in messages] == ["test", "insight"]
+        assert isinstance(messages[1], InsightMessage)
+        assert messages[1].confidence == 0.7
+        assert await channel.receive_messages("agent2") == []
+
+        # Other agents still get the broadcast once
+        assert len(await channel.receive_messages("agent3")) == 1
+
+    @pytest.mark.asyncio
+    async def test_role_consumer_groups_share_messages(self):
+        """Test agents of one role split the role's messages between them."""
+        channel = RedisStreamChannel(
+            FakeRedisStreams(), role_for=lambda agent_id: agent_id.split("-")[0]
+        )
+
+        await channel.send_message(
+            Message(
+                sender_id="planner",
+                recipient_id="coder",
+                message_type="task",
+                content={},
+            )
+        )
+        await channel.broadcast_message(
+            Message(sender_id="planner", message_type="status", content={})
+        )
+
+        first = await channel.receive_messages("coder-1")
+        second = await channel.receive_messages("coder-2")
+        reviewer = await channel.receive_messages("reviewer-1")
+
+        assert [msg.message_type for msg in first] == ["task", "status"]
+        assert second == []
+        assert [msg.message_type for msg in reviewer] == ["status"]
+
+    @pytest.mark.asyncio
+    async def test_unacked_messages_reclaimed(self):
+        """Test messages a consumer never acknowledged go to another one."""
+        channel = RedisStreamChannel(
+            FakeRedisStreams(),
+            role_for=lambda agent_id: "worker",
+            auto_ack=False,
+            claim_idle=0,
+        )
+        await channel.send_message(
+            Message(
+                sender_id="planner",
+                recipient_id="worker",
+                message_type="task",
+                content={"n": 1},
+            )
+        )
+
+        # worker-1 crashes before acknowledging
+        assert len(await channel.receive_messages("worker-1")) == 1
+
+        reclaimed = await channel.receive_messages("worker-2")
+        assert [msg.content for msg in reclaimed] == [{"n": 1}]
+        assert await channel.ack_messages(reclaimed) == 1
+        assert await channel.receive_messages("worker-3") == []
+
+    @pytest.mark.asyncio
+    async def test_streams_trimmed_and_expired_skipped(self):
+        """Test streams keep max_len entries and expired messages are dropped."""
+        client = FakeRedisStreams()
+        channel = RedisStreamChannel(client, max_len=2)
+        past_time = (datetime.now(UTC) - timedelta(seconds=1)).isoformat()
+
+        for i in range(3):
+            await channel.broadcast_message(
+                Message(
+                    sender_id="system",
+                    message_type="test",
+                    content={"n": i},
+                    expires_at=past_time if i == 2 else None,
+                )
+            )
+
+        assert len(client.streams["agentic_comm:broadcast"]) == 2
+        messages = await channel.receive_messages("agent1")
+        assert [msg.content["n"] for msg in messages] == [1]
+
 
 class TestCommunicationManager:
     """Test CommunicationManager functionality."""
@@ -375,26 +663,149 @@ class TestCommunicationManager:
             "notification",
         }
 
-    def test_get_message_history_without_memory(self):
+    @pytest.mark.asyncio
+    async def test_get_message_history_without_memory(self):
         """Test getting message history without memory manager."""
         manager = CommunicationManager()
 
-        history = manager.get_message_history("agent1")
-        assert history == []
+        history = await manager.get_message_history("agent1")
+        assert history.messages == []
+        assert history.next_cursor is None
 
-    def test_get_message_history_with_memory(self):
-        """Test getting message history with memory manager."""
+    @pytest.mark.asyncio
+    async def test_get_message_history_with_memory(self):
+        """Test sent messages are persisted in batches and listed."""
         mock_memory = Mock()
-        mock_memory.search.return_value = [
-            {"sender_id": "agent1", "content": {"data": "test1"}},
-            {"sender_id": "agent2", "content": {"data": "test2"}},
-        ]
+        mock_memory.store_many = AsyncMock(
+            side_effect=lambda items: [item["entry_id"] for item in items]
+        )
 
         manager = CommunicationManager(mock_memory)
+        await manager.send_message(
+            Message(
+                sender_id="agent1",
+                recipient_id="agent2",
+                message_type="test",
+                content={"data": "test1"},
+            )
+        )
+        mock_memory.store_many.assert_not_called()
+
+        history = await manager.get_message_history("agent1")
+        assert [msg["content"] for msg in history.messages] == [{"data": "test1"}]
+
+        await manager.close()
+        mock_memory.store_many.assert_called_once()
+
+
+class TestMessageRouting:
+    """Test send-time routing by message type and topic."""
+
+    def test_topic_patterns(self):
+        """Test single-segment and trailing wildcards."""
+        single = compile_topic_pattern("tasks.*.review")
+        trailing = compile_topic_pattern("tasks.#")
+
+        assert single.fullmatch("tasks.code.review")
+        assert not single.fullmatch("tasks.code.deep.review")
+        assert trailing.fullmatch("tasks")
+        assert trailing.fullmatch("tasks.code.review")
+        assert not trailing.fullmatch("tasksx.code")
+        assert compile_topic_pattern("#").fullmatch("anything.at.all")
+
+    def test_router_routes_by_type_and_topic(self):
+        """Test only agents with a matching route are selected."""
+        router = MessageRouter()
+        router.add_routes("reviewer", ["coordination"], ["tasks.*.review"])
+        router.add_routes("monitor", ["coordination"])
+        router.add_routes("learner", ["insight"])
+
+        message = Message(
+            sender_id="planner",
+            message_type="coordination",
+            content={},
+            topic="tasks.code.review",
+        )
+        assert router.route(message) == {"reviewer", "monitor"}
+        assert router.route(message.model_copy(update={"topic": None})) == {"monitor"}
+
+        router.remove_agent("monitor")
+        assert router.route(message) == {"reviewer"}
+        assert router.get_stats()["routes"] == {"coordination": 1, "insight": 1}
+
+    @pytest.mark.asyncio
+    async def test_broadcast_fanned_out_to_matching_mailboxes(self):
+        """Test broadcasts only land in the mailboxes of matching agents."""
+        manager = CommunicationManager()
+        manager.subscribe_agent("reviewer", ["coordination"], ["tasks.*.review"])
+        manager.subscribe_agent("learner", ["insight"])
+
+        await manager.broadcast_message(
+            CoordinationMessage(
+                sender_id="planner",
+                content={},
+                action_type="request",
+                topic="tasks.code.review",
+            )
+        )
+
+        channel = manager.channels["default"]
+        assert list(channel.messages) == ["reviewer"]
+        assert len(await manager.receive_messages("reviewer")) == 1
+        assert await manager.receive_messages("reviewer") == []
+        assert await manager.receive_messages("learner") == []
+
+        # Agents without subscriptions still get every broadcast
+        assert len(await manager.receive_messages("observer")) == 1
+        stats = manager.get_communication_stats()["routing"]
+        assert stats["deliveries"] == 1
+
+    @pytest.mark.asyncio
+    async def test_unrouted_direct_message_dropped_at_send(self):
+        """Test direct messages matching none of the recipient's routes."""
+        manager = CommunicationManager()
+        manager.subscribe_agent("learner", ["insight"])
+
+        assert not await manager.send_message(
+            Message(
+                sender_id="planner",
+                recipient_id="learner",
+                message_type="coordination",
+                content={},
+            )
+        )
+
+        assert manager.channels["default"].messages == {}
+        assert manager.router.get_stats()["filtered_messages"] == 1
+
+    @pytest.mark.asyncio
+    async def test_shared_channel_routes_broadcasts_on_receive(self):
+        """Test broadcasts from another process reach subscribed agents."""
+        client = FakeRedisStreams()
+        sender = CommunicationManager()
+        sender.add_channel("redis", RedisStreamChannel(client))
+        receiver = CommunicationManager()
+        receiver.add_channel("redis", RedisStreamChannel(client))
+        receiver.subscribe_agent("learner", ["insight"])
+
+        await sender.broadcast_message(
+            InsightMessage(
+                sender_id="planner",
+                content={},
+                insight_type="reasoning",
+                confidence=0.9,
+            ),
+            "redis",
+        )
+        await sender.broadcast_message(
+            CoordinationMessage(sender_id="planner", content={}, action_type="request"),
+            "redis",
+        )
 
-        history = manager.get_message_history("agent1")
-        assert len(history) == 2
-        mock_memory.search.assert_called_once()
+        messages = await receiver.receive_messages("learner", "redis")
+        assert [msg.message_type for msg in messages] == ["insight"]
+        # Nothing was copied into per-agent inboxes at send time
+        assert await receiver.receive_messages("learner", "redis") == []
 
 
 class TestCommunicationUtilities:
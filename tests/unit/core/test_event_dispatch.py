@@ -0,0 +1,151 @@
+"""Tests for background event dispatch."""
+
+import asyncio
+from typing import Any, Dict, List, Tuple
+
+import pytest
+
+from agentic_workflow.core.engine import WorkflowEngine
+from agentic_workflow.core.event_dispatch import EventDispatcher, OverflowPolicy
+from agentic_workflow.core.interfaces import (
+    Component,
+    EventHandler,
+    ServiceResponse,
+    WorkflowDefinition,
+    WorkflowStep,
+)
+
+
+class RecordingHandler(EventHandler):
+    """Handler that records events, optionally slowly or by failing."""
+
+    def __init__(self, delay: float = 0.0, fail: bool = False) -> None:
+        self.events: List[Tuple[str, Dict[str, Any]]] = []
+        self.delay = delay
+        self.fail = fail
+        self.release = asyncio.Event()
+        self.release.set()
+
+    async def handle_event(self, event_type: str, event_data: Dict[str, Any]) -> None:
+        await self.release.wait()
+        await asyncio.sleep(self.delay)
+        if self.fail:
+            raise RuntimeError("handler failed")
+        self.events.append((event_type, event_data))
+
+
+class TestEventDispatcher:
+    """Test queueing, isolation and overflow policies."""
+
+    @pytest.mark.asyncio
+    async def test_failures_and_timeouts_are_isolated(self):
+        """Test a failing or hanging handler does not affect the others."""
+        dispatcher = EventDispatcher(timeout=0.05)
+        good = RecordingHandler()
+        failing = RecordingHandler(fail=True)
+        hanging = RecordingHandler(delay=10)
+        for handler in (good, failing, hanging):
+            dispatcher.register(handler)
+
+        for i in range(3):
+            await dispatcher.dispatch("tick", {"i": i})
+        await dispatcher.flush()
+
+        assert [data["i"] for _, data in good.events] == [0, 1, 2]
+        stats = dispatcher.get_stats()
+        assert stats["RecordingHandler"]["delivered"] == 3
+        assert stats["RecordingHandler#1"]["failed"] == 3
+        assert stats["RecordingHandler#2"]["timed_out"] == 3
+        await dispatcher.stop()
+
+    @pytest.mark.asyncio
+    async def test_drop_policies(self):
+        """Test full queues drop the oldest or the newest event."""
+        dispatcher = EventDispatcher(queue_size=2)
+        oldest = RecordingHandler()
+        newest = RecordingHandler()
+        dispatcher.register(oldest, overflow=OverflowPolicy.DROP_OLDEST)
+        dispatcher.register(newest, overflow=OverflowPolicy.DROP_NEWEST)
+        oldest.release.clear()
+        newest.release.clear()
+
+        await dispatcher.dispatch("tick", {"i": 0})
+        await asyncio.sleep(0)  # first event is taken by each delivery task
+        for i in range(1, 5):
+            await dispatcher.dispatch("tick", {"i": i})
+        oldest.release.set()
+        newest.release.set()
+        await dispatcher.flush()
+
+        assert [data["i"] for _, data in oldest.events] == [0, 3, 4]
+        assert [data["i"] for _, data in newest.events] == [0, 1, 2]
+        assert all(stats["dropped"] == 2 for stats in dispatcher.get_stats().values())
+        await dispatcher.stop()
+
+    @pytest.mark.asyncio
+    async def test_block_policy_waits_for_room(self):
+        """Test the block policy holds the emitter until the queue drains."""
+        dispatcher = EventDispatcher(queue_size=1, overflow=OverflowPolicy.BLOCK)
+        handler = RecordingHandler()
+        handler.release.clear()
+        dispatcher.register(handler)
+
+        await dispatcher.dispatch("tick", {"i": 0})
+        await asyncio.sleep(0)
+        await dispatcher.dispatch("tick", {"i": 1})
+        blocked = asyncio.create_task(dispatcher.dispatch("tick", {"i": 2}))
+        await asyncio.sleep(0.01)
+        assert not blocked.done()
+
+        handler.release.set()
+        await blocked
+        await dispatcher.flush()
+        assert len(handler.events) == 3
+        await dispatcher.stop()
+
+
+class QuickComponent(Component):
+    """Component that answers immediately."""
+
+    async def initialize(self) -> None:
+        pass
+
+    async def start(self) -> None:
+        pass
+
+    async def stop(self) -> None:
+        pass
+
+    async def health_check(self) -> ServiceResponse:
+        return ServiceResponse(success=True)
+
+    async def process_request(self, request: Dict[str, Any]) -> ServiceResponse:
+        return ServiceResponse(success=True, data={"step": request["step_id"]})
+
+
+@pytest.mark.asyncio
+async def test_steps_do_not_wait_on_slow_handlers():
+    """Test workflow execution finishes before a slow handler catches up."""
+    engine = WorkflowEngine()
+    engine.register_component(QuickComponent("quick", {}))
+    slow = RecordingHandler(delay=0.2)
+    engine.register_event_handler(slow)
+    workflow = WorkflowDefinition(
+        id="wf",
+        name="Workflow",
+        description="Three steps",
+        steps=[
+            WorkflowStep(id=f"s{i}", name=f"s{i}", component="quick", action="run")
+            for i in range(3)
+        ],
+    )
+
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+    result = await engine.execute_workflow(workflow)
+
+    assert result.status == "completed"
+    assert loop.time() - started < 0.2
+    await engine.events.flush()
+    assert [event_type for event_type, _ in slow.events].count("step_completed") == 3
+    await engine.stop()
@@ -0,0 +1,191 @@
+"""Tests for component health gating in agentic workflow."""
+
+import asyncio
+from typing import Any, Dict, List
+
+import pytest
+
+from agentic_workflow.core.config import Config
+from agentic_workflow.core.engine import WorkflowEngine
+from agentic_workflow.core.health import CircuitState, ComponentHealthGate
+from agentic_workflow.core.interfaces import (
+    Component,
+    ServiceResponse,
+    WorkflowDefinition,
+    WorkflowStep,
+)
+
+
+class ProbedComponent(Component):
+    """Component that counts health probes."""
+
+    def __init__(self, name: str = "probed") -> None:
+        super().__init__(name, {})
+        self.healthy = True
+        self.probes = 0
+        self.probe_delay = 0.0
+        self.fail_requests = False
+
+    async def initialize(self) -> None:
+        pass
+
+    async def start(self) -> None:
+        pass
+
+    async def stop(self) -> None:
+        pass
+
+    async def health_check(self) -> ServiceResponse:
+        self.probes += 1
+        await asyncio.sleep(self.probe_delay)
+        return ServiceResponse(success=self.healthy, error=None)
+
+    async def process_request(self, request: Dict[str, Any]) -> ServiceResponse:
+        if self.fail_requests:
+            raise ConnectionError("backend down")
+        return ServiceResponse(success=True, data={"step": request["step_id"]})
+
+
+class TestComponentHealthGate:
+    """Test health caching and circuit breaking."""
+
+    @pytest.mark.asyncio
+    async def test_results_cached_for_ttl(self):
+        """Test repeated checks reuse a fresh probe result."""
+        gate = ComponentHealthGate(ttl=60)
+        component = ProbedComponent()
+
+        results = [await gate.check(component) for _ in range(5)]
+
+        assert results == [(True, None)] * 5
+        assert component.probes == 1
+        assert gate.get_stats()["probed"]["cache_hits"] == 4
+
+    @pytest.mark.asyncio
+    async def test_concurrent_checks_share_one_probe(self):
+        """Test concurrent callers wait on the in-flight probe."""
+        gate = ComponentHealthGate(ttl=0)
+        component = ProbedComponent()
+        component.probe_delay = 0.02
+
+        results = await asyncio.gather(*(gate.check(component) for _ in range(10)))
+
+        assert all(allowed for allowed, _ in results)
+        assert component.probes == 1
+
+    @pytest.mark.asyncio
+    async def test_cancelled_caller_does_not_cancel_shared_probe(self):
+        """Test cancelling the caller that started a probe spares the others."""
+        gate = ComponentHealthGate(ttl=0)
+        component = ProbedComponent()
+        component.probe_delay = 0.02
+
+        first = asyncio.create_task(gate.check(component))
+        await asyncio.sleep(0)
+        second = asyncio.create_task(gate.check(component))
+        await asyncio.sleep(0)
+        first.cancel()
+
+        assert await second == (True, None)
+        assert first.cancelled()
+        assert component.probes == 1
+
+    @pytest.mark.asyncio
+    async def test_circuit_opens_and_short_circuits(self):
+        """Test failures open the circuit and later checks skip probing."""
+        gate = ComponentHealthGate(
+            ttl=0, min_probe_interval=0, failure_threshold=2, recovery_timeout=60
+        )
+        component = ProbedComponent()
+        component.healthy = False
+
+        first = await gate.check(component)
+        second = await gate.check(component)
+        third = await gate.check(component)
+
+        assert first == (False, "Component unhealthy: probed")
+        assert second == (False, "Circuit open for component: probed")
+        assert third == second
+        assert component.probes == 2
+        assert gate.get_state("probed").short_circuits == 1
+
+    @pytest.mark.asyncio
+    async def test_half_open_trial_probe(self):
+        """Test an expired open circuit closes after one healthy probe."""
+        gate = ComponentHealthGate(failure_threshold=1, recovery_timeout=0)
+        component = ProbedComponent()
+        gate.record_failure("probed")
+        assert gate.get_state("probed").circuit == CircuitState.OPEN
+
+        assert await gate.check(component) == (True, None)
+        assert gate.get_state("probed").circuit == CircuitState.CLOSED
+
+        # A failed trial re-opens the circuit immediately
+        gate.record_failure("probed")
+        component.healthy = False
+        assert (await gate.check(component))[0] is False
+        assert gate.get_state("probed").circuit == CircuitState.OPEN
+
+    @pytest.mark.asyncio
+    async def test_background_refresh(self):
+        """Test the refresher probes components without any step running."""
+        gate = ComponentHealthGate(refresh_interval=0.01, min_probe_interval=0)
+        component = ProbedComponent()
+
+        gate.start(lambda: [component])
+        await asyncio.sleep(0.05)
+        await gate.stop()
+
+        assert component.probes >= 2
+        assert gate.get_state("probed").healthy is True
+
+
+class TestEngineHealthGating:
+    """Test health gating in workflow execution."""
+
+    @staticmethod
+    def _workflow(count: int) -> WorkflowDefinition:
+        steps: List[WorkflowStep] = [
+            WorkflowStep(
+                id=f"step-{i}",
+                name=f"Step {i}",
+                component="probed",
+                action="process",
+                dependencies=[f"step-{i - 1}"] if i else [],
+            )
+            for i in range(count)
+        ]
+        return WorkflowDefinition(
+            id="chain", name="Chain", description="Sequential steps", steps=steps
+        )
+
+    @pytest.mark.asyncio
+    async def test_steps_reuse_cached_health(self):
+        """Test a long workflow probes its component once."""
+        engine = WorkflowEngine()
+        component = ProbedComponent()
+        engine.register_component(component)
+
+        result = await engine.execute_workflow(self._workflow(20))
+
+        assert result.status == "completed"
+        assert component.probes == 1
+
+    @pytest.mark.asyncio
+    async def test_request_failures_open_shared_circuit(self):
+        """Test failing requests open the breaker for later workflows."""
+        config = Config()
+        config.monitoring.circuit_failure_threshold = 2
+        engine = WorkflowEngine(config)
+        component = ProbedComponent()
+        component.fail_requests = True
+        engine.register_component(component)
+
+        for _ in range(2):
+            result = await engine.execute_workflow(self._workflow(1))
+            assert "backend down" in result.error
+
+        result = await engine.execute_workflow(self._workflow(1))
+        assert result.status == "failed"
+        assert "circuit open" in result.error.lower()
+        assert component.probes == 1
@@ -0,0 +1,107 @@
+"""Tests for the background job queue."""
+
+import asyncio
+from typing import List
+
+import pytest
+
+from agentic_workflow.core.job_queue import JobQueue, QueueFullError
+
+
+class TestJobQueue:
+    """Test job ordering, concurrency and backpressure."""
+
+    @pytest.mark.asyncio
+    async def test_priority_lanes_run_in_order(self):
+        """Test lower lanes run first and each lane keeps submission order."""
+        queue = JobQueue(concurrency=1)
+        order: List[str] = []
+        release = asyncio.Event()
+
+        queue.submit("blocker", release.wait)
+        await asyncio.sleep(0)
+        for job_id, priority in (("free-1", 2), ("biz-1", 0), ("std", 1), ("biz-2", 0)):
+
+            async def job(job_id: str = job_id) -> None:
+                order.append(job_id)
+
+            queue.submit(job_id, job, priority=priority)
+
+        release.set()
+        await queue.join()
+
+        assert order == ["biz-1", "biz-2", "std", "free-1"]
+        await queue.stop()
+
+    @pytest.mark.asyncio
+    async def test_concurrency_limit(self):
+        """Test no more than the configured number of jobs run at once."""
+        queue = JobQueue(concurrency=3)
+        active = 0
+        peak = 0
+
+        async def job() -> None:
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+
+        for i in range(10):
+            queue.submit(f"job-{i}", job)
+        await queue.join()
+
+        assert peak == 3
+        assert queue.get_stats()["completed"] == 10
+        await queue.stop()
+
+    @pytest.mark.asyncio
+    async def test_full_queue_rejects_and_failures_are_isolated(self):
+        """Test a full queue raises and a failing job does not stop workers."""
+        queue = JobQueue(max_size=2, concurrency=1)
+        release = asyncio.Event()
+
+        async def failing() -> None:
+            await release.wait()
+            raise RuntimeError("boom")
+
+        queue.submit("failing", failing)
+        await asyncio.sleep(0)
+        queue.submit("a", release.wait)
+        queue.submit("b", release.wait)
+        with pytest.raises(QueueFullError):
+            queue.submit("c", release.wait)
+
+        release.set()
+        await queue.join()
+
+        stats = queue.get_stats()
+        assert stats["rejected"] == 1
+        assert stats["failed"] == 1
+        assert stats["completed"] == 2
+        await queue.stop()
+
+    @pytest.mark.asyncio
+    async def test_stop_cancels_running_and_reports_dropped(self):
+        """Test stop cancels running jobs and returns the jobs never run."""
+        queue = JobQueue(concurrency=1)
+        cancelled = asyncio.Event()
+
+        async def blocking() -> None:
+            try:
+                await asyncio.Event().wait()
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        queue.submit("running", blocking)
+        await asyncio.sleep(0)
+        queue.submit("low", blocking, priority=1)
+        queue.submit("high", blocking, priority=0)
+
+        dropped = await queue.stop()
+
+        assert dropped == ["high", "low"]
+        assert cancelled.is_set()
+        assert queue.pending == 0
+        assert queue.running == 0
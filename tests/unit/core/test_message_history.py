@@ -0,0 +1,162 @@
+"""Tests for write-behind message history."""
+
+import asyncio
+from datetime import UTC, datetime, timedelta
+from typing import Any, Dict, List, Optional
+
+import pytest
+
+from agentic_workflow.core.communication import Message
+from agentic_workflow.core.message_history import MessageHistory
+from agentic_workflow.memory.interfaces import MemoryEntry, MemoryType
+
+
+class FakeMemoryManager:
+    """In-process stand-in for the MemoryManager batch methods used."""
+
+    def __init__(self) -> None:
+        self.entries: Dict[str, MemoryEntry] = {}
+        self.batches: List[int] = []
+        self.lookups: List[List[str]] = []
+        self.fail = False
+
+    async def store_many(self, items: List[Dict[str, Any]]) -> List[str]:
+        if self.fail:
+            raise RuntimeError("store unavailable")
+        self.batches.append(len(items))
+        for item in items:
+            self.entries[item["entry_id"]] = MemoryEntry(
+                id=item["entry_id"],
+                content=item["content"],
+                metadata=item["metadata"],
+                memory_type=item["memory_type"],
+            )
+        return [item["entry_id"] for item in items]
+
+    async def get_many(
+        self, entry_ids: List[str], memory_type: Optional[MemoryType] = None
+    ) -> Dict[str, MemoryEntry]:
+        self.lookups.append(entry_ids)
+        return {
+            entry_id: self.entries[entry_id]
+            for entry_id in entry_ids
+            if entry_id in self.entries
+        }
+
+
+# Recent enough to stay within the default retention
+_START = datetime.now(UTC) - timedelta(hours=1)
+
+
+def _message(
+    number: int,
+    sender: str = "a",
+    recipient: Optional[str] = "b",
+    start: datetime = _START,
+) -> Message:
+    created = start + timedelta(minutes=number)
+    return Message(
+        message_id=f"m{number}",
+        sender_id=sender,
+        recipient_id=recipient,
+        message_type="test",
+        content={"n": number},
+        created_at=created.isoformat(),
+    )
+
+
+class TestMessageHistory:
+    """Test buffering, indexing and paginated lookups."""
+
+    @pytest.mark.asyncio
+    async def test_batches_written_in_background(self):
+        """Test a full batch is flushed without the sender waiting."""
+        memory = FakeMemoryManager()
+        history = MessageHistory(memory, batch_size=2, flush_interval=60)
+
+        history.record(_message(1))
+        history.record(_message(2))
+        history.record(_message(3))
+        assert memory.batches == []
+
+        for _ in range(5):
+            await asyncio.sleep(0)
+        assert memory.batches == [2, 1]
+        assert history.get_stats()["buffered"] == 0
+
+        await history.close()
+
+    @pytest.mark.asyncio
+    async def test_failed_batches_retried(self):
+        """Test messages stay buffered until they are stored."""
+        memory = FakeMemoryManager()
+        memory.fail = True
+        history = MessageHistory(memory, flush_interval=60)
+        history.record(_message(1))
+
+        assert await history.flush() == 0
+        assert history.get_stats()["buffered"] == 1
+
+        memory.fail = False
+        assert await history.flush() == 1
+        assert "message_m1" in memory.entries
+        await history.close()
+
+    @pytest.mark.asyncio
+    async def test_cursor_pagination_across_partitions(self):
+        """Test pages run newest first across partitions and conversations."""
+        memory = FakeMemoryManager()
+        history = MessageHistory(memory, partition_seconds=120, flush_interval=60)
+        for number in range(1, 6):
+            history.record(_message(number))
+        history.record(_message(6, sender="c", recipient="a"))
+        history.record(_message(7, sender="b", recipient="c"))
+        await history.flush()
+
+        first = await history.query("a", limit=4)
+        assert [msg["content"]["n"] for msg in first.messages] == [6, 5, 4, 3]
+        assert first.next_cursor is not None
+
+        second = await history.query("a", limit=4, cursor=first.next_cursor)
+        assert [msg["content"]["n"] for msg in second.messages] == [2, 1]
+        assert second.next_cursor is None
+
+        # Only the messages on the page are loaded from memory
+        assert memory.lookups[0] == [f"message_m{n}" for n in (6, 5, 4, 3)]
+        await history.close()
+
+    @pytest.mark.asyncio
+    async def test_peer_and_broadcast_conversations(self):
+        """Test lookups limited to one conversation, including broadcasts."""
+        history = MessageHistory(FakeMemoryManager(), flush_interval=60)
+        history.record(_message(1, sender="a", recipient="b"))
+        history.record(_message(2, sender="b", recipient="a"))
+        history.record(_message(3, sender="a", recipient="c"))
+        history.record(_message(4, sender="a", recipient=None))
+
+        with_b = await history.query("a", peer_id="b")
+        broadcasts = await history.query("a", peer_id="*")
+
+        assert [msg["content"]["n"] for msg in with_b.messages] == [2, 1]
+        assert [msg["content"]["n"] for msg in broadcasts.messages] == [4]
+        await history.close()
+
+    @pytest.mark.asyncio
+    async def test_flush_prunes_expired_conversations(self):
+        """Test quiet conversations past retention leave the index on flush."""
+        history = MessageHistory(
+            FakeMemoryManager(), partition_seconds=60, retention=600, flush_interval=60
+        )
+        stale = datetime.now(UTC) - timedelta(hours=2)
+        history.record(_message(1, sender="a", recipient="b", start=stale))
+        recent = datetime.now(UTC) - timedelta(minutes=3)
+        history.record(_message(2, sender="a", recipient="c", start=recent))
+
+        await history.flush()
+
+        page = await history.query("a")
+        assert [msg["content"]["n"] for msg in page.messages] == [2]
+        assert (await history.query("b")).messages == []
+        assert history.get_stats()["conversations"] == 1
+        assert "b" not in history._conversations
+        await history.close()
@@ -0,0 +1,136 @@
+"""Tests for workflow plan compilation and caching."""
+
+from typing import List
+from unittest.mock import patch
+
+from agentic_workflow.core.engine import ComponentRegistry
+from agentic_workflow.core.interfaces import (
+    Component,
+    ServiceResponse,
+    WorkflowDefinition,
+    WorkflowStep,
+)
+from agentic_workflow.core.plan import PlanCache, compile_workflow, workflow_version
+
+
+class IdleComponent(Component):
+    """Component that is only resolved, never run."""
+
+    async def initialize(self) -> None:
+        pass
+
+    async def start(self) -> None:
+        pass
+
+    async def stop(self) -> None:
+        pass
+
+    async def health_check(self) -> ServiceResponse:
+        return ServiceResponse(success=True)
+
+
+def _workflow(*steps: WorkflowStep, version: str = "1") -> WorkflowDefinition:
+    return WorkflowDefinition(
+        id="wf", name="Workflow", description="", steps=list(steps), version=version
+    )
+
+
+def _step(step_id: str, *dependencies: str, component: str = "worker") -> WorkflowStep:
+    return WorkflowStep(
+        id=step_id,
+        name=step_id,
+        component=component,
+        action="run",
+        dependencies=list(dependencies),
+    )
+
+
+class TestCompileWorkflow:
+    """Test plan compilation."""
+
+    def test_levels_and_dependency_bitsets(self):
+        """Test steps are grouped into levels with dependency masks."""
+        plan = compile_workflow(
+            _workflow(_step("join", "a", "b"), _step("a"), _step("b", "a"))
+        )
+
+        assert plan.valid
+        assert plan.levels == (("a",), ("b",), ("join",))
+        assert plan.dependency_masks[plan.index["join"]] == plan.mask(["a", "b"])
+        assert not plan.is_ready(plan.index["join"], plan.mask(["a"]))
+        assert plan.is_ready(plan.index["join"], plan.mask(["a", "b"]))
+
+    def test_validation_errors_collected(self):
+        """Test every validation problem is reported up front."""
+        registry = ComponentRegistry()
+        plan = compile_workflow(
+            _workflow(
+                _step("a", "missing"),
+                _step("b", "c"),
+                _step("c", "b"),
+                _step("a", component="ghost"),
+            ),
+            registry,
+        )
+
+        messages: List[str] = [error.message for error in plan.errors]
+        assert not plan.valid
+        assert "Duplicate step id: a" in messages
+        assert "Step dependency not met: missing" in messages
+        assert "Circular step dependency detected: ['b', 'c']" in messages
+        assert "Component not found: ghost" in messages
+
+
+class TestPlanCache:
+    """Test plan caching by workflow ID and version."""
+
+    def test_cached_by_id_and_version(self):
+        """Test a plan is reused until the version changes."""
+        cache = PlanCache()
+        first = cache.get_plan(_workflow(_step("a")))
+
+        assert cache.get_plan(_workflow(_step("a"))) is first
+        assert cache.get_plan(_workflow(_step("a"), version="2")) is not first
+        assert cache.get_stats() == {"plans": 2, "hits": 1, "misses": 2}
+
+    def test_unversioned_workflows_keyed_by_content(self):
+        """Test definitions without a version are keyed by their content."""
+        cache = PlanCache()
+        first = cache.get_plan(_workflow(_step("a"), version=None))
+
+        assert cache.get_plan(_workflow(_step("a"), version=None)) is first
+        assert cache.get_plan(_workflow(_step("b"), version=None)) is not first
+
+    def test_content_hash_computed_once_per_definition(self):
+        """Test an unversioned definition is hashed once unless rehashed."""
+        cache = PlanCache()
+        workflow = _workflow(_step("a"), version=None)
+
+        with patch(
+            "agentic_workflow.core.plan.workflow_version", wraps=workflow_version
+        ) as hashed:
+            first = cache.get_plan(workflow)
+            assert cache.get_plan(workflow) is first
+            assert hashed.call_count == 1
+
+            workflow.steps.append(_step("b", "a"))
+            assert cache.get_plan(workflow) is first
+            changed = cache.get_plan(workflow, rehash=True)
+
+        assert changed is not first
+        assert len(changed.steps) == 2
+        assert hashed.call_count == 2
+
+    def test_registry_changes_recompile(self):
+        """Test registering a component invalidates resolved plans."""
+        cache = PlanCache()
+        registry = ComponentRegistry()
+        workflow = _workflow(_step("a"))
+
+        missing = cache.get_plan(workflow, registry)
+        assert not missing.valid
+
+        registry.register(IdleComponent("worker", {}))
+        resolved = cache.get_plan(workflow, registry)
+        assert resolved.valid
+        assert resolved.components[0] is registry.get("worker")
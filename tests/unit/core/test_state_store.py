@@ -0,0 +1,252 @@
+"""Tests for durable execution state and resumable workflows."""
+
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import pytest
+
+from agentic_workflow.core.engine import WorkflowEngine
+from agentic_workflow.core.interfaces import (
+    Component,
+    ServiceResponse,
+    WorkflowDefinition,
+    WorkflowExecution,
+    WorkflowStep,
+)
+from agentic_workflow.core.state_store import (
+    ExecutionStateStore,
+    FileStateStore,
+    RedisStateStore,
+    SQLiteStateStore,
+)
+
+
+class FakeRedis:
+    """In-process stand-in for the async Redis hash and set commands used."""
+
+    def __init__(self) -> None:
+        self.hashes: Dict[str, Dict[str, str]] = {}
+        self.sets: Dict[str, set] = {}
+
+    async def hset(
+        self,
+        key: str,
+        field: Optional[str] = None,
+        value: Optional[str] = None,
+        mapping: Optional[Dict[str, str]] = None,
+    ) -> int:
+        target = self.hashes.setdefault(key, {})
+        if mapping:
+            target.update(mapping)
+        if field is not None:
+            target[field] = value
+        return 1
+
+    async def hget(self, key: str, field: str) -> Optional[str]:
+        return self.hashes.get(key, {}).get(field)
+
+    async def hgetall(self, key: str) -> Dict[str, str]:
+        return dict(self.hashes.get(key, {}))
+
+    async def sadd(self, key: str, member: str) -> int:
+        self.sets.setdefault(key, set()).add(member)
+        return 1
+
+    async def srem(self, key: str, member: str) -> int:
+        self.sets.get(key, set()).discard(member)
+        return 1
+
+    async def smembers(self, key: str) -> set:
+        return set(self.sets.get(key, set()))
+
+    async def delete(self, *keys: str) -> int:
+        return sum(self.hashes.pop(key, None) is not None for key in keys)
+
+
+@pytest.fixture(params=["sqlite", "file", "redis"])
+def state_store(request: Any, tmp_path: Path) -> ExecutionStateStore:
+    """Create each state store implementation."""
+    if request.param == "sqlite":
+        return SQLiteStateStore(tmp_path / "state.db")
+    if request.param == "file":
+        return FileStateStore(tmp_path / "state.jsonl")
+    return RedisStateStore(FakeRedis())
+
+
+def _execution(execution_id: str = "exec-1", status: str = "running"):
+    return WorkflowExecution(id=execution_id, workflow_id="wf", status=status)
+
+
+class TestExecutionStateStores:
+    """Test the state store implementations."""
+
+    @pytest.mark.asyncio
+    async def test_round_trip(self, state_store: ExecutionStateStore):
+        """Test headers and step checkpoints are restored together."""
+        await state_store.save_execution(_execution())
+        await state_store.save_step(
+            "exec-1",
+            {
+                "step_id": "a",
+                "output": {"answer": 42},
+                "started_at": "2024-01-01T00:00:00",
+                "completed_at": "2024-01-01T00:00:01",
+            },
+        )
+        await state_store.save_step(
+            "exec-1", {"step_id": "b", "output": None, "completed_at": "2024-01-02"}
+        )
+
+        restored = await state_store.load_execution("exec-1")
+
+        assert restored is not None
+        assert restored.workflow_id == "wf"
+        assert restored.completed_steps == ["a", "b"]
+        assert restored.step_outputs == {"a": {"answer": 42}, "b": None}
+        assert restored.step_start_times == {"a": "2024-01-01T00:00:00"}
+        assert await state_store.load_execution("missing") is None
+        await state_store.close()
+
+    @pytest.mark.asyncio
+    async def test_list_and_delete(self, state_store: ExecutionStateStore):
+        """Test executions can be listed by status and deleted."""
+        await state_store.save_execution(_execution("running-1"))
+        await state_store.save_execution(_execution("done-1", status="completed"))
+
+        assert await state_store.list_executions("running") == ["running-1"]
+        assert sorted(await state_store.list_executions()) == ["done-1", "running-1"]
+
+        assert await state_store.delete_execution("done-1") is True
+        assert await state_store.delete_execution("done-1") is False
+        assert await state_store.list_executions() == ["running-1"]
+        await state_store.close()
+
+
+class TestFileStateStore:
+    """Test the append-only file store."""
+
+    @pytest.mark.asyncio
+    async def test_replay_after_reopen(self, tmp_path: Path):
+        """Test state survives reopening and a torn final record is skipped."""
+        path = tmp_path / "state.jsonl"
+        store = FileStateStore(path)
+        await store.save_execution(_execution())
+        await store.save_step("exec-1", {"step_id": "a", "output": 1})
+        await store.close()
+        with open(path, "a", encoding="utf-8") as log:
+            log.write('{"op": "step", "execution_')
+
+        reopened = FileStateStore(path)
+        restored = await reopened.load_execution("exec-1")
+
+        assert restored is not None
+        assert restored.step_outputs == {"a": 1}
+        await reopened.close()
+
+    @pytest.mark.asyncio
+    async def test_compact(self, tmp_path: Path):
+        """Test compaction drops superseded and deleted records."""
+        path = tmp_path / "state.jsonl"
+        store = FileStateStore(path)
+        for status in ("running", "running", "completed"):
+            await store.save_execution(_execution(status=status))
+        await store.save_execution(_execution("gone"))
+        await store.delete_execution("gone")
+
+        await store.compact()
+
+        assert len(path.read_text().splitlines()) == 1
+        assert (await store.load_execution("exec-1")).status == "completed"
+        await store.close()
+
+
+class CountingComponent(Component):
+    """Component that records which steps it ran."""
+
+    def __init__(self) -> None:
+        super().__init__("worker", {})
+        self.calls: List[str] = []
+        self.fail_on: Optional[str] = None
+
+    async def initialize(self) -> None:
+        pass
+
+    async def start(self) -> None:
+        pass
+
+    async def stop(self) -> None:
+        pass
+
+    async def health_check(self) -> ServiceResponse:
+        return ServiceResponse(success=True)
+
+    async def process_request(self, request: Dict[str, Any]) -> ServiceResponse:
+        step_id = request["step_id"]
+        self.calls.append(step_id)
+        if step_id == self.fail_on:
+            return ServiceResponse(success=False, error="transient failure")
+        return ServiceResponse(success=True, data={"output": step_id.upper()})
+
+
+class TestResumableExecution:
+    """Test checkpointing and resuming workflow executions."""
+
+    @pytest.fixture
+    def workflow(self) -> WorkflowDefinition:
+        return WorkflowDefinition(
+            id="pipeline",
+            name="Pipeline",
+            description="Three chained steps",
+            steps=[
+                WorkflowStep(
+                    id=step_id,
+                    name=step_id,
+                    component="worker",
+                    action="run",
+                    dependencies=dependencies,
+                )
+                for step_id, dependencies in (("a", []), ("b", ["a"]), ("c", ["b"]))
+            ],
+        )
+
+    @pytest.mark.asyncio
+    async def test_resume_skips_checkpointed_steps(
+        self, workflow: WorkflowDefinition, tmp_path: Path
+    ):
+        """Test a restarted engine re-runs only the steps that did not finish."""
+        path = tmp_path / "state.db"
+        first_worker = CountingComponent()
+        first_worker.fail_on = "c"
+        first_engine = WorkflowEngine(state_store=SQLiteStateStore(path))
+        first_engine.register_component(first_worker)
+
+        failed = await first_engine.execute_workflow(workflow)
+        assert failed.status == "failed"
+        assert first_worker.calls == ["a", "b", "c"]
+
+        # Simulate a process restart with a fresh engine and store
+        second_store = SQLiteStateStore(path)
+        assert await second_store.list_executions("failed") == [failed.id]
+        second_worker = CountingComponent()
+        second_engine = WorkflowEngine(state_store=second_store)
+        second_engine.register_component(second_worker)
+
+        resumed = await second_engine.execute_workflow(workflow, execution_id=failed.id)
+
+        assert resumed.status == "completed"
+        assert second_worker.calls == ["c"]
+        assert resumed.completed_steps == ["a", "b", "c"]
+        assert resumed.step_outputs["a"] == {"output": "A"}
+        assert (await second_store.load_execution(failed.id)).status == "completed"
+
+    @pytest.mark.asyncio
+    async def test_resume_rejects_other_workflow(self, workflow: WorkflowDefinition):
+        """Test an execution cannot be resumed with a different workflow."""
+        store = SQLiteStateStore()
+        await store.save_execution(
+            WorkflowExecution(id="exec-1", workflow_id="other", status="failed")
+        )
+        engine = WorkflowEngine(state_store=store)
+
+        with pytest.raises(ValueError):
+            await engine.execute_workflow(workflow, execution_id="exec-1")
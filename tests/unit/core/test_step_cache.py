@@ -0,0 +1,154 @@
+"""Tests for content-addressed step result memoization."""
+
+from pathlib import Path
+from typing import Any, Dict, List
+
+import pytest
+
+from agentic_workflow.core.engine import WorkflowEngine
+from agentic_workflow.core.interfaces import (
+    Component,
+    ServiceResponse,
+    WorkflowDefinition,
+    WorkflowStep,
+)
+from agentic_workflow.core.step_cache import StepResultCache
+
+
+def _step(step_id: str = "a", **kwargs: Any) -> WorkflowStep:
+    return WorkflowStep(
+        id=step_id, name=step_id, component="worker", action="run", **kwargs
+    )
+
+
+class TestStepResultCache:
+    """Test the cache tiers and key derivation."""
+
+    def test_key_is_stable_and_input_sensitive(self):
+        """Test keys ignore ordering but change with any input."""
+        first = _step(parameters={"x": 1, "y": [1, 2]})
+        reordered = _step("other-id", parameters={"y": [1, 2], "x": 1})
+
+        key = StepResultCache.make_key(first, {"up": {"v": 1}})
+
+        assert key == StepResultCache.make_key(reordered, {"up": {"v": 1}})
+        assert key != StepResultCache.make_key(first, {"up": {"v": 2}})
+        assert key != StepResultCache.make_key(
+            _step(parameters={"x": 2, "y": [1, 2]}), {"up": {"v": 1}}
+        )
+
+    @pytest.mark.asyncio
+    async def test_lru_eviction_and_expiry(self):
+        """Test the memory tier evicts least recently used and expired results."""
+        cache = StepResultCache(max_entries=2)
+        await cache.put("a", 1, ttl=60)
+        await cache.put("b", 2, ttl=60)
+        assert await cache.get("a") == (True, 1)
+        await cache.put("c", 3, ttl=60)
+
+        assert await cache.get("b") == (False, None)
+        assert await cache.get("a") == (True, 1)
+
+        await cache.put("d", None, ttl=0)
+        assert await cache.get("d") == (False, None)
+        assert cache.get_stats()["memory_hits"] == 2
+
+    @pytest.mark.asyncio
+    async def test_disk_tier_survives_restart(self, tmp_path: Path):
+        """Test results written to disk are served by a new cache."""
+        path = tmp_path / "steps.db"
+        cache = StepResultCache(disk_path=path)
+        await cache.put("key", {"answer": 42}, ttl=60)
+        cache.close()
+
+        reopened = StepResultCache(disk_path=path)
+
+        assert await reopened.get("key") == (True, {"answer": 42})
+        assert await reopened.get("key") == (True, {"answer": 42})
+        assert reopened.get_stats()["disk_hits"] == 1
+        assert reopened.get_stats()["memory_hits"] == 1
+        reopened.close()
+
+
+class CountingComponent(Component):
+    """Component that records which steps it ran."""
+
+    def __init__(self) -> None:
+        super().__init__("worker", {})
+        self.calls: List[str] = []
+
+    async def initialize(self) -> None:
+        pass
+
+    async def start(self) -> None:
+        pass
+
+    async def stop(self) -> None:
+        pass
+
+    async def health_check(self) -> ServiceResponse:
+        return ServiceResponse(success=True)
+
+    async def process_request(self, request: Dict[str, Any]) -> ServiceResponse:
+        self.calls.append(request["step_id"])
+        return ServiceResponse(
+            success=True, data={"value": request["parameters"].get("value")}
+        )
+
+
+class TestEngineMemoization:
+    """Test step memoization in workflow execution."""
+
+    @staticmethod
+    def _workflow(value: int, cacheable: bool = True) -> WorkflowDefinition:
+        return WorkflowDefinition(
+            id="memo",
+            name="Memo",
+            description="Two chained steps",
+            steps=[
+                _step("load", parameters={"value": value}, cacheable=cacheable),
+                _step("report", dependencies=["load"], cacheable=cacheable),
+            ],
+        )
+
+    @pytest.mark.asyncio
+    async def test_repeated_workflow_served_from_cache(self):
+        """Test identical steps skip the component on the second run."""
+        engine = WorkflowEngine(step_cache=StepResultCache())
+        worker = CountingComponent()
+        engine.register_component(worker)
+
+        first = await engine.execute_workflow(self._workflow(1))
+        second = await engine.execute_workflow(self._workflow(1))
+
+        assert worker.calls == ["load", "report"]
+        assert first.cache_misses == 2 and first.cache_hits == 0
+        assert second.status == "completed"
+        assert second.cached_steps == ["load", "report"]
+        assert second.cache_hits == 2
+        assert second.step_outputs == first.step_outputs
+
+    @pytest.mark.asyncio
+    async def test_changed_input_invalidates_downstream(self):
+        """Test a changed parameter reruns the step and its dependants."""
+        engine = WorkflowEngine(step_cache=StepResultCache())
+        worker = CountingComponent()
+        engine.register_component(worker)
+
+        await engine.execute_workflow(self._workflow(1))
+        await engine.execute_workflow(self._workflow(2))
+
+        assert worker.calls == ["load", "report", "load", "report"]
+
+    @pytest.mark.asyncio
+    async def test_uncacheable_steps_always_run(self):
+        """Test steps are only memoized when marked cacheable."""
+        engine = WorkflowEngine(step_cache=StepResultCache())
+        worker = CountingComponent()
+        engine.register_component(worker)
+
+        await engine.execute_workflow(self._workflow(1, cacheable=False))
+        result = await engine.execute_workflow(self._workflow(1, cacheable=False))
+
+        assert len(worker.calls) == 4
+        assert result.cache_hits == result.cache_misses == 0
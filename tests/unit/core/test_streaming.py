@@ -0,0 +1,176 @@
+"""Tests for streaming partial step output."""
+
+import asyncio
+from typing import Any, AsyncIterator, Dict, List, Tuple
+
+import pytest
+
+from agentic_workflow.core.engine import WorkflowEngine
+from agentic_workflow.core.interfaces import (
+    Component,
+    EventHandler,
+    ServiceResponse,
+    WorkflowDefinition,
+    WorkflowStep,
+)
+from agentic_workflow.core.streaming import StepStream
+
+
+class TokenComponent(Component):
+    """Component streaming tokens and consuming upstream streams."""
+
+    def __init__(self) -> None:
+        super().__init__("tokens", {})
+        self.release = asyncio.Event()
+        self.seen: List[Any] = []
+
+    async def initialize(self) -> None:
+        pass
+
+    async def start(self) -> None:
+        pass
+
+    async def stop(self) -> None:
+        pass
+
+    async def health_check(self) -> ServiceResponse:
+        return ServiceResponse(success=True)
+
+    async def process_request(
+        self, request: Dict[str, Any]
+    ) -> AsyncIterator[Any]:  # type: ignore[override]
+        if request["action"] == "generate":
+            yield "Hello"
+            # Hold the rest back until a downstream reader has seen the start
+            await self.release.wait()
+            yield ", world"
+        elif request["action"] == "consume":
+            async for chunk in request["streams"]["generate"]:
+                self.seen.append(chunk)
+                self.release.set()
+            yield ServiceResponse(success=True, data=len(self.seen))
+
+
+class RecordingHandler(EventHandler):
+    """Event handler keeping every event it receives."""
+
+    def __init__(self) -> None:
+        self.events: List[Tuple[str, Dict[str, Any]]] = []
+
+    async def handle_event(self, event_type: str, event_data: Dict[str, Any]) -> None:
+        self.events.append((event_type, event_data))
+
+
+class TestStepStream:
+    """Test stream buffering and replay."""
+
+    @pytest.mark.asyncio
+    async def test_late_reader_gets_every_chunk(self):
+        """Test readers see buffered chunks, then new ones until closed."""
+        stream = StepStream("a")
+        stream.publish(1)
+
+        async def read() -> List[int]:
+            return [chunk async for chunk in stream]
+
+        reader = asyncio.create_task(read())
+        await asyncio.sleep(0)
+        stream.publish(2)
+        stream.finish(None)
+
+        assert await reader == [1, 2]
+        assert [chunk async for chunk in stream] == [1, 2]
+
+    @pytest.mark.asyncio
+    async def test_failed_stream_raises_after_chunks(self):
+        """Test readers get buffered chunks before the step's failure."""
+        stream = StepStream("a")
+        stream.publish("partial")
+        stream.close(ValueError("boom"))
+
+        seen = []
+        with pytest.raises(RuntimeError, match="Step a failed: boom"):
+            async for chunk in stream:
+                seen.append(chunk)
+        assert seen == ["partial"]
+
+    @pytest.mark.asyncio
+    async def test_completed_stream_holds_output(self):
+        """Test steps that did not stream show up as one chunk."""
+        stream = StepStream.completed("a", {"value": 1})
+
+        assert [chunk async for chunk in stream] == [{"value": 1}]
+
+
+class TestEngineStreaming:
+    """Test streamed step output in workflow execution."""
+
+    @pytest.mark.asyncio
+    async def test_chunks_forwarded_and_assembled(self):
+        """Test chunks are emitted as events and joined into the output."""
+        engine = WorkflowEngine()
+        component = TokenComponent()
+        component.release.set()
+        engine.register_component(component)
+        handler = RecordingHandler()
+        engine.register_event_handler(handler)
+
+        workflow = WorkflowDefinition(
+            id="stream",
+            name="Stream",
+            description="One streaming step",
+            steps=[
+                WorkflowStep(
+                    id="generate",
+                    name="generate",
+                    component="tokens",
+                    action="generate",
+                )
+            ],
+        )
+        execution = await engine.execute_workflow(workflow)
+        await engine.events.flush()
+
+        assert execution.status == "completed"
+        assert execution.step_outputs["generate"] == "Hello, world"
+        outputs = [data for event, data in handler.events if event == "step_output"]
+        assert [data["chunk"] for data in outputs] == ["Hello", ", world"]
+        assert [data["index"] for data in outputs] == [0, 1]
+        assert outputs[0]["workflow_id"] == "stream"
+
+    @pytest.mark.asyncio
+    async def test_streaming_step_reads_while_upstream_runs(self):
+        """Test stream_inputs steps consume chunks before the producer ends."""
+        engine = WorkflowEngine()
+        component = TokenComponent()
+        engine.register_component(component)
+
+        workflow = WorkflowDefinition(
+            id="pipeline",
+            name="Pipeline",
+            description="Consumer reading a producer's stream",
+            steps=[
+                WorkflowStep(
+                    id="generate",
+                    name="generate",
+                    component="tokens",
+                    action="generate",
+                ),
+                WorkflowStep(
+                    id="consume",
+                    name="consume",
+                    component="tokens",
+                    action="consume",
+                    dependencies=["generate"],
+                    stream_inputs=True,
+                ),
+            ],
+        )
+        # The producer only finishes once the consumer has read its first
+        # chunk, so this would hang if the consumer waited for it
+        execution = await asyncio.wait_for(engine.execute_workflow(workflow), 5)
+
+        assert execution.status == "completed"
+        assert component.seen == ["Hello", ", world"]
+        assert execution.step_outputs["consume"] == 2
+        assert sorted(execution.completed_steps) == ["consume", "generate"]
@@ -1,8 +1,11 @@
 """Unit tests for cache store implementation."""
 
+import asyncio
 from datetime import datetime, timezone
-from unittest.mock import AsyncMock, patch
+from typing import List
+from unittest.mock import AsyncMock, MagicMock, patch
 
+import numpy as np
 import pytest
 
 from agentic_workflow.memory import (
@@ -13,9 +16,25 @@ from agentic_workflow.memory import (
     MemoryType,
     RedisCacheStore,
 )
+from agentic_workflow.memory.codec import StructEntryCodec, decode_entry
 from agentic_workflow.utils.serialization import memory_entry_to_dict, serialize_to_json
 
 
+def _packed(vector: List[float]) -> bytes:
+    """Pack a vector the way RedisCacheStore stores it."""
+    return np.array(vector, dtype="<f4").tobytes()
+
+
+def _payload(entry: MemoryEntry) -> str:
+    """Serialize an entry in the legacy JSON format."""
+    return serialize_to_json(memory_entry_to_dict(entry))
+
+
+def _encoded(entry: MemoryEntry) -> bytes:
+    """Encode an entry the way RedisCacheStore stores it."""
+    return StructEntryCodec().encode(entry.model_copy(update={"embedding": None}))
+
+
 class TestRedisCacheStore:
     """Tests for the RedisCacheStore implementation."""
 
@@ -37,6 +56,18 @@ class TestRedisCacheStore:
         client.scard = AsyncMock(return_value=0)
         client.info = AsyncMock(return_value={"used_memory": 1024})
         client.hset = AsyncMock(return_value=True)
+        client.zadd = AsyncMock(return_value=1)
+        client.zrem = AsyncMock(return_value=1)
+        client.zcard = AsyncMock(return_value=0)
+        client.zrevrange = AsyncMock(return_value=[])
+        client.zmscore = AsyncMock(return_value=[])
+        client.sunion = AsyncMock(return_value=[])
+        client.sinter = AsyncMock(return_value=[])
+
+        # Pipelines queue commands synchronously and run them on execute()
+        pipeline = MagicMock()
+        pipeline.execute = AsyncMock(return_value=[])
+        client.pipeline = MagicMock(return_value=pipeline)
         return client
 
     @pytest.fixture
@@ -44,6 +75,7 @@ class TestRedisCacheStore:
         """Create a mock Redis connection manager."""
         manager = AsyncMock()
         manager.client = mock_redis_client
+        manager.binary_client = mock_redis_client
         manager.ensure_connected = AsyncMock(return_value=True)
         manager.health_check = AsyncMock(return_value=True)
         manager.disconnect = AsyncMock()
@@ -87,9 +119,7 @@ class TestRedisCacheStore:
         mock_redis_client: AsyncMock,
     ) -> None:
         """Test storing a memory entry."""
-        # Mock serialization
-        entry_dict = memory_entry_to_dict(sample_entry)
-        serialized_data = serialize_to_json(entry_dict)
+        serialized_data = _encoded(sample_entry)
 
         success = await redis_cache_store.store(sample_entry)
 
@@ -132,8 +162,7 @@ class TestRedisCacheStore:
         """Test storing a memory entry with TTL."""
         # Set TTL
         sample_entry.ttl = 60
-        entry_dict = memory_entry_to_dict(sample_entry)
-        serialized_data = serialize_to_json(entry_dict)
+        serialized_data = _encoded(sample_entry)
 
         success = await redis_cache_store.store(sample_entry)
 
@@ -163,10 +192,8 @@ class TestRedisCacheStore:
     ) -> None:
         """Test basic retrieval."""
         # Set up mock data
-        mock_redis_client.keys.return_value = [
-            b"entry:test-123",
-            b"entry:test-456",
-        ]
+        mock_redis_client.zcard.return_value = 2
+        mock_redis_client.zrevrange.return_value = [b"test-456", b"test-123"]
 
         # Set up mock get responses for each key
         entry1 = MemoryEntry(
@@ -184,9 +211,15 @@ class TestRedisCacheStore:
             timestamp=datetime.now(timezone.utc),
         )
 
-        mock_redis_client.get.side_effect = [
-            serialize_to_json(memory_entry_to_dict(entry1)),
-            serialize_to_json(memory_entry_to_dict(entry2)),
+        pipeline = mock_redis_client.pipeline.return_value
+        pipeline.execute.side_effect = [
+            [
+                [
+                    serialize_to_json(memory_entry_to_dict(entry2)),
+                    serialize_to_json(memory_entry_to_dict(entry1)),
+                ]
+            ],
+            [[_packed([0.5, 0.5]), None]],
         ]
 
         # Create query
@@ -197,10 +230,19 @@ class TestRedisCacheStore:
 
         # Check result
         assert isinstance(result, MemoryResult)
-        assert len(result.entries) == 2
+        assert [e.id for e in result.entries] == ["test-456", "test-123"]
         assert result.total_count == 2
-        assert result.entries[0].id in ["test-123", "test-456"]
-        assert result.entries[1].id in ["test-123", "test-456"]
+        # Top of the rank index is read and fetched with a single MGET
+        mock_redis_client.keys.assert_not_called()
+        mock_redis_client.get.assert_not_called()
+        mock_redis_client.zrevrange.assert_called_once_with("rank:entries", 0, 9)
+        pipeline.mget.assert_called_once_with(["entry:test-456", "entry:test-123"])
+        # Embeddings are restored from the vector block
+        pipeline.hmget.assert_called_once_with(
+            "vectors:cache", ["test-456", "test-123"]
+        )
+        assert result.entries[0].embedding == [0.5, 0.5]
+        assert result.entries[1].embedding is None
 
     @pytest.mark.unit
     @pytest.mark.asyncio
@@ -227,9 +269,15 @@ class TestRedisCacheStore:
             timestamp=datetime.now(timezone.utc),
         )
 
-        mock_redis_client.get.side_effect = [
-            serialize_to_json(memory_entry_to_dict(entry1)),
-            serialize_to_json(memory_entry_to_dict(entry2)),
+        mock_redis_client.zmscore.return_value = [2.0, 1.0]
+        mock_redis_client.pipeline.return_value.execute.side_effect = [
+            [
+                [
+                    serialize_to_json(memory_entry_to_dict(entry1)),
+                    serialize_to_json(memory_entry_to_dict(entry2)),
+                ]
+            ],
+            [[None, None]],
         ]
 
         # Create query with memory type
@@ -264,9 +312,11 @@ class TestRedisCacheStore:
             tags=["test"],
         )
 
-        mock_redis_client.get.return_value = serialize_to_json(
-            memory_entry_to_dict(entry)
-        )
+        mock_redis_client.zmscore.return_value = [1.0]
+        mock_redis_client.pipeline.return_value.execute.side_effect = [
+            [[serialize_to_json(memory_entry_to_dict(entry))]],
+            [[None]],
+        ]
 
         # Create query with tag
         query = MemoryQuery(tags=["test"], limit=10)
@@ -282,6 +332,267 @@ class TestRedisCacheStore:
         # Verify tag set was queried
         mock_redis_client.smembers.assert_called_with("tag:test")
 
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_retrieve_by_multiple_tags_and_type(
+        self, redis_cache_store: RedisCacheStore, mock_redis_client: AsyncMock
+    ) -> None:
+        """Test multi-tag queries use set algebra and rank ordering."""
+        pipeline = mock_redis_client.pipeline.return_value
+        mock_redis_client.sunion.return_value = [b"a", b"b", b"c"]
+        mock_redis_client.zmscore.return_value = [1.0, None, 3.0]
+
+        def entry(entry_id: str) -> str:
+            return serialize_to_json(
+                memory_entry_to_dict(
+                    MemoryEntry(
+                        id=entry_id, content=entry_id, memory_type=MemoryType.CACHE
+                    )
+                )
+            )
+
+        pipeline.execute.side_effect = [[[entry("c"), entry("a")]], [[None, None]]]
+
+        with patch.object(
+            redis_cache_store, "_candidate_ids", wraps=redis_cache_store._candidate_ids
+        ):
+            result = await redis_cache_store.retrieve(
+                MemoryQuery(tags=["x", "y"], limit=2)
+            )
+
+        mock_redis_client.sunion.assert_called_once_with("tag:x", "tag:y")
+        ranked_ids = mock_redis_client.zmscore.call_args[0][1]
+        assert sorted(ranked_ids) == ["a", "b", "c"]
+        assert [e.id for e in result.entries] == ["c", "a"]
+        assert result.total_count == 3
+
+        # With a memory type, each tag set is intersected with the type set
+        pipeline.execute.side_effect = [[[b"a"], [b"b"]], [[entry("a")]], [[None]]]
+        mock_redis_client.zmscore.return_value = [1.0, 2.0]
+        await redis_cache_store.retrieve(
+            MemoryQuery(tags=["x", "y"], memory_type=MemoryType.CACHE, limit=1)
+        )
+        pipeline.sinter.assert_any_call("type:cache", "tag:x")
+        pipeline.sinter.assert_any_call("type:cache", "tag:y")
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_retrieve_skips_and_prunes_expired_ids(
+        self, redis_cache_store: RedisCacheStore, mock_redis_client: AsyncMock
+    ) -> None:
+        """Test expired IDs at the top of the rank are skipped and pruned."""
+        pipeline = mock_redis_client.pipeline.return_value
+        mock_redis_client.zcard.return_value = 4
+        mock_redis_client.zrevrange.side_effect = [[b"dead", b"a"], [b"b"]]
+        live = {
+            i: _payload(MemoryEntry(id=i, content=i, memory_type=MemoryType.CACHE))
+            for i in ("a", "b")
+        }
+        pipeline.execute.side_effect = [
+            [[None, live["a"]]],
+            [[live["b"]]],
+            [],
+            [[None, None]],
+        ]
+
+        result = await redis_cache_store.retrieve(MemoryQuery(limit=2))
+
+        assert [e.id for e in result.entries] == ["a", "b"]
+        assert result.total_count == 3
+        mock_redis_client.zrevrange.assert_any_call("rank:entries", 2, 2)
+        pipeline.zrem.assert_called_once_with("rank:entries", "dead")
+        pipeline.srem.assert_any_call("type:cache", "dead")
+        pipeline.hdel.assert_any_call("vectors:cache", "dead")
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_retrieve_backfills_legacy_entries_once(
+        self, redis_cache_store: RedisCacheStore, mock_redis_client: AsyncMock
+    ) -> None:
+        """Test entries written before the rank index are ranked on first use."""
+
+        async def scan_iter(**kwargs):
+            for key in (b"entry:new", b"entry:old"):
+                yield key
+
+        old = MemoryEntry(id="old", content="old", memory_type=MemoryType.CACHE)
+        mock_redis_client.exists.return_value = 0
+        mock_redis_client.scan_iter = MagicMock(side_effect=scan_iter)
+        mock_redis_client.zmscore.return_value = [5.0, None]
+        pipeline = mock_redis_client.pipeline.return_value
+        pipeline.execute.return_value = [[_payload(old)]]
+
+        await redis_cache_store.retrieve(MemoryQuery(limit=10))
+        await redis_cache_store.retrieve(MemoryQuery(limit=10))
+
+        mock_redis_client.scan_iter.assert_called_once()
+        mock_redis_client.zadd.assert_called_once_with(
+            "rank:entries", {"old": redis_cache_store._rank_score(old)}
+        )
+        mock_redis_client.set.assert_called_once_with("rank:backfilled", "1")
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_bulk_operations_use_one_pipeline(
+        self, redis_cache_store: RedisCacheStore, mock_redis_client: AsyncMock
+    ) -> None:
+        """Test store_many/get_many/delete_many batch their commands."""
+        pipeline = mock_redis_client.pipeline.return_value
+        entries = [
+            MemoryEntry(id="a", content="a", memory_type=MemoryType.CACHE, tags=["t"]),
+            MemoryEntry(
+                id="b", content="b", memory_type=MemoryType.CACHE, tags=["t"], ttl=60
+            ),
+        ]
+        payloads = [_encoded(e) for e in entries]
+
+        assert await redis_cache_store.store_many(entries) == [True, True]
+        pipeline.mset.assert_called_once_with({"entry:a": payloads[0]})
+        pipeline.setex.assert_called_once_with("entry:b", 60, payloads[1])
+        pipeline.sadd.assert_any_call("type:cache", "a", "b")
+        pipeline.sadd.assert_any_call("tag:t", "a", "b")
+        mock_redis_client.set.assert_not_called()
+
+        pipeline.execute.side_effect = [[[payloads[0], None]], [[None]]]
+        found = await redis_cache_store.get_many(["a", "missing"])
+        assert list(found) == ["a"]
+        mock_redis_client.get.assert_not_called()
+
+        pipeline.execute.side_effect = [[payloads], []]
+        assert await redis_cache_store.delete_many(["a", "b", "c"]) == [
+            True,
+            True,
+            False,
+        ]
+        pipeline.delete.assert_called_once_with(
+            "entry:a", "metadata:a", "entry:b", "metadata:b"
+        )
+        pipeline.srem.assert_any_call("tag:t", "a", "b")
+        mock_redis_client.delete.assert_not_called()
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_store_writes_packed_vector(
+        self, redis_cache_store: RedisCacheStore, mock_redis_client: AsyncMock
+    ) -> None:
+        """Test embeddings are stored as float32 bytes outside the payload."""
+        pipeline = mock_redis_client.pipeline.return_value
+        entry = MemoryEntry(
+            id="v1",
+            content="vector",
+            memory_type=MemoryType.CACHE,
+            embedding=[0.5, -1.0, 2.0],
+        )
+
+        assert await redis_cache_store.store(entry) is True
+
+        payload = decode_entry(mock_redis_client.set.call_args[0][1])
+        assert payload.embedding is None
+        pipeline.hset.assert_called_once_with(
+            "vectors:cache",
+            mapping={"v1": np.array([0.5, -1.0, 2.0], dtype="<f4").tobytes()},
+        )
+        pipeline.xadd.assert_called_once()
+        # The caller's entry keeps its embedding
+        assert entry.embedding == [0.5, -1.0, 2.0]
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_auto_embed_is_opt_in(
+        self, redis_cache_store: RedisCacheStore, mock_redis_client: AsyncMock
+    ) -> None:
+        """Test entries without an embedding are only embedded when enabled."""
+        pipeline = mock_redis_client.pipeline.return_value
+        entry = MemoryEntry(id="t1", content="plain text", memory_type=MemoryType.CACHE)
+
+        assert await redis_cache_store.store(entry) is True
+        pipeline.hset.assert_not_called()
+
+        redis_cache_store.auto_embed = True
+        with patch(
+            "agentic_workflow.memory.cache_store.asyncio.to_thread",
+            wraps=asyncio.to_thread,
+        ) as to_thread:
+            assert await redis_cache_store.store(entry) is True
+
+        to_thread.assert_called_once()
+        pipeline.hset.assert_called_once()
+        assert entry.embedding is None
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_similarity_search_ranks_stored_vectors(
+        self, redis_cache_store: RedisCacheStore, mock_redis_client: AsyncMock
+    ) -> None:
+        """Test similarity search scores vector blocks by cosine similarity."""
+        pipeline = mock_redis_client.pipeline.return_value
+        block = {
+            b"near": _packed([1.0, 0.1]),
+            b"far": _packed([-1.0, 0.0]),
+            b"mid": _packed([1.0, 1.0]),
+            b"other-model": _packed([1.0, 0.0, 0.0]),
+        }
+        blocks = [block if t is MemoryType.CACHE else {} for t in MemoryType]
+        near, mid = (
+            MemoryEntry(id=i, content=i, memory_type=MemoryType.CACHE)
+            for i in ("near", "mid")
+        )
+        pipeline.execute.side_effect = [
+            blocks,
+            [[_payload(near), _payload(mid)]],
+            [[_packed([1.0, 0.1]), _packed([1.0, 1.0])]],
+        ]
+
+        result = await redis_cache_store.similarity_search(
+            [2.0, 0.0], limit=5, threshold=0.5
+        )
+
+        assert result.success is True
+        assert [e.id for e in result.entries] == ["near", "mid"]
+        assert result.similarity_scores[0] == pytest.approx(0.995, abs=1e-3)
+        assert result.similarity_scores[1] == pytest.approx(0.7071, abs=1e-3)
+        assert result.entries[0].embedding == pytest.approx([1.0, 0.1])
+        pipeline.mget.assert_called_once_with(["entry:near", "entry:mid"])
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_similarity_search_mirror_replays_changes(
+        self, mock_redis_manager: AsyncMock, mock_redis_client: AsyncMock
+    ) -> None:
+        """Test the in-process mirror loads once and then replays changes."""
+        store = RedisCacheStore("mirror", {"vector_mirror": True})
+        store.redis = mock_redis_manager
+        pipeline = mock_redis_client.pipeline.return_value
+        a, b = (
+            MemoryEntry(id=i, content=i, memory_type=MemoryType.CACHE)
+            for i in ("a", "b")
+        )
+        blocks = [
+            {b"a": _packed([1.0, 0.0])} if t is MemoryType.CACHE else {}
+            for t in MemoryType
+        ]
+        change = {b"type": b"cache", b"id": b"b"}
+        pipeline.execute.side_effect = [
+            # Full load, then the matching entry and its embedding
+            [[(b"1-0", change)], *blocks],
+            [[_payload(a)]],
+            [[_packed([1.0, 0.0])]],
+            # Replay of one change, then the matches
+            [[(b"1-0", change)], [[b"vectors:changes", [(b"2-0", change)]]]],
+            [_packed([0.0, 1.0])],
+            [[_payload(a), _payload(b)]],
+            [[_packed([1.0, 0.0]), _packed([0.0, 1.0])]],
+        ]
+
+        first = await store.similarity_search([1.0, 1.0], threshold=0.5)
+        second = await store.similarity_search([1.0, 1.0], threshold=0.5)
+
+        assert [e.id for e in first.entries] == ["a"]
+        assert sorted(e.id for e in second.entries) == ["a", "b"]
+        assert store._mirror_cursor == "2-0"
+        pipeline.xread.assert_called_once_with({"vectors:changes": "1-0"})
+        pipeline.hget.assert_called_once_with("vectors:cache", "b")
+
     @pytest.mark.unit
     @pytest.mark.asyncio
     async def test_update_entry(
@@ -317,6 +628,76 @@ class TestRedisCacheStore:
             assert called_entry.content == "Updated content"
             assert called_entry.priority == 10
 
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_update_content_drops_stale_vector(
+        self, redis_cache_store: RedisCacheStore, mock_redis_client: AsyncMock
+    ) -> None:
+        """Replacing the content without an embedding removes the old vector."""
+        entry = MemoryEntry(
+            id="test-123", content="Original content", memory_type=MemoryType.CACHE
+        )
+        mock_redis_client.get.return_value = _payload(entry)
+        pipeline = mock_redis_client.pipeline.return_value
+
+        with patch.object(
+            redis_cache_store, "store", AsyncMock(return_value=True)
+        ) as mock_store:
+            success = await redis_cache_store.update(
+                "test-123", {"content": "Updated content"}
+            )
+
+        assert success is True
+        assert mock_store.call_args[0][0].embedding is None
+        pipeline.hdel.assert_called_once_with("vectors:cache", "test-123")
+        pipeline.xadd.assert_called_once()
+        pipeline.srem.assert_not_called()
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_update_memory_type_moves_vector(
+        self, redis_cache_store: RedisCacheStore, mock_redis_client: AsyncMock
+    ) -> None:
+        """Changing the memory type removes the vector from the old type block."""
+        entry = MemoryEntry(
+            id="test-123", content="Original content", memory_type=MemoryType.CACHE
+        )
+        mock_redis_client.get.return_value = _payload(entry)
+        pipeline = mock_redis_client.pipeline.return_value
+        pipeline.execute.side_effect = [[[_packed([1.0, 0.0])]], []]
+
+        with patch.object(
+            redis_cache_store, "store", AsyncMock(return_value=True)
+        ) as mock_store:
+            success = await redis_cache_store.update(
+                "test-123", {"memory_type": MemoryType.SHORT_TERM}
+            )
+
+        assert success is True
+        called_entry = mock_store.call_args[0][0]
+        assert called_entry.memory_type == MemoryType.SHORT_TERM
+        assert called_entry.embedding == [1.0, 0.0]
+        pipeline.hdel.assert_called_once_with("vectors:cache", "test-123")
+        pipeline.srem.assert_called_once_with("type:cache", "test-123")
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_update_metadata_keeps_vector(
+        self, redis_cache_store: RedisCacheStore, mock_redis_client: AsyncMock
+    ) -> None:
+        """Updates that leave content and type alone keep the stored vector."""
+        entry = MemoryEntry(
+            id="test-123", content="Original content", memory_type=MemoryType.CACHE
+        )
+        mock_redis_client.get.return_value = _payload(entry)
+        pipeline = mock_redis_client.pipeline.return_value
+
+        with patch.object(redis_cache_store, "store", AsyncMock(return_value=True)):
+            success = await redis_cache_store.update("test-123", {"priority": 5})
+
+        assert success is True
+        pipeline.hdel.assert_not_called()
+
     @pytest.mark.unit
     @pytest.mark.asyncio
     async def test_delete_entry(
@@ -369,11 +750,12 @@ class TestRedisCacheStore:
 
         assert success is True
         # Verify all key types were deleted in bulk
-        assert mock_redis_client.delete.call_count == 4  # One call per key type
+        assert mock_redis_client.delete.call_count == 5  # Key types + rank index
         mock_redis_client.delete.assert_any_call(b"entry:1", b"entry:2")
         mock_redis_client.delete.assert_any_call(b"metadata:1", b"metadata:2")
         mock_redis_client.delete.assert_any_call(b"type:cache", b"type:short_term")
         mock_redis_client.delete.assert_any_call(b"tag:test", b"tag:important")
+        mock_redis_client.delete.assert_any_call("rank:entries")
 
     @pytest.mark.unit
     @pytest.mark.asyncio
@@ -482,6 +482,146 @@ class TestWorkflowEngine:
 
         await engine.stop()
 
+    @staticmethod
+    def _step(
+        step_id: str, *dependencies: str, action: str = "process"
+    ) -> WorkflowStep:
+        """Create a step on the test component."""
+        return WorkflowStep(
+            id=step_id,
+            name=step_id,
+            component="test-component",
+            action=action,
+            dependencies=list(dependencies),
+        )
+
+    @pytest.mark.asyncio
+    async def test_independent_steps_run_concurrently(
+        self, mock_component: MockComponent
+    ) -> None:
+        """Test ready steps overlap up to the concurrency cap."""
+        engine = WorkflowEngine(Config(max_concurrent_steps=2))
+        engine.register_component(mock_component)
+        active = 0
+        peak = 0
+
+        async def tracked_request(request: Dict[str, Any]) -> ServiceResponse:
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.05)
+            active -= 1
+            return ServiceResponse(success=True, data={"step": request["step_id"]})
+
+        mock_component.process_request = tracked_request
+        workflow = WorkflowDefinition(
+            id="fan-out",
+            name="Fan out",
+            description="Independent branches joined at the end",
+            steps=[
+                self._step("join", "a", "b", "c"),
+                self._step("a"),
+                self._step("b"),
+                self._step("c"),
+            ],
+        )
+
+        result = await engine.execute_workflow(workflow)
+
+        assert result.status == "completed"
+        assert peak == 2
+        assert result.completed_steps[-1] == "join"
+        assert set(result.step_start_times) == {"a", "b", "c", "join"}
+        assert result.step_start_times["join"] >= max(
+            result.step_end_times[step_id] for step_id in ("a", "b", "c")
+        )
+
+    @pytest.mark.asyncio
+    async def test_failure_cancels_downstream_steps(
+        self, engine: WorkflowEngine, mock_component: MockComponent
+    ) -> None:
+        """Test a failing step cancels its dependents but not other branches."""
+        engine.register_component(mock_component)
+
+        async def request(request: Dict[str, Any]) -> ServiceResponse:
+            if request["action"] == "fail":
+                return ServiceResponse(success=False, error="boom")
+            await asyncio.sleep(0.01)
+            return ServiceResponse(success=True)
+
+        mock_component.process_request = request
+        workflow = WorkflowDefinition(
+            id="failing",
+            name="Failing",
+            description="One branch fails",
+            steps=[
+                self._step("bad", action="fail"),
+                self._step("after-bad", "bad"),
+                self._step("good"),
+                self._step("after-good", "good"),
+            ],
+        )
+
+        result = await engine.execute_workflow(workflow)
+
+        assert result.status == "failed"
+        assert "boom" in result.error
+        assert result.failed_steps == ["bad"]
+        assert result.cancelled_steps == ["after-bad"]
+        assert sorted(result.completed_steps) == ["after-good", "good"]
+
+    @pytest.mark.asyncio
+    async def test_circular_steps_rejected(
+        self, engine: WorkflowEngine, mock_component: MockComponent
+    ) -> None:
+        """Test cyclic step dependencies fail before any step runs."""
+        engine.register_component(mock_component)
+        workflow = WorkflowDefinition(
+            id="cycle",
+            name="Cycle",
+            description="Steps that depend on each other",
+            steps=[self._step("a", "b"), self._step("b", "a")],
+        )
+
+        result = await engine.execute_workflow(workflow)
+
+        assert result.status == "failed"
+        assert "circular" in result.error.lower()
+        assert mock_component.requests_processed == 0
+
+    @pytest.mark.asyncio
+    async def test_cancelling_execution_cancels_steps(
+        self, engine: WorkflowEngine, mock_component: MockComponent
+    ) -> None:
+        """Test cancelling the execution cancels running and pending steps."""
+        engine.register_component(mock_component)
+        started = asyncio.Event()
+
+        async def slow_request(request: Dict[str, Any]) -> ServiceResponse:
+            started.set()
+            await asyncio.sleep(10)
+            return ServiceResponse(success=True)
+
+        mock_component.process_request = slow_request
+        workflow = WorkflowDefinition(
+            id="slow",
+            name="Slow",
+            description="A slow step and its dependent",
+            steps=[self._step("slow"), self._step("next", "slow")],
+        )
+
+        task = asyncio.create_task(engine.execute_workflow(workflow))
+        await started.wait()
+        execution = next(iter(engine.running_workflows.values()))
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        assert execution.status == "cancelled"
+        assert execution.cancelled_steps == ["slow", "next"]
+        assert "slow" in execution.step_end_times
+        assert engine.running_workflows == {}
+
     @pytest.mark.asyncio
     async def test_lifecycle_context_manager(self, engine: WorkflowEngine) -> None:
         """Test engine lifecycle using context manager."""
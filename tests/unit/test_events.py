@@ -1,6 +1,6 @@
 """Test the event system functionality."""
 
-from datetime import UTC, datetime
+from datetime import UTC, datetime, timedelta
 from unittest.mock import AsyncMock, Mock
 
 import pytest
@@ -8,6 +8,7 @@ import pytest
 from agentic_workflow.events import (
     Event,
     EventBus,
+    EventHistory,
     EventManager,
     EventType,
     emit_agent_started,
@@ -96,8 +97,7 @@ class TestEventBus:
         await bus.publish(event)
 
         handler.assert_called_once_with(event)
-        assert len(bus._event_history) == 1
-        assert bus._event_history[0] == event
+        assert bus.get_events() == [event]
 
     @pytest.mark.asyncio
     async def test_async_handler(self):
@@ -137,7 +137,8 @@ class TestEventBus:
 
         handler.assert_called_once_with(event)
 
-    def test_get_events(self):
+    @pytest.mark.asyncio
+    async def test_get_events(self):
         """Test getting event history."""
         bus = EventBus()
 
@@ -146,7 +147,8 @@ class TestEventBus:
         event2 = Event("type2", "source2", datetime.now(UTC), {})
         event3 = Event("type1", "source3", datetime.now(UTC), {})
 
-        bus._event_history.extend([event1, event2, event3])
+        for event in (event1, event2, event3):
+            await bus.publish(event)
 
         # Get all events
         all_events = bus.get_events()
@@ -159,7 +161,94 @@ class TestEventBus:
 
         # Get limited events
         limited_events = bus.get_events(limit=2)
-        assert len(limited_events) == 2
+        assert limited_events == [event2, event3]
+
+        # Get events by source
+        assert bus.get_events(source="source3") == [event3]
+
+
+def _event(number: int, event_type: str = "type1", source: str = "source1") -> Event:
+    return Event(
+        event_type,
+        source,
+        datetime(2026, 1, 1, tzinfo=UTC) + timedelta(seconds=number),
+        {"n": number},
+    )
+
+
+class TestEventHistory:
+    """Test bounded, indexed event history."""
+
+    def test_ring_buffer_evicts_oldest(self):
+        """Test the history and its indexes stay within max_events."""
+        history = EventHistory(max_events=3)
+        for number in range(5):
+            history.append(_event(number, f"type{number % 2}", f"source{number}"))
+
+        assert [e.data["n"] for e in history.latest()] == [2, 3, 4]
+        assert [e.data["n"] for e in history.latest("type0")] == [2, 4]
+        assert history.latest(source="source1") == []
+        stats = history.get_stats()
+        assert stats["evicted"] == 2
+        assert stats["sources"] == 3
+
+    def test_max_age_evicts_old_events(self):
+        """Test events older than max_age are dropped."""
+        history = EventHistory(max_age=60)
+        history.append(Event("old", "s", datetime.now(UTC) - timedelta(hours=1), {}))
+        history.append(Event("new", "s", datetime.now(UTC), {}))
+
+        assert [e.event_type for e in history.latest()] == ["new"]
+
+    def test_since_cursor_pages(self):
+        """Test reading events after a cursor or time, page by page."""
+        history = EventHistory()
+        for number in range(6):
+            history.append(_event(number, "even" if number % 2 == 0 else "odd"))
+
+        page = history.since(limit=2)
+        assert [e.data["n"] for e in page.events] == [0, 1]
+        page = history.since(page.cursor, limit=10)
+        assert [e.data["n"] for e in page.events] == [2, 3, 4, 5]
+        assert history.since(page.cursor).events == []
+
+        odd = history.since(2, event_type="odd")
+        assert [e.data["n"] for e in odd.events] == [3, 5]
+        assert odd.cursor == 6
+
+        by_time = history.since(_event(4).timestamp)
+        assert [e.data["n"] for e in by_time.events] == [4, 5]
+
+    def test_since_after_evictions(self):
+        """Test cursors stay valid while the buffer keeps evicting."""
+        history = EventHistory(max_events=4)
+        for number in range(20):
+            history.append(_event(number, source="odd" if number % 2 else "even"))
+
+        assert [e.data["n"] for e in history.since(17).events] == [17, 18, 19]
+        assert [e.data["n"] for e in history.since(0, source="odd").events] == [
+            17,
+            19,
+        ]
+        assert history.get_stats()["oldest_sequence"] == 17
+        # Evicted entries are compacted away rather than kept behind the head
+        assert len(history._entries._items) <= 2 * history.max_events
+
+    def test_evicted_events_spilled_and_replayed(self, tmp_path):
+        """Test evicted events go to segment files and replay in order."""
+        history = EventHistory(max_events=2, spill_dir=tmp_path, segment_bytes=1)
+        for number in range(5):
+            history.append(_event(number, source="odd" if number % 2 else "even"))
+
+        assert len(list(tmp_path.glob("events-*.jsonl"))) == 3
+        assert [e.data["n"] for e in history.replay()] == [0, 1, 2, 3, 4]
+        assert [e.data["n"] for e in history.replay(since=2)] == [2, 3, 4]
+        assert [e.data["n"] for e in history.replay(source="odd")] == [1, 3]
+        history.close()
+
+        # A new history continues the numbering of spilled events
+        resumed = EventHistory(spill_dir=tmp_path)
+        assert resumed.append(_event(5)) == 4
 
 
 class TestEventManager:
@@ -135,3 +135,70 @@ async def test_clear(cache):
     assert result is True
     assert cache.client.delete.call_count == 3  # One call per key
     # scan_iter is now a lambda, so can't use assert_called_once_with
+
+
+@pytest.mark.asyncio
+async def test_retrieve_scan_uses_batched_mget(cache):
+    entries = [
+        MemoryEntry(
+            id=f"entry_{i}",
+            content=f"content {i}",
+            memory_type=MemoryType.CACHE,
+            priority=i,
+        )
+        for i in range(5)
+    ]
+    values = {
+        f"{cache.key_prefix}{entry.id}": cache._serialize_entry(entry)
+        for entry in entries
+    }
+
+    cache.scan_batch_size = 2
+    cache._ensure_client = AsyncMock(return_value=True)
+    cache.client.scan_iter = lambda **kwargs: AsyncIter(list(values))
+    cache.client.get = AsyncMock()
+    cache.client.mget = AsyncMock(side_effect=lambda keys: [values[k] for k in keys])
+
+    result = await cache.retrieve(MemoryQuery(limit=10))
+
+    # Five scanned keys are loaded in batches of two, never key by key
+    assert cache.client.mget.await_count == 3
+    cache.client.get.assert_not_awaited()
+    assert {e.id for e in result.entries} == {entry.id for entry in entries}
+    assert result.total_count == 5
+
+
+@pytest.mark.asyncio
+async def test_bulk_operations(cache):
+    entry = MemoryEntry(id="a", content="a", memory_type=MemoryType.CACHE)
+    pipeline = cache.client.pipeline.return_value
+    pipeline.execute = AsyncMock(return_value=[True, True])
+    cache._ensure_client = AsyncMock(return_value=True)
+
+    assert await cache.store_many([entry, entry]) == [True, True]
+    assert pipeline.setex.call_count == 2
+
+    cache.client.mget = AsyncMock(return_value=[cache._serialize_entry(entry), None])
+    found = await cache.get_many(["a", "b"])
+    assert list(found) == ["a"]
+
+    pipeline.execute = AsyncMock(return_value=[1, 0])
+    assert await cache.delete_many(["a", "b"]) == [True, False]
+
+
+@pytest.mark.asyncio
+async def test_reads_binary_and_legacy_json_entries(cache):
+    entry = MemoryEntry(
+        id="a", content="a", memory_type=MemoryType.CACHE, embedding=[0.5, 0.25]
+    )
+    legacy = MemoryEntry(id="b", content="b", memory_type=MemoryType.CACHE)
+    cache._ensure_client = AsyncMock(return_value=True)
+
+    binary = cache._serialize_entry(entry)
+    assert binary[:1] == b"\x00"
+
+    cache.client.mget = AsyncMock(return_value=[binary, legacy.model_dump_json()])
+    found = await cache.get_many(["a", "b"])
+
+    assert found["a"].embedding == [0.5, 0.25]
+    assert found["b"].content == "b"
@@ -0,0 +1,112 @@
+"""Unit tests for memory entry codecs."""
+
+import json
+from datetime import datetime, timezone
+
+import pytest
+
+from agentic_workflow.memory.codec import (
+    EntryCodec,
+    JsonEntryCodec,
+    StructEntryCodec,
+    decode_entry,
+    get_entry_codec,
+    is_binary_payload,
+    register_entry_codec,
+)
+from agentic_workflow.memory.interfaces import MemoryEntry, MemoryType
+
+
+@pytest.fixture
+def entry() -> MemoryEntry:
+    """Create an entry using every field."""
+    return MemoryEntry(
+        id="entry-ü",
+        content="Some content ✓",
+        metadata={"source": "test", "nested": {"n": 1}},
+        memory_type=MemoryType.LONG_TERM,
+        timestamp=datetime(2024, 5, 1, 12, 30, tzinfo=timezone.utc),
+        ttl=120,
+        embedding=[0.5, -0.25, 1.0],
+        tags=["a", "b"],
+        priority=3,
+    )
+
+
+@pytest.mark.unit
+class TestEntryCodecs:
+    """Test entry codec functionality."""
+
+    def test_struct_round_trip(self, entry: MemoryEntry) -> None:
+        """Test the struct codec preserves every field."""
+        payload = StructEntryCodec().encode(entry)
+
+        assert is_binary_payload(payload)
+        assert decode_entry(payload) == entry
+        assert decode_entry(payload, trusted=False) == entry
+
+    def test_struct_optional_fields(self) -> None:
+        """Test entries without TTL or embedding round trip."""
+        entry = MemoryEntry(id="x", content="", memory_type=MemoryType.CACHE)
+
+        decoded = decode_entry(StructEntryCodec().encode(entry))
+
+        assert decoded.ttl is None
+        assert decoded.embedding is None
+        assert decoded == entry
+
+    def test_embeddings_stored_as_float32(self) -> None:
+        """Test embeddings are packed much smaller than JSON floats."""
+        embedding = [i / 3 for i in range(384)]
+        entry = MemoryEntry(
+            id="v", content="v", memory_type=MemoryType.VECTOR, embedding=embedding
+        )
+
+        binary = StructEntryCodec().encode(entry)
+        text = JsonEntryCodec().encode(entry)
+
+        assert len(binary) < len(text) / 3
+        assert decode_entry(binary).embedding == pytest.approx(embedding, rel=1e-6)
+
+    def test_legacy_json_is_readable(self, entry: MemoryEntry) -> None:
+        """Test JSON payloads without a header are still decoded."""
+        payload = json.dumps(
+            {**entry.model_dump(mode="json"), "memory_type": "long_term"}
+        )
+
+        assert not is_binary_payload(payload)
+        assert decode_entry(payload) == entry
+        assert decode_entry(payload.encode("utf-8")) == entry
+
+    def test_unknown_version_rejected(self) -> None:
+        """Test payloads from an unregistered codec version raise."""
+        with pytest.raises(ValueError):
+            decode_entry(b"\x00\x7f")
+        with pytest.raises(ValueError):
+            get_entry_codec("missing")
+
+    def test_register_custom_codec(self, entry: MemoryEntry) -> None:
+        """Test custom codecs are selectable by name and decoded by version."""
+
+        class ReversedJsonCodec(EntryCodec):
+            name = "reversed-json"
+            version = 200
+
+            def encode(self, entry: MemoryEntry) -> bytes:
+                return bytes((0, self.version)) + entry.model_dump_json().encode()[::-1]
+
+            def decode(self, payload: bytes, trusted: bool = True) -> MemoryEntry:
+                return MemoryEntry.model_validate_json(payload[2:][::-1])
+
+        codec = ReversedJsonCodec()
+        register_entry_codec(codec)
+
+        assert get_entry_codec("reversed-json") is codec
+        assert decode_entry(codec.encode(entry)) == entry
+
+        class ClashingCodec(JsonEntryCodec):
+            name = "clashing"
+            version = 200
+
+        with pytest.raises(ValueError):
+            register_entry_codec(ClashingCodec())
@@ -0,0 +1,125 @@
+"""Unit tests for the batched embedding pipeline."""
+
+import asyncio
+import threading
+from pathlib import Path
+from typing import List
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from agentic_workflow.memory.embedding_pipeline import EmbeddingPipeline
+
+
+class RecordingModel:
+    """Synchronous embedding model that records its calls."""
+
+    model = "recording"
+
+    def __init__(self) -> None:
+        self.calls: List[List[str]] = []
+        self.threads: List[int] = []
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        self.calls.append(list(texts))
+        self.threads.append(threading.get_ident())
+        return [[float(len(text)), 1.0] for text in texts]
+
+
+@pytest.mark.unit
+class TestEmbeddingPipeline:
+    """Test embedding pipeline functionality."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_requests_are_batched(self) -> None:
+        """Test concurrent embeds coalesce into one off-loop call."""
+        model = RecordingModel()
+        pipeline = EmbeddingPipeline(model, {"batch_window": 0.01})
+
+        results = await asyncio.gather(
+            pipeline.embed("a"), pipeline.embed("bb"), pipeline.embed("a")
+        )
+
+        assert results == [[1.0, 1.0], [2.0, 1.0], [1.0, 1.0]]
+        # Duplicate in-flight content is embedded once, off the loop thread
+        assert model.calls == [["a", "bb"]]
+        assert model.threads[0] != threading.get_ident()
+
+    @pytest.mark.asyncio
+    async def test_cancelled_caller_does_not_cancel_shared_request(self) -> None:
+        """Test cancelling one caller leaves others waiting on the same text."""
+        model = RecordingModel()
+        pipeline = EmbeddingPipeline(model, {"batch_window": 0.05})
+
+        first = asyncio.ensure_future(pipeline.embed("shared"))
+        second = asyncio.ensure_future(pipeline.embed("shared"))
+        await asyncio.sleep(0)
+        first.cancel()
+
+        assert await second == [6.0, 1.0]
+        assert first.cancelled()
+        # A later caller is served the completed result, not a cancelled one
+        assert await pipeline.embed("shared") == [6.0, 1.0]
+        assert model.calls == [["shared"]]
+
+    @pytest.mark.asyncio
+    async def test_cache_prevents_re_embedding(self) -> None:
+        """Test identical content is served from the cache."""
+        model = RecordingModel()
+        pipeline = EmbeddingPipeline(model, {"batch_window": 0})
+
+        await pipeline.embed_many(["x", "y"])
+        await pipeline.embed_many(["y", "x", "z"])
+
+        assert model.calls == [["x", "y"], ["z"]]
+        stats = pipeline.get_stats()
+        assert stats["cache_hits"] == 2
+        assert stats["total_embedded"] == 3
+
+    @pytest.mark.asyncio
+    async def test_lru_eviction_and_batch_size(self) -> None:
+        """Test the LRU is bounded and batches are capped."""
+        model = RecordingModel()
+        pipeline = EmbeddingPipeline(
+            model, {"batch_window": 0, "max_batch_size": 2, "cache_size": 2}
+        )
+
+        await pipeline.embed_many(["a", "b", "c"])
+        assert model.calls == [["a", "b"], ["c"]]
+
+        await pipeline.embed("a")
+        assert model.calls[-1] == ["a"]
+
+    @pytest.mark.asyncio
+    async def test_disk_cache_survives_restart(self, tmp_path: Path) -> None:
+        """Test embeddings persist in the on-disk cache."""
+        cache_path = str(tmp_path / "embeddings.db")
+        model = RecordingModel()
+
+        first = EmbeddingPipeline(model, {"batch_window": 0, "cache_path": cache_path})
+        await first.embed("hello")
+        await first.close()
+
+        second = EmbeddingPipeline(model, {"batch_window": 0, "cache_path": cache_path})
+        assert await second.embed("hello") == [5.0, 1.0]
+        assert len(model.calls) == 1
+        assert second.get_stats()["disk_hits"] == 1
+        await second.close()
+
+    @pytest.mark.asyncio
+    async def test_native_async_model_and_errors(self) -> None:
+        """Test async providers are awaited and failures reach every caller."""
+        model = MagicMock()
+        model.aembed_documents = AsyncMock(return_value=[[0.5]])
+        pipeline = EmbeddingPipeline(model, {"batch_window": 0})
+
+        assert await pipeline.embed("q") == [0.5]
+        model.embed_documents.assert_not_called()
+
+        model.aembed_documents = AsyncMock(side_effect=RuntimeError("boom"))
+        with pytest.raises(RuntimeError):
+            await pipeline.embed("other")
+
+        # The failed request is not cached or left pending
+        model.aembed_documents = AsyncMock(return_value=[[0.25]])
+        assert await pipeline.embed("other") == [0.25]
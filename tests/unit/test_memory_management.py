@@ -66,6 +66,10 @@ class MockMemoryStore(MemoryStore):
             success=True,
         )
 
+    async def get_many(self, entry_ids: List[str]) -> Dict[str, MemoryEntry]:
+        """Get several memory entries by ID."""
+        return {i: self.entries[i] for i in entry_ids if i in self.entries}
+
     async def update(self, entry_id: str, updates: Dict[str, Any]) -> bool:
         """Update a memory entry."""
         if entry_id not in self.entries:
@@ -159,6 +163,10 @@ class MockVectorStore(VectorStore):
             success=True,
         )
 
+    async def get_many(self, entry_ids: List[str]) -> Dict[str, MemoryEntry]:
+        """Get several memory entries by ID."""
+        return {i: self.entries[i] for i in entry_ids if i in self.entries}
+
     async def update(self, entry_id: str, updates: Dict[str, Any]) -> bool:
         """Update a memory entry."""
         if entry_id not in self.entries:
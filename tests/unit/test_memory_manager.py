@@ -1,5 +1,7 @@
 """Unit tests for MemoryManager logic."""
 
+import asyncio
+import time
 from datetime import datetime, timezone
 from unittest.mock import AsyncMock, MagicMock, Mock, patch
 
@@ -129,3 +131,90 @@ async def test_retrieve_error(manager):
         query=MemoryQuery(memory_type=MemoryType.SHORT_TERM)
     )
     assert result.entries == []
+
+
+@pytest.mark.asyncio
+async def test_bulk_operations_batch_per_store(manager):
+    short_term = MagicMock()
+    short_term.store_many = AsyncMock(side_effect=lambda entries: [True] * len(entries))
+    short_term.get_many = AsyncMock(return_value={})
+    short_term.delete_many = AsyncMock(return_value=[True, False])
+    cache = MagicMock()
+    cache.store_many = AsyncMock(return_value=[False])
+    cache.get_many = AsyncMock(side_effect=ConnectionError("down"))
+    cache.delete_many = AsyncMock(return_value=[False, True])
+    manager.stores = {"short_term": short_term, "cache": cache}
+    manager.store_types = {
+        MemoryType.SHORT_TERM: "short_term",
+        MemoryType.CACHE: "cache",
+    }
+
+    entry_ids = await manager.store_many(
+        [
+            {"content": "one", "entry_id": "a"},
+            {"content": "two", "memory_type": "cache", "entry_id": "b"},
+            {"content": "three", "entry_id": "c"},
+        ]
+    )
+
+    # One call per store; the failed cache write is left out
+    assert entry_ids == ["a", "c"]
+    short_term.store_many.assert_awaited_once()
+    assert [e.id for e in short_term.store_many.call_args[0][0]] == ["a", "c"]
+    cache.store_many.assert_awaited_once()
+
+    # get_many skips stores that fail
+    assert await manager.get_many(["a"]) == {}
+
+    # An ID counts as deleted if any store deleted it
+    assert await manager.delete_many(["a", "b"]) == [True, True]
+
+    with pytest.raises(ValueError):
+        await manager.store_many([{"content": ""}])
+
+
+@pytest.mark.asyncio
+async def test_retrieve_across_stores_concurrent_with_deadline(manager):
+    def make_entry(entry_id, priority):
+        return MemoryEntry(
+            id=entry_id,
+            content=entry_id,
+            memory_type=MemoryType.SHORT_TERM,
+            priority=priority,
+        )
+
+    def store_returning(entries, delay=0.0):
+        async def retrieve(query):
+            await asyncio.sleep(delay)
+            return MemoryResult(
+                entries=entries,
+                total_count=len(entries),
+                query_time=delay,
+                similarity_scores=[],
+            )
+
+        store = MagicMock()
+        store.retrieve = AsyncMock(side_effect=retrieve)
+        return store
+
+    manager.store_timeout = 0.5
+    manager.stores = {
+        "fast": store_returning([make_entry("a", 1), make_entry("b", 5)], 0.2),
+        "also_fast": store_returning([make_entry("c", 3)], 0.2),
+        "slow": store_returning([make_entry("d", 9)], 5.0),
+        "broken": MagicMock(retrieve=AsyncMock(side_effect=Exception("down"))),
+    }
+
+    started = time.perf_counter()
+    result = await manager.retrieve(query=MemoryQuery(limit=2))
+    elapsed = time.perf_counter() - started
+
+    # Stores run side by side and the slow one is cut off at the deadline
+    assert elapsed < 1.0
+    assert [e.id for e in result.entries] == ["b", "c"]
+    assert result.total_count == 3
+    assert result.success is True
+    assert sorted(result.failed_stores) == ["broken", "slow"]
+    assert set(result.store_timings) == set(manager.stores)
+    assert result.query_time >= result.store_timings["fast"]
+    assert "fast" in (await manager.get_stats())["average_retrieval_time_by_store"]
@@ -5,7 +5,7 @@ from unittest.mock import AsyncMock, patch
 import pytest
 
 from agentic_workflow.core.interfaces import ComponentStatus
-from agentic_workflow.memory.interfaces import MemoryResult
+from agentic_workflow.memory.interfaces import MemoryEntry, MemoryResult, MemoryType
 from agentic_workflow.memory.service import MemoryService
 
 
@@ -126,6 +126,48 @@ class TestMemoryService:
         assert response.data["entry_id"] == "test_entry_id"
         service.memory_manager.store.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_process_request_batch_actions(self, service):
+        """Test store_many, get_many and delete_many request processing."""
+        await service.initialize()
+
+        service.memory_manager.store_many = AsyncMock(return_value=["a", "b"])
+        service.memory_manager.get_many = AsyncMock(
+            return_value={
+                "a": MemoryEntry(
+                    id="a", content="one", memory_type=MemoryType.SHORT_TERM
+                )
+            }
+        )
+        service.memory_manager.delete_many = AsyncMock(return_value=[True, False])
+
+        response = await service.process_request(
+            {
+                "action": "store_many",
+                "parameters": {"entries": [{"content": "one"}, {"content": "two"}]},
+            }
+        )
+        assert response.success
+        assert response.data["entry_ids"] == ["a", "b"]
+
+        response = await service.process_request(
+            {"action": "get_many", "parameters": {"entry_ids": ["a", "b"]}}
+        )
+        assert response.success
+        assert list(response.data["entries"]) == ["a"]
+        assert response.data["missing"] == ["b"]
+
+        response = await service.process_request(
+            {"action": "delete_many", "parameters": {"entry_ids": ["a", "b"]}}
+        )
+        assert not response.success
+        assert response.data["deleted"] == {"a": True, "b": False}
+
+        response = await service.process_request(
+            {"action": "store_many", "parameters": {}}
+        )
+        assert not response.success
+
     @pytest.mark.asyncio
     async def test_process_request_retrieve(self, service):
         """Test retrieve request processing."""
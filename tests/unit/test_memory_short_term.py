@@ -159,6 +159,24 @@ class TestShortTermMemory:
         assert len(result.entries) == 1
         assert result.entries[0].id == "entry-1"
 
+        # A None filter matches entries without the key, as well as None values
+        await short_term_memory.store(
+            MemoryEntry(
+                id="entry-none",
+                content="Content none",
+                metadata={"type": "test", "owner": None},
+                memory_type=MemoryType.SHORT_TERM,
+            )
+        )
+        query = MemoryQuery(metadata_filters={"type": "test", "owner": None})
+        result = await short_term_memory.retrieve(query)
+        assert {e.id for e in result.entries} == {
+            "entry-0",
+            "entry-1",
+            "entry-2",
+            "entry-none",
+        }
+
     @pytest.mark.asyncio
     async def test_update_entry(
         self, short_term_memory: ShortTermMemory, memory_entry: MemoryEntry
@@ -292,3 +310,224 @@ class TestShortTermMemory:
         await short_term_memory.close()
         assert short_term_memory._cleanup_task is None
         assert short_term_memory._cleanup_started is False
+
+    @pytest.mark.asyncio
+    async def test_similarity_search(self, short_term_memory: ShortTermMemory) -> None:
+        """Test similarity search ranks entries by embedding."""
+        for entry_id, embedding in [
+            ("north", [1.0, 0.0]),
+            ("east", [0.0, 1.0]),
+            ("north-east", [1.0, 1.0]),
+        ]:
+            await short_term_memory.store(
+                MemoryEntry(
+                    id=entry_id,
+                    content=entry_id,
+                    memory_type=MemoryType.SHORT_TERM,
+                    embedding=embedding,
+                )
+            )
+
+        result = await short_term_memory.similarity_search(
+            [1.0, 0.2], limit=2, threshold=0.5
+        )
+
+        assert result.success is True
+        assert [entry.id for entry in result.entries] == ["north", "north-east"]
+        assert result.similarity_scores[0] > result.similarity_scores[1]
+
+    @pytest.mark.asyncio
+    async def test_vector_index_follows_eviction(
+        self, short_term_memory: ShortTermMemory
+    ) -> None:
+        """Test the vector index drops entries removed by cleanup and capacity."""
+        expired = MemoryEntry(
+            id="expired",
+            content="Expired content",
+            timestamp=datetime.now(timezone.utc) - timedelta(hours=2),
+            memory_type=MemoryType.SHORT_TERM,
+            embedding=[1.0, 0.0],
+        )
+        await short_term_memory.store(expired)
+        await short_term_memory._cleanup_expired()
+        assert "expired" not in short_term_memory.vector_index
+
+        for i in range(12):
+            await short_term_memory.store(
+                MemoryEntry(
+                    id=f"entry-{i}",
+                    content=f"Content {i}",
+                    memory_type=MemoryType.SHORT_TERM,
+                    embedding=[1.0, float(i)],
+                )
+            )
+
+        assert len(short_term_memory.vector_index) == len(short_term_memory.entries)
+        assert "entry-0" not in short_term_memory.vector_index
+
+    @pytest.mark.asyncio
+    async def test_retrieve_uses_secondary_indexes(
+        self, short_term_memory: ShortTermMemory
+    ) -> None:
+        """Test type, tag, metadata and time filters through the indexes."""
+        now = datetime.now(timezone.utc)
+        for i in range(6):
+            await short_term_memory.store(
+                MemoryEntry(
+                    id=f"entry-{i}",
+                    content=f"Content {i}",
+                    memory_type=(MemoryType.SHORT_TERM if i % 2 else MemoryType.CACHE),
+                    metadata={"agent": f"agent-{i % 3}", "payload": {"n": i}},
+                    tags=[f"tag-{i % 2}"],
+                    timestamp=now - timedelta(minutes=i),
+                )
+            )
+
+        result = await short_term_memory.retrieve(
+            MemoryQuery(memory_type=MemoryType.SHORT_TERM, tags=["tag-1"])
+        )
+        assert {e.id for e in result.entries} == {"entry-1", "entry-3", "entry-5"}
+
+        result = await short_term_memory.retrieve(
+            MemoryQuery(tags=["tag-0", "tag-1"], metadata_filters={"agent": "agent-1"})
+        )
+        assert {e.id for e in result.entries} == {"entry-1", "entry-4"}
+
+        result = await short_term_memory.retrieve(
+            MemoryQuery(metadata_filters={"payload": {"n": 2}})
+        )
+        assert [e.id for e in result.entries] == ["entry-2"]
+
+        result = await short_term_memory.retrieve(
+            MemoryQuery(
+                time_range=(now - timedelta(minutes=2, seconds=30), now),
+                memory_type=MemoryType.CACHE,
+            )
+        )
+        assert [e.id for e in result.entries] == ["entry-0", "entry-2"]
+
+    @pytest.mark.asyncio
+    async def test_retrieve_orders_by_priority_then_recency(
+        self, short_term_memory: ShortTermMemory
+    ) -> None:
+        """Test results come back highest priority, then most recent, first."""
+        now = datetime.now(timezone.utc)
+        for entry_id, priority, minutes_ago in [
+            ("low-new", 0, 0),
+            ("high-old", 5, 10),
+            ("high-new", 5, 1),
+            ("mid", 2, 0),
+        ]:
+            await short_term_memory.store(
+                MemoryEntry(
+                    id=entry_id,
+                    content=entry_id,
+                    memory_type=MemoryType.SHORT_TERM,
+                    priority=priority,
+                    timestamp=now - timedelta(minutes=minutes_ago),
+                )
+            )
+
+        result = await short_term_memory.retrieve(MemoryQuery(limit=3))
+
+        assert [e.id for e in result.entries] == ["high-new", "high-old", "mid"]
+        assert result.total_count == 4
+
+    @pytest.mark.asyncio
+    async def test_update_reindexes_entry(
+        self, short_term_memory: ShortTermMemory, memory_entry: MemoryEntry
+    ) -> None:
+        """Test updates move the entry between index buckets."""
+        await short_term_memory.store(memory_entry)
+        await short_term_memory.update(
+            memory_entry.id, {"tags": ["fresh"], "memory_type": MemoryType.CACHE}
+        )
+
+        result = await short_term_memory.retrieve(MemoryQuery(tags=["fresh"]))
+        assert [e.id for e in result.entries] == [memory_entry.id]
+
+        result = await short_term_memory.retrieve(
+            MemoryQuery(memory_type=MemoryType.SHORT_TERM)
+        )
+        assert result.entries == []
+
+        await short_term_memory.delete(memory_entry.id)
+        assert short_term_memory._tag_index == {}
+        assert short_term_memory._type_index == {}
+        assert short_term_memory._time_index == []
+
+    @pytest.mark.asyncio
+    async def test_retrieve_by_content_tokens(
+        self, short_term_memory: ShortTermMemory
+    ) -> None:
+        """Test content queries match on words through the text index."""
+        for entry_id, content in [
+            ("a", "Deploy the payment service"),
+            ("b", "Review the payment pipeline"),
+            ("c", "Deploy the search service"),
+        ]:
+            await short_term_memory.store(
+                MemoryEntry(
+                    id=entry_id, content=content, memory_type=MemoryType.SHORT_TERM
+                )
+            )
+
+        result = await short_term_memory.retrieve(MemoryQuery(content="deploy service"))
+        assert {e.id for e in result.entries} == {"a", "c"}
+
+        result = await short_term_memory.retrieve(MemoryQuery(content="payment pipe"))
+        assert [e.id for e in result.entries] == ["b"]
+        assert result.similarity_scores == []
+
+        await short_term_memory.update("b", {"content": "Archived"})
+        result = await short_term_memory.retrieve(MemoryQuery(content="payment"))
+        assert [e.id for e in result.entries] == ["a"]
+
+    @pytest.mark.asyncio
+    async def test_retrieve_scored(self, short_term_memory: ShortTermMemory) -> None:
+        """Test scored mode ranks by relevance and returns the scores."""
+        for entry_id, content, priority in [
+            ("weak", "cache notes and other notes", 9),
+            ("strong", "cache cache cache", 0),
+            ("none", "unrelated", 5),
+        ]:
+            await short_term_memory.store(
+                MemoryEntry(
+                    id=entry_id,
+                    content=content,
+                    memory_type=MemoryType.SHORT_TERM,
+                    priority=priority,
+                )
+            )
+
+        result = await short_term_memory.retrieve(
+            MemoryQuery(content="cache", scored=True)
+        )
+
+        assert [e.id for e in result.entries] == ["strong", "weak"]
+        assert len(result.similarity_scores) == 2
+        assert result.similarity_scores[0] > result.similarity_scores[1] > 0.0
+
+    @pytest.mark.asyncio
+    async def test_bulk_operations(self, short_term_memory: ShortTermMemory) -> None:
+        """Test store_many, get_many and delete_many keep the indexes in sync."""
+        entries = [
+            MemoryEntry(
+                id=f"bulk_{i}",
+                content=f"bulk entry {i}",
+                memory_type=MemoryType.SHORT_TERM,
+                tags=["bulk"],
+            )
+            for i in range(3)
+        ]
+
+        assert await short_term_memory.store_many(entries) == [True, True, True]
+
+        found = await short_term_memory.get_many(["bulk_0", "bulk_2", "missing"])
+        assert set(found) == {"bulk_0", "bulk_2"}
+
+        deleted = await short_term_memory.delete_many(["bulk_1", "missing"])
+        assert deleted == [True, False]
+
+        result = await short_term_memory.retrieve(MemoryQuery(tags=["bulk"]))
+        assert {e.id for e in result.entries} == {"bulk_0", "bulk_2"}
@@ -0,0 +1,70 @@
+"""Unit tests for the inverted full-text index."""
+
+import pytest
+
+from agentic_workflow.memory.text_index import TextIndex, tokenize
+
+
+@pytest.mark.unit
+class TestTextIndex:
+    """Test text index functionality."""
+
+    def test_tokenize(self) -> None:
+        """Test tokenization lowercases and strips punctuation."""
+        assert tokenize("Deploy the API, then test!") == [
+            "deploy",
+            "the",
+            "api",
+            "then",
+            "test",
+        ]
+
+    def test_match_requires_all_terms(self) -> None:
+        """Test a query matches documents containing every term."""
+        index = TextIndex()
+        index.add("a", "deploy the pipeline")
+        index.add("b", "deploy the service")
+        index.add("c", "test the pipeline")
+
+        assert index.match("deploy pipeline") == {"a"}
+        assert index.match("the") == {"a", "b", "c"}
+        assert index.match("rollback") == set()
+        assert index.match("!!!") is None
+
+    def test_match_last_term_as_prefix(self) -> None:
+        """Test the last query term also matches as a prefix."""
+        index = TextIndex()
+        index.add("a", "deploy pipeline")
+        index.add("b", "deployment plan")
+
+        assert index.match("deploy") == {"a", "b"}
+        assert index.match("deploy pip") == {"a"}
+
+    def test_remove_and_replace(self) -> None:
+        """Test postings are updated when documents change or leave."""
+        index = TextIndex()
+        index.add("a", "alpha beta")
+        index.add("a", "gamma")
+
+        assert index.match("alpha") == set()
+        assert index.match("gamma") == {"a"}
+
+        assert index.remove("a") is True
+        assert index.remove("a") is False
+        assert len(index) == 0
+        assert index._vocabulary == []
+
+    def test_bm25_ranks_relevant_documents_higher(self) -> None:
+        """Test BM25 favours rarer terms and higher term frequency."""
+        index = TextIndex()
+        index.add("a", "memory cache memory cache memory")
+        index.add("b", "memory store for agents")
+        index.add("c", "agents plan tasks")
+
+        scores = index.score("memory")
+        assert set(scores) == {"a", "b"}
+        assert scores["a"] > scores["b"] > 0.0
+
+        scores = index.score("agents memory", {"b", "c"})
+        assert set(scores) == {"b", "c"}
+        assert scores["b"] > scores["c"]
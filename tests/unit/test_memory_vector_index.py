@@ -0,0 +1,120 @@
+"""Unit tests for the in-process vector index."""
+
+import numpy as np
+import pytest
+
+from agentic_workflow.memory.vector_index import VectorIndex
+
+
+def _random_vectors(count: int, dim: int = 16, seed: int = 1) -> np.ndarray:
+    """Create reproducible random vectors."""
+    return np.random.default_rng(seed).normal(size=(count, dim)).astype(np.float32)
+
+
+@pytest.mark.unit
+class TestVectorIndex:
+    """Test vector index functionality."""
+
+    def test_add_and_search_exact(self) -> None:
+        """Test exact cosine search ranks the closest vector first."""
+        index = VectorIndex()
+        index.add("x", [1.0, 0.0, 0.0])
+        index.add("y", [0.0, 1.0, 0.0])
+        index.add("xy", [1.0, 1.0, 0.0])
+
+        hits = index.search([1.0, 0.1, 0.0], k=2)
+
+        assert [entry_id for entry_id, _ in hits] == ["x", "xy"]
+        assert hits[0][1] == pytest.approx(0.995, abs=1e-3)
+        assert not index.is_trained
+
+    def test_threshold_filters_results(self) -> None:
+        """Test results below the similarity threshold are dropped."""
+        index = VectorIndex()
+        index.add("x", [1.0, 0.0])
+        index.add("y", [0.0, 1.0])
+
+        hits = index.search([1.0, 0.0], k=10, threshold=0.5)
+
+        assert hits == [("x", pytest.approx(1.0))]
+
+    def test_rejects_dimension_mismatch(self) -> None:
+        """Test vectors with a different dimension are rejected."""
+        index = VectorIndex()
+        assert index.add("a", [1.0, 0.0]) is True
+        assert index.add("b", [1.0, 0.0, 0.0]) is False
+        assert index.search([1.0, 0.0, 0.0]) == []
+        assert len(index) == 1
+
+    def test_replace_existing_vector(self) -> None:
+        """Test re-adding an ID replaces its vector in place."""
+        index = VectorIndex()
+        index.add("a", [1.0, 0.0])
+        index.add("a", [0.0, 1.0])
+
+        assert len(index) == 1
+        assert index.search([0.0, 1.0], k=1)[0][0] == "a"
+
+    def test_remove_keeps_matrix_dense(self) -> None:
+        """Test removing a row moves the last vector into its slot."""
+        index = VectorIndex()
+        for i, vector in enumerate(_random_vectors(5)):
+            index.add(f"v{i}", vector)
+
+        assert index.remove("v1") is True
+        assert index.remove("v1") is False
+        assert len(index) == 4
+        assert "v1" not in index
+
+        vectors = _random_vectors(5)
+        assert index.search(vectors[4], k=1)[0][0] == "v4"
+        assert all(entry_id != "v1" for entry_id, _ in index.search(vectors[1]))
+
+    def test_search_batch(self) -> None:
+        """Test batched search returns one result list per query."""
+        vectors = _random_vectors(20)
+        index = VectorIndex()
+        for i, vector in enumerate(vectors):
+            index.add(f"v{i}", vector)
+
+        results = index.search_batch(vectors[:3], k=1)
+
+        assert [hits[0][0] for hits in results] == ["v0", "v1", "v2"]
+
+    def test_ivf_training_and_recall(self) -> None:
+        """Test the IVF layer is trained past the threshold and still recalls."""
+        vectors = _random_vectors(400)
+        index = VectorIndex({"train_threshold": 100, "nprobe": 4})
+        for i, vector in enumerate(vectors):
+            index.add(f"v{i}", vector)
+
+        assert index.is_trained
+
+        found = sum(
+            index.search(vectors[i], k=1)[0][0] == f"v{i}" for i in range(0, 400, 10)
+        )
+        assert found == 40
+
+    def test_ivf_remove_updates_lists(self) -> None:
+        """Test removals stay consistent with the IVF lists."""
+        vectors = _random_vectors(200)
+        index = VectorIndex({"train_threshold": 50, "nprobe": 64})
+        for i, vector in enumerate(vectors):
+            index.add(f"v{i}", vector)
+
+        for i in range(0, 200, 2):
+            index.remove(f"v{i}")
+
+        assert len(index) == 100
+        listed = sorted(row for rows in index._lists for row in rows)
+        assert listed == list(range(100))
+        assert index.search(vectors[3], k=1)[0][0] == "v3"
+
+    def test_clear(self) -> None:
+        """Test clearing the index resets its dimension."""
+        index = VectorIndex()
+        index.add("a", [1.0, 0.0])
+        index.clear()
+
+        assert len(index) == 0
+        assert index.add("b", [1.0, 0.0, 0.0]) is True
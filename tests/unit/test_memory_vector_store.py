@@ -1,6 +1,10 @@
+import uuid
+from unittest.mock import AsyncMock, MagicMock
+
 import pytest
 
-from agentic_workflow.memory.vector_store import VectorStore
+from agentic_workflow.memory.interfaces import MemoryEntry, MemoryType
+from agentic_workflow.memory.vector_store import VectorStore, WeaviateVectorStore
 
 
 class DummyVectorStore(VectorStore):
@@ -43,8 +47,40 @@ class DummyVectorStore(VectorStore):
     async def update(self, *args, **kwargs):
         return True
 
+    async def get_many(self, *args, **kwargs):
+        return {}
+
 
 @pytest.mark.unit
 def test_vector_store_methods():
     store = DummyVectorStore("dummy", {})
     assert store.name == "dummy"
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_weaviate_store_many_uses_entry_ids():
+    store = WeaviateVectorStore("weaviate", {"openai_api_key": ""})
+    store.client = MagicMock()
+    store.embedding_pipeline = MagicMock()
+    store.embedding_pipeline.embed_many = AsyncMock(return_value=[[0.5, 0.5]])
+    collection = store.client.collections.get.return_value
+    collection.data.insert_many.return_value.errors = {}
+    entry_id = str(uuid.uuid4())
+    entries = [
+        MemoryEntry(id=entry_id, content="a", memory_type=MemoryType.LONG_TERM),
+        MemoryEntry(
+            id=str(uuid.uuid4()),
+            content="b",
+            memory_type=MemoryType.LONG_TERM,
+            embedding=[1.0, 0.0],
+        ),
+    ]
+
+    assert await store.store_many(entries) == [True, True]
+
+    objects = collection.data.insert_many.call_args[0][0]
+    assert [str(obj.uuid) for obj in objects] == [e.id for e in entries]
+    assert [obj.vector for obj in objects] == [[0.5, 0.5], [1.0, 0.0]]
+    # The caller's entries are not modified
+    assert entries[0].embedding is None
@@ -2,10 +2,12 @@
 
 from unittest.mock import AsyncMock
 
+import numpy as np
 import pytest
 
 from agentic_workflow.utils.embeddings import (
     EmbeddingProvider,
+    LocalEmbeddingProvider,
     MockEmbeddingProvider,
     get_embedding_provider,
 )
@@ -51,6 +53,41 @@ async def test_get_embedding_provider():
     provider = get_embedding_provider("mock")
     assert isinstance(provider, MockEmbeddingProvider)
 
+    # Test local provider
+    provider = get_embedding_provider("local", {"dimension": 64})
+    assert isinstance(provider, LocalEmbeddingProvider)
+    assert provider.dimension == 64
+
     # Test OpenAI provider (should fall back to mock if not available)
     provider = get_embedding_provider("openai")
     assert isinstance(provider, (MockEmbeddingProvider, EmbeddingProvider))
+
+
+@pytest.mark.asyncio
+async def test_local_provider_is_deterministic_and_ranks():
+    """Test local embeddings are stable, normalised and cosine-meaningful."""
+    provider = LocalEmbeddingProvider({"dimension": 256})
+    docs = [
+        "deploy the payment service to production",
+        "write unit tests for the parser",
+        "banana smoothie recipe",
+    ]
+
+    batch = await provider.embed_batch(docs)
+    again = LocalEmbeddingProvider({"dimension": 256}).embed_documents(docs)
+    assert batch == again
+    assert all(len(vector) == 256 for vector in batch)
+    assert np.allclose(np.linalg.norm(batch, axis=1), 1.0)
+
+    query = await provider.embed_text("deploy payment service")
+    scores = np.array(batch) @ np.array(query)
+    assert scores.argmax() == 0
+    assert scores[0] > 0.5 > scores[2]
+
+    # A different seed changes the hashing
+    other = LocalEmbeddingProvider({"dimension": 256, "seed": 1})
+    assert other.embed_query(docs[0]) != batch[0]
+
+    # Texts without word characters embed to a zero vector
+    assert not any(provider.embed_query("!!!"))
+    assert await provider.embed_batch([]) == []